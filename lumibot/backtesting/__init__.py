@@ -7,6 +7,7 @@ from .pandas_backtesting import PandasDataBacktesting
 from .polygon_backtesting import PolygonDataBacktesting
 from .thetadata_backtesting import ThetaDataBacktesting
 from .thetadata_backtesting_pandas import ThetaDataBacktestingPandas
+from .thetadata_backtesting_polars import ThetaDataBacktestingPolars
 from .yahoo_backtesting import YahooDataBacktesting
 
 from .databento_backtesting import DataBentoDataBacktesting
@@ -23,6 +24,7 @@ __all__ = [
     "PolygonDataBacktesting",
     "ThetaDataBacktesting",
     "ThetaDataBacktestingPandas",
+    "ThetaDataBacktestingPolars",
     "YahooDataBacktesting",
     "DataBentoDataBacktesting",
     "DataBentoDataBacktestingPandas",
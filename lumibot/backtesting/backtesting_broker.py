@@ -13,6 +13,7 @@ import pytz
 from lumibot.brokers import Broker
 from lumibot.data_sources import DataSourceBacktesting
 from lumibot.entities import Asset, Order, Position, TradingFee
+from lumibot.tools.backtest_profiler import profiled
 from lumibot.tools.lumibot_logger import get_logger
 from lumibot.trading_builtins import CustomStream
 
@@ -21,6 +22,11 @@ try:
 except Exception:  # pragma: no cover - optional dependency
     ThetaDataBacktestingPandas = None
 
+try:
+    from lumibot.backtesting.thetadata_backtesting_polars import ThetaDataBacktestingPolars
+except Exception:  # pragma: no cover - optional dependency
+    ThetaDataBacktestingPolars = None
+
 logger = get_logger(__name__)
 
 
@@ -138,11 +144,6 @@ class BacktestingBroker(Broker):
         self._daily_sessions = {}  # {date: [(start, end), ...]}
         self._sessions_built = False
 
-        # Prefetchers (optional). Some builds/tests won't configure these.
-        # Initialize to None so attribute checks are safe in processing code.
-        self.prefetcher = None
-        self.hybrid_prefetcher = None
-        self._last_cache_clear = None
         # Market open lookup cache (populated when calendars are initialized)
         self._market_open_cache = {}
         # Track per-strategy futures lots for accurate margin/P&L when flipping
@@ -269,12 +270,12 @@ class BacktestingBroker(Broker):
             Current cash balance
         portfolio_value : float, optional
             Current portfolio value
-        positions : list, optional
-            List of minimal position dicts from Position.to_minimal_dict()
+        positions : list or callable, optional
+            List of minimal position dicts from Position.to_minimal_dict(), or a function returning it
         initial_budget : float, optional
             Initial budget for calculating return percentage
-        orders : list, optional
-            List of minimal order dicts from Order.to_minimal_dict()
+        orders : list or callable, optional
+            List of minimal order dicts from Order.to_minimal_dict(), or a function returning it
         """
         tz = self.datetime.tzinfo
         is_pytz = isinstance(tz, (pytz.tzinfo.StaticTzInfo, pytz.tzinfo.DstTzInfo))
@@ -1072,7 +1073,7 @@ class BacktestingBroker(Broker):
         --------
             List of orders
         """
-        if self.data_source.SOURCE != "PANDAS":
+        if self.data_source.SOURCE not in ("PANDAS", "THETADATA_POLARS"):
             return
 
         # If it's the same day as the expiration, we need to check the time to see if it's after market close
@@ -1307,6 +1308,7 @@ class BacktestingBroker(Broker):
         return trade_cost
         
 
+    @profiled("order_processing")
     def process_pending_orders(self, strategy):
         """Used to evaluate and execute open orders in backtesting.
 
@@ -1339,75 +1341,6 @@ class BacktestingBroker(Broker):
         if len(pending_orders) == 0:
             return
 
-        # Prefetching: Track assets and schedule prefetch
-        current_dt = self.datetime
-
-        if self.hybrid_prefetcher:
-            # Use advanced hybrid prefetcher
-            try:
-                import asyncio
-
-                # Record access patterns for all pending orders
-                for order in pending_orders:
-                    asset = order.asset if order.asset.asset_type != "crypto" else order.asset
-                    timestep = getattr(strategy, 'timestep', 'minute')
-                    lookback = getattr(strategy, 'bars_lookback', 100)
-
-                    # Record this access for pattern learning
-                    self.hybrid_prefetcher.record_access(asset, current_dt, timestep, lookback)
-
-                # Get predictions and prefetch
-                predictions = self.hybrid_prefetcher.get_predictions(current_dt, horizon=30)
-
-                # Execute prefetch asynchronously if possible
-                try:
-                    loop = asyncio.get_event_loop()
-                    if loop.is_running():
-                        asyncio.create_task(self.hybrid_prefetcher.prefetch_parallel(predictions))
-                    else:
-                        loop.run_until_complete(self.hybrid_prefetcher.prefetch_parallel(predictions))
-                except:
-                    # Fall back to sync if async not available
-                    pass
-
-                # Periodic cleanup
-                if hasattr(self, '_last_cache_clear'):
-                    if (current_dt - self._last_cache_clear).days > 1:
-                        self.hybrid_prefetcher.cleanup(max_age_hours=48)
-                        self._last_cache_clear = current_dt
-                        # Log stats
-                        stats = self.hybrid_prefetcher.get_stats()
-                        logger.debug(f"Hybrid prefetch stats: {stats}")
-                else:
-                    self._last_cache_clear = current_dt
-
-            except Exception as e:
-                logger.debug(f"Hybrid prefetching error (non-critical): {e}")
-
-        elif self.prefetcher:
-            # Use standard aggressive prefetcher
-            try:
-                # Track all assets from pending orders
-                for order in pending_orders:
-                    asset = order.asset if order.asset.asset_type != "crypto" else order.asset
-                    timestep = getattr(strategy, 'timestep', 'minute')
-                    lookback = getattr(strategy, 'bars_lookback', 100)
-                    self.prefetcher.track_asset(asset, timestep=timestep, lookback=lookback)
-
-                # Schedule aggressive prefetch for future iterations
-                self.prefetcher.schedule_prefetch(current_dt)
-
-                # Clear old cache periodically to prevent memory bloat
-                if hasattr(self, '_last_cache_clear'):
-                    if (current_dt - self._last_cache_clear).days > 1:
-                        self.prefetcher.clear_old_cache(current_dt, max_age_days=3)
-                        self._last_cache_clear = current_dt
-                else:
-                    self._last_cache_clear = current_dt
-
-            except Exception as e:
-                logger.debug(f"Standard prefetching error (non-critical): {e}")
-
         for order in pending_orders:
             if not order.is_active():
                 continue
@@ -1521,7 +1454,7 @@ class BacktestingBroker(Broker):
                     volume = ohlc.df['volume'][-1]
 
             # Get the OHLCV data for the asset if we're using the PANDAS data source
-            elif self.data_source.SOURCE == "PANDAS":
+            elif self.data_source.SOURCE in ("PANDAS", "THETADATA_POLARS"):
                 # This is a hack to get around the fact that we need to get the previous day's data to prevent lookahead bias.
                 ohlc = self.data_source.get_historical_prices(
                     asset=asset,
@@ -1721,9 +1654,8 @@ class BacktestingBroker(Broker):
         return timestep == "day"
 
     def _is_thetadata_source(self) -> bool:
-        if ThetaDataBacktestingPandas is None:
-            return False
-        return isinstance(self.data_source, ThetaDataBacktestingPandas)
+        theta_classes = tuple(cls for cls in (ThetaDataBacktestingPandas, ThetaDataBacktestingPolars) if cls is not None)
+        return bool(theta_classes) and isinstance(self.data_source, theta_classes)
 
     def _get_spread_limit(self, strategy, key: str) -> Optional[float]:
         if strategy is None or not key:
@@ -7,6 +7,7 @@ from lumibot import LUMIBOT_DEFAULT_PYTZ
 from lumibot.data_sources import PandasData
 from lumibot.entities import Asset, Data
 from lumibot.tools import databento_helper
+from lumibot.tools.backtest_profiler import profiled
 from lumibot.tools.databento_helper import DataBentoAuthenticationError
 from lumibot.tools.helpers import to_datetime_aware
 from termcolor import colored
@@ -248,6 +249,7 @@ class DataBentoDataBacktestingPandas(PandasData):
                 logger.error(f"Error prefetching data for {asset.symbol}: {str(e)}")
                 logger.error(traceback.format_exc())
 
+    @profiled("data_fetch")
     def _update_pandas_data(self, asset, quote, length, timestep, start_dt=None):
         """
         Get asset data and update the self.pandas_data dictionary.
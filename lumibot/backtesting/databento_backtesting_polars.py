@@ -10,6 +10,7 @@ from lumibot.data_sources import PolarsData
 from lumibot.entities import Asset, Data, Quote
 from lumibot.entities.data_polars import DataPolars
 from lumibot.tools import databento_helper_polars as databento_helper
+from lumibot.tools.backtest_profiler import profiled
 from lumibot.tools.databento_helper_polars import DataBentoAuthenticationError
 from lumibot.tools.helpers import to_datetime_aware
 from termcolor import colored
@@ -273,6 +274,7 @@ class DataBentoDataBacktestingPolars(PolarsData):
                 logger.error(f"Error prefetching data for {asset.symbol}: {str(e)}")
                 logger.error(traceback.format_exc())
 
+    @profiled("data_fetch")
     def _update_pandas_data(self, asset, quote, length, timestep, start_dt=None):
         """
         Get asset data and update the self.pandas_data dictionary.
@@ -1,8 +1,9 @@
 from collections import OrderedDict
 
 
-from lumibot.data_sources import InteractiveBrokersRESTData, DataSourceBacktesting
+from lumibot.data_sources import DataSource, DataSourceBacktesting, InteractiveBrokersRESTData
 from lumibot.entities import Asset, Data
+from lumibot.tools.backtest_profiler import profiled
 
 
 class InteractiveBrokersRESTBacktesting(DataSourceBacktesting, InteractiveBrokersRESTData):
@@ -51,6 +52,7 @@ class InteractiveBrokersRESTBacktesting(DataSourceBacktesting, InteractiveBroker
         else:
             raise ValueError("Asset must be an Asset or a tuple of Asset and quote")
 
+    @profiled("data_fetch")
     def _update_pandas_data(self, asset, quote, length, timestep, start_dt=None):
         """
         Get asset data and update the self.pandas_data dictionary.
@@ -152,6 +154,15 @@ class InteractiveBrokersRESTBacktesting(DataSourceBacktesting, InteractiveBroker
 
         return super().get_last_price(asset=asset, quote=quote, exchange=exchange)
 
+    def get_last_prices(self, assets, quote=None, exchange=None):
+        """
+        Get the last prices for several assets during backtesting.
+
+        The live batch snapshot of ``InteractiveBrokersRESTData`` does not apply to backtests, so each asset is priced
+        with ``get_last_price`` like the other backtesting data sources do.
+        """
+        return DataSource.get_last_prices(self, assets, quote=quote, exchange=exchange)
+
     def get_quote(self, asset, timestep="minute", quote=None, exchange=None, **kwargs):
         """
         Get quote data for an asset during backtesting.
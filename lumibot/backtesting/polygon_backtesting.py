@@ -1,3 +1,4 @@
+import threading
 import traceback
 from collections import OrderedDict
 from datetime import timedelta
@@ -11,6 +12,7 @@ from lumibot.tools.lumibot_logger import get_logger
 from lumibot.data_sources import PandasData
 from lumibot.entities import Asset, Data
 from lumibot.tools import polygon_helper
+from lumibot.tools.backtest_profiler import profiled
 from lumibot.tools.polygon_helper import PolygonClient
 
 logger = get_logger(__name__)
@@ -22,6 +24,8 @@ class PolygonDataBacktesting(PandasData):
     """
 
     option_quote_fallback_allowed = True
+    # Each asset is downloaded to its own cache file and store updates are locked, so warm-up loads several at once.
+    WARM_UP_MAX_WORKERS = 4
 
     def __init__(
         self,
@@ -39,6 +43,8 @@ class PolygonDataBacktesting(PandasData):
 
         # Memory limit, off by default
         self.MAX_STORAGE_BYTES = max_memory
+        # Guards pandas_data updates made by concurrent warm-up downloads.
+        self._store_lock = threading.RLock()
         
         # Store errors CSV path for use in data retrieval
 
@@ -54,6 +60,7 @@ class PolygonDataBacktesting(PandasData):
             storage_used -= mu
             logger.info(f"Storage limit exceeded. Evicted LRU data: {k} used {mu:,} bytes")
 
+    @profiled("data_fetch")
     def _update_pandas_data(self, asset, quote, length, timestep, start_dt=None):
         """
         Get asset data and update the self.pandas_data dictionary.
@@ -182,10 +189,16 @@ class PolygonDataBacktesting(PandasData):
             return
         data = Data(asset_separated, df, timestep=ts_unit, quote=quote_asset)
         pandas_data_update = self._set_pandas_data_keys([data])
-        # Add the keys to the self.pandas_data dictionary
-        self.pandas_data.update(pandas_data_update)
-        if self.MAX_STORAGE_BYTES:
-            self._enforce_storage_limit(self.pandas_data)
+        with self._store_lock:
+            # Add the keys to the self.pandas_data dictionary
+            self.pandas_data.update(pandas_data_update)
+            if self.MAX_STORAGE_BYTES:
+                self._enforce_storage_limit(self.pandas_data)
+
+    def _warm_up_asset(self, asset, timestep):
+        """Download one asset for ``warm_up`` without reading it, so several downloads can run at once."""
+        self._update_pandas_data(asset, None, 1, timestep, self.get_datetime())
+        return self.find_asset_in_data_store(asset) is not None
 
     def _pull_source_symbol_bars(
         self,
@@ -229,6 +242,15 @@ class PolygonDataBacktesting(PandasData):
         return bars
 
     def get_last_price(self, asset, timestep="minute", quote=None, exchange=None, **kwargs) -> Union[float, Decimal, None]:
+        return self._price_memo_get_or_compute(
+            "last_price",
+            asset,
+            quote,
+            timestep,
+            lambda: self._get_last_price_polygon(asset, timestep=timestep, quote=quote, exchange=exchange),
+        )
+
+    def _get_last_price_polygon(self, asset, timestep="minute", quote=None, exchange=None):
         try:
             dt = self.get_datetime()
             self._update_pandas_data(asset, quote, 1, timestep, dt)
@@ -1,5 +1,7 @@
 import logging
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Dict, List, Optional, Union
@@ -11,6 +13,8 @@ from lumibot.credentials import THETADATA_CONFIG
 from lumibot.data_sources import PandasData
 from lumibot.entities import Asset, AssetsMapping, Data
 from lumibot.tools import thetadata_helper
+from lumibot.tools.backtest_profiler import profiled
+from lumibot.tools.thetadata_queue_client import MAX_CONCURRENT_REQUESTS
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +39,8 @@ class ThetaDataBacktestingPandas(PandasData):
     ALLOW_DAILY_TIMESTEP = True
 
     IS_BACKTESTING_BROKER = True
+    # Cache updates are guarded by _store_lock, so warm-up downloads run as concurrently as the queue allows.
+    WARM_UP_MAX_WORKERS = MAX_CONCURRENT_REQUESTS
 
     # Do not fall back to last_price when bid/ask quotes are unavailable for options
     option_quote_fallback_allowed = False
@@ -69,6 +75,7 @@ class ThetaDataBacktestingPandas(PandasData):
 
         self._dataset_metadata: Dict[tuple, Dict[str, object]] = {}
         self._chain_constraints = None
+        self._store_lock = threading.RLock()
 
         # Set data_source to self since this class acts as both broker and data source
         self.data_source = self
@@ -524,6 +531,7 @@ class ThetaDataBacktestingPandas(PandasData):
         )
         return meta
 
+    @profiled("data_fetch")
     def _update_pandas_data(self, asset, quote, length, timestep, start_dt=None, require_quote_data: bool = False):
         """
         Get asset data and update the self.pandas_data dictionary.
@@ -696,8 +704,9 @@ class ThetaDataBacktestingPandas(PandasData):
                     )
 
         if cached_data is not None and canonical_key not in self.pandas_data:
-            self.pandas_data[canonical_key] = cached_data
-            self._data_store[canonical_key] = cached_data
+            with self._store_lock:
+                self.pandas_data[canonical_key] = cached_data
+                self._data_store[canonical_key] = cached_data
 
         existing_meta = self._dataset_metadata.get(canonical_key)
         if existing_meta is None and legacy_key in self._dataset_metadata:
@@ -1171,8 +1180,6 @@ class ThetaDataBacktestingPandas(PandasData):
         if wants_quotes:
             # Performance: OHLC + QUOTE requests are independent network calls. Fetch them concurrently
             # for first-touch cache misses (common for 0DTE option strategies), then merge.
-            from concurrent.futures import ThreadPoolExecutor
-
             with ThreadPoolExecutor(max_workers=2) as executor:
                 future_ohlc = executor.submit(_fetch_ohlc)
                 future_quote = executor.submit(_fetch_quote)
@@ -1532,18 +1539,20 @@ class ThetaDataBacktestingPandas(PandasData):
                 enriched_update[key] = data_obj
                 if isinstance(key, tuple) and len(key) == 2:
                     enriched_update[(key[0], key[1], data_obj.timestep)] = data_obj
-            # Add the keys (legacy + timestep-aware) to the caches
-            self.pandas_data.update(enriched_update)
-            self._data_store.update(enriched_update)
-            if ts_unit == "day":
-                # Signal to the strategy executor that we're effectively running on daily cadence.
-                if getattr(self, "_timestep", None) != "day":
-                    self._timestep = "day"
-                # Refresh the cached date index so daily iteration can advance efficiently.
-                try:
-                    self._date_index = self.update_date_index()
-                except Exception:
-                    logger.debug("[THETA][DEBUG][THETADATA-PANDAS] Failed to rebuild date index for daily cache.", exc_info=True)
+            # prefetch_data() runs this method on several threads; the date index rebuild iterates the store.
+            with self._store_lock:
+                # Add the keys (legacy + timestep-aware) to the caches
+                self.pandas_data.update(enriched_update)
+                self._data_store.update(enriched_update)
+                if ts_unit == "day":
+                    # Signal to the strategy executor that we're effectively running on daily cadence.
+                    if getattr(self, "_timestep", None) != "day":
+                        self._timestep = "day"
+                    # Refresh the cached date index so daily iteration can advance efficiently.
+                    try:
+                        self._date_index = self.update_date_index()
+                    except Exception:
+                        logger.debug("[THETA][DEBUG][THETADATA-PANDAS] Failed to rebuild date index for daily cache.", exc_info=True)
         rows_override = len(metadata_frame) if placeholder_rows else None
         self._record_metadata(
             canonical_key,
@@ -1732,6 +1741,78 @@ class ThetaDataBacktestingPandas(PandasData):
             except Exception:
                 pass
 
+    def _warm_up_asset(self, asset, timestep):
+        """Load one asset for ``warm_up`` like ``prefetch_data`` does, concurrently with the other assets."""
+        return self.prefetch_data([asset], timestep=timestep, max_workers=1) == 1
+
+    def prefetch_data(self, assets, timestep="minute", length=5, quote=None, require_quote_data=None, max_workers=None):
+        """
+        Load the data of many assets concurrently, before the strategy prices them one by one.
+
+        ``get_last_price``/``get_quote`` download an uncached contract on first use, one contract after the
+        other, so scanning 40 strikes of a chain waits for 80 sequential OHLC and quote requests. This method
+        runs the same cache updates on a pool of threads (bounded by the queue client's concurrency limit), so
+        the later per-contract calls of the iteration are served from ``pandas_data``.
+
+        Parameters
+        ----------
+        assets : list of Asset
+            The assets to load, e.g. the option contracts a strategy is about to scan.
+        timestep : str, optional
+            The timestep of the data. Aligned to ``"day"`` when the backtest runs on daily data, like ``get_quote``.
+        length : int, optional
+            The number of bars needed before the current datetime. The default covers ``get_last_price``.
+        quote : Asset, optional
+            The quote asset.
+        require_quote_data : bool, optional
+            Also download bid/ask quotes. Defaults to True for options when quote data is enabled.
+        max_workers : int, optional
+            The number of threads. Defaults to THETADATA_MAX_CONCURRENT.
+
+        Returns
+        -------
+        int
+            The number of assets whose data is now loaded.
+
+        Example
+        -------
+        >>> contracts = [Asset("SPY", "option", expiration=expiry, strike=s, right="call") for s in strikes]
+        >>> self.broker.data_source.prefetch_data(contracts)
+        >>> quotes = [self.get_quote(contract) for contract in contracts]
+        """
+        assets = list(dict.fromkeys(asset for asset in assets or [] if asset is not None))
+        if not assets:
+            return 0
+
+        # Same day-mode alignment as get_quote()/get_last_price(), so the prefetched data is the data they read.
+        if timestep == "minute" and (
+            getattr(self, "_timestep", None) == "day"
+            or any(getattr(data, "timestep", None) == "day" for data in self.pandas_data.values())
+        ):
+            timestep = "day"
+        dt = self.get_datetime()
+
+        def _load(asset):
+            wants_quotes = require_quote_data
+            if wants_quotes is None:
+                wants_quotes = bool(self._use_quote_data) and getattr(asset, "asset_type", None) == Asset.AssetType.OPTION
+            self._update_pandas_data(asset, quote, length, timestep, dt, require_quote_data=wants_quotes)
+
+        loaded = 0
+        workers = min(max_workers or MAX_CONCURRENT_REQUESTS, len(assets))
+        with ThreadPoolExecutor(max_workers=max(workers, 1), thread_name_prefix="theta_prefetch") as executor:
+            futures = {executor.submit(_load, asset): asset for asset in assets}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                    loaded += 1
+                except Exception as e:
+                    # The strategy's own call for this asset will hit (and report) the same problem.
+                    logger.debug("[THETA][PREFETCH] could not load %s: %s", futures[future], e)
+
+        logger.debug("[THETA][PREFETCH] loaded %s/%s assets (%s) at %s", loaded, len(assets), timestep, dt)
+        return loaded
+
     @staticmethod
     def _combine_duplicate_columns(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
         """Deduplicate duplicate-named columns, preferring the first non-null entry per row."""
@@ -1953,6 +2034,15 @@ class ThetaDataBacktestingPandas(PandasData):
         return AssetsMapping(result)
 
     def get_last_price(self, asset, timestep="minute", quote=None, exchange=None, **kwargs) -> Union[float, Decimal, None]:
+        return self._price_memo_get_or_compute(
+            "last_price",
+            asset,
+            quote,
+            timestep,
+            lambda: self._get_last_price_theta(asset, timestep=timestep, quote=quote, exchange=exchange),
+        )
+
+    def _get_last_price_theta(self, asset, timestep="minute", quote=None, exchange=None) -> Union[float, Decimal, None]:
         sample_length = 5
         dt = self.get_datetime()
         # In day mode, use day data for price lookups instead of defaulting to minute.
@@ -2108,6 +2198,15 @@ class ThetaDataBacktestingPandas(PandasData):
 
     def get_price_snapshot(self, asset, quote=None, timestep="minute", **kwargs) -> Optional[Dict[str, object]]:
         """Return the latest OHLC + quote snapshot for the requested asset."""
+        return self._price_memo_get_or_compute(
+            "snapshot",
+            asset,
+            quote,
+            timestep,
+            lambda: self._get_price_snapshot_theta(asset, quote=quote, timestep=timestep),
+        )
+
+    def _get_price_snapshot_theta(self, asset, quote=None, timestep="minute") -> Optional[Dict[str, object]]:
         sample_length = 5
         dt = self.get_datetime()
         # In day mode, use day data for price snapshots instead of defaulting to minute.
@@ -2312,6 +2411,15 @@ class ThetaDataBacktestingPandas(PandasData):
         Quote
             A Quote object with the quote information.
         """
+        return self._price_memo_get_or_compute(
+            "quote",
+            asset,
+            quote,
+            timestep,
+            lambda: self._get_quote_theta(asset, quote=quote, exchange=exchange, timestep=timestep),
+        )
+
+    def _get_quote_theta(self, asset, quote=None, exchange=None, timestep="minute"):
         dt = self.get_datetime()
 
         # FIX (2025-12-12): In day mode, use day data for quote lookups instead of minute.
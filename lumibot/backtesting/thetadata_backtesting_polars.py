@@ -0,0 +1,682 @@
+"""Polars-native ThetaData backtesting data source.
+
+``ThetaDataBacktestingPandas`` turns every download into a ``Data`` entity: the merged OHLC/quote frame is
+re-indexed onto the backtest's minute grid and converted into per-column ``Dataline`` arrays. This source keeps
+the same downloads as polars LazyFrames in the ``PolarsMixin`` store instead. Placeholder rows and quote columns
+stay in the stored frame, reads filter them lazily at the current backtest datetime, and only the frames handed
+to the strategy are converted to pandas (unless ``return_polars=True`` is requested).
+"""
+
+import logging
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+import pandas as pd
+import polars as pl
+
+from lumibot.credentials import THETADATA_CONFIG
+from lumibot.data_sources import DataSourceBacktesting
+from lumibot.data_sources.polars_mixin import PolarsMixin
+from lumibot.entities import Asset, Quote
+from lumibot.tools import thetadata_helper
+from lumibot.tools.backtest_profiler import profiled
+from lumibot.tools.thetadata_queue_client import MAX_CONCURRENT_REQUESTS, set_queue_client_id
+
+from .thetadata_backtesting_pandas import START_BUFFER, ThetaDataBacktestingPandas
+
+logger = logging.getLogger(__name__)
+
+OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+QUOTE_COLUMNS = ["bid", "ask", "bid_size", "ask_size", "bid_condition", "ask_condition", "bid_exchange", "ask_exchange"]
+QUOTE_TIMESTAMP_COLUMNS = ["last_trade_time", "last_bid_time", "last_ask_time"]
+
+# Quotes are forward-filled inside a session only: a gap longer than this starts a new session.
+QUOTE_FFILL_MAX_GAP = {
+    "minute": timedelta(minutes=120),
+    "hour": timedelta(minutes=240),
+    "second": timedelta(minutes=120),
+}
+
+
+class ThetaDataBacktestingPolars(PolarsMixin, DataSourceBacktesting):
+    """
+    Backtesting implementation of ThetaData on polars LazyFrames.
+
+    Downloads go through the same ``thetadata_helper.get_price_data`` calls (and disk cache) as
+    ``ThetaDataBacktestingPandas`` and the read methods follow its semantics, so the two sources can be swapped.
+
+    Parameters
+    ----------
+    datetime_start : datetime
+        Start datetime for backtesting period
+    datetime_end : datetime
+        End datetime for backtesting period
+    username : str, optional
+        ThetaData username, defaults to THETADATA_USERNAME
+    password : str, optional
+        ThetaData password, defaults to THETADATA_PASSWORD
+    use_quote_data : bool, optional
+        Download bid/ask quotes next to the OHLC bars when a quote is requested, default True
+    max_memory : int, optional
+        Upper bound for the stored frames in bytes, default None (no limit)
+    **kwargs
+        Additional parameters passed to DataSourceBacktesting
+    """
+
+    SOURCE = "THETADATA_POLARS"
+    MIN_TIMESTEP = "minute"
+    # Allow the broker to switch to day-level fills for daily-cadence strategies
+    ALLOW_DAILY_TIMESTEP = True
+    TIMESTEP_MAPPING = [
+        {"timestep": "day", "representations": ["1D", "day"]},
+        {"timestep": "minute", "representations": ["1M", "minute"]},
+    ]
+
+    IS_BACKTESTING_BROKER = True
+    # Cache updates are guarded by _store_lock, so warm-up downloads run as concurrently as the queue allows.
+    WARM_UP_MAX_WORKERS = MAX_CONCURRENT_REQUESTS
+
+    # Do not fall back to last_price when bid/ask quotes are unavailable for options
+    option_quote_fallback_allowed = False
+
+    # Source-agnostic helpers shared with the pandas implementation.
+    is_weekend = ThetaDataBacktestingPandas.is_weekend
+    kill_processes_by_name = ThetaDataBacktestingPandas.kill_processes_by_name
+    get_start_datetime_and_ts_unit = ThetaDataBacktestingPandas.get_start_datetime_and_ts_unit
+    get_yesterday_dividends = ThetaDataBacktestingPandas.get_yesterday_dividends
+    get_chains = ThetaDataBacktestingPandas.get_chains
+    _normalize_default_timezone = ThetaDataBacktestingPandas._normalize_default_timezone
+    _option_expiration_end = ThetaDataBacktestingPandas._option_expiration_end
+
+    def __init__(
+        self,
+        datetime_start,
+        datetime_end,
+        username=None,
+        password=None,
+        use_quote_data=True,
+        max_memory=None,
+        **kwargs,
+    ):
+        super().__init__(datetime_start=datetime_start, datetime_end=datetime_end, **kwargs)
+
+        # Default to minute; broker can flip to day for daily strategies.
+        self._timestep = self.MIN_TIMESTEP
+
+        if username is None:
+            username = THETADATA_CONFIG.get("THETADATA_USERNAME")
+        if password is None:
+            password = THETADATA_CONFIG.get("THETADATA_PASSWORD")
+        if username is None or password is None:
+            logger.warning("ThetaData credentials are not configured; ThetaTerminal may fail to authenticate.")
+
+        self._username = username
+        self._password = password
+        self._use_quote_data = use_quote_data
+        self._chain_constraints = None
+        self.MAX_STORAGE_BYTES = max_memory
+
+        # LazyFrames keyed by (asset, quote, timestep), plus what each of them covers.
+        self._init_polars_storage()
+        self._coverage: Dict[tuple, Dict[str, object]] = {}
+        self._store_lock = threading.RLock()
+
+        # Set data_source to self since this class acts as both broker and data source
+        self.data_source = self
+
+        # Unique client id for queue fairness, like the pandas source.
+        set_queue_client_id(f"{kwargs.get('name', 'Backtest')}_{uuid.uuid4().hex[:8]}")
+
+        self.kill_processes_by_name("ThetaTerminal.jar")
+        thetadata_helper.reset_theta_terminal_tracking()
+
+    # ========Downloads and storage ======================
+
+    def _align_timestep(self, timestep):
+        """Serve implicit and intraday requests from day data when the backtest runs on daily cadence."""
+        if self._timestep == "day" and (timestep is None or str(timestep).lower() in {"minute", "hour", "second"}):
+            return "day"
+        return timestep or self.MIN_TIMESTEP
+
+    @staticmethod
+    def _to_polars(frame: Optional[pd.DataFrame]) -> Optional[pl.DataFrame]:
+        """Convert a ``get_price_data`` frame (UTC datetime index) to polars with a ``datetime`` column."""
+        if frame is None or frame.empty:
+            return None
+        if "datetime" in frame.columns:
+            frame = frame.set_index("datetime")
+        index = pd.DatetimeIndex(frame.index)
+        index = index.tz_localize("UTC") if index.tz is None else index.tz_convert("UTC")
+        frame = frame.set_axis(index.rename("datetime"), axis=0)
+        return pl.from_pandas(frame.reset_index()).sort("datetime")
+
+    @staticmethod
+    def _merge_quotes(ohlc: pl.DataFrame, quotes: pl.DataFrame, ts_unit: str) -> pl.DataFrame:
+        """Outer-join the quote rows onto the OHLC rows and forward-fill quotes within each session."""
+        shared = [col for col in quotes.columns if col in ohlc.columns and col != "datetime"]
+        merged = ohlc.join(quotes, on="datetime", how="full", coalesce=True, suffix="_quote")
+        if shared:
+            merged = merged.with_columns(
+                [pl.coalesce(pl.col(col), pl.col(f"{col}_quote").cast(merged.schema[col], strict=False)).alias(col)
+                 for col in shared]
+            ).drop([f"{col}_quote" for col in shared])
+        merged = merged.sort("datetime")
+
+        fill_columns = [col for col in QUOTE_COLUMNS + QUOTE_TIMESTAMP_COLUMNS if col in merged.columns]
+        max_gap = QUOTE_FFILL_MAX_GAP.get(ts_unit)
+        if fill_columns and max_gap is not None:
+            session = (pl.col("datetime").diff() > max_gap).fill_null(False).cum_sum()
+            merged = merged.with_columns([pl.col(col).forward_fill().over(session) for col in fill_columns])
+        return merged
+
+    def _fetch_window(self, asset, length, ts_unit, dt):
+        """Return the ``(start, end, start_buffer)`` a download for ``asset`` should cover, like the pandas source."""
+        is_option = asset.asset_type == Asset.AssetType.OPTION
+        # Point-in-time option lookups only need the previous session, not the 5-day buffer.
+        short_option_window = is_option and length <= 5 and ts_unit in {"minute", "hour"}
+        start_buffer = timedelta(days=1) if short_option_window else START_BUFFER
+        start, _ = self.get_start_datetime_and_ts_unit(length, ts_unit, dt, start_buffer=start_buffer)
+        start = self._normalize_default_timezone(start)
+        window_start = self._normalize_default_timezone(self.datetime_start - START_BUFFER)
+        if not is_option and window_start < start:
+            # Non-options are downloaded for the whole backtest once; options only up to the current datetime.
+            start = window_start
+
+        end = min(self._normalize_default_timezone(dt), self._normalize_default_timezone(self.datetime_end))
+        if ts_unit == "day":
+            end_day = end.date() if is_option else self.datetime_end.date()
+            end = self.to_default_timezone(self.tzinfo.localize(datetime.combine(end_day, datetime.max.time())))
+        expiration_end = self._option_expiration_end(asset)
+        if expiration_end is not None and expiration_end < end:
+            end = expiration_end
+        return start, end, start_buffer
+
+    def _is_covered(self, key, start, end, start_buffer, wants_quotes):
+        coverage = self._coverage.get(key)
+        if coverage is None or (wants_quotes and not coverage["has_quotes"]):
+            return False
+        # Date-level end check: Theta returns whole sessions, and an option ends at its expiration.
+        tolerance = timedelta(days=3) if key[2] == "day" else timedelta(0)
+        last_day = coverage["end"].astimezone(end.tzinfo).date()
+        return coverage["start"] <= start + start_buffer and last_day >= end.date() - tolerance
+
+    @profiled("data_fetch")
+    def _update_data(self, asset, quote, length, timestep, dt, require_quote_data=False):
+        """
+        Download the data of ``asset`` when the stored frame does not cover the current request.
+
+        Parameters
+        ----------
+        asset : Asset
+            The asset to get data for.
+        quote : Asset
+            The quote asset, defaults to USD.
+        length : int
+            The number of bars needed before ``dt``.
+        timestep : str
+            The timestep of the data, "minute" or "day".
+        dt : datetime
+            The datetime the bars are needed at.
+        require_quote_data : bool, optional
+            Also download bid/ask quotes (intraday only).
+
+        Returns
+        -------
+        tuple or None
+            The ``(asset, quote, timestep)`` key of the stored frame, None when the asset has no data.
+        """
+        quote_asset = quote if quote is not None else Asset("USD", "forex")
+        if asset.asset_type == Asset.AssetType.OPTION and self.is_weekend(asset.expiration):
+            logger.info(f"\nSKIP: Expiry {asset.expiration} date is a weekend, no contract exists: {asset}")
+            return None
+
+        _, ts_unit = self.convert_timestep_str_to_timedelta(timestep)
+        key = (asset, quote_asset, ts_unit)
+        start, end, start_buffer = self._fetch_window(asset, max(int(length or 1), 1), ts_unit, dt)
+        wants_quotes = bool(self._use_quote_data and require_quote_data) and ts_unit in QUOTE_FFILL_MAX_GAP
+        if self._is_covered(key, start, end, start_buffer, wants_quotes):
+            return key
+
+        # Keep quotes once they have been loaded, so a trade-only refresh does not drop them.
+        coverage = self._coverage.get(key)
+        wants_quotes = wants_quotes or bool(coverage and coverage["has_quotes"])
+        logger.debug(
+            "[THETA][POLARS] fetch asset=%s quote=%s timestep=%s start=%s end=%s quotes=%s",
+            asset, quote_asset, ts_unit, start, end, wants_quotes,
+        )
+
+        def _fetch(datastyle):
+            return thetadata_helper.get_price_data(
+                asset,
+                start,
+                end,
+                timespan=ts_unit,
+                quote_asset=quote_asset,
+                dt=dt,
+                datastyle=datastyle,
+                include_after_hours=True,
+                preserve_full_history=True,
+                **({} if datastyle == "quote" else {
+                    # Day bars of options carry the EOD NBBO, so get_quote() can price days without trades.
+                    "include_eod_nbbo": bool(
+                        self._use_quote_data and ts_unit == "day" and asset.asset_type == Asset.AssetType.OPTION
+                    )
+                }),
+            )
+
+        if wants_quotes:
+            # OHLC and quote requests are independent, download them concurrently.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                future_ohlc, future_quote = executor.submit(_fetch, "ohlc"), executor.submit(_fetch, "quote")
+                ohlc, quotes = self._to_polars(future_ohlc.result()), self._to_polars(future_quote.result())
+        else:
+            ohlc, quotes = self._to_polars(_fetch("ohlc")), None
+
+        if ohlc is None:
+            expiration_end = self._option_expiration_end(asset)
+            if expiration_end is not None and expiration_end == end:
+                logger.debug("[THETA][POLARS] no new rows for %s; option expired on %s", asset, asset.expiration)
+                return key if key in self._coverage else None
+            raise ValueError(
+                f"No OHLC data returned for {asset} / {quote_asset} ({ts_unit}) start={start} end={end}; "
+                "refusing to proceed with empty dataset."
+            )
+
+        frame = ohlc
+        if quotes is not None:
+            frame = self._merge_quotes(ohlc, quotes, ts_unit)
+        elif wants_quotes:
+            logger.warning(
+                f"No QUOTE data returned for {asset} / {quote_asset} ({ts_unit}); continuing without quotes."
+            )
+        if "missing" not in frame.columns:
+            frame = frame.with_columns(pl.lit(False).alias("missing"))
+        frame = frame.with_columns(pl.col("missing").fill_null(False).cast(pl.Boolean))
+
+        real = frame.filter(~pl.col("missing"))["datetime"]
+        if real.len() == 0:
+            # Only placeholders: keep them so the key exists, coverage starts at the first placeholder.
+            real = frame["datetime"]
+        with self._store_lock:
+            self._store_data_polars(key, frame, rename_columns=False)
+            self._coverage[key] = {
+                "start": self._normalize_default_timezone(frame["datetime"].min()),
+                "end": self._normalize_default_timezone(frame["datetime"].max()),
+                "first_real": self._normalize_default_timezone(real.min()),
+                "has_quotes": all(col in frame.columns for col in ("bid", "ask")),
+            }
+            self._enforce_storage_limit_polars(self.MAX_STORAGE_BYTES)
+            for evicted in [k for k in self._coverage if k not in self._data_store]:
+                del self._coverage[evicted]
+        return key
+
+    def _warm_up_asset(self, asset, timestep):
+        """Load one asset for ``warm_up`` like ``prefetch_data`` does, concurrently with the other assets."""
+        return self.prefetch_data([asset], timestep=timestep, max_workers=1) == 1
+
+    def prefetch_data(self, assets, timestep="minute", length=5, quote=None, require_quote_data=None, max_workers=None):
+        """
+        Load the data of many assets concurrently, before the strategy prices them one by one.
+
+        Same contract as ``ThetaDataBacktestingPandas.prefetch_data``.
+
+        Parameters
+        ----------
+        assets : list of Asset
+            The assets to load, e.g. the option contracts a strategy is about to scan.
+        timestep : str, optional
+            The timestep of the data. Aligned to ``"day"`` when the backtest runs on daily data.
+        length : int, optional
+            The number of bars needed before the current datetime.
+        quote : Asset, optional
+            The quote asset.
+        require_quote_data : bool, optional
+            Also download bid/ask quotes. Defaults to True for options when quote data is enabled.
+        max_workers : int, optional
+            The number of threads. Defaults to THETADATA_MAX_CONCURRENT.
+
+        Returns
+        -------
+        int
+            The number of assets whose data is now loaded.
+        """
+        assets = list(dict.fromkeys(asset for asset in assets or [] if asset is not None))
+        if not assets:
+            return 0
+        timestep = self._align_timestep(timestep)
+        dt = self.get_datetime()
+
+        def _load(asset):
+            wants_quotes = require_quote_data
+            if wants_quotes is None:
+                wants_quotes = bool(self._use_quote_data) and asset.asset_type == Asset.AssetType.OPTION
+            return self._update_data(asset, quote, length, timestep, dt, require_quote_data=wants_quotes)
+
+        loaded = 0
+        workers = min(max_workers or MAX_CONCURRENT_REQUESTS, len(assets))
+        with ThreadPoolExecutor(max_workers=max(workers, 1), thread_name_prefix="theta_prefetch") as executor:
+            futures = {executor.submit(_load, asset): asset for asset in assets}
+            for future in as_completed(futures):
+                try:
+                    if future.result() is not None:
+                        loaded += 1
+                except Exception as e:
+                    # The strategy's own call for this asset will hit (and report) the same problem.
+                    logger.debug("[THETA][PREFETCH] could not load %s: %s", futures[future], e)
+
+        logger.debug("[THETA][PREFETCH] loaded %s/%s assets (%s) at %s", loaded, len(assets), timestep, dt)
+        return loaded
+
+    # ========Reads ======================
+
+    def _rows_until(self, key, dt) -> Optional[pl.LazyFrame]:
+        """The real (non-placeholder) rows of ``key`` at or before ``dt``."""
+        lazy_data = self._get_data_lazy(key)
+        if lazy_data is None:
+            return None
+        return lazy_data.filter(~pl.col("missing") & (pl.col("datetime") <= self._utc_literal(dt)))
+
+    def _utc_literal(self, dt):
+        """A polars literal of ``dt`` comparable with the stored UTC ``datetime`` column."""
+        return pl.lit(self._convert_datetime_for_filtering(dt)).dt.replace_time_zone("UTC")
+
+    def _day_bars(self, lazy_data, dt, length, timeshift):
+        """
+        Daily bars before ``dt``, stamped at local midnight, with the same windowing as the pandas source.
+
+        That is ``Data.get_bars`` (the window ends before the last bar at or before ``dt``, moved back by
+        ``timeshift`` bars) followed by ``_finalize_day_frame`` (only sessions up to yesterday, minus a
+        ``timedelta`` timeshift, and positive integer timeshifts drop that many more bars).
+        """
+        shift_rows = timeshift.days if isinstance(timeshift, timedelta) else int(timeshift or 0)
+        cutoff_day = self.to_default_timezone(dt).date() - timedelta(days=1)
+        if isinstance(timeshift, timedelta):
+            cutoff_day -= timeshift
+
+        tz_name = str(self.tzinfo)
+        rows = lazy_data.sort("datetime").with_row_index("_row")
+        last_row = (
+            rows.filter(pl.col("datetime") <= self._utc_literal(dt)).select(pl.col("_row").max()).collect().item()
+        )
+        window_end = (-1 if last_row is None else last_row) - shift_rows
+        bars = (
+            rows.filter((pl.col("_row") < window_end) & (pl.col("_row") >= window_end - length))
+            .with_columns(pl.col("datetime").dt.convert_time_zone(tz_name).dt.truncate("1d"))
+            .filter(pl.col("datetime").dt.date() <= cutoff_day)
+            .drop("_row")
+            .collect()
+        )
+        if isinstance(timeshift, int) and timeshift > 0:
+            bars = bars.head(max(bars.height - timeshift, 0))
+        return bars.tail(length).with_columns(pl.lit(False).alias("missing"))
+
+    def _minute_bars(self, key, lazy_data, dt, length, timeshift):
+        """
+        Minute bars before ``dt`` with the same windowing as the pandas source.
+
+        That is ``Data.get_bars``, which counts stored rows rather than minutes: the window ends before the last
+        row at or before ``dt``, moved back by ``timeshift`` rows. On sparse data that row is the last trade
+        before ``dt``, so it is left out too. Quote-only rows carry the last close forward, rows before the first
+        trade are dropped after windowing, and bars after ``dt`` are never returned, even for a negative
+        ``timeshift``. Returns ``None`` when ``dt`` is outside the stored rows, where the pandas source's
+        ``strict_end_check`` asks for a refresh instead of serving stale bars.
+        """
+        if self.to_default_timezone(dt) < self._coverage[key]["first_real"]:
+            return None
+        if isinstance(timeshift, timedelta):
+            timeshift = int(timeshift.total_seconds() / 60)
+
+        rows = lazy_data.sort("datetime").with_row_index("_row")
+        last_row, row_count, data_end = (
+            rows.select(
+                pl.col("_row").filter(pl.col("datetime") <= self._utc_literal(dt)).max(),
+                pl.len(),
+                pl.col("datetime").max(),
+            )
+            .collect()
+            .row(0)
+        )
+        if data_end is None or self.to_default_timezone(dt) > self._normalize_default_timezone(data_end):
+            return None
+        window_end = min(max((-1 if last_row is None else last_row) - (timeshift or 0), 0), row_count)
+        window_start = max(window_end - length, 0)
+        if window_start == window_end and window_end > 0:
+            window_start = window_end - 1
+        # Data fills minutes without a trade (quote-only rows) from the last close, with no volume.
+        close = pl.col("close").fill_nan(None).forward_fill()
+        return (
+            rows.filter(pl.col("_row") < window_end)
+            .with_columns(
+                [pl.col(col).fill_nan(None).fill_null(close) for col in ("open", "high", "low")]
+                + [close.alias("close"), pl.col("volume").fill_nan(None).fill_null(0)]
+            )
+            .filter((pl.col("_row") >= window_start) & (pl.col("datetime") <= self._utc_literal(dt)))
+            .drop("_row")
+            .drop_nulls(OHLCV_COLUMNS)
+            .collect()
+        )
+
+    def get_historical_prices(
+        self,
+        asset,
+        length,
+        timestep="minute",
+        timeshift=None,
+        quote=None,
+        exchange=None,
+        include_after_hours=True,
+        return_polars=False,
+    ):
+        """
+        Get the ``length`` bars before the current backtest datetime.
+
+        Parameters
+        ----------
+        asset : Asset
+            The asset to get the bars for.
+        length : int
+            The number of bars.
+        timestep : str, optional
+            "minute" or "day", aligned to "day" in daily-cadence backtests.
+        timeshift : int or timedelta, optional
+            Shift the window back by this many bars (or this duration); negative values look ahead, like the
+            broker's fill lookups.
+        quote : Asset, optional
+            The quote asset.
+        exchange : str, optional
+            Not used by ThetaData.
+        include_after_hours : bool, optional
+            Not used, ThetaData downloads always include extended hours.
+        return_polars : bool, optional
+            Return the bars as a polars DataFrame instead of pandas.
+
+        Returns
+        -------
+        Bars or None
+        """
+        if isinstance(asset, str):
+            asset = Asset(asset)
+        timestep = self._align_timestep(timestep)
+        dt = self.get_datetime()
+        key = self._update_data(asset, quote, self.estimate_requested_length(length), timestep, dt)
+        if key is None or key not in self._coverage:
+            return None
+
+        lazy_data = self._get_data_lazy(key).filter(~pl.col("missing")).select(["datetime"] + OHLCV_COLUMNS)
+        if key[2] == "day":
+            bars = self._day_bars(lazy_data, dt, length, timeshift)
+            if bars.is_empty():
+                return None
+        else:
+            # Like the pandas source, an empty minute window is an empty Bars rather than None.
+            bars = self._minute_bars(key, lazy_data, dt, length, timeshift)
+            if bars is None:
+                return None
+        return self._parse_source_symbol_bars_polars(
+            bars, asset, self.SOURCE, quote, length, return_polars=return_polars
+        )
+
+    def get_historical_prices_between_dates(
+        self,
+        asset,
+        timestep="minute",
+        quote=None,
+        exchange=None,
+        include_after_hours=True,
+        start_date=None,
+        end_date=None,
+    ):
+        """Get the bars from ``start_date`` (inclusive) to ``end_date`` (exclusive)."""
+        timestep = self._align_timestep(timestep)
+        length = self.estimate_requested_length(None, start_date=start_date, end_date=end_date, timestep=timestep)
+        key = self._update_data(asset, quote, length, timestep, end_date)
+        if key is None:
+            return None
+
+        lazy_data = self._get_data_lazy(key).filter(~pl.col("missing"))
+        if start_date is not None:
+            lazy_data = lazy_data.filter(pl.col("datetime") >= self._utc_literal(start_date))
+        if end_date is not None:
+            lazy_data = lazy_data.filter(pl.col("datetime") < self._utc_literal(end_date))
+        response = lazy_data.select(["datetime"] + OHLCV_COLUMNS).collect()
+        if response.is_empty():
+            return None
+        return self._parse_source_symbol_bars_polars(response, asset, self.SOURCE, quote)
+
+    def get_last_price(self, asset, timestep="minute", quote=None, exchange=None, **kwargs):
+        """
+        Get the close of the most recent trade at or before the current backtest datetime.
+
+        Trade-only like the pandas source: quotes never leak into the last price.
+
+        Parameters
+        ----------
+        asset : Asset
+            The asset to get the price of.
+        timestep : str, optional
+            "minute" or "day", aligned to "day" in daily-cadence backtests.
+        quote : Asset, optional
+            The quote asset.
+        exchange : str, optional
+            Not used by ThetaData.
+
+        Returns
+        -------
+        float or None
+        """
+        return self._price_memo_get_or_compute(
+            "last_price",
+            asset,
+            quote,
+            timestep,
+            lambda: self._get_last_price_polars(asset, timestep=timestep, quote=quote),
+        )
+
+    def _get_last_price_polars(self, asset, timestep="minute", quote=None):
+        timestep = self._align_timestep(timestep)
+        dt = self.get_datetime()
+
+        def _last_trade(key):
+            rows = self._rows_until(key, dt) if key is not None else None
+            if rows is None:
+                return None
+            closes = rows.filter(pl.col("close") > 0).select(pl.col("close").last()).collect()
+            value = closes.item() if closes.height else None
+            return float(value) if value is not None else None
+
+        key = self._update_data(asset, quote, 5, timestep, dt)
+        value = _last_trade(key)
+
+        # Illiquid contracts can go weeks without prints; look further back once, like a live broker would.
+        if value is None and key is not None and asset.asset_type == Asset.AssetType.OPTION and key[2] == "day":
+            coverage = self._coverage.get(key, {})
+            if not coverage.get("last_trade_lookback_attempted"):
+                coverage["last_trade_lookback_attempted"] = True
+                for lookback_days in (30, 252):
+                    try:
+                        key = self._update_data(asset, quote, lookback_days, timestep, dt)
+                    except Exception:
+                        continue
+                    value = _last_trade(key)
+                    if value is not None:
+                        break
+        return value
+
+    def get_quote(self, asset, quote=None, exchange=None, timestep="minute", **kwargs):
+        """
+        Get the bid/ask quote of an asset at the current backtest datetime.
+
+        Parameters
+        ----------
+        asset : Asset
+            The asset for which the quote is needed.
+        quote : Asset, optional
+            The quote asset.
+        exchange : str, optional
+            Not used by ThetaData.
+        timestep : str, optional
+            "minute" or "day", aligned to "day" in daily-cadence backtests.
+
+        Returns
+        -------
+        Quote
+        """
+        return self._price_memo_get_or_compute(
+            "quote",
+            asset,
+            quote,
+            timestep,
+            lambda: self._get_quote_polars(asset, quote=quote, exchange=exchange, timestep=timestep),
+        )
+
+    def _get_quote_polars(self, asset, quote=None, exchange=None, timestep="minute"):
+        timestep = self._align_timestep(timestep)
+        dt = self.get_datetime()
+        key = self._update_data(asset, quote, 1, timestep, dt, require_quote_data=True)
+        rows = self._rows_until(key, dt) if key is not None else None
+        if rows is None:
+            return Quote(asset=asset)
+
+        columns = [col for col in OHLCV_COLUMNS + QUOTE_COLUMNS if col in rows.collect_schema().names()]
+        # Bars without trades have no OHLC; like the pandas grid fill, the close carries forward.
+        last = rows.select(
+            [pl.col(col).last() for col in columns if col != "close"]
+            + [pl.col("close").drop_nulls().last(), pl.len().alias("_rows")]
+        ).collect()
+        if last["_rows"].item() == 0:
+            return Quote(asset=asset)
+
+        values = {}
+        for col in columns:
+            value = last[col].item()
+            if value is not None and col in ("open", "high", "low", "close", "bid", "ask"):
+                value = round(value, 2)
+            values[col] = value
+        for side in ("bid", "ask"):
+            if values.get(side) is not None and values[side] <= 0:
+                values[side] = None
+
+        quote_obj = Quote(
+            asset=asset,
+            price=values.get("close"),
+            bid=values.get("bid"),
+            ask=values.get("ask"),
+            volume=values.get("volume") or 0.0,
+            timestamp=dt,
+            bid_size=values.get("bid_size"),
+            ask_size=values.get("ask_size"),
+            raw_data=values,
+        )
+
+        # Option quotes without trades are marked at the mid, and only fall back to the last trade without NBBO.
+        if asset.asset_type == Asset.AssetType.OPTION and not (quote_obj.price and quote_obj.price > 0):
+            if quote_obj.bid is not None and quote_obj.ask is not None:
+                quote_obj.price = (quote_obj.bid + quote_obj.ask) / 2.0
+            else:
+                last_trade = self.get_last_price(asset, timestep=timestep, quote=quote, exchange=exchange)
+                if last_trade is not None:
+                    quote_obj.price = float(last_trade)
+        return quote_obj
@@ -1095,7 +1095,7 @@ class Alpaca(Broker):
             @broker.stream.add_action(PollingStream.POLL_EVENT)
             def on_trade_event_poll():
                 logger.debug("Alpaca Stream: Polling event triggered, calling do_polling()")
-                self.do_polling()
+                self._poll_and_reconcile()
 
             @broker.stream.add_action(broker.NEW_ORDER)
             def on_trade_event_new(order):
@@ -1154,6 +1154,13 @@ class Alpaca(Broker):
             # For API key/secret, use traditional streaming (existing code)
             pass
 
+    def _polled_order_version(self, raw_order):
+        # Alpaca bumps updated_at on every change to an order.
+        updated_at = getattr(raw_order, "updated_at", None)
+        if updated_at is None:
+            return super()._polled_order_version(raw_order)
+        return updated_at, getattr(raw_order, "status", None), getattr(raw_order, "filled_qty", None)
+
     def do_polling(self):
         """
         This function is called every polling_interval for OAuth-only configurations.
@@ -1176,7 +1183,8 @@ class Alpaca(Broker):
             # Only log summary, not detailed per-order processing
             logger.debug(f"OAuth Polling: Found {len(raw_orders)} raw orders from Alpaca, {len(stored_orders)} stored orders in Lumibot")
 
-            for alpaca_order in raw_orders:
+            # Only parse the orders that are new or changed since the last poll
+            for alpaca_order in self._changed_polled_orders(raw_orders):
                 # Use strategy name if available, otherwise use a default
                 strategy_name = strategy.name if strategy else "default"
                 order = self._parse_broker_order(alpaca_order, strategy_name=strategy_name)
@@ -1268,7 +1276,11 @@ class Alpaca(Broker):
                             # Network/API error - don't assume anything, just log and continue
                             logger.debug(f"OAuth Polling: Could not verify order {order_id}: {e}")
 
+            self._get_poll_reconciler().commit()
+
         except Exception as e:
+            if self._record_polling_rate_limit(e):
+                return
             # Handle authentication errors by stopping execution
             error_message = str(e).lower()
             if "unauthorized" in error_message or "401" in error_message or "authentication" in error_message:
@@ -22,7 +22,8 @@ from lumibot.tools.lumibot_logger import get_logger, get_strategy_logger
 from ..data_sources import DataSource
 from ..entities import Asset, Order, Position, Quote
 from ..entities.chains import normalize_option_chains
-from ..trading_builtins import SafeList
+from ..trading_builtins import PollingReconciler, SafeList
+from ..tools.trade_event_log import TradeEventLog
 
 DEFAULT_CLEANUP_CONFIG = {
     "enabled": True,
@@ -70,6 +71,15 @@ class Broker(ABC):
     ERROR_ORDER = "error"
     PLACEHOLDER_ORDER = "placeholder"
 
+    # Polling brokers: the configured polling_interval is used while orders are working, this multiple of it when the
+    # account is flat, and rate limits back off exponentially up to POLLING_MAX_INTERVAL seconds.
+    POLLING_IDLE_MULTIPLIER = 3.0
+    POLLING_MAX_INTERVAL = 60.0
+    # Re-process every order in the broker's snapshot every N cycles, even the ones that have not changed.
+    POLLING_FULL_SYNC_EVERY = 60
+    # Dispatch tracked orders that disappeared from the broker's order list as canceled.
+    POLLING_CANCEL_MISSING_ORDERS = True
+
     def __init__(self, name="", connect_stream=True, data_source: DataSource = None, option_source: DataSource = None,
                  config=None, max_workers=20, extended_trading_minutes=0, cleanup_config=None):
         """Broker constructor"""
@@ -87,7 +97,11 @@ class Broker(ABC):
         self._filled_positions = SafeList(self._lock)
         self._subscribers = SafeList(self._lock)
         self._is_stream_subscribed = False
-        self._trade_event_log_df = pd.DataFrame()
+        self._trade_event_log = TradeEventLog()
+        # Live sessions can stream every trade event to a CSV/parquet file as it happens.
+        trade_events_stream_file = os.environ.get("TRADE_EVENTS_STREAM_FILE")
+        if trade_events_stream_file and not self.IS_BACKTESTING_BROKER:
+            self._trade_event_log.stream_to(trade_events_stream_file)
         self._hold_trade_events = False
         self._held_trades = []
         self._config = config
@@ -321,6 +335,10 @@ class Broker(ABC):
         if hasattr(self, '_stop_event'):
             self._stop_event.set()
 
+        # Write out any trade events still buffered for the stream file
+        if hasattr(self, '_trade_event_log'):
+            self._trade_event_log.close()
+
         # Stop the stream
         if hasattr(self, 'stream') and self.stream:
             try:
@@ -423,6 +441,197 @@ class Broker(ABC):
     def _run_stream(self):
         pass
 
+    # =========Polling reconciliation=======================
+
+    def _get_poll_reconciler(self):
+        """Return the ``PollingReconciler`` that diffs order snapshots and paces the polling stream."""
+        reconciler = getattr(self, "_polling_reconciler", None)
+        if reconciler is None:
+            base_interval = (
+                getattr(self, "polling_interval", None)
+                or getattr(getattr(self, "stream", None), "polling_interval", None)
+                or 5.0
+            )
+            reconciler = PollingReconciler(
+                base_interval,
+                idle_multiplier=self.POLLING_IDLE_MULTIPLIER,
+                max_interval=self.POLLING_MAX_INTERVAL,
+                full_sync_every=self.POLLING_FULL_SYNC_EVERY,
+            )
+            self._polling_reconciler = reconciler
+        return reconciler
+
+    def _poll_and_reconcile(self):
+        """
+        Run one polling cycle (``do_polling``) and set how long the polling stream waits before the next one.
+
+        Rate limit errors are swallowed and back the interval off; any other error is raised to the stream.
+        """
+        reconciler = self._get_poll_reconciler()
+        reconciler.start_cycle()
+        try:
+            self.do_polling()
+        except Exception as e:
+            if not self._record_polling_rate_limit(e):
+                raise
+        finally:
+            self._set_polling_interval(reconciler.finish_cycle(self._has_working_orders()))
+
+    def _record_polling_rate_limit(self, error) -> bool:
+        """Back the polling interval off if ``error`` is a rate limit. Returns True if it was one."""
+        is_rate_limit, retry_after = PollingReconciler.rate_limit_info(error)
+        if is_rate_limit:
+            reconciler = self._get_poll_reconciler()
+            reconciler.rate_limited(retry_after)
+            logger.warning(
+                f"{self.name} rate limited the order poll, next poll in {reconciler.next_interval(True):.1f}s: {error}"
+            )
+        return is_rate_limit
+
+    def _has_working_orders(self) -> bool:
+        return bool(
+            len(self._unprocessed_orders) or len(self._new_orders) or len(self._partially_filled_orders)
+        )
+
+    def _set_polling_interval(self, interval):
+        stream = getattr(self, "stream", None)
+        if stream is not None and hasattr(stream, "polling_interval"):
+            stream.polling_interval = interval
+
+    def _wake_polling(self):
+        """Switch a relaxed polling stream back to the working interval (called when an order becomes active)."""
+        reconciler = getattr(self, "_polling_reconciler", None)
+        if reconciler is not None:
+            self._set_polling_interval(reconciler.wake())
+
+    def _changed_polled_orders(self, raw_orders) -> list:
+        """
+        Return the raw orders that are new or changed since the last committed poll.
+
+        Call ``self._get_poll_reconciler().commit()`` once they have been processed; until then the same orders are
+        returned again by the next poll.
+        """
+        return self._get_poll_reconciler().changed(raw_orders, self._polled_order_key, self._polled_order_version)
+
+    def _polled_order_key(self, raw_order):
+        """Broker identifier of a raw order returned by ``_pull_broker_all_orders``."""
+        key = raw_order.get("id") if isinstance(raw_order, dict) else getattr(raw_order, "id", None)
+        return str(key) if key is not None else None
+
+    def _polled_order_version(self, raw_order):
+        """A value that changes whenever the raw order changes (by default a digest of the whole order)."""
+        return PollingReconciler.digest(raw_order)
+
+    def _parse_polled_order(self, raw_order):
+        """Parse a raw order from the broker's snapshot into an ``Order``."""
+        return self._parse_broker_order(raw_order, self._strategy_name)
+
+    def _polled_fill_values(self, order, raw_order):
+        """Return ``(price, quantity)`` of a polled order that the broker reports as filled."""
+        return order.avg_fill_price, order.quantity
+
+    def _polled_error_message(self, order, raw_order):
+        return f"{self.name} encountered an error with order {order.identifier} | {order}"
+
+    def _get_broker_id_from_raw_orders(self, raw_orders):
+        """Return every broker order identifier (parents and legs) in a raw order snapshot."""
+        return [key for key in map(self._polled_order_key, raw_orders) if key is not None]
+
+    def _reconcile_polled_orders(self, raw_orders):
+        """
+        Update Lumibot's orders from the broker's snapshot of all orders.
+
+        Only raw orders that are new or changed since the last poll are parsed. For each of them (children first, so
+        they are tracked before their parent) unknown orders are added, known orders get the broker's quantity,
+        dates, fill price and children, and status changes are dispatched to the stream. Finally, active tracked
+        orders that the broker no longer reports are dispatched as canceled (see ``POLLING_CANCEL_MISSING_ORDERS``).
+        """
+        reconciler = self._get_poll_reconciler()
+        changed = self._changed_polled_orders(raw_orders)
+        if changed:
+            stored_orders = {x.identifier: x for x in self.get_all_orders()}
+            for raw_order in changed:
+                order = self._parse_polled_order(raw_order)
+                if order is None:
+                    continue
+                # Process child orders first so they are tracked in the Lumi system before the parent order
+                for polled_order in [*order.child_orders, order]:
+                    self._reconcile_polled_order(polled_order, raw_order, stored_orders)
+
+        if self.POLLING_CANCEL_MISSING_ORDERS:
+            broker_ids = {str(order_id) for order_id in self._get_broker_id_from_raw_orders(raw_orders)}
+            for order in self.get_tracked_orders():
+                if str(order.identifier) not in broker_ids and order.is_active():
+                    # Likely the broker has simply stopped tracking the order. This is particularly true with Paper
+                    # Trading where orders are not tracked overnight.
+                    logger.debug(
+                        f"Poll Update: {self.name} no longer has order {order}, but Lumibot does. "
+                        f"Dispatching as cancelled."
+                    )
+                    self.stream.dispatch(self.CANCELED_ORDER, order=order)
+
+        reconciler.commit()
+
+    def _reconcile_polled_order(self, order, raw_order, stored_orders):
+        if order.identifier not in stored_orders:
+            # If it is the brokers first iteration then fully process the order because it is likely
+            # that the order was filled/canceled/etc before the strategy started.
+            if self._first_iteration:
+                if order.status == Order.OrderStatus.FILLED:
+                    self._process_new_order(order)
+                    self._process_filled_order(order, order.avg_fill_price, order.quantity)
+                elif order.status == Order.OrderStatus.CANCELED:
+                    self._process_new_order(order)
+                    self._process_canceled_order(order)
+                elif order.status == Order.OrderStatus.PARTIALLY_FILLED:
+                    self._process_new_order(order)
+                    self._process_partially_filled_order(order, order.avg_fill_price, order.quantity)
+                elif order.status == Order.OrderStatus.NEW:
+                    self._process_new_order(order)
+                elif order.status == Order.OrderStatus.ERROR:
+                    self._process_new_order(order)
+                    self._process_error_order(order, order.error_message)
+            else:
+                self._process_new_order(order)
+            return
+
+        # Always update quantity and children. Children can change as they are assigned an identifier for the
+        # first time.
+        stored_order = stored_orders[order.identifier]
+        stored_order.quantity = order.quantity
+        if order.broker_create_date is not None:
+            stored_order.broker_create_date = order.broker_create_date
+        if order.broker_update_date is not None:
+            stored_order.broker_update_date = order.broker_update_date
+        if order.avg_fill_price:
+            stored_order.avg_fill_price = order.avg_fill_price
+        stored_children = [stored_orders.get(o.identifier, o) for o in order.child_orders]
+        if stored_children:
+            stored_order.child_orders = stored_children
+
+        if order.equivalent_status(stored_order):
+            # Status hasn't changed, but make sure we use the broker's status. I.e. 'submitted' becomes 'open'
+            stored_order.status = order.status
+            return
+
+        # Polling is unable to track partial fills reliably (they often happen between two polls), so only
+        # completely filled orders are dispatched.
+        match order.status.lower():
+            case "submitted" | "open":
+                self.stream.dispatch(self.NEW_ORDER, order=stored_order)
+            case "fill":
+                fill_price, fill_qty = self._polled_fill_values(order, raw_order)
+                # Brokers can mark an order filled before the fill data is populated; wait for a later poll.
+                if fill_price is not None and fill_qty is not None:
+                    self.stream.dispatch(
+                        self.FILLED_ORDER, order=stored_order, price=fill_price, filled_quantity=fill_qty
+                    )
+            case "canceled":
+                self.stream.dispatch(self.CANCELED_ORDER, order=stored_order)
+            case "error":
+                msg = self._polled_error_message(order, raw_order)
+                self.stream.dispatch(self.ERROR_ORDER, order=stored_order, error_msg=msg)
+
     # =========Broker Positions=======================
 
     @abstractmethod
@@ -748,6 +957,53 @@ class Broker(ABC):
 
         return self.data_source.calculate_greeks(asset, asset_price, underlying_price, risk_free_rate)
 
+    def get_greeks_batch(self, assets, asset_prices, underlying_price, risk_free_rate, query_greeks=False):
+        """
+        Get the greeks of many option assets at once.
+
+        Parameters
+        ----------
+        assets : list of Asset
+            The option assets to get the greeks of.
+        asset_prices : list of float
+            The price of each option asset (``None`` where unknown).
+        underlying_price : float or list of float
+            The price of the underlying asset, shared by every option or one per option.
+        risk_free_rate : float
+            The risk-free rate used in interest calculations.
+        query_greeks : bool, optional
+            Whether to query the greeks from the broker first. Options the broker has no greeks for are calculated
+            locally.
+
+        Returns
+        -------
+        list of dict or None
+            The greeks of each option asset, in the order of ``assets``.
+        """
+        results = [None] * len(assets)
+        to_calculate = list(range(len(assets)))
+        if query_greeks:
+            to_calculate = []
+            for i, asset in enumerate(assets):
+                greeks = self.data_source.query_greeks(asset)
+                if greeks:
+                    results[i] = greeks
+                else:
+                    to_calculate.append(i)
+
+        if to_calculate:
+            if isinstance(underlying_price, (list, tuple)):
+                underlying_price = [underlying_price[i] for i in to_calculate]
+            calculated = self.data_source.calculate_greeks_batch(
+                [assets[i] for i in to_calculate],
+                [asset_prices[i] for i in to_calculate],
+                underlying_price,
+                risk_free_rate,
+            )
+            for i, greeks in zip(to_calculate, calculated):
+                results[i] = greeks
+        return results
+
     def get_multiplier(self, chains, exchange="SMART"):
         """Returns option chain for a particular exchange.
 
@@ -873,6 +1129,7 @@ class Broker(ABC):
         order.status = self.NEW_ORDER
         order.set_new()
         self._new_orders.append(order)
+        self._wake_polling()
         return order
 
     def _process_placeholder_order(self, order):
@@ -1778,16 +2035,40 @@ class Broker(ABC):
                 delattr(stored_order, "_price_source")
             except AttributeError:
                 pass
-        # Create a DataFrame with the new row
-        new_row_df = pd.DataFrame(new_row, index=[0])
+        # Append to the columnar log; the DataFrame is only built when _trade_event_log_df is read.
+        self._trade_event_log.append(new_row)
 
-        # Filter out empty or all-NA columns from new_row_df
-        new_row_df = new_row_df.dropna(axis=1, how="all")
+        return
 
-        # Concatenate the filtered new_row_df with the existing _trade_event_log_df
-        self._trade_event_log_df = pd.concat([self._trade_event_log_df, new_row_df], axis=0)
+    @property
+    def _trade_event_log_df(self):
+        """All trade events processed so far as a DataFrame (built on access and cached until the next event)."""
+        trade_event_log = self.__dict__.get("_trade_event_log")
+        if trade_event_log is None:
+            return pd.DataFrame()
+        return trade_event_log.to_dataframe()
+
+    @_trade_event_log_df.setter
+    def _trade_event_log_df(self, df):
+        self._trade_event_log = TradeEventLog.from_dataframe(df)
+
+    def stream_trade_events_to(self, path, flush_every=100):
+        """
+        Write every trade event to a file as it is processed, in addition to keeping it in memory.
 
-        return
+        Parameters
+        ----------
+        path : str
+            A ``.csv`` file (appended to) or a ``.parquet`` file (replaced). The ``TRADE_EVENTS_STREAM_FILE``
+            environment variable sets this for live brokers at startup.
+        flush_every : int
+            Number of events buffered between writes. Call ``flush_trade_events`` to force a write.
+        """
+        self._trade_event_log.stream_to(path, flush_every=flush_every)
+
+    def flush_trade_events(self):
+        """Write any buffered trade events to the stream file set with ``stream_trade_events_to``."""
+        self._trade_event_log.flush()
 
     def _launch_stream(self):
         """Set the asynchronous actions to be executed after
@@ -69,6 +69,8 @@ class InteractiveBrokersREST(Broker):
     """
 
     POLL_EVENT = PollingStream.POLL_EVENT
+    # Tracked orders missing from the IB order list are left alone rather than dispatched as canceled.
+    POLLING_CANCEL_MISSING_ORDERS = False
     NAME = "InteractiveBrokersREST"
 
     def __init__(self, config, data_source=None, poll_interval=5.0):
@@ -1062,7 +1064,7 @@ class InteractiveBrokersREST(Broker):
 
         @broker.stream.add_action(broker.POLL_EVENT)
         def on_trade_event_poll():
-            self.do_polling()
+            self._poll_and_reconcile()
 
         @broker.stream.add_action(broker.NEW_ORDER)
         def on_trade_event_new(order):
@@ -1162,84 +1164,16 @@ class InteractiveBrokersREST(Broker):
         # Pull the current IB positions and sync them with Lumibot's positions
         self.sync_positions(None)
 
-        # Get current orders from IB and dispatch them to the stream for processing
+        # Get current orders from IB and reconcile the ones that changed since the last poll
         raw_orders = self.data_source.get_broker_all_orders()
-        stored_orders = {x.identifier: x for x in self.get_all_orders()}
-
-        for order_raw in raw_orders:
-            order = self._parse_broker_order(order_raw, self._strategy_name)
-
-            # Process child orders first so they are tracked in the Lumi system
-            all_orders = [child for child in order.child_orders] + [order]
-
-            # Process all parent and child orders
-            for order in all_orders:
-                # First time seeing this order
-                if order.identifier not in stored_orders:
-                    if self._first_iteration:
-                        # Process existing orders on first poll
-                        if order.status == Order.OrderStatus.FILLED:
-                            self._process_new_order(order)
-                            self._process_filled_order(order, order.avg_fill_price, order.quantity)
-                        elif order.status == Order.OrderStatus.CANCELED:
-                            self._process_new_order(order)
-                            self._process_canceled_order(order)
-                        elif order.status == Order.OrderStatus.PARTIALLY_FILLED:
-                            self._process_new_order(order)
-                            self._process_partially_filled_order(order, order.avg_fill_price, order.quantity)
-                        elif order.status == Order.OrderStatus.NEW:
-                            self._process_new_order(order)
-                        elif order.status == Order.OrderStatus.ERROR:
-                            self._process_new_order(order)
-                            self._process_error_order(order, order.error_message)
-                    else:
-                        # Add to orders in lumibot
-                        self._process_new_order(order)
-                else:
-                    # Update existing order
-                    stored_order = stored_orders[order.identifier]
-                    stored_order.quantity = order.quantity
-                    stored_children = [stored_orders[o.identifier] if o.identifier in stored_orders else o
-                                    for o in order.child_orders]
-
-                    if stored_children:
-                        stored_order.child_orders = stored_children
-
-                    # Handle status changes
-                    if not order.equivalent_status(stored_order):
-                        match order.status.lower():
-                            case "submitted" | "open":
-                                self.stream.dispatch(self.NEW_ORDER, order=stored_order)
-                            case "fill":
-                                self.stream.dispatch(
-                                    self.FILLED_ORDER,
-                                    order=stored_order,
-                                    price=order.avg_fill_price,
-                                    filled_quantity=order.quantity
-                                )
-                            case "canceled":
-                                self.stream.dispatch(self.CANCELED_ORDER, order=stored_order)
-                            case "error":
-                                msg = f"IB encountered an error with order {order.identifier}"
-                                self.stream.dispatch(self.ERROR_ORDER, order=stored_order, error_msg=msg)
-                    else:
-                        stored_order.status = order.status
+        self._reconcile_polled_orders(raw_orders)
 
-        # Check for disappeared orders
-        tracked_orders = {x.identifier: x for x in self.get_tracked_orders()}
-        broker_ids = self._get_broker_id_from_raw_orders(raw_orders)
-        for order_id, order in tracked_orders.items():
-            if order_id not in broker_ids:
-                logger.debug(
-                    f"Poll Update: {self.name} no longer has order {order}, but Lumibot does. "
-                    f"Dispatching as cancelled."
-                )
-                # Only dispatch orders that have not been filled or cancelled. Likely the broker has simply
-                # stopped tracking them. This is particularly true with Paper Trading where orders are not tracked
-                # overnight.
-                if order.is_active():
-                    #self.stream.dispatch(self.CANCELED_ORDER, order=order)
-                    pass
+    def _polled_order_key(self, raw_order):
+        order_id = raw_order.get("orderId")
+        return str(order_id) if order_id is not None else None
+
+    def _polled_error_message(self, order, raw_order):
+        return f"IB encountered an error with order {order.identifier}"
 
     def _get_broker_id_from_raw_orders(self, raw_orders):
         """Extract all order IDs from raw orders including child orders"""
@@ -1078,24 +1078,7 @@ class Schwab(Broker):
 
         @broker.stream.add_action(broker.POLL_EVENT)
         def on_trade_event_poll():
-            # Implement polling similar to tradier.py without referencing _orders
-            try:
-                # Track the last time we synced positions to avoid doing it too frequently
-                current_time = datetime.now()
-                if not hasattr(broker, '_last_position_sync_time') or (current_time - broker._last_position_sync_time).total_seconds() > 30:
-                    # Only sync positions every 30 seconds to avoid duplication
-                    broker.sync_positions(None)
-                    broker._last_position_sync_time = current_time
-
-                # Always check for new orders
-                orders = broker._pull_broker_all_orders()
-                for order_data in orders:
-                    order = broker._parse_broker_order(order_data, broker._strategy_name)
-                    if order:
-                        # Process each new order without checking against a nonexistent _orders attribute
-                        broker._process_new_order(order)
-            except Exception:
-                logger.error(traceback.format_exc())
+            broker._poll_and_reconcile()
 
         @broker.stream.add_action(broker.FILLED_ORDER)
         def on_trade_event_fill(order, price, filled_quantity):
@@ -1131,6 +1114,36 @@ class Schwab(Broker):
             except Exception:
                 logger.error(traceback.format_exc())
 
+    def do_polling(self):
+        """
+        Called by the polling stream. Syncs positions and adds the orders that are new or changed at Schwab since
+        the last poll.
+        """
+        # Implement polling similar to tradier.py without referencing _orders
+        try:
+            # Track the last time we synced positions to avoid doing it too frequently
+            current_time = datetime.now()
+            if not hasattr(self, '_last_position_sync_time') or (current_time - self._last_position_sync_time).total_seconds() > 30:
+                # Only sync positions every 30 seconds to avoid duplication
+                self.sync_positions(None)
+                self._last_position_sync_time = current_time
+
+            # Always check for new orders, but only parse the ones that changed since the last poll
+            orders = self._pull_broker_all_orders()
+            for order_data in self._changed_polled_orders(orders):
+                order = self._parse_broker_order(order_data, self._strategy_name)
+                if order:
+                    # Process each new order without checking against a nonexistent _orders attribute
+                    self._process_new_order(order)
+            self._get_poll_reconciler().commit()
+        except Exception as e:
+            if not self._record_polling_rate_limit(e):
+                logger.error(traceback.format_exc())
+
+    def _polled_order_key(self, raw_order):
+        order_id = raw_order.get("orderId") if isinstance(raw_order, dict) else None
+        return str(order_id) if order_id is not None else None
+
     def _run_stream(self):
         self._stream_established()
         try:
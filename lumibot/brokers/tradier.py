@@ -818,130 +818,35 @@ class Tradier(Broker):
         # Pull the current Tradier positions and sync them with Lumibot's positions
         self.sync_positions(None)
 
-        # Get current orders from Tradier and dispatch them to the stream for processing. Need to see all
-        # lumi orders (not just active "tracked" ones) to catch any orders that might have changed final
-        # status in Tradier.
-        # df_orders = self.tradier.orders.get_orders()
+        # Get current orders from Tradier and reconcile them with Lumibot's orders. Need to see all lumi orders (not
+        # just active "tracked" ones) to catch any orders that might have changed final status in Tradier. Only the
+        # orders that changed since the last poll are parsed.
         raw_orders = self._pull_broker_all_orders()
-        stored_orders = {x.identifier: x for x in self.get_all_orders()}
-        for order_row in raw_orders:
-            order = self._parse_broker_order_dict(order_row, strategy_name=self._strategy_name)
-            # Process child orders first so they are tracked in the Lumi system before the parent order
-            all_orders = [child for child in order.child_orders] + [order]
-
-            # Process all parent and child orders
-            for order in all_orders:
-                # First time seeing this order, something weird has happened
-                if order.identifier not in stored_orders:
-                    # If it is the brokers first iteration then fully process the order because it is likely
-                    # that the order was filled/canceled/etc before the strategy started.
-                    if self._first_iteration:
-                        if order.status == Order.OrderStatus.FILLED:
-                            self._process_new_order(order)
-                            self._process_filled_order(order, order.avg_fill_price, order.quantity)
-                        elif order.status == Order.OrderStatus.CANCELED:
-                            self._process_new_order(order)
-                            self._process_canceled_order(order)
-                        elif order.status == Order.OrderStatus.PARTIALLY_FILLED:
-                            self._process_new_order(order)
-                            self._process_partially_filled_order(order, order.avg_fill_price, order.quantity)
-                        elif order.status == Order.OrderStatus.NEW:
-                            self._process_new_order(order)
-                        elif order.status == Order.OrderStatus.ERROR:
-                            self._process_new_order(order)
-                            self._process_error_order(order, order.error_message)
-                    else:
-                        # Add to order in lumibot.
-                        self._process_new_order(order)
-                else:
-                    # Always Update Quantity and Children. Children can change as they are assigned an identifier
-                    # for the first time.
-                    stored_order = stored_orders[order.identifier]
-                    stored_order.quantity = order.quantity  # Update the quantity in case it has changed
-                    stored_order.broker_create_date = order.broker_create_date
-                    stored_order.broker_update_date = order.broker_update_date
-                    if order.avg_fill_price:
-                        stored_order.avg_fill_price = order.avg_fill_price
-                    stored_children = [stored_orders[o.identifier] if o.identifier in stored_orders else o
-                                       for o in order.child_orders]
-                    stored_order.child_orders = stored_children
-
-                    # Status has changed since last time we saw it, dispatch the new status.
-                    #  - Polling methods are unable to track partial fills
-                    #     - Partial fills often happen quickly and it is highly likely that polling will miss some of them
-                    #     - Additionally, Lumi Order objects don't have a way to track quantity status changes and
-                    #        adjusting the average sell price can be tricky
-                    #     - Only dispatch filled orders if they are completely filled.
-                    if not order.equivalent_status(stored_order):
-                        match order.status.lower():
-                            case "submitted" | "open":
-                                self.stream.dispatch(self.NEW_ORDER, order=stored_order)
-                            case "partial_filled":
-                                # Not handled for polling, only dispatch completely filled orders
-                                pass
-                            case "fill":
-                                # Check if the order has an avg_fill_price, if not use the order_row price
-                                if order.avg_fill_price is None:
-                                    fill_price = order_row["avg_fill_price"]
-                                else:
-                                    fill_price = order.avg_fill_price
-
-                                # Check if the order has a quantity
-                                if order.quantity is None:
-                                    fill_qty = order_row["exec_quantity"]
-                                else:
-                                    fill_qty = order.quantity
-
-                                # For OCO orders - Parent order never gets filled values populated by Tradier API.
-                                # Need to look at the child orders to get the necessary fill values.
-                                if order.order_class == Order.OrderClass.OCO:
-                                    filled_children = [o for o in order.child_orders if o.is_filled()]
-                                    if filled_children:
-                                        fill_price = filled_children[0].avg_fill_price
-                                        fill_qty = filled_children[0].quantity
-
-                                # There's race condition where Tradier API is marking status=filled but has not yet
-                                # populated the avg_fill_price and other fill data. At some time in the future these
-                                # values will be filled in by Tradier, so do not trigger a 'filled' event until
-                                # all the needed data has been populated.
-                                if fill_price is not None and fill_qty is not None:
-                                    self.stream.dispatch(
-                                        self.FILLED_ORDER, order=stored_order, price=fill_price,
-                                        filled_quantity=fill_qty
-                                    )
-                            case "canceled":
-                                self.stream.dispatch(self.CANCELED_ORDER, order=stored_order)
-                            case "error":
-                                default_msg = f"{self.name} encountered an error with order {order.identifier} | {order}"
-                                msg = order_row["reason_description"] if "reason_description" in order_row else default_msg
-                                self.stream.dispatch(self.ERROR_ORDER, order=stored_order, error_msg=msg)
-                            case "cash_settled":
-                                # Don't know how to detect this case in Tradier.
-                                # Reference: https://documentation.tradier.com/brokerage-api/reference/response/orders
-                                # Theory:
-                                #  - Tradier will auto settle and create a new fill order for cash settled orders. Needs
-                                #    testing to confirm.
-                                pass
-                    else:
-                        # Status hasn't changed, but make sure we use the broker's status.
-                        # I.e. 'submitted' becomes 'open'
-                        stored_order.status = order.status
-
-        # See if there are any tracked (aka active) orders that are no longer in the broker's list,
-        # dispatch them as cancelled
-        tracked_orders = {x.identifier: x for x in self.get_tracked_orders()}
-        broker_ids = self._get_broker_id_from_raw_orders(raw_orders)
-        for order_id, order in tracked_orders.items():
-            if order_id not in broker_ids:
-                logger.debug(
-                    f"Poll Update: {self.name} no longer has order {order}, but Lumibot does. "
-                    f"Dispatching as cancelled."
-                )
-                # Only dispatch orders that have not been filled or cancelled. Likely the broker has simply
-                # stopped tracking them. This is particularly true with Paper Trading where orders are not tracked
-                # overnight.
-                if order.is_active():
-                    self.stream.dispatch(self.CANCELED_ORDER, order=order)
+        self._reconcile_polled_orders(raw_orders)
+
+    def _parse_polled_order(self, raw_order):
+        return self._parse_broker_order_dict(raw_order, strategy_name=self._strategy_name)
+
+    def _polled_fill_values(self, order, raw_order):
+        # Check if the order has an avg_fill_price / quantity, if not use the order_row values
+        fill_price = raw_order.get("avg_fill_price") if order.avg_fill_price is None else order.avg_fill_price
+        fill_qty = raw_order.get("exec_quantity") if order.quantity is None else order.quantity
+
+        # For OCO orders - Parent order never gets filled values populated by Tradier API.
+        # Need to look at the child orders to get the necessary fill values.
+        if order.order_class == Order.OrderClass.OCO:
+            filled_children = [o for o in order.child_orders if o.is_filled()]
+            if filled_children:
+                fill_price = filled_children[0].avg_fill_price
+                fill_qty = filled_children[0].quantity
+
+        # There's race condition where Tradier API is marking status=filled but has not yet populated the
+        # avg_fill_price and other fill data. A None value here makes the poll wait for a later snapshot.
+        return fill_price, fill_qty
+
+    def _polled_error_message(self, order, raw_order):
+        default_msg = f"{self.name} encountered an error with order {order.identifier} | {order}"
+        return raw_order["reason_description"] if "reason_description" in raw_order else default_msg
 
     def _get_broker_id_from_raw_orders(self, raw_orders):
         ids = []
@@ -967,7 +872,7 @@ class Tradier(Broker):
 
         @broker.stream.add_action(broker.POLL_EVENT)
         def on_trade_event_poll():
-            self.do_polling()
+            self._poll_and_reconcile()
 
         @broker.stream.add_action(broker.NEW_ORDER)
         def on_trade_event_new(order):
@@ -181,7 +181,8 @@ class OptionsHelper:
                         data_source = getattr(broker, "data_source", None) if broker is not None else None
                         prefer_actionable = (
                             data_source is not None
-                            and data_source.__class__.__name__ == "ThetaDataBacktestingPandas"
+                            and data_source.__class__.__name__
+                            in ("ThetaDataBacktestingPandas", "ThetaDataBacktestingPolars")
                         )
 
                     max_spread_pct = None
@@ -332,6 +333,28 @@ class OptionsHelper:
         self.strategy.log_message("Exceeded maximum attempts to find a valid option.", color="red")
         return None
 
+    def _prefetch_strikes(self, underlying_asset: Asset, expiry: date, strikes: List[float], right: str) -> None:
+        """Ask the backtesting data source to load the contracts of a strike scan concurrently, before the scan
+        prices them one by one. Nothing happens in live trading or when the data source has no bulk loader."""
+        prefetch = getattr(self.strategy, "prefetch_data", None)
+        if not callable(prefetch) or len(strikes) < 2:
+            return
+        contracts = [
+            Asset(
+                underlying_asset.symbol,
+                asset_type="option",
+                expiration=expiry,
+                strike=strike,
+                right=right,
+                underlying_asset=underlying_asset,
+            )
+            for strike in strikes
+        ]
+        try:
+            prefetch(contracts)
+        except Exception as e:
+            logger.debug(f"Prefetching {len(contracts)} {underlying_asset.symbol} contracts failed: {e}")
+
     def get_strike_deltas(self, underlying_asset: Asset, expiry: date, strikes: List[float],
                           right: str, stop_greater_than: Optional[float] = None,
                           stop_less_than: Optional[float] = None) -> Dict[float, Optional[float]]:
@@ -361,6 +384,9 @@ class OptionsHelper:
         self.strategy.log_message(f"Computing strike deltas for {underlying_asset.symbol} at expiry {expiry}.", color="blue")
         strike_deltas: Dict[float, Optional[float]] = {}
         underlying_price = self.strategy.get_last_price(underlying_asset)
+        if stop_greater_than is None and stop_less_than is None:
+            # Every strike will be priced; with a stop condition the scan may end early, so load lazily.
+            self._prefetch_strikes(underlying_asset, expiry, strikes, right)
         for strike in strikes:
             option = Asset(
                 underlying_asset.symbol,
@@ -520,7 +546,9 @@ class OptionsHelper:
         elif option_type.startswith("P"):
             option_type = "PUT"
 
-        if chains:
+        if isinstance(chains, Chains) and chains:
+            candidate_strikes = [s for s in chains.strike_array(expiry, option_type).tolist() if s > 0]
+        elif chains:
             strikes_raw = []
             try:
                 strikes_raw = chains.strikes(expiry, option_type)
@@ -561,6 +589,7 @@ class OptionsHelper:
         closest_strike: Optional[float] = None
         closest_delta: Optional[float] = None
 
+        self._prefetch_strikes(underlying_asset, expiry, candidate_strikes, right)
         for strike in candidate_strikes:
             self.strategy.log_message(
                 f"🔎 Trying strike {strike:g} (range: {strike_min:.2f}-{strike_max:.2f})",
@@ -960,7 +989,11 @@ class OptionsHelper:
             underlying_symbol = chains_map['UnderlyingSymbol']
 
         # Convert string expiries to dates for comparison
-        expiration_dates: List[Tuple[str, date]] = _try_resolve_expiration(specific_chain)
+        if isinstance(chains, Chains) and specific_chain is chains.get("Chains", {}).get(call_or_put_caps):
+            # Chains keeps its expirations sorted, no need to parse and sort them again.
+            expiration_dates: List[Tuple[str, date]] = chains.expiration_items(call_or_put_caps)
+        else:
+            expiration_dates = _try_resolve_expiration(specific_chain)
         future_candidates = [(s, d) for s, d in expiration_dates if d >= dt]
 
         # Log chain search (DEBUG level for details)
@@ -1027,37 +1060,55 @@ class OptionsHelper:
             except Exception:
                 underlying_price = None
 
-        def _validate_candidates(candidates: List[Tuple[str, date]]) -> Optional[date]:
-            for exp_str, exp_date in candidates:
-                strikes = specific_chain.get(exp_str)
-                if not strikes:
+        sorted_chains = chains_map if isinstance(chains_map, Chains) else None
+        if sorted_chains is not None and specific_chain is not sorted_chains.get("Chains", {}).get(call_or_put_caps):
+            sorted_chains = None
+
+        def _sorted_strikes(exp_str: str) -> List[float]:
+            if sorted_chains is not None:
+                return sorted_chains.strike_array(exp_str, call_or_put_caps).tolist()
+
+            strikes = specific_chain.get(exp_str)
+            if not strikes:
+                return []
+            strike_candidates: List[float] = []
+            try:
+                iterable = strikes if isinstance(strikes, (list, tuple, set)) else list(strikes)
+            except Exception:
+                iterable = strikes
+            for raw_strike in iterable:
+                try:
+                    strike_candidates.append(float(raw_strike))
+                except (TypeError, ValueError):
                     continue
+            strike_candidates.sort()
+            return strike_candidates
 
+        def _validate_candidates(candidates: List[Tuple[str, date]]) -> Optional[date]:
+            for exp_str, exp_date in candidates:
                 # Prefer a strike near the underlying's current price for validation.
                 # Middle-of-chain can be far OTM when chains include very wide strike ranges,
                 # leading to false "no data" results during backtests.
-                strike_candidates: List[float] = []
-                try:
-                    iterable = strikes if isinstance(strikes, (list, tuple, set)) else list(strikes)
-                except Exception:
-                    iterable = strikes
-                for raw_strike in iterable:
-                    try:
-                        strike_candidates.append(float(raw_strike))
-                    except (TypeError, ValueError):
-                        continue
+                strike_candidates = _sorted_strikes(exp_str)
                 if not strike_candidates:
                     continue
-                strike_candidates.sort()
                 if underlying_price is not None:
-                    near_strikes = [
-                        s
-                        for s in strike_candidates
-                        if (underlying_price * 0.5) <= s <= (underlying_price * 1.5)
-                    ]
-                    if not near_strikes:
-                        continue
-                    test_strike = min(near_strikes, key=lambda s: abs(s - underlying_price))
+                    if sorted_chains is not None:
+                        near_strikes = sorted_chains.strikes_in_range(
+                            exp_str, underlying_price * 0.5, underlying_price * 1.5, call_or_put_caps
+                        )
+                        if len(near_strikes) == 0:
+                            continue
+                        test_strike = sorted_chains.nearest_strike(exp_str, underlying_price, call_or_put_caps)
+                    else:
+                        near_strikes = [
+                            s
+                            for s in strike_candidates
+                            if (underlying_price * 0.5) <= s <= (underlying_price * 1.5)
+                        ]
+                        if not near_strikes:
+                            continue
+                        test_strike = min(near_strikes, key=lambda s: abs(s - underlying_price))
                 else:
                     test_strike = strike_candidates[len(strike_candidates) // 2]
 
@@ -1837,12 +1888,37 @@ class OptionsHelper:
         self.strategy.log_message("Aggregating portfolio greeks.", color="blue")
         total_delta = total_gamma = total_theta = total_vega = 0.0
         underlying_price = self.strategy.get_last_price(underlying_asset)
-        for pos in positions:
-            option = pos.asset
+        option_positions = [pos for pos in positions if getattr(pos.asset, "asset_type", None) == "option"]
+
+        # Price every option, then compute all of their greeks in one batch.
+        greeks_by_position = None
+        broker = getattr(self.strategy, "broker", None)
+        if option_positions and hasattr(broker, "get_greeks_batch"):
             try:
-                greeks = self.strategy.get_greeks(option, underlying_price=underlying_price)
+                options = [pos.asset for pos in option_positions]
+                prices = self.strategy.get_last_prices(options)
+                greeks_by_position = broker.get_greeks_batch(
+                    options,
+                    [prices.get(option) for option in options],
+                    underlying_price,
+                    self.strategy.risk_free_rate,
+                )
             except Exception as e:
-                self.strategy.log_message(f"Error getting greeks for {option.symbol}: {e}", color="red")
+                self.strategy.log_message(f"Error getting greeks in one batch, retrying per option: {e}", color="red")
+                greeks_by_position = None
+
+        for k, pos in enumerate(option_positions):
+            option = pos.asset
+            if greeks_by_position is not None:
+                greeks = greeks_by_position[k]
+            else:
+                try:
+                    greeks = self.strategy.get_greeks(option, underlying_price=underlying_price)
+                except Exception as e:
+                    self.strategy.log_message(f"Error getting greeks for {option.symbol}: {e}", color="red")
+                    continue
+            if not greeks:
+                self.strategy.log_message(f"Greeks unavailable for {option.symbol}; skipping it.", color="red")
                 continue
             quantity = pos.quantity
             total_delta += greeks.get("delta", 0) * quantity
@@ -1,23 +1,17 @@
 import datetime
-import traceback
+import os
+import threading
+import uuid
 from datetime import timedelta
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
-from scipy import stats
-import traceback
-import datetime
-
-# Fix for NumPy 2.0+ compatibility with pandas_ta
-import numpy as np
 
-# pandas_ta 0.3.14b uses numpy.NaN which was removed in NumPy 2.0
-# Create alias for backward compatibility if needed
-if not hasattr(np, 'NaN'):
-    np.NaN = np.nan
+from lumibot.constants import LUMIBOT_CACHE_FOLDER
+from lumibot.tools.lumibot_logger import get_logger
 
-# Import pandas-ta-classic
-import pandas_ta_classic as ta
+logger = get_logger(__name__)
 
 """ 
     Description
@@ -25,9 +19,144 @@ import pandas_ta_classic as ta
 
     This is a general component for working with the VIX. It can be used to check the 
     VIX, VIX 1D, VIX RSI, VIX percentile values and more.
+
+    The daily history of each index (VIX, VIX 1D and GVZ) is downloaded from Yahoo at most once per day and shared
+    by every helper of the process, through a parquet file in the lumibot cache folder and an in-memory copy. The
+    rolling features (percentile, RSI, min and max) are computed over the whole history at once the first time a
+    window is used, so during a backtest each check is a binary search on the dates and an array read.
 """
 
+# Yahoo symbols of the indexes, by the name used for their cache files and helper attributes.
+INDEX_SYMBOLS = {"vix": "^VIX", "vix_1d": "^VIX1D", "gvz": "^GVZ"}
+INDEX_LABELS = {"vix": "VIX", "vix_1d": "VIX 1D", "gvz": "GVZ"}
+
+_DAY_NS = 24 * 60 * 60 * 1_000_000_000
+
+# Histories shared by all the helpers of the process, by index name.
+_shared_series = {}
+_shared_series_lock = threading.Lock()
+
+
+def _window_offsets(starts):
+    """Yield, for ``offset = 0, 1, ...``, the row ``offset`` rows before each row and whether it is in its window."""
+    rows = np.arange(len(starts))
+    sizes = rows - starts + 1
+    for offset in range(int(sizes.max(initial=0))):
+        yield np.maximum(rows - offset, 0), offset < sizes
+
+
+def _nan_where_missing(result, values, starts):
+    missing = np.concatenate(([0], np.cumsum(np.isnan(values))))
+    result[missing[1:] - missing[starts] > 0] = np.nan
+    return result
+
+
+def _rolling_percentile(values, starts):
+    """``scipy.stats.percentileofscore(window, values[i])`` for the window ending at each row."""
+    below = np.zeros(len(values))
+    at_or_below = np.zeros(len(values))
+    for previous, valid in _window_offsets(starts):
+        below += valid & (values[previous] < values)
+        at_or_below += valid & (values[previous] <= values)
+    sizes = np.arange(len(values)) - starts + 1
+    percentile = (below + at_or_below + (at_or_below > below)) * (50.0 / sizes)
+    return _nan_where_missing(percentile, values, starts)
+
+
+def _rolling_extreme(values, starts, combine):
+    result = values.copy()
+    for previous, valid in _window_offsets(starts):
+        result = np.where(valid, combine(result, values[previous]), result)
+    return result
+
+
+def _rolling_rsi(values, starts, length):
+    """``rsi_values(window, length)[-1]`` for the window ending at each row, NaN if the window is too short."""
+    count = len(values)
+    sizes = np.arange(count) - starts + 1
+    change = np.diff(values, prepend=np.nan)
+    gains, losses = np.maximum(change, 0.0), np.maximum(-change, 0.0)
+
+    # Same operations, in the same order, as the Wilder averages of ``rsi_values``: the sum of the first ``length``
+    # changes of the window divided by ``length``, then one smoothing step per later change.
+    gain, loss = np.zeros(count), np.zeros(count)
+    for step in range(1, length + 1):
+        at = np.minimum(starts + step, count - 1)
+        gain, loss = gain + gains[at], loss + losses[at]
+    gain, loss = gain / length, loss / length
+    for step in range(length + 1, int(sizes.max(initial=0))):
+        valid = step < sizes
+        at = np.minimum(starts + step, count - 1)
+        gain = np.where(valid, gain + (gains[at] - gain) / length, gain)
+        loss = np.where(valid, loss + (losses[at] - loss) / length, loss)
+
+    total = gain + loss
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100.0 * gain / total
+    rsi[(sizes <= length) | (total == 0)] = np.nan
+    return rsi
+
+
+class _IndexSeries:
+    """The daily history of one index as NumPy arrays, with its rolling features computed once per window."""
+
+    def __init__(self, frame, loaded_on):
+        self.frame = frame
+        index = pd.DatetimeIndex(frame.index)
+        self.tz = index.tz
+        self.timestamps = index.asi8
+        self.columns = {column: frame[column].to_numpy(dtype=float) for column in ("Open", "Close")}
+        self.loaded_on = loaded_on
+        self._starts = {}
+        self._features = {}
+
+    def position(self, dt, use_open=False):
+        """Row of the value known at ``dt``: the open of the day, or the close of the day before to avoid lookahead."""
+        timestamp = pd.Timestamp(dt if use_open else dt - timedelta(days=1))
+        if self.tz is not None and timestamp.tzinfo is None:
+            timestamp = timestamp.tz_localize(self.tz)
+        elif self.tz is None and timestamp.tzinfo is not None:
+            timestamp = timestamp.tz_localize(None)
+        position = int(np.searchsorted(self.timestamps, timestamp.value, side="right")) - 1
+        if position < 0:
+            raise KeyError(f"no data on or before {timestamp}")
+        return position
+
+    def window_starts(self, window):
+        """First row of the ``window`` calendar days that end at each row (both ends included)."""
+        starts = self._starts.get(window)
+        if starts is None:
+            starts = np.searchsorted(self.timestamps, self.timestamps - window * _DAY_NS, side="left")
+            self._starts[window] = starts
+        return starts
+
+    def window_values(self, column, position, window):
+        return self.columns[column][self.window_starts(window)[position]:position + 1]
+
+    def feature(self, kind, column, window):
+        key = (kind, column, window)
+        values = self._features.get(key)
+        if values is None:
+            data = self.columns[column]
+            if kind == "percentile":
+                values = _rolling_percentile(data, self.window_starts(window))
+            elif kind == "rsi":
+                # 60% more calendar days than RSI periods because of weekends and holidays
+                values = _rolling_rsi(data, self.window_starts(int(window * 1.6)), window)
+            elif kind == "min":
+                values = _rolling_extreme(data, self.window_starts(window), np.fmin)
+            elif kind == "max":
+                values = _rolling_extreme(data, self.window_starts(window), np.fmax)
+            else:
+                raise ValueError(f"Unknown feature {kind!r}, use 'percentile', 'rsi', 'min' or 'max'")
+            self._features[key] = values
+        return values
+
+
 class VixHelper:
+    # Folder of the shared parquet cache of the index histories.
+    CACHE_FOLDER = os.path.join(LUMIBOT_CACHE_FOLDER, "vix")
+
     def __init__(self, strategy) -> None:
         """ 
             Initialize the VIX helper with the given strategy.
@@ -48,6 +177,127 @@ class VixHelper:
         self.last_historical_vix_1d_update = None
         self.last_historical_gvz_update = None
 
+    @staticmethod
+    def clear_cache():
+        """Forget the histories loaded in memory. They are read again from the parquet cache or Yahoo when needed."""
+        with _shared_series_lock:
+            _shared_series.clear()
+
+    @staticmethod
+    def _load_history(name, today):
+        path = os.path.join(VixHelper.CACHE_FOLDER, f"{name}.parquet")
+        try:
+            if datetime.date.fromtimestamp(os.path.getmtime(path)) == today:
+                return pd.read_parquet(path)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Could not read the cached {INDEX_LABELS[name]} history {path}: {e}")
+
+        history = yf.Ticker(INDEX_SYMBOLS[name]).history(period="max")
+        if history is None or len(history) == 0:
+            raise ValueError(f"No {INDEX_LABELS[name]} history returned by Yahoo")
+        history.index = pd.to_datetime(history.index)
+        history = history[["Open", "Close"]]
+
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            os.makedirs(VixHelper.CACHE_FOLDER, exist_ok=True)
+            history.to_parquet(tmp_path)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not cache the {INDEX_LABELS[name]} history in {path}: {e}")
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return history
+
+    def _index_series(self, name):
+        """
+        Get the shared history of an index, downloaded at most once per day for all the helpers.
+
+        Returns
+        -------
+        tuple
+            The ``_IndexSeries`` and whether this helper had not used it yet today.
+        """
+        today = datetime.date.today()
+        with _shared_series_lock:
+            series = _shared_series.get(name)
+            if series is None or series.loaded_on != today:
+                series = _IndexSeries(self._load_history(name, today), today)
+                _shared_series[name] = series
+
+        last_update = getattr(self, f"last_historical_{name}_update")
+        refreshed = last_update is None or last_update.date() != today
+        if refreshed:
+            setattr(self, f"historical_{name}", series.frame)
+            setattr(self, f"last_historical_{name}_update", datetime.datetime.now())
+        return series, refreshed
+
+    def _index_value(self, name, dt, use_open=False):
+        series, refreshed = self._index_series(name)
+        value = float(series.columns["Open" if use_open else "Close"][series.position(dt, use_open)])
+
+        if refreshed:
+            # Add a marker to the chart to show the index value
+            self.strategy.add_marker(f"{name}_value", value=value, symbol="square", color="blue")
+
+        return value
+
+    def _index_values(self, name, dt, window, use_open=False):
+        if window is None or dt is None:
+            return None
+
+        try:
+            series, _ = self._index_series(name)
+            column = "Open" if use_open else "Close"
+            return series.window_values(column, series.position(dt, use_open), window).tolist()
+        except Exception as e:
+            self.strategy.log_message(
+                f"ERROR: Failed to fetch live {INDEX_LABELS[name]} values: {e}", color="red", broadcast=True
+            )
+            return None
+
+    def get_index_feature(self, index, feature, dt, window, use_open=False):
+        """
+        Get a rolling feature of the VIX, VIX 1D or GVZ at the given datetime.
+
+        The feature is computed for the whole history the first time a window is used, then looked up.
+
+        Parameters
+        ----------
+        index : str
+            The index: "vix", "vix_1d" or "gvz".
+        feature : str
+            "percentile" (of the current value among the values of the window), "rsi", "min" or "max".
+        dt : datetime.datetime
+            The datetime to get the feature at. The close of the day before is used unless ``use_open`` is True.
+        window : int
+            The window in calendar days, or the number of periods of the RSI.
+        use_open : bool
+            Whether to use the open price of the day instead of the close of the day before.
+
+        Returns
+        -------
+        float
+            The value of the feature, or None if it is not available.
+        """
+        if dt is None or window is None:
+            return None
+
+        try:
+            series, _ = self._index_series(index)
+            column = "Open" if use_open else "Close"
+            value = series.feature(feature, column, window)[series.position(dt, use_open)]
+        except Exception as e:
+            self.strategy.log_message(
+                f"ERROR: Failed to get the {INDEX_LABELS.get(index, index)} {feature}: {e}", color="red", broadcast=True
+            )
+            return None
+
+        return None if np.isnan(value) else float(value)
+
     def check_max_vix_1d(self, dt, max_vix_1d, use_open=False):
         """
         Check if the VIX 1D is too high. If it is, log a message, add a marker to the chart, and return True.
@@ -207,29 +457,11 @@ class VixHelper:
         float
             The VIX percentile value.
         """
-        # Check if dt is not None
-        if dt is None:
-            return None
-
-        # Check if window is not None
-        if window is None:
-            return None
-
-        # Get the VIX values for the window
-        vix_values = self.get_vix_values(dt, window, use_open=use_open)
-
-        # Check if vix_values is not None
-        if vix_values is None or len(vix_values) == 0:
-            return None
-
-        # Get the current VIX value
-        vix = self.get_vix_value(dt, use_open=use_open)
-        if vix is None:
+        # Get the percentile of the VIX value among the VIX values of the window
+        vix_percentile = self.get_index_feature("vix", "percentile", dt, window, use_open=use_open)
+        if vix_percentile is None:
             return None
 
-        # Get the VIX percentile value
-        vix_percentile = stats.percentileofscore(vix_values, vix)
-
         # Add a marker to the chart
         self.strategy.add_marker(
             "vix_percentile", symbol="square", color="blue", value=vix_percentile, detail_text=f"VIX percentile: {vix_percentile}"
@@ -402,30 +634,8 @@ class VixHelper:
         float
             The VIX RSI value.
         """
-        # Check if dt is not None
-        if dt is None:
-            return None
-
-        # Data window. Get a 60% larger window for the VIX RSI calculation because of weekends and holidays
-        download_window = int(window * 1.6)
-
-        # Get the VIX values for the window
-        vix_values = self.get_vix_values(dt, download_window, use_open=use_open)
-
-        # Check if vix_values is not None
-        if vix_values is None or len(vix_values) == 0:
-            return None
-
-        # Convert the list to a pandas DataFrame
-        vix_df = pd.DataFrame(vix_values, columns=['VIX'])
-
-        # Calculate the RSI
-        vix_df['RSI'] = ta.rsi(vix_df['VIX'], length=window)
-
-        # Get the last VIX RSI value
-        vix_rsi = vix_df['RSI'].iloc[-1]
-
-        return vix_rsi
+        # Wilder's RSI (the same as pandas_ta.rsi) over 60% more days than the window because of weekends and holidays
+        return self.get_index_feature("vix", "rsi", dt, window, use_open=use_open)
 
     def get_vix_values(self, dt, window, use_open=False):
         """
@@ -445,80 +655,7 @@ class VixHelper:
         list
             The VIX values for the window.
         """
-        # Check if the window is None
-        if window is None:
-            return None
-
-        # Check if the current date is None
-        if dt is None:
-            return None
-
-        # If the current date is None, then return a super high value so it doesn't trigger trades
-        if dt is None:
-            return None
-
-        try:
-            # Get the actual dt for the current date to speed this up for backtesting
-            actual_dt = datetime.datetime.now()
-
-            # Subtract one day to get the previous day's date to avoid lookahead bias
-            previous_dt = dt - timedelta(days=1)
-
-            # Get today as a Timestamp
-            today_date = pd.Timestamp(dt)
-
-            # Get previous date as a Timestamp
-            previous_date = pd.Timestamp(previous_dt)
-
-            # --- FIX: Normalize tz-awareness for index and lookup datetimes ---
-            if hasattr(self, 'historical_vix'):
-                idx = self.historical_vix.index
-                if idx.tz is not None and today_date.tzinfo is None:
-                    today_date = today_date.tz_localize(idx.tz)
-                    previous_date = previous_date.tz_localize(idx.tz)
-                elif idx.tz is None and today_date.tzinfo is not None:
-                    today_date = today_date.tz_localize(None)
-                    previous_date = previous_date.tz_localize(None)
-            # --- END FIX ---
-
-            # Check if the historical VIX data is up to date
-            if self.last_historical_vix_update is not None and self.last_historical_vix_update.date() == actual_dt.date():
-                # If we are using the open price, then return the open price for today
-                if use_open:
-                    # Get the row closest to today
-                    nearest_date = self.historical_vix.index.asof(today_date)
-                    vix_values = self.historical_vix.loc[nearest_date - timedelta(days=window):nearest_date]['Open'].tolist()
-                    return vix_values
-                else:
-                    # Get the row closest to the previous date
-                    nearest_date = self.historical_vix.index.asof(previous_date)
-                    vix_values = self.historical_vix.loc[nearest_date - timedelta(days=window):nearest_date]['Close'].tolist()
-                    return vix_values
-
-            vix = yf.Ticker("^VIX")
-            self.historical_vix = vix.history(period="max")
-
-            # Set the Date column as the index
-            self.historical_vix.index = pd.to_datetime(self.historical_vix.index)
-
-            # Set the last historical VIX date as the current date
-            self.last_historical_vix_update = actual_dt
-
-            # If we are using the open price, then return the open price for today
-            if use_open:
-                # Get the row closest to today
-                nearest_date = self.historical_vix.index.asof(today_date)
-                vix_values = self.historical_vix.loc[nearest_date - timedelta(days=window):nearest_date]['Open'].tolist()
-                return vix_values
-            else:
-                # Get the row closest to the previous date
-                nearest_date = self.historical_vix.index.asof(previous_date)
-                vix_values = self.historical_vix.loc[nearest_date - timedelta(days=window):nearest_date]['Close'].tolist()
-                return vix_values
-
-        except Exception as e:
-            self.strategy.log_message(f"ERROR: Failed to fetch live VIX values: {e}", color="red", broadcast=True)
-            return None
+        return self._index_values("vix", dt, window, use_open=use_open)
 
     def get_vix_value(self, current_dt=None, use_open=False):
         """
@@ -537,66 +674,12 @@ class VixHelper:
             The VIX value for the current date.
         """
 
-        # If the current date is None, then return a super high value so it doesn't trigger trades
+        # If the current date is None, then return None so it doesn't trigger trades
         if current_dt is None:
             return None
 
         try:
-            # Get the actual dt for the current date to speed this up for backtesting
-            actual_dt = datetime.datetime.now()
-
-            # Subtract one day to get the previous day's date
-            previous_dt = current_dt - timedelta(days=1)
-
-            # Get today as a Timestamp
-            today_date = pd.Timestamp(current_dt)
-
-            # Get previous date as a Timestamp
-            previous_date = pd.Timestamp(previous_dt)
-
-            # Check if the historical VIX data is up to date
-            if self.last_historical_vix_update is not None and self.last_historical_vix_update.date() == actual_dt.date():
-                # If we are using the open price, then return the open price for today
-                if use_open:
-                    # Get the row closest to today
-                    nearest_date = self.historical_vix.index.asof(today_date)
-                    vix_val = self.historical_vix.loc[nearest_date]['Open']
-                    return vix_val
-                else:
-                    # Get the row closest to the previous date
-                    nearest_date = self.historical_vix.index.asof(previous_date)
-                    vix_val = self.historical_vix.loc[nearest_date]['Close']
-                    return vix_val
-
-            vix = yf.Ticker("^VIX")
-            self.historical_vix = vix.history(period="max")
-
-            # Set the Date column as the index
-            self.historical_vix.index = pd.to_datetime(self.historical_vix.index)
-
-            # Set the last historical VIX date as the current date
-            self.last_historical_vix_update = actual_dt
-
-            # If we are using the open price, then return the open price for today
-            if use_open:
-                # Get the row closest to today
-                nearest_date = self.historical_vix.index.asof(today_date)
-                vix_val = self.historical_vix.loc[nearest_date]['Open']
-            else:
-                # Get the row closest to the previous date
-                nearest_date = self.historical_vix.index.asof(previous_date)
-                vix_val = self.historical_vix.loc[nearest_date]['Close']
-
-            # Add a marker to the chart to show the VIX value
-            self.strategy.add_marker(
-                "vix_value",
-                value=vix_val,
-                symbol="square",
-                color="blue",
-            )
-
-            return vix_val
-
+            return self._index_value("vix", current_dt, use_open=use_open)
         except Exception as e:
             self.strategy.log_message(f"ERROR: Failed to fetch live VIX value: {e}", color="red", broadcast=True)
             return None  # Return None if unable to fetch
@@ -623,74 +706,8 @@ class VixHelper:
             return 1000
 
         try:
-            # Get the actual dt for the current date to speed this up for backtesting
-            actual_dt = datetime.datetime.now()
-
-            # Subtract one day to get the previous day's date
-            previous_dt = current_dt - timedelta(days=1)
-
-            # Get today as a Timestamp
-            today_date = pd.Timestamp(current_dt)
-
-            # Get previous date as a Timestamp
-            previous_date = pd.Timestamp(previous_dt)
-
-            # --- FIX: Normalize tz-awareness for index and lookup datetimes ---
-            if hasattr(self, 'historical_vix_1d'):
-                idx = self.historical_vix_1d.index
-                if idx.tz is not None and today_date.tzinfo is None:
-                    today_date = today_date.tz_localize(idx.tz)
-                    previous_date = previous_date.tz_localize(idx.tz)
-                elif idx.tz is None and today_date.tzinfo is not None:
-                    today_date = today_date.tz_localize(None)
-                    previous_date = previous_date.tz_localize(None)
-            # --- END FIX ---
-
-            # Check if the historical VIX 1D data is up to date
-            if self.last_historical_vix_1d_update is not None and self.last_historical_vix_1d_update.date() == actual_dt.date():
-                # If we are using the open price, then return the open price for today
-                if use_open:
-                    # Get the row closest to today
-                    nearest_date = self.historical_vix_1d.index.asof(today_date)
-                    vix_val = self.historical_vix_1d.loc[nearest_date]['Open']
-                    return vix_val
-                else:
-                    # Get the row closest to the previous date
-                    nearest_date = self.historical_vix_1d.index.asof(previous_date)
-                    vix_val = self.historical_vix_1d.loc[nearest_date]['Close']
-                    return vix_val
-
-            vix_1d = yf.Ticker("^VIX1D")
-            self.historical_vix_1d = vix_1d.history(period="max")
-
-            # Set the Date column as the index
-            self.historical_vix_1d.index = pd.to_datetime(self.historical_vix_1d.index)
-
-            # Set the last historical VIX 1D date as the current date
-            self.last_historical_vix_1d_update = actual_dt
-
-            # If we are using the open price, then return the open price for today
-            if use_open:
-                # Get the row closest to today
-                nearest_date = self.historical_vix_1d.index.asof(today_date)
-                vix_val = self.historical_vix_1d.loc[nearest_date]['Open']
-            else:
-                # Get the row closest to the previous date
-                nearest_date = self.historical_vix_1d.index.asof(previous_date)
-                vix_val = self.historical_vix_1d.loc[nearest_date]['Close']
-
-            # Add a marker to the chart to show the VIX 1D value
-            self.strategy.add_marker(
-                "vix_1d_value",
-                value=vix_val,
-                symbol="square",
-                color="blue",
-            )
-
-            return vix_val
-
+            return self._index_value("vix_1d", current_dt, use_open=use_open)
         except Exception as e:
-            # Get the traceback
             self.strategy.log_message(f"ERROR: Failed to fetch live VIX 1D value: {e}", color="red", broadcast=True)
             return 1000
 
@@ -716,76 +733,9 @@ class VixHelper:
             return 1000
 
         try:
-            # Get the actual dt for the current date to speed this up for backtesting
-            actual_dt = datetime.datetime.now()
-
-            # Subtract one day to get the previous day's date
-            previous_dt = current_dt - timedelta(days=1)
-
-            # Get today as a Timestamp
-            today_date = pd.Timestamp(current_dt)
-
-            # Get previous date as a Timestamp
-            previous_date = pd.Timestamp(previous_dt)
-
-            # --- FIX: Normalize tz-awareness for index and lookup datetimes ---
-            if hasattr(self, 'historical_gvz'):
-                idx = self.historical_gvz.index
-                if idx.tz is not None and today_date.tzinfo is None:
-                    today_date = today_date.tz_localize(idx.tz)
-                    previous_date = previous_date.tz_localize(idx.tz)
-                elif idx.tz is None and today_date.tzinfo is not None:
-                    today_date = today_date.tz_localize(None)
-                    previous_date = previous_date.tz_localize(None)
-            # --- END FIX ---
-
-            # Check if the historical GVZ data is up to date
-            if self.last_historical_gvz_update is not None and self.last_historical_gvz_update.date() == actual_dt.date():
-                # If we are using the open price, then return the open price for today
-                if use_open:
-                    # Get the row closest to today
-                    nearest_date = self.historical_gvz.index.asof(today_date)
-                    gvz_val = self.historical_gvz.loc[nearest_date]['Open']
-                    return gvz_val
-                else:
-                    # Get the row closest to the previous date
-                    nearest_date = self.historical_gvz.index.asof(previous_date)
-                    gvz_val = self.historical_gvz.loc[nearest_date]['Close']
-                    return gvz_val
-
-            gvz = yf.Ticker("^GVZ")
-            self.historical_gvz = gvz.history(period="max")
-
-            # Set the Date column as the index
-            self.historical_gvz.index = pd.to_datetime(self.historical_gvz.index)
-
-            # Set the last historical GVZ date as the current date
-            self.last_historical_gvz_update = actual_dt
-
-            # If we are using the open price, then return the open price for today
-            if use_open:
-                # Get the row closest to today
-                nearest_date = self.historical_gvz.index.asof(today_date)
-                gvz_val = self.historical_gvz.loc[nearest_date]['Open']
-            else:
-                # Get the row closest to the previous date
-                nearest_date = self.historical_gvz.index.asof(previous_date)
-                gvz_val = self.historical_gvz.loc[nearest_date]['Close']
-
-            # Add a marker to the chart to show the GVZ value
-            self.strategy.add_marker(
-                "gvz_value",
-                value=gvz_val,
-                symbol="square",
-                color="blue",
-            )
-
-            return gvz_val
-
+            return self._index_value("gvz", current_dt, use_open=use_open)
         except Exception as e:
-            # Get the traceback
             self.strategy.log_message(f"ERROR: Failed to fetch live GVZ value: {e}", color="red", broadcast=True)
-            traceback.print_exc()
             return 1000
 
     def check_max_gvz(self, dt, max_gvz, use_open=False):
@@ -948,27 +898,11 @@ class VixHelper:
         float
             The GVZ percentile value.
         """
-        # Check if dt is not None
-        if dt is None:
-            return None
-
-        # Check if window is not None
-        if window is None:
-            return None
-
-        # Get the GVZ values for the window
-        gvz_values = self.get_gvz_values(dt, window, use_open=use_open)
-
-        if gvz_values is None or len(gvz_values) == 0:
-            return None
-
-        gvz = self.get_gvz_value(dt, use_open=use_open)
-        if gvz is None:
+        # Get the percentile of the GVZ value among the GVZ values of the window
+        gvz_percentile = self.get_index_feature("gvz", "percentile", dt, window, use_open=use_open)
+        if gvz_percentile is None:
             return None
 
-        # Get the GVZ percentile value
-        gvz_percentile = stats.percentileofscore(gvz_values, gvz)
-
         # Add a marker to the chart
         self.strategy.add_marker(
             "gvz_percentile", symbol="square", color="blue", value=gvz_percentile, detail_text=f"GVZ percentile: {gvz_percentile}"
@@ -994,79 +928,7 @@ class VixHelper:
         list
             The GVZ values for the window.
         """
-        # Check if the window is None
-        if window is None:
-            return None
-
-        # Check if the current date is None
-        if dt is None:
-            return None
-
-        if dt is None:
-            return None
-
-        try:
-            # Get the actual dt for the current date to speed this up for backtesting
-            actual_dt = datetime.datetime.now()
-
-            # Subtract one day to get the previous day's date to avoid lookahead bias
-            previous_dt = dt - timedelta(days=1)
-
-            # Get today as a Timestamp
-            today_date = pd.Timestamp(dt)
-
-            # Get previous date as a Timestamp
-            previous_date = pd.Timestamp(previous_dt)
-
-            # --- FIX: Normalize tz-awareness for index and lookup datetimes ---
-            if hasattr(self, 'historical_gvz'):
-                idx = self.historical_gvz.index
-                if idx.tz is not None and today_date.tzinfo is None:
-                    today_date = today_date.tz_localize(idx.tz)
-                    previous_date = previous_date.tz_localize(idx.tz)
-                elif idx.tz is None and today_date.tzinfo is not None:
-                    today_date = today_date.tz_localize(None)
-                    previous_date = previous_date.tz_localize(None)
-            # --- END FIX ---
-
-            # Check if the historical GVZ data is up to date
-            if self.last_historical_gvz_update is not None and self.last_historical_gvz_update.date() == actual_dt.date():
-                # If we are using the open price, then return the open price for today
-                if use_open:
-                    # Get the row closest to today
-                    nearest_date = self.historical_gvz.index.asof(today_date)
-                    gvz_values = self.historical_gvz.loc[nearest_date - timedelta(days=window):nearest_date]['Open'].tolist()
-                    return gvz_values
-                else:
-                    # Get the row closest to the previous date
-                    nearest_date = self.historical_gvz.index.asof(previous_date)
-                    gvz_values = self.historical_gvz.loc[nearest_date - timedelta(days=window):nearest_date]['Close'].tolist()
-                    return gvz_values
-
-            gvz = yf.Ticker("^GVZ")
-            self.historical_gvz = gvz.history(period="max")
-
-            # Set the Date column as the index
-            self.historical_gvz.index = pd.to_datetime(self.historical_gvz.index)
-
-            # Set the last historical GVZ date as the current date
-            self.last_historical_gvz_update = actual_dt
-
-            # If we are using the open price, then return the open price for today
-            if use_open:
-                # Get the row closest to today
-                nearest_date = self.historical_gvz.index.asof(today_date)
-                gvz_values = self.historical_gvz.loc[nearest_date - timedelta(days=window):nearest_date]['Open'].tolist()
-                return gvz_values
-            else:
-                # Get the row closest to the previous date
-                nearest_date = self.historical_gvz.index.asof(previous_date)
-                gvz_values = self.historical_gvz.loc[nearest_date - timedelta(days=window):nearest_date]['Close'].tolist()
-                return gvz_values
-
-        except Exception as e:
-            self.strategy.log_message(f"ERROR: Failed to fetch live GVZ values: {e}", color="red", broadcast=True)
-            return None
+        return self._index_values("gvz", dt, window, use_open=use_open)
 
     def get_gvz_rsi_value(self, dt, window=14, use_open=False):
         """
@@ -1086,635 +948,5 @@ class VixHelper:
         float
             The GVZ RSI value.
         """
-        # Check if dt is not None
-        if dt is None:
-            return None
-
-        # Data window. Get a 60% larger window for the GVZ RSI calculation because of weekends and holidays
-        download_window = int(window * 1.6)
-
-        # Get the GVZ values for the window
-        gvz_values = self.get_gvz_values(dt, download_window, use_open=use_open)
-
-        if gvz_values is None or len(gvz_values) == 0:
-            return None
-
-        # Convert the list to a pandas DataFrame
-        gvz_df = pd.DataFrame(gvz_values, columns=['GVZ'])
-
-        # Calculate the RSI
-        gvz_df['RSI'] = ta.rsi(gvz_df['GVZ'], length=window)
-
-        # Get the last GVZ RSI value
-        gvz_rsi = gvz_df['RSI'].iloc[-1]
-
-        return gvz_rsi
-
-    def check_max_vix_1d(self, dt, max_vix_1d, use_open=False):
-        """
-        Check if the VIX 1D is too high. If it is, log a message, add a marker to the chart, and return True.
-
-        Parameters
-        ----------
-        dt : datetime.datetime
-            The datetime to check the VIX 1D value.
-        max_vix_1d : float
-            The maximum VIX 1D value to create a condor.
-        use_open : bool
-            Whether to use the open price of the underlying asset to get the VIX
-
-        Returns
-        -------
-        bool
-            True if the VIX 1D is too high, False otherwise.
-        """
-        # Get the VIX 1D value
-        vix_1d = self.get_vix_1d_value(dt, use_open=use_open)
-
-        # Plot the VIX 1D value
-        self.strategy.add_line("vix_1d", vix_1d)
-
-        # Check if the VIX 1D is greater than the maximum VIX 1D
-        if max_vix_1d is not None and vix_1d > max_vix_1d:
-            # Log message that the VIX 1D is too high
-            self.strategy.log_message(
-                f"VIX 1D is too high: {vix_1d} which is greater than the max of {max_vix_1d}",
-                color="yellow", broadcast=True
-            )
-
-            # Add a marker to the chart
-            self.strategy.add_marker(
-                "vix_1d_too_high", symbol="circle", color="blue", detail_text=f"VIX 1D too high: {vix_1d}"
-            )
-
-            return True
-
-        # Log message that the VIX 1D is within the limits
-        self.strategy.log_message(
-            f"VIX 1D is within the limits: {vix_1d} which is less than the max of {max_vix_1d}",
-            color="green", broadcast=True
-        )
-
-        return False
-
-    def check_min_vix_1d(self, dt, min_vix_1d, use_open=False):
-        """
-        Check if the VIX 1D is too low. If it is, log a message, add a marker to the chart, and return True.
-
-        Parameters
-        ----------
-        dt : datetime.datetime
-            The datetime to check the VIX 1D value.
-        min_vix_1d : float
-            The minimum VIX 1D value to create a condor.
-
-        Returns
-        -------
-        bool
-            True if the VIX 1D is too low, False otherwise.
-        """
-        # Get the VIX 1D value
-        vix_1d = self.get_vix_1d_value(dt, use_open=use_open)
-
-        # Check if the VIX 1D is greater than the minimum VIX 1D
-        if min_vix_1d is not None and vix_1d < min_vix_1d:
-            # Log message that the VIX 1D is too low
-            self.strategy.log_message(
-                f"VIX 1D is too low: {vix_1d} which is less than the min of {min_vix_1d}",
-                color="yellow", broadcast=True
-            )
-
-            # Add a marker to the chart
-            self.strategy.add_marker(
-                "vix_1d_too_low", symbol="circle", color="blue", detail_text=f"VIX 1D too low: {vix_1d}"
-            )
-
-            return True
-
-        return False
-
-    def check_max_vix_percentile(self, dt, max_vix_percentile, vix_percentile_window, use_open=False):
-        """
-        Check if the VIX is too high based on the percentile. If it is, log a message, add a marker to the chart, and return True.
-
-        Parameters
-        ----------
-        dt : datetime.datetime
-            The datetime to check the VIX value.
-        max_vix_percentile : float
-            The maximum VIX percentile value to create a condor.
-        vix_percentile_window : int
-            The window (in days) to calculate the VIX percentile.
-        use_open : bool
-            Whether to use the open price of the underlying asset to get the VIX value.
-
-        Returns
-        -------
-        bool
-            True if the VIX is too high based on the percentile, False otherwise.
-        """
-        # Check if the max VIX percentile is not None
-        if max_vix_percentile is None:
-            return False
-
-        # Check if the VIX percentile window is not None
-        if vix_percentile_window is None:
-            return False
-
-        # Get the VIX percentile value
-        vix_percentile = self.get_vix_percentile(dt, vix_percentile_window, use_open=use_open)
-
-        # Check if the VIX percentile is not None
-        if vix_percentile is None:
-            return False
-
-        # Check if the VIX is greater than the maximum VIX percentile
-        if max_vix_percentile is not None and vix_percentile > max_vix_percentile:
-            # Log message that the VIX is too high based on the percentile
-            self.strategy.log_message(
-                f"VIX is too high based on the percentile: {vix_percentile} which is greater than the max of {max_vix_percentile}",
-                color="yellow", broadcast=True
-            )
-
-            # Add a marker to the chart
-            self.strategy.add_marker(
-                "vix_percentile_too_high", symbol="circle", color="blue", detail_text=f"VIX too high based on the percentile: {vix_percentile}"
-            )
-
-            return True
-
-        # Log message that the VIX is within the limits based on the percentile
-        self.strategy.log_message(
-            f"VIX is within the limits based on the percentile: {vix_percentile} which is less than the max of {max_vix_percentile}",
-            color="green", broadcast=True
-        )
-
-        return False
-
-    def get_vix_percentile(self, dt, window, use_open=False):
-        """
-        Get the VIX percentile value for the given window.
-
-        Parameters
-        ----------
-        dt : datetime.datetime
-            The datetime to get the VIX percentile value.
-        window : int
-            The window (in days) to calculate the VIX percentile.
-        use_open : bool
-            Whether to use the open price of the underlying asset to get the VIX
-
-        Returns
-        -------
-        float
-            The VIX percentile value.
-        """
-        # Check if dt is not None
-        if dt is None:
-            return None
-
-        # Check if window is not None
-        if window is None:
-            return None
-
-        # Get the VIX values for the window
-        vix_values = self.get_vix_values(dt, window, use_open=use_open)
-
-        # Check if vix_values is not None
-        if vix_values is None or len(vix_values) == 0:
-            return None
-
-        # Get the current VIX value
-        vix = self.get_vix_value(dt, use_open=use_open)
-        if vix is None:
-            return None
-
-        # Get the VIX percentile value
-        vix_percentile = stats.percentileofscore(vix_values, vix)
-
-        # Add a marker to the chart
-        self.strategy.add_marker(
-            "vix_percentile", symbol="square", color="blue", value=vix_percentile, detail_text=f"VIX percentile: {vix_percentile}"
-        )
-
-        return vix_percentile
-
-    def check_max_vix(self, dt, max_vix, use_open=False):
-        """
-        Check if the VIX is too high. If it is, log a message, add a marker to the chart, and return True.
-
-        Parameters
-        ----------
-        dt : datetime.datetime
-            The datetime to check the VIX value.
-        max_vix : float
-            The maximum VIX value to create a condor.
-        use_open : bool
-            Whether to use the open price of the underlying asset to get the VIX value.
-
-        Returns
-        -------
-        bool
-            True if the VIX is too high, False otherwise.
-        """
-        # Get the VIX value
-        vix = self.get_vix_value(dt, use_open=use_open)
-
-        # Plot the VIX value
-        if vix is not None:
-            self.strategy.add_line("vix", vix)
-            self.strategy.add_marker("vix", symbol="square", color="blue", detail_text=f"VIX: {vix}", value=vix)
-
-        # Check if the VIX is greater than the maximum VIX
-        if vix is None or max_vix is None:
-            return False
-        if vix > max_vix:
-            # Log message that the VIX is too high
-            self.strategy.log_message(
-                f"VIX is too high: {vix} which is greater than the max of {max_vix}",
-                color="yellow", broadcast=True
-            )
-
-            # Add a marker to the chart
-            self.strategy.add_marker(
-                "vix_too_high", symbol="circle", color="blue", detail_text=f"VIX too high: {vix}"
-            )
-
-            return True
-
-        # Log message that the VIX is within the limits
-        self.strategy.log_message(
-            f"VIX is within the limits: {vix} which is less than the max of {max_vix}",
-            color="green", broadcast=True
-        )
-
-        return False
-
-    def check_min_vix(self, dt, min_vix, use_open=False):
-        """
-        Check if the VIX is too low. If it is, log a message, add a marker to the chart, and return True.
-
-        Parameters
-        ----------
-        dt : datetime.datetime
-            The datetime to check the VIX value.
-        min_vix : float
-            The minimum VIX value to create a condor.
-        use_open : bool
-            Whether to use the open price of the underlying asset to get the VIX value.
-
-        Returns
-        -------
-        bool
-            True if the VIX is too low, False otherwise.
-        """
-        # Get the VIX value
-        vix = self.get_vix_value(dt, use_open=use_open)
-
-        if vix is None or min_vix is None:
-            return False
-
-        if vix < min_vix:
-            # Log message that the VIX is too low
-            self.strategy.log_message(
-                f"VIX is too low: {vix} which is less than the min of {min_vix}",
-                color="yellow", broadcast=True
-            )
-
-            # Add a marker to the chart
-            self.strategy.add_marker(
-                "vix_too_low", symbol="circle", color="blue", detail_text=f"VIX too low: {vix}"
-            )
-
-            return True
-
-        return False
-
-    def check_max_vix_rsi(self, dt, max_vix_rsi, rsi_window=14, use_open=False):
-        """
-        Check if the VIX RSI is too high. If it is, log a message, add a marker to the chart, and return True.
-
-        Parameters
-        ----------
-        dt : datetime.datetime
-            The datetime to check the VIX RSI value.
-        max_vix_rsi : float
-            The maximum VIX RSI value to create a condor.
-        rsi_window : int
-            The window (in days) to calculate the VIX RSI.
-        use_open : bool
-            Whether to use the open price of the underlying asset to get the VIX RSI value.
-
-        Returns
-        -------
-        bool
-            True if the VIX RSI is too high, False otherwise.
-        """
-        # If max VIX RSI is None, then return False
-        if max_vix_rsi is None:
-            return False
-
-        # Get the VIX RSI value
-        vix_rsi = self.get_vix_rsi_value(dt, rsi_window, use_open=use_open)
-
-        if vix_rsi is None:
-            return False
-
-        # Plot the VIX RSI value
-        self.strategy.add_line("vix_rsi", vix_rsi)
-
-        # Check if the VIX RSI is greater than the maximum VIX RSI
-        if max_vix_rsi is not None and vix_rsi > max_vix_rsi:
-            # Log message that the VIX RSI is too high
-            self.strategy.log_message(
-                f"VIX RSI is too high: {vix_rsi} which is greater than the max of {max_vix_rsi}",
-                color="yellow", broadcast=True
-            )
-
-            # Add a marker to the chart
-            self.strategy.add_marker(
-                "vix_rsi_too_high", symbol="circle", color="blue", detail_text=f"VIX RSI too high: {vix_rsi}"
-            )
-
-            return True
-
-        # Log message that the VIX RSI is within the limits
-        self.strategy.log_message(
-            f"VIX RSI is within the limits: {vix_rsi} which is less than the max of {max_vix_rsi}",
-            color="green", broadcast=True
-        )
-
-        return False
-
-    def get_vix_rsi_value(self, dt, window=14, use_open=False):
-        """
-        Get the VIX RSI value for the given datetime.
-
-        Parameters
-        ----------
-        dt : datetime.datetime
-            The datetime to get the VIX RSI value.
-        window : int
-            The window (in days) to calculate the VIX RSI.
-        use_open : bool
-            Whether to use the open price of the underlying asset to get the VIX RSI value.
-
-        Returns
-        -------
-        float
-            The VIX RSI value.
-        """
-        # Check if dt is not None
-        if dt is None:
-            return None
-
-        # Data window. Get a 60% larger window for the VIX RSI calculation because of weekends and holidays
-        download_window = int(window * 1.6)
-
-        # Get the VIX values for the window
-        vix_values = self.get_vix_values(dt, download_window, use_open=use_open)
-
-        # Check if vix_values is not None
-        if vix_values is None or len(vix_values) == 0:
-            return None
-
-        # Convert the list to a pandas DataFrame
-        vix_df = pd.DataFrame(vix_values, columns=['VIX'])
-
-        # Calculate the RSI
-        vix_df['RSI'] = ta.rsi(vix_df['VIX'], length=window)
-
-        # Get the last VIX RSI value
-        vix_rsi = vix_df['RSI'].iloc[-1]
-
-        return vix_rsi
-
-    def get_gvz_value(self, current_dt=None, use_open=False):
-        """
-        Get the GVZ value for the current date.
-
-        Parameters
-        ----------
-        current_dt : datetime.datetime
-            The current datetime to get the GVZ value.
-        use_open : bool
-            Whether to use the open price of the GVZ.
-
-        Returns
-        -------
-        float
-            The GVZ value for the current date.
-        """
-
-        # If the current date is None, then return a super high value so it doesn't trigger trades
-        if current_dt is None:
-            return 1000
-
-        try:
-            # Get the actual dt for the current date to speed this up for backtesting
-            actual_dt = datetime.datetime.now()
-
-            # Subtract one day to get the previous day's date
-            previous_dt = current_dt - timedelta(days=1)
-
-            # Get today as a Timestamp
-            today_date = pd.Timestamp(current_dt)
-
-            # Get previous date as a Timestamp
-            previous_date = pd.Timestamp(previous_dt)
-
-            # --- FIX: Normalize tz-awareness for index and lookup datetimes ---
-            if hasattr(self, 'historical_gvz'):
-                idx = self.historical_gvz.index
-                if idx.tz is not None and today_date.tzinfo is None:
-                    today_date = today_date.tz_localize(idx.tz)
-                    previous_date = previous_date.tz_localize(idx.tz)
-                elif idx.tz is None and today_date.tzinfo is not None:
-                    today_date = today_date.tz_localize(None)
-                    previous_date = previous_date.tz_localize(None)
-            # --- END FIX ---
-
-            # Check if the historical GVZ data is up to date
-            if self.last_historical_gvz_update is not None and self.last_historical_gvz_update.date() == actual_dt.date():
-                # If we are using the open price, then return the open price for today
-                if use_open:
-                    # Get the row closest to today
-                    nearest_date = self.historical_gvz.index.asof(today_date)
-                    gvz_val = self.historical_gvz.loc[nearest_date]['Open']
-                    return gvz_val
-                else:
-                    # Get the row closest to the previous date
-                    nearest_date = self.historical_gvz.index.asof(previous_date)
-                    gvz_val = self.historical_gvz.loc[nearest_date]['Close']
-                    return gvz_val
-
-            gvz = yf.Ticker("^GVZ")
-            self.historical_gvz = gvz.history(period="max")
-
-            # Set the Date column as the index
-            self.historical_gvz.index = pd.to_datetime(self.historical_gvz.index)
-
-            # Set the last historical GVZ date as the current date
-            self.last_historical_gvz_update = actual_dt
-
-            # If we are using the open price, then return the open price for today
-            if use_open:
-                # Get the row closest to today
-                nearest_date = self.historical_gvz.index.asof(today_date)
-                gvz_val = self.historical_gvz.loc[nearest_date]['Open']
-            else:
-                # Get the row closest to the previous date
-                nearest_date = self.historical_gvz.index.asof(previous_date)
-                gvz_val = self.historical_gvz.loc[nearest_date]['Close']
-
-            # Add a marker to the chart to show the GVZ value
-            self.strategy.add_marker(
-                "gvz_value",
-                value=gvz_val,
-                symbol="square",
-                color="blue",
-            )
-
-            return gvz_val
-
-        except Exception as e:
-            # Get the traceback
-            self.strategy.log_message(f"ERROR: Failed to fetch live GVZ value: {e}", color="red", broadcast=True)
-            traceback.print_exc()
-            return 1000
-
-    def get_gvz_percentile(self, dt, window, use_open=False):
-        """
-        Get the GVZ percentile value for the given window.
-
-        Parameters
-        ----------
-        dt : datetime.datetime
-            The datetime to get the GVZ percentile value.
-        window : int
-            The window (in days) to calculate the GVZ percentile.
-        use_open : bool
-            Whether to use the open price of the GVZ
-
-        Returns
-        -------
-        float
-            The GVZ percentile value.
-        """
-        # Check if dt is not None
-        if dt is None:
-            return None
-
-        # Check if window is not None
-        if window is None:
-            return None
-
-        # Get the GVZ values for the window
-        gvz_values = self.get_gvz_values(dt, window, use_open=use_open)
-
-        if gvz_values is None or len(gvz_values) == 0:
-            return None
-
-        gvz = self.get_gvz_value(dt, use_open=use_open)
-        if gvz is None:
-            return None
-
-        # Get the GVZ percentile value
-        gvz_percentile = stats.percentileofscore(gvz_values, gvz)
-
-        # Add a marker to the chart
-        self.strategy.add_marker(
-            "gvz_percentile", symbol="square", color="blue", value=gvz_percentile, detail_text=f"GVZ percentile: {gvz_percentile}"
-        )
-
-        return gvz_percentile
-
-    def check_max_gvz(self, dt, max_gvz, use_open=False):
-        """
-        Check if the GVZ is too high. If it is, log a message, add a marker to the chart, and return True.
-
-        Parameters
-        ----------
-        dt : datetime.datetime
-            The datetime to check the GVZ value.
-        max_gvz : float
-            The maximum GVZ value to create a condor.
-        use_open : bool
-            Whether to use the open price of the GVZ.
-
-        Returns
-        -------
-        bool
-            True if the GVZ is too high, False otherwise.
-        """
-        # Get the GVZ value
-        gvz = self.get_gvz_value(dt, use_open=use_open)
-
-        # Plot the GVZ value
-        if gvz is not None:
-            self.strategy.add_line("gvz", gvz)
-            self.strategy.add_marker("gvz", symbol="square", color="blue", detail_text=f"GVZ: {gvz}", value=gvz)
-
-        # Check if the GVZ is greater than the maximum GVZ
-        if gvz is None or max_gvz is None:
-            return False
-        if gvz > max_gvz:
-            # Log message that the GVZ is too high
-            self.strategy.log_message(
-                f"GVZ is too high: {gvz} which is greater than the max of {max_gvz}",
-                color="yellow", broadcast=True
-            )
-
-            # Add a marker to the chart
-            self.strategy.add_marker(
-                "gvz_too_high", symbol="circle", color="blue", detail_text=f"GVZ too high: {gvz}"
-            )
-
-            return True
-
-        # Log message that the GVZ is within the limits
-        self.strategy.log_message(
-            f"GVZ is within the limits: {gvz} which is less than the max of {max_gvz}",
-            color="green", broadcast=True
-        )
-
-        return False
-
-    def check_min_gvz(self, dt, min_gvz, use_open=False):
-        """
-        Check if the GVZ is too low. If it is, log a message, add a marker to the chart, and return True.
-
-        Parameters
-        ----------
-        dt : datetime.datetime
-            The datetime to check the GVZ value.
-        min_gvz : float
-            The minimum GVZ value to create a condor.
-        use_open : bool
-            Whether to use the open price of the GVZ.
-
-        Returns
-        -------
-        bool
-            True if the GVZ is too low, False otherwise.
-        """
-        # Get the GVZ value
-        gvz = self.get_gvz_value(dt, use_open=use_open)
-
-        if gvz is None or min_gvz is None:
-            return False
-        if gvz < min_gvz:
-            # Log message that the GVZ is too low
-            self.strategy.log_message(
-                f"GVZ is too low: {gvz} which is less than the min of {min_gvz}",
-                color="yellow", broadcast=True
-            )
-
-            # Add a marker to the chart
-            self.strategy.add_marker(
-                "gvz_too_low", symbol="circle", color="blue", detail_text=f"GVZ too low: {gvz}"
-            )
-
-            return True
-
-        return False
+        # Wilder's RSI (the same as pandas_ta.rsi) over 60% more days than the window because of weekends and holidays
+        return self.get_index_feature("gvz", "rsi", dt, window, use_open=use_open)
@@ -95,12 +95,7 @@ class CcxtBacktestingData(DataSourceBacktesting):
                 f"the exchange parameter is not implemented for CcxtData, but {exchange} was passed as the exchange"
             )
 
-        if isinstance(asset, tuple):
-            symbol = f"{asset[0].symbol.upper()}/{asset[1].symbol.upper()}"
-        elif quote is not None:
-            symbol = f"{asset.symbol.upper()}/{quote.symbol.upper()}"
-        else:
-            symbol = asset
+        symbol = self._get_symbol(asset, quote)
 
         parsed_timestep = self._parse_source_timestep(timestep, reverse=True)
         symbol_timestep = f"{symbol}_{parsed_timestep}"
@@ -135,39 +130,61 @@ class CcxtBacktestingData(DataSourceBacktesting):
             quote: Asset = None,
             include_after_hours: bool = False
     ) -> Dict:
-        """pull broker bars for a list assets"""
+        """pull broker bars for a list assets (every symbol is read from the cache with one query)"""
         parsed_timestep = self._parse_source_timestep(timestep, reverse=True)
+        symbols = [self._get_symbol(asset, quote) for asset in assets]
 
-        result = {}
-        for asset in assets:
-            if isinstance(asset, tuple):
-                symbol = f"{asset[0].symbol.upper()}/{asset[1].symbol.upper()}"
-            elif quote is not None:
-                symbol = f"{asset.symbol.upper()}/{quote.symbol.upper()}"
-            else:
-                symbol = asset
-
-            # convert native timezone aware
-            start_dt = self._to_utc_timezone(self.datetime_start)
-            end_dt = self._to_utc_timezone(self.datetime_end)
-
-            if parsed_timestep == "1d":
-                start_dt = start_dt - timedelta(days=self._download_start_dt_prebuffer)
-            else:
-                start_dt = start_dt - timedelta(minutes=self._download_start_dt_prebuffer)
-
-            data = self.cache_db.download_ohlcv(
-                symbol,parsed_timestep,
-                start_dt,
-                end_dt
-            )
+        # convert native timezone aware
+        start_dt = self._to_utc_timezone(self.datetime_start)
+        end_dt = self._to_utc_timezone(self.datetime_end)
 
+        if parsed_timestep == "1d":
+            start_dt = start_dt - timedelta(days=self._download_start_dt_prebuffer)
+        else:
+            start_dt = start_dt - timedelta(minutes=self._download_start_dt_prebuffer)
+
+        result = self.cache_db.download_ohlcv_for_symbols(symbols, parsed_timestep, start_dt, end_dt)
+        for data in result.values():
             data.index = data.index.tz_localize("UTC")
             data.index = data.index.tz_convert(LUMIBOT_DEFAULT_PYTZ)
-            result[symbol] = data
 
         return result
 
+    def _get_symbol(self, asset, quote:Asset=None)->str:
+        if isinstance(asset, tuple):
+            return f"{asset[0].symbol.upper()}/{asset[1].symbol.upper()}"
+        elif quote is not None:
+            return f"{asset.symbol.upper()}/{quote.symbol.upper()}"
+        return asset
+
+    def get_bars(self, assets, length, timestep="minute", timeshift=None, chunk_size=2, max_workers=2, quote=None,
+                 exchange=None, include_after_hours=True, sleep_time=0.1):
+        """Get bars for a list of assets. Symbols that are not loaded yet are loaded together with one query."""
+        asset_list = assets if isinstance(assets, list) else [assets]
+        asset_list = [Asset(symbol=a, asset_type="crypto") if isinstance(a, str) else a for a in asset_list]
+        parsed_timestep = self._parse_source_timestep(timestep, reverse=True)
+
+        missing = []
+        for asset in asset_list:
+            symbol = self._get_symbol(asset, quote)
+            if isinstance(symbol, str) and f"{symbol}_{parsed_timestep}" not in self._data_store:
+                missing.append(asset)
+        if missing:
+            try:
+                data = self._pull_source_bars(missing, length, timestep, timeshift, quote, include_after_hours)
+            except Exception as e:
+                # Fall back to loading the symbols one at a time, which reports the failing ones individually.
+                logger.warning(f"Could not load {len(missing)} symbols together: {e}")
+                data = {}
+            for symbol, df in data.items():
+                if df is not None and not df.empty:
+                    self._append_data(f"{symbol}_{parsed_timestep}", df)
+
+        # Everything is in memory now, so there is no rate limit to respect.
+        return super().get_bars(asset_list, length, timestep=timestep, timeshift=timeshift, chunk_size=chunk_size,
+                                max_workers=max_workers, quote=quote, exchange=exchange,
+                                include_after_hours=include_after_hours, sleep_time=0)
+
     def get_historical_prices(self, asset:tuple[Asset,Asset], length:int, timestep:str=None,
             timeshift:int=None, quote:Asset=None, exchange:Any=None, include_after_hours:bool=True
     )->Bars:
@@ -207,13 +224,7 @@ class CcxtBacktestingData(DataSourceBacktesting):
         end_date:datetime=None,
     )->Bars:
         parsed_timestep = self._parse_source_timestep(timestep, reverse=True)
-
-        if isinstance(asset, tuple):
-            symbol = f"{asset[0].symbol.upper()}/{asset[1].symbol.upper()}"
-        elif quote is not None:
-            symbol = f"{asset.symbol.upper()}/{quote.symbol.upper()}"
-        else:
-            symbol = asset
+        symbol = self._get_symbol(asset, quote)
 
         # convert utc timezone
         start_dt = self._to_utc_timezone(start_date)
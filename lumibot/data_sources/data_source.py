@@ -7,12 +7,14 @@ from datetime import date, datetime, timedelta
 from decimal import Decimal
 from typing import Union
 
+import numpy as np
 import pandas as pd
 import pytz
 
 from lumibot.constants import LUMIBOT_DEFAULT_PYTZ, LUMIBOT_DEFAULT_TIMEZONE
-from lumibot.entities import Asset, AssetsMapping, Bars, Quote
+from lumibot.entities import Asset, AssetsMapping, Bars, Chains, Quote
 from lumibot.tools import black_scholes, create_options_symbol
+from lumibot.tools.greeks_cache import GreeksCache
 from lumibot.tools.lumibot_logger import get_logger
 
 from .exceptions import UnavailabeTimestep
@@ -28,6 +30,9 @@ class DataSource(ABC):
     DEFAULT_TIMEZONE = LUMIBOT_DEFAULT_TIMEZONE
     DEFAULT_PYTZ = LUMIBOT_DEFAULT_PYTZ
     option_quote_fallback_allowed = False
+    # Size of the Greeks cache, and seconds a cached Greek stays valid (None: until it is evicted).
+    GREEKS_CACHE_SIZE = 10000
+    GREEKS_CACHE_TTL = None
 
     def __init__(
             self,
@@ -70,7 +75,9 @@ class DataSource(ABC):
         self.tzinfo = tzinfo
 
         # Initialize caches centrally (avoid ad-hoc hasattr checks in methods)
-        self._greeks_cache = {}
+        self._greeks_cache = GreeksCache(self.GREEKS_CACHE_SIZE, ttl=self.GREEKS_CACHE_TTL)
+        # Option expiration date -> 4pm expiration datetime in the data source timezone
+        self._expiration_datetimes = {}
 
         # Thread pool for parallel operations - reuse to avoid creation/destruction overhead
         self._thread_pool = None
@@ -444,10 +451,12 @@ class DataSource(ABC):
     def get_strikes(self, asset) -> list:
         """Return a set of strikes for a given asset"""
         chains = self.get_chains(asset)
+        if isinstance(chains, Chains):
+            return chains.all_strikes().tolist()
         strikes = set()
         for right in chains["Chains"]:
-            for exp_date, strikes in chains["Chains"][right].items():
-                strikes |= set(strikes)
+            for exp_date, expiration_strikes in chains["Chains"][right].items():
+                strikes |= set(expiration_strikes)
 
         return sorted(strikes)
 
@@ -597,6 +606,8 @@ class DataSource(ABC):
             chains = self.get_chains(asset)
 
         rows = []
+        options = []
+        option_prices = []
         query_total = 0
         for right in chains["Chains"]:
             expirations_map = chains["Chains"].get(right, {})
@@ -618,7 +629,6 @@ class DataSource(ABC):
                 query_t = time.perf_counter()
                 option_symbol = create_options_symbol(opt_asset.symbol, expiry_dt, right, strike)
                 opt_price = self.get_last_price(opt_asset)
-                greeks = self.calculate_greeks(opt_asset, opt_price, underlying_price, risk_free_rate)
                 query_total += time.perf_counter() - query_t
 
                 # Build the row. Match the Tradier column naming conventions.
@@ -639,9 +649,15 @@ class DataSource(ABC):
                     "average_volume": 0,
                     "type": 'option',
                 }
-                # Add in the greeks. Format: greeks.delta, greeks.theta, etc.
-                row.update({f"greeks.{col}": val for col, val in greeks.items()})
                 rows.append(row)
+                options.append(opt_asset)
+                option_prices.append(opt_price)
+
+        # Add in the greeks, computed for the whole chain at once. Format: greeks.delta, greeks.theta, etc.
+        for row, greeks in zip(rows, self.calculate_greeks_batch(options, option_prices, underlying_price,
+                                                                  risk_free_rate)):
+            if greeks is not None:
+                row.update({f"greeks.{col}": val for col, val in greeks.items()})
 
         logger.info(f"Chain Full Info Query Total: {query_total:.2f}s. "
                      f"Total Time: {time.perf_counter() - start_t:.2f}s, "
@@ -661,10 +677,107 @@ class DataSource(ABC):
         if asset_price is None or underlying_price is None or risk_free_rate is None:
             return None
 
-        # Optimization: Cache Greeks calculations based on key parameters
-        # Round prices to 2 decimal places for cache key to handle minor price fluctuations
         current_date = self.get_datetime()
-        cache_key = (
+        cache_key = self._greeks_cache_key(asset, asset_price, underlying_price, risk_free_rate, current_date)
+        greeks = self._greeks_cache.get(cache_key)
+        if greeks is not None:
+            return greeks
+
+        days_to_expiration = self._days_to_expiration(asset, current_date)
+        greeks = self._calculate_option_greeks(asset, asset_price, underlying_price, risk_free_rate,
+                                               days_to_expiration)
+        self._greeks_cache.put(cache_key, greeks)
+        return greeks
+
+    def calculate_greeks_batch(self, assets, asset_prices, underlying_price, risk_free_rate):
+        """Returns the Greeks of many options at once, in the order of ``assets``.
+
+        Cached results are reused. The implied volatility search and the Greeks of the remaining options are
+        computed together in one vectorised pass, which gives the same values as ``calculate_greeks``.
+
+        Parameters
+        ----------
+        assets : list of Asset
+            The option assets.
+        asset_prices : list of float
+            The price of each option (``None`` where unknown).
+        underlying_price : float or list of float
+            The price of the underlying, either shared by every option or one per option.
+        risk_free_rate : float
+            The risk-free rate used in interest calculations.
+
+        Returns
+        -------
+        list of dict or None
+            The Greeks of each option, ``None`` where a price is missing (as ``calculate_greeks`` returns).
+        """
+        n = len(assets)
+        if isinstance(underlying_price, (list, tuple, np.ndarray, pd.Series)):
+            underlying_prices = list(underlying_price)
+        else:
+            underlying_prices = [underlying_price] * n
+        results = [None] * n
+        if risk_free_rate is None:
+            return results
+
+        current_date = self.get_datetime()
+        pending = []
+        for i, (asset, asset_price, und_price) in enumerate(zip(assets, asset_prices, underlying_prices)):
+            if asset_price is None or und_price is None:
+                continue
+            cache_key = self._greeks_cache_key(asset, asset_price, und_price, risk_free_rate, current_date)
+            greeks = self._greeks_cache.get(cache_key)
+            if greeks is not None:
+                results[i] = greeks
+            else:
+                pending.append((i, cache_key, self._days_to_expiration(asset, current_date)))
+
+        # Options the vectorised pass cannot price go through the scalar path, which handles (or reports) them.
+        vectorised = []
+        for i, cache_key, days in pending:
+            asset, price, und_price = assets[i], float(asset_prices[i]), float(underlying_prices[i])
+            right = (asset.right or "").upper()
+            if (
+                right in ("CALL", "PUT") and days > 0 and price > 0 and und_price > 0 and float(asset.strike) > 0
+                and "e" not in str(round(price, 6))
+            ):
+                vectorised.append((i, cache_key, days, right == "CALL"))
+            else:
+                results[i] = self._calculate_option_greeks(asset, asset_prices[i], underlying_prices[i],
+                                                           risk_free_rate, days)
+                self._greeks_cache.put(cache_key, results[i])
+
+        if vectorised:
+            rows = [i for i, _, _, _ in vectorised]
+            und_prices = [float(underlying_prices[i]) for i in rows]
+            values = black_scholes.batchGreeksBS(
+                und_prices,
+                [float(assets[i].strike) for i in rows],
+                [risk_free_rate * 100] * len(rows),
+                [days for _, _, days, _ in vectorised],
+                [asset_prices[i] for i in rows],
+                [is_call for _, _, _, is_call in vectorised],
+            )
+            for j, (i, cache_key, _, _) in enumerate(vectorised):
+                greeks = dict(
+                    implied_volatility=float(values["impliedVolatility"][j]),
+                    delta=float(values["delta"][j]),
+                    option_price=float(values["optionPrice"][j]),
+                    pv_dividend=None,  # (No equiv )
+                    gamma=float(values["gamma"][j]),
+                    vega=float(values["vega"][j]),
+                    theta=float(values["theta"][j]),
+                    underlying_price=underlying_prices[i],
+                )
+                results[i] = greeks
+                self._greeks_cache.put(cache_key, greeks)
+
+        return results
+
+    @staticmethod
+    def _greeks_cache_key(asset, asset_price, underlying_price, risk_free_rate, current_date):
+        # Round prices to 2 decimal places for cache key to handle minor price fluctuations
+        return (
             asset.symbol,
             asset.strike,
             asset.right,
@@ -675,34 +788,28 @@ class DataSource(ABC):
             current_date.date() if hasattr(current_date, 'date') else current_date  # Cache per day to handle time decay
         )
 
-        # Check cache
-        if cache_key in self._greeks_cache:
-            return self._greeks_cache[cache_key]
-
-        # Keep cache size limited to prevent memory issues
-        if len(self._greeks_cache) > 10000:
-            # Clear oldest half of cache
-            keys_to_remove = list(self._greeks_cache.keys())[:5000]
-            for key in keys_to_remove:
-                del self._greeks_cache[key]
-
-        opt_price = asset_price
-        und_price = underlying_price
-        interest = risk_free_rate * 100
-
-        # If asset expiration is a datetime object, convert it to date
+    def _days_to_expiration(self, asset, current_date):
+        """Days (fractional) from ``current_date`` to 4pm New York time on the option's expiration date."""
         expiration = asset.expiration
         if isinstance(expiration, datetime):
             expiration = expiration.date()
 
-        # Convert the expiration to be a datetime with 4pm New York time
-        expiration = datetime.combine(expiration, datetime.min.time())
-        expiration = self.tzinfo.localize(expiration)
-        expiration = expiration.astimezone(self.tzinfo)
-        expiration = expiration.replace(hour=16, minute=0, second=0, microsecond=0)
+        expiration_dt = self._expiration_datetimes.get(expiration)
+        if expiration_dt is None:
+            # Convert the expiration to be a datetime with 4pm New York time
+            expiration_dt = datetime.combine(expiration, datetime.min.time())
+            expiration_dt = self.tzinfo.localize(expiration_dt)
+            expiration_dt = expiration_dt.astimezone(self.tzinfo)
+            expiration_dt = expiration_dt.replace(hour=16, minute=0, second=0, microsecond=0)
+            self._expiration_datetimes[expiration] = expiration_dt
+
+        return (expiration_dt - current_date).total_seconds() / (60 * 60 * 24)
 
-        # Calculate the days to expiration, but allow for fractional days
-        days_to_expiration = (expiration - current_date).total_seconds() / (60 * 60 * 24)
+    @staticmethod
+    def _calculate_option_greeks(asset, asset_price, underlying_price, risk_free_rate, days_to_expiration):
+        opt_price = asset_price
+        und_price = underlying_price
+        interest = risk_free_rate * 100
 
         if asset.right.upper() == "CALL":
             is_call = True
@@ -724,7 +831,7 @@ class DataSource(ABC):
             volatility=iv.impliedVolatility,
         )
 
-        greeks = dict(
+        return dict(
             implied_volatility=iv.impliedVolatility,
             delta=c.callDelta if is_call else c.putDelta,
             option_price=c.callPrice if is_call else c.putPrice,
@@ -735,11 +842,6 @@ class DataSource(ABC):
             underlying_price=und_price,
         )
 
-        # Cache the result
-        self._greeks_cache[cache_key] = greeks
-
-        return greeks
-
     def query_greeks(self, asset):
         """Query for the Greeks as it can be more accurate than calculating locally."""
         logger.info(f"Querying Options Greeks for {asset.symbol} is not supported for this "
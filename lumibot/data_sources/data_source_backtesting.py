@@ -1,13 +1,20 @@
-import csv
 import datetime as dt
-import os
+import json
 from abc import ABC
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 
 from lumibot.data_sources import DataSource
 from lumibot.tools import print_progress_bar, to_datetime_aware
 from lumibot.tools.helpers import get_timezone_from_datetime
+from lumibot.tools.lumibot_logger import get_logger
+from lumibot.tools.progress_writer import ProgressFileWriter
+
+logger = get_logger(__name__)
+
+# Sentinel used by the per-timestamp price memo to distinguish "not cached" from a cached ``None``.
+_PRICE_MEMO_MISS = object()
 
 
 class DataSourceBacktesting(DataSource, ABC):
@@ -18,6 +25,9 @@ class DataSourceBacktesting(DataSource, ABC):
     """
 
     IS_BACKTESTING_DATA_SOURCE = True
+    # Threads used by warm_up(). Sources whose cache updates are thread-safe raise it to download concurrently, and
+    # sources with a bulk loader (YahooData) override warm_up(). In-memory PandasData has nothing to download.
+    WARM_UP_MAX_WORKERS = 1
 
     def __init__(
              self,
@@ -73,10 +83,18 @@ class DataSourceBacktesting(DataSource, ABC):
         self._show_progress_bar = show_progress_bar
 
         self._progress_csv_path = "logs/progress.csv"
+        self._progress_writer = None
         # Add initialization for the logging timer attribute
         self._last_logging_time = None
         self._portfolio_value = None
 
+        # Timestamp-scoped memo shared by get_last_price / get_quote / get_price_snapshot.
+        # Keyed by (kind, asset, quote, timestep) and dropped every time the backtest clock moves.
+        self._price_memo = {}
+        self._price_memo_datetime = None
+        self._price_memo_hits = 0
+        self._price_memo_misses = 0
+
     @staticmethod
     def estimate_requested_length(length=None, start_date=None, end_date=None, timestep="minute"):
         """
@@ -138,6 +156,130 @@ class DataSourceBacktesting(DataSource, ABC):
         start_date = end_date - period_length
         return start_date, end_date
 
+    def _price_memo_get_or_compute(self, kind, asset, quote, timestep, compute):
+        """
+        Return a memoized price lookup for the current simulated timestamp.
+
+        A strategy iteration typically asks for the same asset's price many times (the strategy itself,
+        portfolio valuation, pending order fills, option helpers). The memo keeps the first non-empty result
+        for ``(kind, asset, quote, timestep)`` until the backtest datetime changes.
+
+        Parameters
+        ----------
+        kind : str
+            The kind of lookup, e.g. ``"last_price"``, ``"quote"`` or ``"snapshot"``.
+        asset : Asset or tuple
+            The asset being priced.
+        quote : Asset or None
+            The quote asset.
+        timestep : str or None
+            The timestep of the lookup, ``None`` when the lookup does not depend on it.
+        compute : callable
+            Zero-argument callable that performs the uncached lookup.
+
+        Returns
+        -------
+        object
+            The (possibly cached) result of ``compute``.
+        """
+        if self._price_memo_datetime != self._datetime:
+            self._price_memo.clear()
+            self._price_memo_datetime = self._datetime
+
+        key = (kind, asset, quote, timestep)
+        try:
+            value = self._price_memo.get(key, _PRICE_MEMO_MISS)
+        except TypeError:
+            # Unhashable asset representation; skip memoization entirely.
+            return compute()
+
+        if value is not _PRICE_MEMO_MISS:
+            self._price_memo_hits += 1
+            return value
+
+        self._price_memo_misses += 1
+        value = compute()
+
+        # Empty results are not memoized so that data loaded later in the same bar is still picked up.
+        if value is not None and not self._is_empty_quote(value):
+            self._price_memo[key] = value
+        return value
+
+    @staticmethod
+    def _is_empty_quote(value):
+        if not hasattr(value, "bid") or not hasattr(value, "ask"):
+            return False
+        return value.price is None and value.bid is None and value.ask is None
+
+    def clear_price_memo(self):
+        """Drop all memoized prices for the current timestamp."""
+        self._price_memo.clear()
+        self._price_memo_datetime = None
+
+    def get_price_memo_stats(self):
+        """
+        Get hit/miss counters for the per-timestamp price memo.
+
+        Returns
+        -------
+        dict
+            Dictionary with ``hits``, ``misses``, ``size`` and ``hit_rate`` keys.
+        """
+        total = self._price_memo_hits + self._price_memo_misses
+        return {
+            "hits": self._price_memo_hits,
+            "misses": self._price_memo_misses,
+            "size": len(self._price_memo),
+            "hit_rate": (self._price_memo_hits / total) if total else 0.0,
+        }
+
+    def warm_up(self, assets, timestep="minute", max_workers=None):
+        """
+        Load the data of ``assets`` before the backtest clock starts.
+
+        Without a warm-up, each asset is loaded the first time the strategy prices it, one after the other and
+        in between the strategy's own logic. This loads all of them up front on a bounded pool of threads
+        (``WARM_UP_MAX_WORKERS``), and shows the progress on the backtest progress bar.
+
+        Parameters
+        ----------
+        assets : list of Asset
+            The assets to load.
+        timestep : str, optional
+            The timestep the strategy will read, "minute" or "day".
+        max_workers : int, optional
+            The number of threads. Defaults to ``WARM_UP_MAX_WORKERS``.
+
+        Returns
+        -------
+        int
+            The number of assets whose data is now loaded.
+        """
+        assets = list(dict.fromkeys(asset for asset in assets or [] if asset is not None))
+        if not assets:
+            return 0
+
+        loaded = 0
+        workers = max(min(max_workers or self.WARM_UP_MAX_WORKERS, len(assets)), 1)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="backtest_warm_up") as executor:
+            futures = {executor.submit(self._warm_up_asset, asset, timestep): asset for asset in assets}
+            for done, future in enumerate(as_completed(futures), start=1):
+                try:
+                    if future.result():
+                        loaded += 1
+                except Exception as e:
+                    # The strategy's own call for this asset will hit (and report) the same problem.
+                    logger.debug(f"Could not warm up the data of {futures[future]}: {e}")
+                if self._show_progress_bar:
+                    print_progress_bar(done, 0, len(assets), self.backtesting_started, prefix="Warm-up")
+
+        logger.info(f"Warmed up the data of {loaded}/{len(assets)} assets ({timestep}).")
+        return loaded
+
+    def _warm_up_asset(self, asset, timestep):
+        """Load the data of one asset for ``warm_up``; returns whether data is available."""
+        return self.get_historical_prices(asset, 1, timestep=timestep) is not None
+
     def _update_datetime(self, new_datetime, cash=None, portfolio_value=None, positions=None, initial_budget=None, orders=None):
         """
         Update the current datetime of the backtest and optionally log progress.
@@ -150,18 +292,20 @@ class DataSourceBacktesting(DataSource, ABC):
             Current cash balance
         portfolio_value : float, optional
             Current portfolio value
-        positions : list, optional
+        positions : list or callable, optional
             List of minimal position dicts from Position.to_minimal_dict():
             [{"asset": {"symbol": "AAPL", "type": "stock"}, "qty": 100, "val": 15000.0, "pnl": 500.0}, ...]
+            or a function returning that list. A function is only called when a progress row is written.
         initial_budget : float, optional
             Initial budget for calculating return percentage
-        orders : list, optional
+        orders : list or callable, optional
             List of minimal order dicts from Order.to_minimal_dict():
             [{"asset": {"symbol": "AAPL", "type": "stock"}, "side": "buy", "qty": 100, "type": "market", "status": "new"}, ...]
+            or a function returning that list. A function is only called when a progress row is written.
         """
-        import json
-
         self._datetime = new_datetime
+        self._price_memo.clear()
+        self._price_memo_datetime = new_datetime
 
         total_seconds = max((self.datetime_end - self.datetime_start).total_seconds(), 1)
         current_seconds = max((new_datetime - self.datetime_start).total_seconds(), 0)
@@ -234,21 +378,27 @@ class DataSourceBacktesting(DataSource, ABC):
                     except (ValueError, TypeError):
                         pass
 
-                # Serialize positions and orders to JSON
-                positions_json = json.dumps(positions) if positions else "[]"
-                orders_json = json.dumps(orders) if orders else "[]"
-
-                self.log_backtest_progress_to_csv(
-                    percent,
-                    elapsed,
-                    log_eta,
-                    log_portfolio_value,
-                    simulation_date=simulation_date,
-                    cash=cash,
-                    total_return_pct=total_return_pct,
-                    positions_json=positions_json,
-                    orders_json=orders_json
-                )
+                # Take the snapshots now, on the simulation thread, and leave the JSON encoding, the download
+                # status and the file IO to the background writer.
+                if callable(positions):
+                    positions = positions()
+                if callable(orders):
+                    orders = orders()
+
+                def build_row():
+                    return self._progress_row(
+                        percent,
+                        elapsed,
+                        log_eta,
+                        log_portfolio_value,
+                        simulation_date=simulation_date,
+                        cash=cash,
+                        total_return_pct=total_return_pct,
+                        positions_json=json.dumps(positions) if positions else "[]",
+                        orders_json=json.dumps(orders) if orders else "[]",
+                    )
+
+                self._get_progress_writer().submit(build_row)
 
     def log_backtest_progress_to_csv(
         self,
@@ -295,6 +445,47 @@ class DataSourceBacktesting(DataSource, ABC):
         elif portfolio_value is not None:
             self._portfolio_value = portfolio_value
 
+        self._get_progress_writer().write(self._progress_row(
+            percent,
+            elapsed,
+            log_eta,
+            portfolio_value,
+            simulation_date=simulation_date,
+            cash=cash,
+            total_return_pct=total_return_pct,
+            positions_json=positions_json,
+            orders_json=orders_json,
+        ))
+
+    def _get_progress_writer(self):
+        """Return the writer for ``self._progress_csv_path``, replacing it if the path changed."""
+        writer = getattr(self, "_progress_writer", None)
+        if writer is None or writer.path != self._progress_csv_path:
+            if writer is not None:
+                writer.close()
+            writer = ProgressFileWriter(self._progress_csv_path)
+            self._progress_writer = writer
+        return writer
+
+    def flush_progress_log(self):
+        """Wait until the latest progress row has been written to the progress file."""
+        writer = getattr(self, "_progress_writer", None)
+        if writer is not None:
+            writer.flush()
+
+    @staticmethod
+    def _progress_row(
+        percent,
+        elapsed,
+        log_eta,
+        portfolio_value,
+        simulation_date=None,
+        cash=None,
+        total_return_pct=None,
+        positions_json=None,
+        orders_json=None
+    ):
+        """Build the values of a progress CSV row, in the order of ``PROGRESS_CSV_HEADER``."""
         current_time = dt.datetime.now().isoformat()
 
         # Get download status from ThetaData helper (if available)
@@ -303,7 +494,6 @@ class DataSourceBacktesting(DataSource, ABC):
             from lumibot.tools.thetadata_helper import get_download_status
             download_status = get_download_status()
             if download_status.get("active"):
-                import json
                 download_status_json = json.dumps(download_status)
         except ImportError:
             # ThetaData helper not available, skip download status
@@ -312,8 +502,7 @@ class DataSourceBacktesting(DataSource, ABC):
             # Any other error, skip download status
             pass
 
-        # Build row with all columns
-        row = [
+        return [
             current_time,
             f"{percent:.2f}",
             str(elapsed).split('.')[0],
@@ -326,25 +515,3 @@ class DataSourceBacktesting(DataSource, ABC):
             orders_json if orders_json else "[]",
             download_status_json
         ]
-
-        # Ensure the directory exists before opening the file.
-        dir_path = os.path.dirname(self._progress_csv_path)
-        if not os.path.exists(dir_path):
-            os.makedirs(dir_path, exist_ok=True)
-        with open(self._progress_csv_path, "w", newline="") as csvfile:
-            writer = csv.writer(csvfile)
-            # Header with all columns including orders and download status
-            writer.writerow([
-                "timestamp",
-                "percent",
-                "elapsed",
-                "eta",
-                "portfolio_value",
-                "simulation_date",
-                "cash",
-                "total_return_pct",
-                "positions_json",
-                "orders_json",
-                "download_status"
-            ])
-            writer.writerow(row)
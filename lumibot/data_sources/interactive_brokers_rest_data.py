@@ -1,5 +1,6 @@
 import os
 import subprocess
+import threading
 import time
 from datetime import datetime, timezone
 from decimal import Decimal
@@ -7,12 +8,13 @@ from typing import Union
 
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
 from termcolor import colored
 
 from lumibot.constants import LUMIBOT_DEFAULT_PYTZ
 from lumibot.tools.lumibot_logger import get_logger
 
-from ..entities import Asset, Bars
+from ..entities import Asset, AssetsMapping, Bars
 from .data_source import DataSource
 
 logger = get_logger(__name__)
@@ -32,6 +34,21 @@ TYPE_MAP = dict(
     multileg="BAG",
 )
 
+# Snapshot field ids and the names they are returned under.
+# https://www.interactivebrokers.com/campus/ibkr-api-page/webapi-ref/#tag/Trading-Market-Data/paths/~1iserver~1marketdata~1snapshot/get
+SNAPSHOT_FIELDS = {
+    "84": "bid",
+    "85": "ask_size",
+    "86": "ask",
+    "88": "bid_size",
+    "31": "last_price",
+    "7283": "implied_volatility",
+    "7311": "vega",
+    "7310": "theta",
+    "7308": "delta",
+    "7309": "gamma",
+}
+
 
 class InteractiveBrokersRESTData(DataSource):
     """
@@ -41,10 +58,31 @@ class InteractiveBrokersRESTData(DataSource):
     MIN_TIMESTEP = "minute"
     SOURCE = "InteractiveBrokersREST"
 
+    # Seconds between /iserver/accounts pings made before market data and contract requests.
+    PING_INTERVAL = 60
+    # Seconds a resolved conid or contract-rules response is reused before it is fetched again.
+    CONTRACT_CACHE_TTL = 6 * 60 * 60
+    # Most conids requested in one /iserver/marketdata/snapshot call.
+    SNAPSHOT_BATCH_SIZE = 50
+
+    _QUOTE_FIELDS = ["last_price", "bid", "ask", "bid_size", "ask_size"]
+
     def __init__(self, config, **kwargs):
         # Call superclass constructor
         super().__init__(**kwargs)
 
+        # One keep-alive session for every gateway request
+        self._session = requests.Session()
+        self._session.verify = False
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        self._cache_lock = threading.Lock()
+        self._conid_cache = {}
+        self._contract_rules_cache = {}
+        self._last_iserver_ping = None
+
         if config["API_URL"] is None:
             self.port = "4234"
             self.base_url = f"https://localhost:{self.port}/v1/api"
@@ -232,15 +270,37 @@ class InteractiveBrokersRESTData(DataSource):
         else:
             return True
 
-    def ping_iserver(self):
+    def ping_iserver(self, force=False):
+        """
+        Call /iserver/accounts, which the gateway requires before market data and contract requests.
+
+        Parameters
+        ----------
+        force : bool
+            Ping even if the last successful ping was less than ``PING_INTERVAL`` seconds ago.
+
+        Returns
+        -------
+        bool
+            True if the gateway answered without an error.
+        """
+        if (
+            not force
+            and self._last_iserver_ping is not None
+            and time.monotonic() - self._last_iserver_ping < self.PING_INTERVAL
+        ):
+            return True
+
         url = f"{self.base_url}/iserver/accounts"
         response = self.get_from_endpoint(
             url, "Auth Check", silent=True, allow_fail=False
         )
 
         if response is None or 'error' in response:
+            self._last_iserver_ping = None
             return False
         else:
+            self._last_iserver_ping = time.monotonic()
             return True
 
     def ping_portfolio(self):
@@ -276,6 +336,10 @@ class InteractiveBrokersRESTData(DataSource):
         dict
             The contract rules if the request is successful, None otherwise.
         """
+        cached = self._cache_get(self._contract_rules_cache, conid)
+        if cached is not None:
+            return cached
+
         self.ping_iserver()
 
         url = f"{self.base_url}/iserver/contract/{conid}/info-and-rules"
@@ -288,8 +352,31 @@ class InteractiveBrokersRESTData(DataSource):
             )
             return None
 
+        if response is not None:
+            self._cache_set(self._contract_rules_cache, conid, response)
         return response
 
+    def _cache_get(self, cache, key):
+        with self._cache_lock:
+            entry = cache.get(key)
+            if entry is None:
+                return None
+            value, stored_at = entry
+            if time.monotonic() - stored_at >= self.CONTRACT_CACHE_TTL:
+                del cache[key]
+                return None
+            return value
+
+    def _cache_set(self, cache, key, value):
+        with self._cache_lock:
+            cache[key] = (value, time.monotonic())
+
+    def clear_contract_cache(self):
+        """Forget every cached conid and contract-rules response."""
+        with self._cache_lock:
+            self._conid_cache.clear()
+            self._contract_rules_cache.clear()
+
     def get_account_balances(self):
         """
         Retrieves the account balances for a given account ID.
@@ -370,7 +457,7 @@ class InteractiveBrokersRESTData(DataSource):
             re_msg = "The server is undergoing maintenance. Should fix itself soon"
 
         elif 'Please query /accounts first' in error_message:
-            self.ping_iserver()
+            self.ping_iserver(force=True)
             retrying = True
             re_msg = "Lumibot got Deauthenticated"
 
@@ -436,7 +523,7 @@ class InteractiveBrokersRESTData(DataSource):
 
         while retrying or not allow_fail:
             try:
-                response = requests.get(url, verify=False)
+                response = self._session.get(url, verify=False)
             except requests.exceptions.RequestException as e:
                 response = requests.Response()
                 response.status_code = 503
@@ -463,7 +550,7 @@ class InteractiveBrokersRESTData(DataSource):
 
         while retrying or not allow_fail:
             try:
-                response = requests.post(url, json=json, verify=False)
+                response = self._session.post(url, json=json, verify=False)
             except requests.exceptions.RequestException as e:
                 response = requests.Response()
                 response.status_code = 503
@@ -485,7 +572,7 @@ class InteractiveBrokersRESTData(DataSource):
 
         while retrying or not allow_fail:
             try:
-                response = requests.delete(url, verify=False)
+                response = self._session.delete(url, verify=False)
             except requests.exceptions.RequestException as e:
                 response = requests.Response()
                 response.status_code = 503
@@ -749,7 +836,7 @@ class InteractiveBrokersRESTData(DataSource):
         url = f"{self.base_url}/trsrv/futures"
         params = {"symbols": symbol, "secType": "CONTFUT", "exchange": exchange}
         try:
-            response = requests.get(url, params=params, verify=False)
+            response = self._session.get(url, params=params, verify=False)
             if response.status_code != 200:
                 logger.error(colored(f"Failed to retrieve security definition for {symbol}: {response.text}", "red"))
                 return None
@@ -990,9 +1077,11 @@ class InteractiveBrokersRESTData(DataSource):
         Get the last price for an asset.
         For futures, always use get_market_snapshot (the official IBKR endpoint for all asset types).
         """
-        field = "last_price"
-        response = self.get_market_snapshot(asset, [field])  # Always use this for all asset types
+        response = self.get_market_snapshot(asset, ["last_price"])  # Always use this for all asset types
+        return self._last_price_from_snapshot(asset, response)
 
+    def _last_price_from_snapshot(self, asset, response):
+        field = "last_price"
         if response is None or field not in response:
             if getattr(asset, "asset_type", None) in ["option", "future"]:
                 logger.debug(
@@ -1013,6 +1102,19 @@ class InteractiveBrokersRESTData(DataSource):
         return float(price)
 
     def get_conid_from_asset(self, asset: Asset):
+        """
+        Return the IBKR contract id for an asset. Resolved conids are cached for ``CONTRACT_CACHE_TTL`` seconds.
+        """
+        # Asset equality ignores the multiplier, which the futures lookup uses
+        key = (asset.symbol, asset.asset_type, asset.expiration, asset.strike, asset.right, asset.multiplier)
+        conid = self._cache_get(self._conid_cache, key)
+        if conid is None:
+            conid = self._lookup_conid(asset)
+            if conid is not None:
+                self._cache_set(self._conid_cache, key, conid)
+        return conid
+
+    def _lookup_conid(self, asset: Asset):
         # --- Use helper for futures conid ---
         if getattr(asset, "asset_type", None) == Asset.AssetType.FUTURE:
             return self._get_futures_conid(asset, "CME")
@@ -1125,66 +1227,72 @@ class InteractiveBrokersRESTData(DataSource):
         return greeks if greeks is not None else {}
 
     def get_market_snapshot(self, asset: Asset, fields: list):
-        all_fields = {
-            "84": "bid",
-            "85": "ask_size",
-            "86": "ask",
-            "88": "bid_size",
-            "31": "last_price",
-            "7283": "implied_volatility",
-            "7311": "vega",
-            "7310": "theta",
-            "7308": "delta",
-            "7309": "gamma",
-            # https://www.interactivebrokers.com/campus/ibkr-api-page/webapi-ref/#tag/Trading-Market-Data/paths/~1iserver~1marketdata~1snapshot/get
-        }
-        self.ping_iserver()
+        return self.get_market_snapshots([asset], fields).get(asset)
 
-        conId = self.get_conid_from_asset(asset)
-        if conId is None:
-            return None
+    def get_market_snapshots(self, assets: list, fields: list) -> dict:
+        """
+        Get snapshot fields for many assets, requesting up to ``SNAPSHOT_BATCH_SIZE`` conids per call.
 
-        fields_to_get = []
-        for identifier, name in all_fields.items():
-            if name in fields:
-                fields_to_get.append(identifier)
+        The gateway often answers the first snapshot request for a conid without any fields, so requests are
+        repeated (only for the conids still missing fields) until every field is present or the retries run out.
+
+        Parameters
+        ----------
+        assets : list of Asset
+            The assets to get the snapshot for.
+        fields : list of str
+            Field names from ``SNAPSHOT_FIELDS`` (e.g. ``"last_price"``, ``"bid"``, ``"delta"``).
+
+        Returns
+        -------
+        dict
+            Maps each asset to a dict of the requested fields that were returned (numbers as floats), or to None
+            when its conid could not be resolved.
+        """
+        self.ping_iserver()
 
-        fields_str = ",".join(str(field) for field in fields_to_get)
+        fields_to_get = [identifier for identifier, name in SNAPSHOT_FIELDS.items() if name in fields]
+        fields_str = ",".join(fields_to_get)
 
-        url = f"{self.base_url}/iserver/marketdata/snapshot?conids={conId}&fields={fields_str}"
+        results = {}
+        assets_by_conid = {}
+        for asset in assets:
+            conid = self.get_conid_from_asset(asset)
+            if conid is None:
+                results[asset] = None
+            else:
+                assets_by_conid.setdefault(int(conid), []).append(asset)
 
-        # If fields are missing, fetch again
+        snapshots = {}
+        pending = list(assets_by_conid)
         max_retries = 500
         retries = 0
-        missing_fields = True
-
-        response = None
-        while missing_fields and retries < max_retries:
+        while pending and retries < max_retries:
             if retries >= 3:
                 time.sleep(5)
-            response = self.get_from_endpoint(url, "Getting Market Snapshot")
             retries += 1
-            missing_fields = False
-            for field in fields_to_get:
-                if (
-                    response
-                    and isinstance(response, list)
-                    and len(response) > 0
-                    and field not in response[0]
-                ):
-                    missing_fields = True
-                    break
-
-        # return only what was requested
-        output = {}
-
-        if (
-            response
-            and isinstance(response, list)
-            and len(response) > 0
-            and isinstance(response[0], dict)
-        ):
-            for key, value in response[0].items():
+            for start in range(0, len(pending), self.SNAPSHOT_BATCH_SIZE):
+                batch = pending[start:start + self.SNAPSHOT_BATCH_SIZE]
+                conids_str = ",".join(str(conid) for conid in batch)
+                url = f"{self.base_url}/iserver/marketdata/snapshot?conids={conids_str}&fields={fields_str}"
+                response = self.get_from_endpoint(url, "Getting Market Snapshot")
+                if not isinstance(response, list):
+                    continue
+                for row in response:
+                    if isinstance(row, dict) and "conid" in row:
+                        snapshots[int(row["conid"])] = row
+
+            # Only conids the gateway answered for but without every field are asked for again
+            pending = [
+                conid
+                for conid in pending
+                if conid in snapshots and any(field not in snapshots[conid] for field in fields_to_get)
+            ]
+
+        for conid, conid_assets in assets_by_conid.items():
+            # return only what was requested
+            output = {}
+            for key, value in snapshots.get(conid, {}).items():
                 if key in fields_to_get:
                     # Convert the value to a float if it is a number
                     try:
@@ -1193,9 +1301,32 @@ class InteractiveBrokersRESTData(DataSource):
                         pass
 
                     # Map the field to the name
-                    output[all_fields[key]] = value
+                    output[SNAPSHOT_FIELDS[key]] = value
+            for asset in conid_assets:
+                results[asset] = dict(output)
+
+        return results
+
+    def get_last_prices(self, assets, quote=None, exchange=None):
+        """
+        Get the last prices for many assets with batched snapshot requests.
 
-        return output
+        Parameters
+        ----------
+        assets : list of Asset
+            The assets to get the prices for.
+        quote : Asset, optional
+            Not used for Interactive Brokers.
+        exchange : str, optional
+            Not used for Interactive Brokers.
+
+        Returns
+        -------
+        AssetsMapping
+            Maps each asset to its last price, or None when it is not available.
+        """
+        snapshots = self.get_market_snapshots(list(assets), ["last_price"])
+        return AssetsMapping({asset: self._last_price_from_snapshot(asset, snapshots.get(asset)) for asset in assets})
 
     def get_quote(self, asset, quote=None, exchange=None):
         """
@@ -1215,9 +1346,31 @@ class InteractiveBrokersRESTData(DataSource):
         Quote
            Quote object containing bid, ask, price and other information.
         """
-        result = self.get_market_snapshot(
-            asset, ["last_price", "bid", "ask", "bid_size", "ask_size"]
-        )
+        result = self.get_market_snapshot(asset, self._QUOTE_FIELDS)
+        return self._quote_from_snapshot(asset, result)
+
+    def get_quotes(self, assets, quote=None, exchange=None) -> dict:
+        """
+        Get quotes for many assets with batched snapshot requests.
+
+        Parameters
+        ----------
+        assets : list of Asset
+            The assets to get quotes for.
+        quote : Asset, optional
+            Not used for Interactive Brokers.
+        exchange : str, optional
+            Not used for Interactive Brokers.
+
+        Returns
+        -------
+        dict
+            Maps each asset to its Quote, or None when no snapshot was returned.
+        """
+        snapshots = self.get_market_snapshots(list(assets), self._QUOTE_FIELDS)
+        return {asset: self._quote_from_snapshot(asset, snapshots.get(asset)) for asset in assets}
+
+    def _quote_from_snapshot(self, asset, result):
         if not result:
             return None
 
@@ -8,6 +8,8 @@ import pandas as pd
 from lumibot.data_sources import DataSourceBacktesting
 from lumibot.entities import Asset, Bars, Quote
 from lumibot.tools.lumibot_logger import get_logger
+from lumibot.tools.shared_data_store import SharedDataStore
+from lumibot.tools.universe_store import UniverseStore
 
 logger = get_logger(__name__)
 
@@ -16,6 +18,14 @@ class PandasData(DataSourceBacktesting):
     """
     PandasData is a Backtesting-only DataSource that uses a Pandas DataFrame (read from CSV) as the source of
     data for a backtest run. It is not possible to use this class to run a live trading strategy.
+
+    ``pandas_data`` may also be a ``lumibot.tools.shared_data_store.SharedDataStore``, in which case the data is
+    attached read-only from memory-mapped files shared with other backtest processes.
+
+    With ``columnar_store=True`` the loaded data is also lined up in a ``lumibot.tools.universe_store.UniverseStore``
+    so ``get_last_prices``, ``get_bars`` (``Strategy.get_historical_prices_for_assets``) and portfolio valuation read
+    a whole universe with one row or block slice instead of one lookup per asset. It costs one ``bars x assets``
+    float matrix per column read, so it is meant for large multi-asset universes.
     """
 
     SOURCE = "PANDAS"
@@ -24,7 +34,15 @@ class PandasData(DataSourceBacktesting):
         {"timestep": "minute", "representations": ["1M", "minute"]},
     ]
 
-    def __init__(self, *args, pandas_data=None, auto_adjust=True, allow_option_quote_fallback: bool = False, **kwargs):
+    def __init__(
+        self,
+        *args,
+        pandas_data=None,
+        auto_adjust=True,
+        allow_option_quote_fallback: bool = False,
+        columnar_store: bool = False,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
         self.option_quote_fallback_allowed = allow_option_quote_fallback
         self.name = "pandas"
@@ -34,12 +52,18 @@ class PandasData(DataSourceBacktesting):
         self._date_index = None
         self._date_supply = None
         self._timestep = "minute"
+        self._columnar_store = columnar_store
+        self.universe_store = None
 
     @staticmethod
     def _set_pandas_data_keys(pandas_data):
         # OrderedDict tracks the LRU dataframes for when it comes time to do evictions.
         new_pandas_data = OrderedDict()
 
+        # Attach read-only to memory-mapped frames published by another process.
+        if isinstance(pandas_data, SharedDataStore):
+            pandas_data = pandas_data.attach()
+
         def _get_new_pandas_data_key(data):
             # Always save the asset as a tuple of Asset and quote
             if isinstance(data.asset, tuple):
@@ -79,6 +103,10 @@ class PandasData(DataSourceBacktesting):
         self._date_index = self.clean_trading_times(self._date_index, pcal)
         for _, data in self._data_store.items():
             data.repair_times_and_fill(self._date_index)
+
+        # Subclasses that load data on demand keep the per-asset path: their data store changes during the run.
+        if self._columnar_store and type(self)._pull_source_symbol_bars is PandasData._pull_source_symbol_bars:
+            self.universe_store = UniverseStore(self._date_index, self._data_store)
         return pcal
 
     def clean_trading_times(self, dt_index, pcal):
@@ -221,6 +249,15 @@ class PandasData(DataSourceBacktesting):
         return dt_index
 
     def get_last_price(self, asset, quote=None, exchange=None) -> Union[float, Decimal, None]:
+        return self._price_memo_get_or_compute(
+            "last_price",
+            asset,
+            quote,
+            None,
+            lambda: self._get_last_price_from_store(asset, quote=quote, exchange=exchange),
+        )
+
+    def _get_last_price_from_store(self, asset, quote=None, exchange=None) -> Union[float, Decimal, None]:
         # Takes an asset and returns the last known price
         tuple_to_find = self.find_asset_in_data_store(asset, quote)
 
@@ -296,8 +333,15 @@ class PandasData(DataSourceBacktesting):
         Quote
             A Quote object with the quote information.
         """
-        from lumibot.entities import Quote
+        return self._price_memo_get_or_compute(
+            "quote",
+            asset,
+            quote,
+            None,
+            lambda: self._get_quote_from_store(asset, quote=quote, exchange=exchange),
+        )
 
+    def _get_quote_from_store(self, asset, quote=None, exchange=None) -> Quote:
         # Takes an asset and returns the last known price
         tuple_to_find = self.find_asset_in_data_store(asset, quote)
 
@@ -337,9 +381,21 @@ class PandasData(DataSourceBacktesting):
             return Quote(asset=asset)
 
     def get_last_prices(self, assets, quote=None, exchange=None, **kwargs):
+        prices = {}
+        if self.universe_store is not None:
+            keys = [self.find_asset_in_data_store(asset, quote) for asset in assets]
+            for asset, price in zip(assets, self.universe_store.get_last_prices(keys, self.get_datetime())):
+                if price is not None:
+                    # Seed the memo so later get_last_price calls for this bar reuse the cross-section.
+                    prices[asset] = self._price_memo_get_or_compute(
+                        "last_price", asset, quote, None, lambda price=price: price
+                    )
+
         result = {}
         for asset in assets:
-            result[asset] = self.get_last_price(asset, quote=quote, exchange=exchange)
+            result[asset] = prices[asset] if asset in prices else self.get_last_price(
+                asset, quote=quote, exchange=exchange
+            )
         return result
 
     def find_asset_in_data_store(self, asset, quote=None, timestep=None):
@@ -404,6 +460,21 @@ class PandasData(DataSourceBacktesting):
 
         return res
 
+    def _pull_source_symbol_arrays(self, asset, length, timestep="", timeshift=0, quote=None):
+        """Like ``_pull_source_symbol_bars`` but returns a ``BarArrays`` of the data store's arrays."""
+        timestep = timestep if timestep else self.MIN_TIMESTEP
+        asset_to_find = self.find_asset_in_data_store(asset, quote, timestep)
+        data = self._data_store.get(asset_to_find)
+        if data is None:
+            logger.warning(f"The asset: `{asset}` does not exist or does not have data.")
+            return None
+
+        try:
+            return data.get_bars_arrays(self.get_datetime(), length=length, timestep=timestep, timeshift=timeshift or 0)
+        except ValueError as e:
+            logger.info(f"Error getting bars for {asset}: {e}")
+            return None
+
     def _pull_source_symbol_bars_between_dates(
         self,
         asset,
@@ -459,6 +530,66 @@ class PandasData(DataSourceBacktesting):
 
         return result
 
+    def get_bars(
+        self,
+        assets,
+        length,
+        timestep="minute",
+        timeshift=None,
+        chunk_size=2,
+        max_workers=2,
+        quote=None,
+        exchange=None,
+        include_after_hours=True,
+        sleep_time=0.1,
+    ):
+        """Get bars for a list of assets, reading the assets in the columnar store with one block slice."""
+        if self.universe_store is None:
+            return super().get_bars(
+                assets,
+                length,
+                timestep=timestep,
+                timeshift=timeshift,
+                chunk_size=chunk_size,
+                max_workers=max_workers,
+                quote=quote,
+                exchange=exchange,
+                include_after_hours=include_after_hours,
+                sleep_time=sleep_time,
+            )
+
+        if not isinstance(assets, list):
+            assets = [assets]
+        assets = [Asset(symbol=a) if isinstance(a, str) else a for a in assets]
+        timestep = timestep if timestep else self.get_timestep()
+        pairs = [asset if isinstance(asset, tuple) else (asset, quote) for asset in assets]
+        keys = [self.find_asset_in_data_store(base, quote_asset, timestep) for base, quote_asset in pairs]
+        frames = self.universe_store.get_bars(keys, self.get_datetime(), length, timestep, timeshift=timeshift)
+
+        result = {}
+        remaining = []
+        for asset, (base, quote_asset), frame in zip(assets, pairs, frames):
+            if frame is None:
+                remaining.append(asset)
+            else:
+                result[asset] = self._parse_source_symbol_bars(frame, base, quote=quote_asset, length=length)
+        if remaining:
+            result.update(
+                super().get_bars(
+                    remaining,
+                    length,
+                    timestep=timestep,
+                    timeshift=timeshift,
+                    chunk_size=chunk_size,
+                    max_workers=max_workers,
+                    quote=quote,
+                    exchange=exchange,
+                    include_after_hours=include_after_hours,
+                    sleep_time=sleep_time,
+                )
+            )
+        return result
+
     def _parse_source_symbol_bars(self, response, asset, quote=None, length=None, return_polars: bool = False):
         """parse broker response for a single asset
 
@@ -571,13 +702,23 @@ class PandasData(DataSourceBacktesting):
         # Accept `return_polars` for API compatibility with other data sources.
         # PandasData always returns pandas-backed Bars, so this flag is ignored.
         return_polars: bool = False,
+        return_numpy: bool = False,
     ):
-        """Get bars for a given asset"""
+        """Get bars for a given asset
+
+        With ``return_numpy=True`` a ``BarArrays`` is returned instead of ``Bars``. When the data is already in the
+        data store, its arrays are views of the store's datalines and no DataFrame is built.
+        """
         if isinstance(asset, str):
             asset = Asset(symbol=asset)
 
         if not timestep:
             timestep = self.get_timestep()
+
+        # Subclasses that load data on demand do it in _pull_source_symbol_bars, so they keep the Bars path.
+        if return_numpy and type(self)._pull_source_symbol_bars is PandasData._pull_source_symbol_bars:
+            return self._pull_source_symbol_arrays(asset, length, timestep=timestep, timeshift=timeshift, quote=quote)
+
         response = self._pull_source_symbol_bars(
             asset,
             length,
@@ -593,4 +734,6 @@ class PandasData(DataSourceBacktesting):
             return None
 
         bars = self._parse_source_symbol_bars(response, asset, quote=quote, length=length, return_polars=return_polars)
+        if return_numpy:
+            return bars.arrays
         return bars
@@ -9,6 +9,7 @@ from lumibot.data_sources import DataSourceBacktesting
 from lumibot.entities import Asset, Bars, Quote
 from lumibot.constants import LUMIBOT_DEFAULT_PYTZ
 from lumibot.tools.lumibot_logger import get_logger
+from lumibot.tools.shared_data_store import SharedDataStore
 
 logger = get_logger(__name__)
 
@@ -337,6 +338,10 @@ class PolarsData(DataSourceBacktesting):
         # OrderedDict tracks the LRU dataframes for when it comes time to do evictions.
         new_pandas_data = OrderedDict()
 
+        # Attach read-only to memory-mapped frames published by another process.
+        if isinstance(pandas_data, SharedDataStore):
+            pandas_data = pandas_data.attach()
+
         def _get_new_pandas_data_key(data):
             # Always save the asset as a tuple of Asset and quote
             if isinstance(data.asset, tuple):
@@ -204,23 +204,11 @@ class YahooData(DataSourceBacktesting):
 
         interval = self._parse_source_timestep(timestep, reverse=True)
 
-        # Check if the asset is a futures contract or index and format the symbol accordingly
-        symbol = asset.symbol
-        symbols_to_try = [symbol]  # Default to just trying the original symbol
-
-        if asset.asset_type == 'futures' or getattr(asset, 'asset_type', None) == Asset.AssetType.FUTURE:
-            symbols_to_try = self._format_futures_symbol(symbol)
-            if not isinstance(symbols_to_try, list):
-                symbols_to_try = [symbols_to_try]
-        elif asset.asset_type == 'index' or getattr(asset, 'asset_type', None) == Asset.AssetType.INDEX:
-            symbols_to_try = self._format_index_symbol(symbol)
-            if not isinstance(symbols_to_try, list):
-                symbols_to_try = [symbols_to_try]
-
         if asset in self._data_store:
             data = self._data_store[asset]
         else:
             # Try each symbol format until we get data
+            symbols_to_try = self._yahoo_symbols(asset)
             data = None
             successful_symbol = None
 
@@ -309,6 +297,59 @@ class YahooData(DataSourceBacktesting):
 
         return result
 
+    def _yahoo_symbols(self, asset):
+        """Return the Yahoo symbols to try for ``asset``, in order of preference."""
+        if asset.asset_type in ("futures", Asset.AssetType.FUTURE):
+            symbols = self._format_futures_symbol(asset.symbol)
+        elif asset.asset_type in ("index", Asset.AssetType.INDEX):
+            symbols = self._format_index_symbol(asset.symbol)
+        else:
+            symbols = [asset.symbol]
+        return symbols if isinstance(symbols, list) else [symbols]
+
+    def _load_assets(self, assets, timestep=MIN_TIMESTEP, max_workers=None):
+        """Load every asset that is not in the data store yet with one parallel ``YahooHelper.get_symbols_data`` call.
+
+        Each asset is requested under its preferred Yahoo symbol. Assets without data are left out of the store, so
+        ``_pull_source_symbol_bars`` still tries their other symbol formats and reports them one by one.
+        """
+        missing = {}
+        for asset in assets:
+            if asset not in self._data_store:
+                symbols = self._yahoo_symbols(asset)
+                if symbols:
+                    missing.setdefault(symbols[0], []).append(asset)
+        if not missing:
+            return
+
+        interval = self._parse_source_timestep(timestep, reverse=True)
+        dfs = YahooHelper.get_symbols_data(
+            list(missing),
+            interval=interval,
+            auto_adjust=self.auto_adjust,
+            last_needed_datetime=self.datetime_end,
+            max_workers=max_workers,
+        )
+        for symbol, df in dfs.items():
+            if df is None or df.empty:
+                continue
+            for asset in missing[symbol]:
+                self._append_data(asset, df)
+
+    def warm_up(self, assets, timestep="minute", max_workers=None):
+        """Download ``assets`` in parallel with one ``_load_assets`` call before the backtest clock starts.
+
+        The per-asset warm-up then runs on the data already in memory, which shows the progress and tries the other
+        symbol formats of the assets the bulk download could not load.
+        """
+        assets = [Asset(symbol=asset) if isinstance(asset, str) else asset for asset in assets or [] if asset]
+        try:
+            self._load_assets(assets, timestep, max_workers=max_workers)
+        except Exception as e:
+            logger.warning(f"Could not load {len(assets)} assets together: {e}")
+        # The data store is not locked, so the remaining per-asset loads run one at a time.
+        return super().warm_up(assets, timestep=timestep, max_workers=1)
+
     def _pull_source_bars(
         self, assets, length, timestep=MIN_TIMESTEP, timeshift=None, quote=None, include_after_hours=False
     ):
@@ -317,46 +358,50 @@ class YahooData(DataSourceBacktesting):
         if quote is not None:
             logger.warning(f"quote is not implemented for YahooData, but {quote} was passed as the quote")
 
-        interval = self._parse_source_timestep(timestep, reverse=True)
-        missing_assets = []
-
-        # Check for futures and index symbols and properly format them
-        for asset in assets:
-            if asset not in self._data_store:
-                if asset.asset_type == Asset.AssetType.FUTURE:
-                    symbol = self._format_futures_symbol(asset.symbol)
-                    missing_assets.append(symbol)
-                elif asset.asset_type == Asset.AssetType.INDEX:
-                    symbol = self._format_index_symbol(asset.symbol)
-                    missing_assets.append(symbol)
-                else:
-                    missing_assets.append(asset.symbol)
-
-        if missing_assets:
-            # Fetch data using the helper without restricting dates here
-            dfs = YahooHelper.get_symbols_data(
-                missing_assets,
-                interval=interval,
-                auto_adjust=self.auto_adjust
-            )
-            for symbol, df in dfs.items():
-                # Find the corresponding asset for this symbol
-                for asset in assets:
-                    asset_symbol = asset.symbol
-                    if asset.asset_type == Asset.AssetType.FUTURE:
-                        asset_symbol = self._format_futures_symbol(asset_symbol)
-                    elif asset.asset_type == Asset.AssetType.INDEX:
-                        asset_symbol = self._format_index_symbol(asset_symbol)
-
-                    if asset_symbol == symbol:
-                        self._append_data(asset, df)
-                        break
+        self._load_assets(assets, timestep)
 
         result = {}
         for asset in assets:
             result[asset] = self._pull_source_symbol_bars(asset, length, timestep=timestep, timeshift=timeshift)
         return result
 
+    def get_bars(
+        self,
+        assets,
+        length,
+        timestep="minute",
+        timeshift=None,
+        chunk_size=2,
+        max_workers=2,
+        quote=None,
+        exchange=None,
+        include_after_hours=True,
+        sleep_time=0.1,
+    ):
+        """Get bars for a list of assets. Assets that are not loaded yet are downloaded in parallel first."""
+        asset_list = assets if isinstance(assets, list) else [assets]
+        to_load = [asset[0] if isinstance(asset, tuple) else asset for asset in asset_list]
+        to_load = [Asset(symbol=asset) if isinstance(asset, str) else asset for asset in to_load]
+        try:
+            self._load_assets(to_load, timestep)
+        except Exception as e:
+            # get_historical_prices loads the assets one at a time and reports the failing ones individually.
+            logger.warning(f"Could not load {len(to_load)} assets together: {e}")
+
+        # Everything is in memory now, so there is no rate limit to respect.
+        return super().get_bars(
+            assets,
+            length,
+            timestep=timestep,
+            timeshift=timeshift,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            quote=quote,
+            exchange=exchange,
+            include_after_hours=include_after_hours,
+            sleep_time=0,
+        )
+
     def _parse_source_symbol_bars(self, response, asset, quote=None, length=None):
         if quote is not None:
             logger.warning(f"quote is not implemented for YahooData, but {quote} was passed as the quote")
@@ -2,6 +2,7 @@ from .asset import Asset, AssetsMapping
 from .bar import Bar
 
 # Import base implementations
+from .bars import BarArrays
 from .bars import Bars as _BarsBase
 from .chains import Chains
 from .data import Data as _DataBase
@@ -19,6 +20,7 @@ __all__ = [
     "Asset",
     "AssetsMapping",
     "Bar",
+    "BarArrays",
     "Bars",
     "Chains",
     "Data",
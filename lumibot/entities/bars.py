@@ -76,12 +76,125 @@ class PolarsConversionTracker:
             cls._instance._first_warning_shown = False
 
 
+class BarArrays:
+    """NumPy arrays of a set of bars, one per column, oldest bar first.
+
+    Returned by ``Bars.arrays`` and by ``get_historical_prices(..., return_numpy=True)``. Columns can be read as items
+    (``arrays["close"]``) or attributes (``arrays.close``). ``datetime`` holds the bar times as ``datetime64[ns]`` in
+    UTC. The arrays may be read-only views of the data source's own data: copy them before modifying.
+
+    The derived columns ``price_change``, ``dividend_yield`` (with dividends) and ``return`` are computed the first
+    time they are read, the same way as in ``Bars``.
+
+    Parameters
+    ----------
+    columns : dict
+        Column name to 1-d NumPy array, all of the same length, including "datetime".
+    asset : Asset, optional
+        The asset of the bars.
+    source : str, optional
+        The source of the data.
+    """
+
+    DERIVED_COLUMNS = ("price_change", "dividend_yield", "return")
+
+    def __init__(self, columns, asset=None, source=None):
+        self._columns = dict(columns)
+        self.asset = asset
+        self.source = source
+
+    @classmethod
+    def from_frame(cls, frame, asset=None, source=None):
+        """Build the arrays of a pandas (datetime index) or polars (datetime column) DataFrame, sharing its memory."""
+        columns = {}
+        if isinstance(frame, pl.DataFrame):
+            for name in frame.columns:
+                series = frame[name]
+                if series.dtype == pl.Datetime:
+                    if series.dtype.time_zone is not None:
+                        series = series.dt.convert_time_zone("UTC").dt.replace_time_zone(None)
+                    columns["datetime"] = series.cast(pl.Datetime("ns")).to_numpy()
+                else:
+                    columns[name] = series.to_numpy()
+        elif frame is not None:
+            index = frame.index
+            if isinstance(index, pd.DatetimeIndex):
+                columns["datetime"] = (index.tz_convert("UTC").tz_localize(None) if index.tz is not None else index).to_numpy()
+            for name in frame.columns:
+                columns[name] = frame[name].to_numpy()
+        return cls(columns, asset=asset, source=source)
+
+    def __len__(self):
+        """Return the number of bars."""
+        for values in self._columns.values():
+            return len(values)
+        return 0
+
+    @property
+    def empty(self):
+        return len(self) == 0
+
+    def keys(self):
+        names = list(self._columns)
+        if "close" in self._columns:
+            derived = self.DERIVED_COLUMNS if "dividend" in self._columns else ("return",)
+            names += [name for name in derived if name not in self._columns]
+        return names
+
+    def items(self):
+        return [(name, self[name]) for name in self.keys()]
+
+    def __contains__(self, name):
+        return name in self.keys()
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __getitem__(self, name):
+        values = self._columns.get(name)
+        if values is None:
+            if name not in self.keys():
+                raise KeyError(name)
+            values = self._columns[name] = self._derive(name)
+        return values
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}") from None
+
+    def _derive(self, name):
+        close = np.asarray(self._columns["close"], dtype=np.float64)
+        if name == "price_change" or (name == "return" and "dividend" not in self._columns):
+            price_change = np.full(len(close), np.nan)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                price_change[1:] = close[1:] / close[:-1] - 1
+            return price_change
+        if name == "dividend_yield":
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return np.asarray(self._columns["dividend"], dtype=np.float64) / close
+        return self["dividend_yield"] + self["price_change"]
+
+    def get_last_price(self):
+        """Return the close of the last bar, or None if there are no bars."""
+        close = self._columns.get("close")
+        return close[-1] if close is not None and len(close) else None
+
+    def __repr__(self):
+        return f"BarArrays({self.asset}, {len(self)} bars, columns={list(self._columns)})"
+
+
 class Bars:
     """Pricing and financial data for given Symbol.
 
     The OHLCV, and if available, dividends, stock splits for a given
     financial instrument. Price change, dividend yield and return
-    are calculated if appropriate.
+    are calculated if appropriate, the first time the DataFrame is read.
+    ``arrays`` gives the columns as NumPy arrays without building a
+    DataFrame.
 
     Parameters
     ----------
@@ -183,28 +296,18 @@ class Bars:
         self._polars_cache = None
         self._pandas_cache = None
         self._tzinfo = self._normalize_tzinfo(tzinfo)
-        
+        self._arrays = None
+
         # Check if empty
         if (isinstance(df, pl.DataFrame) and df.shape[0] == 0) or \
            (isinstance(df, pd.DataFrame) and df.shape[0] == 0):
             logger.warning(f"Unable to get bar data for {asset} {source}")
         
+        # The derived columns (price_change, dividend_yield, return) are only computed when a DataFrame is read.
+        self._derived_pending = True
+
         if isinstance(df, pl.DataFrame):
             # Already polars, process it
-            columns = df.columns
-            
-            # Calculate derived columns using polars
-            if "dividend" in columns:
-                df = df.with_columns([
-                    pl.col("close").pct_change().alias("price_change"),
-                    (pl.col("dividend") / pl.col("close")).alias("dividend_yield"),
-                    ((pl.col("dividend") / pl.col("close")) + pl.col("close").pct_change()).alias("return")
-                ])
-            else:
-                df = df.with_columns([
-                    pl.col("close").pct_change().alias("return")
-                ])
-            
             if "datetime" in df.columns and self._tzinfo is not None:
                 target_tz = getattr(self._tzinfo, "zone", None) or getattr(self._tzinfo, "key", None)
                 if target_tz:
@@ -235,14 +338,6 @@ class Bars:
         else:
             # Already pandas, keep it as is
             self._df = df
-            # Calculate derived columns if needed
-            if "dividend" in df.columns:
-                self._df["price_change"] = df["close"].pct_change()
-                self._df["dividend_yield"] = df["dividend"] / df["close"]
-                self._df["return"] = self._df["dividend_yield"] + self._df["price_change"]
-            else:
-                self._df["return"] = df["close"].pct_change()
-
             self._apply_timezone()
             if self._return_polars:
                 self._pandas_cache = self._df
@@ -257,6 +352,8 @@ class Bars:
     @df.setter
     def df(self, value):
         """Allow setting the DataFrame while keeping caches in sync."""
+        self._derived_pending = False
+        self._arrays = None
         self._df = value
         self._polars_cache = None
         self._pandas_cache = None
@@ -280,6 +377,7 @@ class Bars:
     @property
     def polars_df(self):
         """Return as Polars DataFrame if needed"""
+        self._ensure_derived_columns()
         if isinstance(self._df, pl.DataFrame):
             return self._df
         else:
@@ -292,6 +390,7 @@ class Bars:
     @property
     def pandas_df(self):
         """Return as Pandas DataFrame, converting on demand if required."""
+        self._ensure_derived_columns()
         if isinstance(self._df, pd.DataFrame):
             return self._df
         if self._pandas_cache is not None:
@@ -309,6 +408,67 @@ class Bars:
         self._pandas_cache = self._apply_timezone(pandas_df)
         return self._pandas_cache
 
+    @staticmethod
+    def _add_derived_columns(frame):
+        """Add the price_change, dividend_yield and return columns (in place for pandas, as a new polars frame)."""
+        if isinstance(frame, pl.DataFrame):
+            if "close" not in frame.columns:
+                return frame
+            if "dividend" in frame.columns:
+                return frame.with_columns([
+                    pl.col("close").pct_change().alias("price_change"),
+                    (pl.col("dividend") / pl.col("close")).alias("dividend_yield"),
+                    ((pl.col("dividend") / pl.col("close")) + pl.col("close").pct_change()).alias("return")
+                ])
+            return frame.with_columns([
+                pl.col("close").pct_change().alias("return")
+            ])
+
+        if isinstance(frame, pd.DataFrame) and "close" in frame.columns:
+            if "dividend" in frame.columns:
+                frame["price_change"] = frame["close"].pct_change()
+                frame["dividend_yield"] = frame["dividend"] / frame["close"]
+                frame["return"] = frame["dividend_yield"] + frame["price_change"]
+            else:
+                frame["return"] = frame["close"].pct_change()
+        return frame
+
+    def _ensure_derived_columns(self):
+        """Compute the derived columns the first time a DataFrame is handed out."""
+        if not getattr(self, "_derived_pending", False):
+            return
+        self._derived_pending = False
+        self._df = self._add_derived_columns(self._df)
+        if self._pandas_cache is not None and self._pandas_cache is not self._df:
+            self._pandas_cache = self._add_derived_columns(self._pandas_cache)
+        self._polars_cache = None
+
+    def _frame(self):
+        """The active DataFrame (pandas or polars, like ``df``) without computing the derived columns."""
+        if isinstance(self._df, pl.DataFrame) == bool(self._return_polars):
+            return self._df
+        return self.df
+
+    @property
+    def arrays(self):
+        """The bars as NumPy arrays, without building another DataFrame.
+
+        Returns
+        -------
+        BarArrays
+            One array per column (``arrays["close"]`` or ``arrays.close``) plus ``datetime`` as ``datetime64[ns]``
+            in UTC. The arrays share memory with the bars; copy them before modifying.
+
+        Example
+        -------
+        >>> bars = self.get_historical_prices("SPY", 200, "minute")
+        >>> closes = bars.arrays.close
+        >>> sma = closes[-50:].mean()
+        """
+        if getattr(self, "_arrays", None) is None:
+            self._arrays = BarArrays.from_frame(self._frame(), asset=self.asset, source=self.source)
+        return self._arrays
+
     def __repr__(self):
         return repr(self.df)
 
@@ -379,20 +539,9 @@ class Bars:
         for bar in bar_list:
             raw.append(bar)
 
-        # Create polars DataFrame directly
+        # Create polars DataFrame directly; Bars adds the derived columns when they are read
         df = pl.DataFrame(raw)
 
-        # Calculate derived columns using polars
-        df = df.with_columns([
-            pl.col("close").pct_change().alias("price_change"),
-            (pl.col("dividend") / pl.col("close")).alias("dividend_yield"),
-        ])
-
-        # Calculate return
-        df = df.with_columns([
-            (pl.col("dividend_yield") + pl.col("price_change")).alias("return")
-        ])
-
         bars = cls(df, source, asset, raw=bar_list)
         return bars
 
@@ -458,7 +607,7 @@ class Bars:
         float, Decimal or None
 
         """
-        return self.df["close"][-1]
+        return self._frame()["close"][-1]
 
     def get_last_dividend(self):
         """Return the last dividend of the last bar
@@ -471,8 +620,9 @@ class Bars:
         -------
         float
         """
-        if "dividend" in self.df.columns:
-            return self.df["dividend"][-1]
+        frame = self._frame()
+        if "dividend" in frame.columns:
+            return frame["dividend"][-1]
         else:
             logger.debug("Unable to find 'dividend' column in bars")
             return 0
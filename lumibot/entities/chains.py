@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from bisect import bisect_left
 from datetime import date, datetime
-from typing import Any, Dict, Iterable, List, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
 
 
 class OptionsDataFormatError(ValueError):
@@ -16,6 +19,13 @@ class Chains(dict):
     ``dict`` the old code paths that index into the structure (e.g.
     ``chains["Chains"]["PUT"]`` or ``chains.get("Chains")``) continue to work
     unchanged.
+
+    The lookup helpers (``strike_array``, ``nearest_strike``, ``strikes_in_range``,
+    ``expiration_on_or_after``...) work on a sorted view of each side of the chain:
+    the expirations as a sorted date list and the strikes of each expiration as a
+    sorted, de-duplicated float array. The view is built on first use and rebuilt
+    when the CALL or PUT mapping is replaced or changes size, so each lookup is a
+    binary search instead of a sort of the raw lists.
     """
 
     def __init__(self, data: Dict[str, Any]):
@@ -26,6 +36,7 @@ class Chains(dict):
         self.exchange: str | None = data.get("Exchange")
         # Optional metadata (used by options helpers to validate historical expirations)
         self.underlying_symbol: str | None = data.get("UnderlyingSymbol")
+        self._sides: Dict[str, Tuple[Any, int, _ChainSide]] = {}
 
     # ------------------------------------------------------------------
     # Convenience accessors
@@ -64,6 +75,67 @@ class Chains(dict):
         expiry_str = expiry_date.strftime("%Y-%m-%d")
         return self.get("Chains", {}).get(option_type.upper(), {}).get(expiry_str, [])
 
+    # ------------------------------------------------------------------
+    # Sorted lookups
+    # ------------------------------------------------------------------
+    def _side(self, option_type: str) -> "_ChainSide":
+        option_type = option_type.upper()
+        source = self.get("Chains", {}).get(option_type, {})
+        sides = self.__dict__.setdefault("_sides", {})
+        cached = sides.get(option_type)
+        if cached is None or cached[0] is not source or cached[1] != len(source):
+            cached = (source, len(source), _ChainSide(source))
+            sides[option_type] = cached
+        return cached[2]
+
+    def expiration_items(self, option_type: str = "CALL") -> List[Tuple[str, date]]:
+        """List ``(expiration key, expiration date)`` pairs sorted by date. Unparseable keys are skipped."""
+        side = self._side(option_type)
+        return list(zip(side.keys, side.dates))
+
+    def expirations_on_or_after(self, dt: Union[date, datetime], option_type: str = "CALL") -> List[Tuple[str, date]]:
+        """List the ``(expiration key, expiration date)`` pairs on or after ``dt``, sorted by date."""
+        side = self._side(option_type)
+        start = bisect_left(side.dates, _normalise_expiry(dt))
+        return list(zip(side.keys[start:], side.dates[start:]))
+
+    def expiration_on_or_after(self, dt: Union[date, datetime], option_type: str = "CALL") -> Optional[date]:
+        """Return the first expiration on or after ``dt``, or None."""
+        side = self._side(option_type)
+        index = bisect_left(side.dates, _normalise_expiry(dt))
+        return side.dates[index] if index < len(side.dates) else None
+
+    def strike_array(self, expiration: Union[str, date, datetime], option_type: str = "CALL") -> np.ndarray:
+        """Return the strikes of an expiration as a sorted, de-duplicated, read-only float array."""
+        return self._side(option_type).strikes(expiration)
+
+    def strikes_in_range(
+        self, expiration: Union[str, date, datetime], low: float, high: float, option_type: str = "CALL"
+    ) -> np.ndarray:
+        """Return the strikes of an expiration between ``low`` and ``high`` (both included)."""
+        strikes = self.strike_array(expiration, option_type)
+        return strikes[np.searchsorted(strikes, low, side="left"):np.searchsorted(strikes, high, side="right")]
+
+    def nearest_strike(
+        self, expiration: Union[str, date, datetime], price: float, option_type: str = "CALL"
+    ) -> Optional[float]:
+        """Return the strike of an expiration closest to ``price`` (the lower one on ties), or None."""
+        strikes = self.strike_array(expiration, option_type)
+        if len(strikes) == 0:
+            return None
+        index = int(np.searchsorted(strikes, price))
+        if index == len(strikes) or (index > 0 and price - strikes[index - 1] <= strikes[index] - price):
+            index -= 1
+        return float(strikes[index])
+
+    def all_strikes(self, option_type: Optional[str] = None) -> np.ndarray:
+        """Return the strikes of every expiration (of one side, or of both) as one sorted float array."""
+        option_types = [option_type] if option_type else list(self.get("Chains", {}).keys())
+        arrays = [
+            self._side(right).strikes(key) for right in option_types for key in self._side(right).keys
+        ]
+        return np.unique(np.concatenate(arrays)) if arrays else np.empty(0)
+
     # ------------------------------------------------------------------
     # Niceties
     # ------------------------------------------------------------------
@@ -80,6 +152,49 @@ class Chains(dict):
         return bool(self.calls()) or bool(self.puts())
 
 
+class _ChainSide:
+    """Sorted view of the ``{expiration: [strikes]}`` mapping of one side of a chain."""
+
+    __slots__ = ("source", "keys", "dates", "_strikes")
+
+    def __init__(self, source: Dict[Any, Any]):
+        pairs = []
+        for key in source:
+            try:
+                pairs.append((_normalise_expiry(key), key))
+            except OptionsDataFormatError:
+                continue
+        pairs.sort(key=lambda pair: pair[0])
+        self.source = source
+        self.dates: List[date] = [expiry for expiry, _ in pairs]
+        self.keys: List[Any] = [key for _, key in pairs]
+        self._strikes: Dict[Any, np.ndarray] = {}
+
+    def strikes(self, expiration: Any) -> np.ndarray:
+        if isinstance(expiration, (date, datetime)):
+            index = bisect_left(self.dates, _normalise_expiry(expiration))
+            if index == len(self.dates) or self.dates[index] != _normalise_expiry(expiration):
+                return _EMPTY_STRIKES
+            expiration = self.keys[index]
+        strikes = self._strikes.get(expiration)
+        if strikes is None:
+            values = []
+            for value in self.source.get(expiration) or []:
+                try:
+                    values.append(float(value))
+                except (TypeError, ValueError):
+                    continue
+            strikes = np.unique(np.asarray(values, dtype=float))
+            strikes = strikes[~np.isnan(strikes)]
+            strikes.flags.writeable = False
+            self._strikes[expiration] = strikes
+        return strikes
+
+
+_EMPTY_STRIKES = np.empty(0)
+_EMPTY_STRIKES.flags.writeable = False
+
+
 def _normalise_expiry(expiry: Any) -> date:
     """Convert various expiry representations into a ``datetime.date``."""
 
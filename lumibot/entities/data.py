@@ -7,10 +7,12 @@ import numpy as np
 import pandas as pd
 
 from lumibot.constants import LUMIBOT_DEFAULT_PYTZ as DEFAULT_PYTZ
+from lumibot.tools.backtest_profiler import profile_section
 from lumibot.tools.helpers import parse_timestep_qty_and_unit, to_datetime_aware
 from lumibot.tools.lumibot_logger import get_logger
 
 from .asset import Asset
+from .bars import BarArrays
 from .dataline import Dataline
 
 logger = get_logger(__name__)
@@ -23,6 +25,88 @@ except (pd._config.config.OptionError, AttributeError):
     pass
 
 
+_OHLC_FILL_COLUMNS = ("open", "high", "low")
+_QUOTE_COLUMNS = ("bid", "ask", "bid_size", "ask_size")
+# The columns returned by get_bars
+_BAR_COLUMNS = ("open", "high", "low", "close", "volume", "dividend")
+# Bars further apart than this start a new session for quote forward-filling (allows filling within a session).
+_QUOTE_SESSION_GAP_NS = 120 * 60 * 1_000_000_000
+
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def _datetime_to_ns(dt):
+    """Nanoseconds since the epoch for a datetime (naive values are taken as default-timezone wall time)."""
+    if isinstance(dt, pd.Timestamp):
+        return (dt if dt.tzinfo is not None else dt.tz_localize(DEFAULT_PYTZ)).value
+    if dt.tzinfo is None:
+        dt = DEFAULT_PYTZ.localize(dt)
+    delta = dt - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1_000
+
+
+def _forward_fill(values, segment_starts=None):
+    """Forward-fill missing values of a 1-d array, optionally without crossing ``segment_starts``."""
+    missing = pd.isna(values)
+    if not missing.any():
+        return values
+    positions = np.arange(len(values))
+    last_valid = np.where(missing, -1, positions)
+    np.maximum.accumulate(last_valid, out=last_valid)
+    if segment_starts is not None:
+        segment_begin = np.maximum.accumulate(np.where(segment_starts, positions, 0))
+        last_valid[last_valid < segment_begin] = -1
+    fill = missing & (last_valid >= 0)
+    if not fill.any():
+        return values
+    values = values.copy()
+    values[fill] = values[last_valid[fill]]
+    return values
+
+
+class _LazyDatalines(dict):
+    """``dict`` of column name to ``Dataline`` that builds each ``Dataline`` on first access.
+
+    Built entries are stored in the dict itself so repeated lookups stay C-speed; membership, iteration and length
+    always reflect every available column, built or not.
+    """
+
+    def __init__(self, factory, names):
+        super().__init__()
+        self._factory = factory
+        self._names = list(dict.fromkeys(names))
+        self._name_set = set(self._names)
+
+    def __missing__(self, name):
+        if name not in self._name_set:
+            raise KeyError(name)
+        dataline = self._factory(name)
+        self[name] = dataline
+        return dataline
+
+    def __contains__(self, name):
+        return name in self._name_set
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def get(self, name, default=None):
+        return self[name] if name in self._name_set else default
+
+    def keys(self):
+        return list(self._names)
+
+    def values(self):
+        return [self[name] for name in self._names]
+
+    def items(self):
+        return [(name, self[name]) for name in self._names]
+
+
 class Data:
     """Input and manage Pandas dataframes for backtesting.
 
@@ -79,10 +163,7 @@ class Data:
         Either "minute" (default) or "day"
     datalines : dict
         Keys are column names like `datetime` or `close`, values are
-        numpy arrays.
-    iter_index : Pandas Series
-        Datetime in the index, range count in values. Used to retrieve
-        the current df iteration for this data and datetime.
+        numpy arrays. Columns are repaired and materialized on first access.
 
     Methods
     -------
@@ -114,6 +195,13 @@ class Data:
     """
 
     MIN_TIMESTEP = "minute"
+    # Repair state, set by repair_times_and_fill (see there).
+    _df = None
+    _fill_pending = False
+    _index_ns = None
+    _repair_index = None
+    _iter_cache = None
+    _shared_repaired = False
     TIMESTEP_MAPPING = [
         {"timestep": "day", "representations": ["1D", "day"]},
         {"timestep": "minute", "representations": ["1M", "minute"]},
@@ -196,6 +284,45 @@ class Data:
         self.datetime_start = self.df.index[0]
         self.datetime_end = self.df.index[-1]
 
+    @classmethod
+    def _from_shared_frame(
+        cls,
+        asset,
+        df,
+        timestep,
+        quote=None,
+        trading_hours_start=datetime.time(0, 0),
+        trading_hours_end=datetime.time(23, 59),
+        date_start=None,
+        date_end=None,
+        repaired=False,
+    ):
+        """Wrap an already-normalized dataframe without copying it.
+
+        Used by ``lumibot.tools.shared_data_store.SharedDataStore`` to build ``Data`` objects on top of memory-mapped
+        columns. The frame must already be sorted, de-duplicated, trimmed and indexed in the default timezone, so
+        none of the ``__init__`` normalization steps (which would copy every column) are run.
+
+        Parameters
+        ----------
+        repaired : bool
+            True when the frame was already passed through ``repair_times_and_fill``. ``repair_times_and_fill`` then
+            only rebuilds the iteration index when it is called with the same index.
+        """
+        data = cls.__new__(cls)
+        data.asset = asset
+        data.symbol = asset.symbol
+        data.quote = quote
+        data.timestep = timestep
+        data.df = df
+        data.trading_hours_start, data.trading_hours_end = data.set_times(trading_hours_start, trading_hours_end)
+        data.date_start = date_start if date_start is not None else df.index[0]
+        data.date_end = date_end if date_end is not None else df.index[-1]
+        data.datetime_start = df.index[0]
+        data.datetime_end = df.index[-1]
+        data._shared_repaired = repaired
+        return data
+
     def set_times(self, trading_hours_start, trading_hours_end):
         """Set the start and end times for the data. The default is 0001 hrs to 2359 hrs.
 
@@ -281,12 +408,19 @@ class Data:
             )
         return df
 
-    # ./lumibot/build/__editable__.lumibot-3.1.14-py3-none-any/lumibot/entities/data.py:280:
-    # FutureWarning: Downcasting object dtype arrays on .fillna, .ffill, .bfill is deprecated and will change in a future version.
-    # Call result.infer_objects(copy=False) instead.
-    # To opt-in to the future behavior, set `pd.set_option('future.no_silent_downcasting', True)`
-
     def repair_times_and_fill(self, idx):
+        """Align the data to the backtest index ``idx`` and forward-fill the gaps.
+
+        Only the index bookkeeping happens here: for every bar of ``idx`` the position of the source row that a
+        forward-filling reindex would use is computed with ``searchsorted``. Column values are gathered and filled
+        with numpy the first time they are read (through ``datalines``, the column attributes or ``df``), so
+        columns, and whole assets, that a strategy never reads cost almost nothing.
+
+        Parameters
+        ----------
+        idx : pandas.DatetimeIndex
+            The combined backtest index. It is trimmed to this data's own date range.
+        """
         # OPTIMIZATION: Use searchsorted instead of expensive boolean indexing
         # Replace: idx[(idx >= self.datetime_start) & (idx <= self.datetime_end)]
         start_pos = idx.searchsorted(self.datetime_start, side='left')
@@ -294,240 +428,244 @@ class Data:
         idx = idx[start_pos:end_pos]
 
         # OPTIMIZATION: More efficient duplicate removal
-        if self.df.index.has_duplicates:
-            self.df = self.df[~self.df.index.duplicated(keep='first')]
+        source = self._df
+        if source.index.has_duplicates:
+            source = source[~source.index.duplicated(keep='first')]
+            self._df = source
+
+        self._fill_pending = True
+        if self._shared_repaired:
+            if idx.equals(source.index):
+                # Shared (memory-mapped) frames were repaired by the publisher against this same index. Filling
+                # again would produce an identical frame but copy every column into private memory.
+                self._fill_pending = False
+            else:
+                logger.warning(
+                    f"Shared data for {self.asset} was published for a different date index; "
+                    f"repairing a private copy instead of using the shared memory map."
+                )
+                self._shared_repaired = False
+
+        self._repair_index = idx
+        self._index_ns = np.asarray(idx.asi8, dtype=np.int64)
+        self._source_pos = None
+        self._session_starts = None
+        self._iter_cache = None
+        if self._fill_pending:
+            source_ns = np.asarray(pd.DatetimeIndex(source.index).asi8, dtype=np.int64)
+            self._source_pos = source_ns.searchsorted(self._index_ns, side="right") - 1
+            self._source_exact = source_ns[self._source_pos] == self._index_ns
+            self._columns = list(source.columns)
+            if "volume" not in self._columns:
+                self._columns.append("volume")
+            self._columns += [col for col in ["close", "open", "high", "low"] if col not in self._columns]
+        else:
+            self._columns = list(source.columns)
 
-        # Reindex the DataFrame with the new index and forward-fill missing values.
-        df = self.df.reindex(idx, method="ffill")
+        self.to_datalines()
 
-        # Check if we have a volume column, if not then add it and fill with 0 or NaN.
-        if "volume" in df.columns:
-            df.loc[df["volume"].isna(), "volume"] = 0
+    def _column_values(self, column):
+        """Return the repaired values of ``column`` as a numpy array (built once, then cached)."""
+        cache = self._column_cache
+        if column in cache:
+            return cache[column]
+
+        source = self._df
+        if not self._fill_pending:
+            values = source[column].to_numpy()
+        elif column in _OHLC_FILL_COLUMNS:
+            values = self._gather(column)
+            # Vectorized NaN filling for OHLC columns from the (already forward-filled) close.
+            mask = pd.isna(values)
+            if mask.any():
+                values = np.where(mask, self._column_values("close"), values)
+        elif column in _QUOTE_COLUMNS:
+            values = self._gather(column)
+            # NOTE: Only apply session-boundary quote handling for minute data. Daily datasets (e.g., option EOD
+            # NBBO) are intentionally sparse and are only forward-filled by the reindex so mark-to-market pricing
+            # remains stable between observations.
+            if self.timestep == "minute":
+                session_starts = self._get_session_starts()
+                # Prevent stale weekend/after-hours quotes from being forward-filled into the first bar of a new
+                # session: a bar more than two hours after the previous one keeps only a quote observed at it.
+                cleared = session_starts & ~(self._source_exact & ~pd.isna(source[column].to_numpy()[self._source_pos]))
+                if cleared.any():
+                    values = values.astype(float) if values.dtype.kind in "biu" else values.copy()
+                    values[cleared] = np.nan
+                values = _forward_fill(values, session_starts)
         else:
-            df["volume"] = None
-
-        # CRITICAL FIX: Time-gap aware forward-fill for bid/ask columns
-        # Prevent stale weekend/after-hours quote data from being forward-filled
-        # into the first bar of a new trading session.
-        # The reindex above already did ffill, but we need to UNDO it for bid/ask
-        # where there's a large time gap (> 2 hours).
-        quote_cols = ["bid", "ask", "bid_size", "ask_size"]
-        quote_cols_present = [col for col in quote_cols if col in df.columns]
-        apply_quote_session_boundaries = self.timestep == "minute"
-
-        # NOTE: Only apply session-boundary quote clearing for minute data.
-        # Daily datasets (e.g., option EOD NBBO) are intentionally sparse and must be forward-filled
-        # across sessions so mark-to-market pricing remains stable between observations.
-        if apply_quote_session_boundaries and quote_cols_present and isinstance(df.index, pd.DatetimeIndex):
-            # Calculate time gaps between consecutive rows
-            time_diff = df.index.to_series().diff()
-            max_gap_minutes = 120  # 2 hours - allows filling within a session
-            gap_threshold = pd.Timedelta(minutes=max_gap_minutes)
-            session_boundaries = time_diff > gap_threshold
-
-            if session_boundaries.sum() > 0:
-                # At session boundaries, revert bid/ask to NaN (undo the reindex ffill)
-                # We need to get the ORIGINAL values from self.df to check if they were NaN
-                for col in quote_cols_present:
-                    if col in self.df.columns:
-                        # Create a series aligned to df's index. Values will be NaN for newly
-                        # introduced rows during the reindex/ffill step.
-                        original_values = self.df[col].reindex(df.index)
-
-                        # Only clear values that were forward-filled across a large time gap.
-                        # Do NOT wipe real quotes that exist on the boundary bar (common for daily EOD NBBO).
-                        clear_mask = session_boundaries & original_values.isna()
-                        if clear_mask.any():
-                            df.loc[clear_mask, col] = float("nan")
-
-        # OPTIMIZATION: More efficient column selection and forward fill
-        ohlc_cols = ["open", "high", "low"]
-        # MODIFIED: Exclude bid/ask from standard ffill - handle them separately
-        quote_cols_set = set(quote_cols)
-        non_ohlc_cols = [col for col in df.columns if col not in ohlc_cols and col not in quote_cols_set]
-        if non_ohlc_cols:
-            df[non_ohlc_cols] = df[non_ohlc_cols].ffill()
-
-        # For quote columns, do segment-wise ffill (don't fill across session boundaries)
-        if apply_quote_session_boundaries and quote_cols_present and isinstance(df.index, pd.DatetimeIndex):
-            time_diff = df.index.to_series().diff()
-            max_gap_minutes = 120
-            gap_threshold = pd.Timedelta(minutes=max_gap_minutes)
-            session_boundaries = time_diff > gap_threshold
-            segment_ids = session_boundaries.cumsum()
-
-            for col in quote_cols_present:
-                # Group by segment and forward-fill within each group only
-                df[col] = df.groupby(segment_ids)[col].ffill()
-
-        # If any of close, open, high, low columns are missing, add them with NaN.
-        for col in ["close", "open", "high", "low"]:
-            if col not in df.columns:
-                df[col] = None
-
-        # OPTIMIZATION: Vectorized NaN filling for OHLC columns
-        if "close" in df.columns:
-            for col in ["open", "high", "low"]:
-                if col in df.columns:
-                    try:
-                        # More efficient: compute mask once, use where
-                        mask = df[col].isna()
-                        if mask.any():
-                            df[col] = df[col].where(~mask, df["close"])
-                    except Exception as e:
-                        logger.error(f"Error filling {col} column: {e}")
-
-        self.df = df
-
-        # Set up iter_index and iter_index_dict for later use.
-        iter_index = pd.Series(df.index)
-        self.iter_index = pd.Series(iter_index.index, index=iter_index)
-        self.iter_index_dict = self.iter_index.to_dict()
-
-        # Populate the datalines dictionary (assuming to_datalines is defined elsewhere).
-        self.datalines = dict()
-        self.to_datalines()
+            values = self._gather(column)
+            if column == "volume" and column in source.columns:
+                mask = pd.isna(values)
+                if mask.any():
+                    values = values.copy()
+                    values[mask] = 0
+            values = _forward_fill(values)
+
+        cache[column] = values
+        return values
+
+    def _gather(self, column):
+        # Equivalent of ``df.reindex(idx, method="ffill")[column]``; columns the source lacks are all-None.
+        source = self._df
+        if column not in source.columns:
+            return np.full(len(self._index_ns), None, dtype=object)
+        return source[column].to_numpy()[self._source_pos]
+
+    def _get_session_starts(self):
+        if self._session_starts is None:
+            gaps = np.diff(self._index_ns) > _QUOTE_SESSION_GAP_NS
+            self._session_starts = np.concatenate(([False], gaps))
+        return self._session_starts
 
     def to_datalines(self):
-        self.datalines.update(
-            {
-                "datetime": Dataline(
-                    self.asset,
-                    "datetime",
-                    self.df.index.to_numpy(),
-                    self.df.index.dtype,
-                )
-            }
-        )
-        self.datetime = self.datalines["datetime"].dataline
-
-        for column in self.df.columns:
-            self.datalines.update(
-                {
-                    column: Dataline(
-                        self.asset,
-                        column,
-                        self.df[column].to_numpy(),
-                        self.df[column].dtype,
-                    )
-                }
-            )
-            setattr(self, column, self.datalines[column].dataline)
+        """Register a lazily built ``Dataline`` for the datetime index and every repaired column."""
+        self._column_cache = {}
+        self.datalines = _LazyDatalines(self._make_dataline, ["datetime"] + self._columns)
+
+    def _make_dataline(self, name):
+        if name == "datetime":
+            values = self._repair_index.to_numpy()
+            return Dataline(self.asset, name, values, self._repair_index.dtype)
+        values = self._column_values(name)
+        return Dataline(self.asset, name, values, values.dtype)
+
+    def __getattr__(self, name):
+        # Column attributes such as ``self.close`` or ``self.datetime`` are built on first access.
+        datalines = self.__dict__.get("datalines")
+        if datalines is not None and not name.startswith("_") and name in datalines:
+            return datalines[name].dataline
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    @property
+    def df(self):
+        """The data as a dataframe; after ``repair_times_and_fill`` the fully repaired frame (built on access)."""
+        if self._fill_pending:
+            columns = {column: self._column_values(column) for column in self._columns}
+            self._df = pd.DataFrame(columns, index=self._repair_index, copy=False)
+            self._fill_pending = False
+            self._source_pos = None
+        return self._df
+
+    @df.setter
+    def df(self, value):
+        self._df = value
+        # Everything derived from the previous frame is stale; the next lookup repairs the new one.
+        self._fill_pending = False
+        self._index_ns = None
+        self._repair_index = None
+        self._iter_cache = None
+        self._source_pos = None
+        self._session_starts = None
+        self._column_cache = {}
 
     def get_iter_count(self, dt):
-        # Return the index location for a given datetime.
+        """Return the position of the last bar at or before ``dt`` (-1 if ``dt`` precedes the data)."""
+        cached = self._iter_cache
+        if cached is not None and cached[0] == dt:
+            return cached[1]
 
-        # Check if the date is in the dataframe, if not then get the last
-        # known data (this speeds up the process)
-        i = None
-
-        # Check if we have the iter_index_dict, if not then repair the times and fill (which will create the iter_index_dict)
-        if getattr(self, "iter_index_dict", None) is None:
+        # Repair the times and fill if that has not happened yet (which builds the int64 index)
+        if self._index_ns is None:
             self.repair_times_and_fill(self.df.index)
 
-        # Search for dt in self.iter_index_dict
-        if dt in self.iter_index_dict:
-            i = self.iter_index_dict[dt]
-        else:
-            # If not found, get the last known data
-            i = self.iter_index.asof(dt)
-
+        dt_ns = _datetime_to_ns(dt)
+        i = int(self._index_ns.searchsorted(dt_ns, side="right")) - 1
+        self._iter_cache = (dt, i, i >= 0 and self._index_ns[i] == dt_ns)
         return i
 
+    def _is_exact_bar(self, dt):
+        """True when ``dt`` falls exactly on a bar timestamp (uses the ``get_iter_count`` cache)."""
+        self.get_iter_count(dt)
+        return self._iter_cache[2]
+
     def check_data(func):
         # Validates if the provided date, length, timeshift, and timestep
         # will return data. Runs function if data, returns None if no data.
         def checker(self, *args, **kwargs):
-            if type(kwargs.get("length", 1)) not in [int, float]:
-                raise TypeError(f"Length must be an integer. {type(kwargs.get('length', 1))} was provided.")
-
-            dt = args[0]
-            length = kwargs.get("length", 1)
-            timeshift = kwargs.get("timeshift", 0)
+            with profile_section("check_data"):
+                if type(kwargs.get("length", 1)) not in [int, float]:
+                    raise TypeError(f"Length must be an integer. {type(kwargs.get('length', 1))} was provided.")
+
+                dt = args[0]
+                length = kwargs.get("length", 1)
+                timeshift = kwargs.get("timeshift", 0)
+
+                if isinstance(timeshift, datetime.timedelta):
+                    if self.timestep == "day":
+                        timeshift = int(timeshift.total_seconds() / (24 * 3600))
+                    else:
+                        timeshift = int(timeshift.total_seconds() / 60)
+                    kwargs["timeshift"] = timeshift
+
+                # Check if the iter date is outside of this data's date range.
+                if dt < self.datetime_start:
+                    raise ValueError(
+                        f"The date you are looking for ({dt}) for ({self.asset}) is outside of the data's date range ({self.datetime_start} to {self.datetime_end}). This could be because the data for this asset does not exist for the date you are looking for, or something else."
+                    )
 
-            if isinstance(timeshift, datetime.timedelta):
+                # For daily data, compare dates (not timestamps) to handle timezone issues.
+                # ThetaData daily bars are timestamped at 00:00 UTC, which when converted to EST
+                # appears as the previous day's evening. A bar for Nov 3 00:00 UTC represents
+                # trading on Nov 3 and should cover the entire Nov 3 trading day.
+                dt_exceeds_end = False
                 if self.timestep == "day":
-                    timeshift = int(timeshift.total_seconds() / (24 * 3600))
+                    # Convert datetime_end to UTC to get the actual date the bar represents
+                    import pytz
+                    utc = pytz.UTC
+                    if hasattr(self.datetime_end, 'astimezone'):
+                        datetime_end_utc = self.datetime_end.astimezone(utc)
+                    else:
+                        datetime_end_utc = self.datetime_end
+                    datetime_end_date = datetime_end_utc.date()
+                    dt_date = dt.date()
+                    dt_exceeds_end = dt_date > datetime_end_date
                 else:
-                    timeshift = int(timeshift.total_seconds() / 60)
-                kwargs["timeshift"] = timeshift
-
-            # Check if the iter date is outside of this data's date range.
-            if dt < self.datetime_start:
-                raise ValueError(
-                    f"The date you are looking for ({dt}) for ({self.asset}) is outside of the data's date range ({self.datetime_start} to {self.datetime_end}). This could be because the data for this asset does not exist for the date you are looking for, or something else."
-                )
-
-            # For daily data, compare dates (not timestamps) to handle timezone issues.
-            # ThetaData daily bars are timestamped at 00:00 UTC, which when converted to EST
-            # appears as the previous day's evening. A bar for Nov 3 00:00 UTC represents
-            # trading on Nov 3 and should cover the entire Nov 3 trading day.
-            dt_exceeds_end = False
-            if self.timestep == "day":
-                # Convert datetime_end to UTC to get the actual date the bar represents
-                import pytz
-                utc = pytz.UTC
-                if hasattr(self.datetime_end, 'astimezone'):
-                    datetime_end_utc = self.datetime_end.astimezone(utc)
-                else:
-                    datetime_end_utc = self.datetime_end
-                datetime_end_date = datetime_end_utc.date()
-                dt_date = dt.date()
-                dt_exceeds_end = dt_date > datetime_end_date
-            else:
-                dt_exceeds_end = dt > self.datetime_end
-
-            if dt_exceeds_end:
-                strict_end_check = getattr(self, "strict_end_check", False)
-                if strict_end_check:
-                    raise ValueError(
-                        f"The date you are looking for ({dt}) for ({self.asset}) is after the available data's end ({self.datetime_end}) with length={length} and timeshift={timeshift}; data refresh required instead of using stale bars."
+                    dt_exceeds_end = dt > self.datetime_end
+
+                if dt_exceeds_end:
+                    strict_end_check = getattr(self, "strict_end_check", False)
+                    if strict_end_check:
+                        raise ValueError(
+                            f"The date you are looking for ({dt}) for ({self.asset}) is after the available data's end ({self.datetime_end}) with length={length} and timeshift={timeshift}; data refresh required instead of using stale bars."
+                        )
+                    gap = dt - self.datetime_end
+                    max_gap = datetime.timedelta(days=3)
+                    if gap > max_gap:
+                        raise ValueError(
+                            f"The date you are looking for ({dt}) for ({self.asset}) is after the available data's end ({self.datetime_end}) with length={length} and timeshift={timeshift}; data refresh required instead of using stale bars."
+                        )
+                    logger.warning(
+                        f"The date you are looking for ({dt}) is after the available data's end ({self.datetime_end}) by {gap}. Using the last available bar (within tolerance of {max_gap})."
                     )
-                gap = dt - self.datetime_end
-                max_gap = datetime.timedelta(days=3)
-                if gap > max_gap:
-                    raise ValueError(
-                        f"The date you are looking for ({dt}) for ({self.asset}) is after the available data's end ({self.datetime_end}) with length={length} and timeshift={timeshift}; data refresh required instead of using stale bars."
-                    )
-                logger.warning(
-                    f"The date you are looking for ({dt}) is after the available data's end ({self.datetime_end}) by {gap}. Using the last available bar (within tolerance of {max_gap})."
-                )
-
-            # Search for dt in self.iter_index_dict
-            if getattr(self, "iter_index_dict", None) is None:
-                self.repair_times_and_fill(self.df.index)
 
-            if dt in self.iter_index_dict:
-                i = self.iter_index_dict[dt]
-            else:
-                # If not found, get the last known data
-                i = self.iter_index.asof(dt)
+                i = self.get_iter_count(dt)
 
-            data_index = i + 1 - length - timeshift
-            is_data = data_index >= 0
-            if not is_data:
-                # Log a warning
-                logger.warning(
-                    f"The date you are looking for ({dt}) is outside of the data's date range ({self.datetime_start} to {self.datetime_end}) after accounting for a length of {kwargs.get('length', 1)} and a timeshift of {kwargs.get('timeshift', 0)}. Keep in mind that the length you are requesting must also be available in your data, in this case we are {data_index} rows away from the data you need."
-                )
-                try:
-                    idx_vals = self.df.index
-                    idx_min = idx_vals.min()
-                    idx_max = idx_vals.max()
-                    logger.info(
-                        "[DATA][CHECK] asset=%s timestep=%s dt=%s length=%s timeshift=%s iter_index=%s idx_min=%s idx_max=%s rows=%s",
-                        getattr(self.asset, "symbol", self.asset),
-                        getattr(self, "timestep", None),
-                        dt,
-                        length,
-                        timeshift,
-                        i,
-                        idx_min,
-                        idx_max,
-                        len(idx_vals),
+                data_index = i + 1 - length - timeshift
+                is_data = data_index >= 0
+                if not is_data:
+                    # Log a warning
+                    logger.warning(
+                        f"The date you are looking for ({dt}) is outside of the data's date range ({self.datetime_start} to {self.datetime_end}) after accounting for a length of {kwargs.get('length', 1)} and a timeshift of {kwargs.get('timeshift', 0)}. Keep in mind that the length you are requesting must also be available in your data, in this case we are {data_index} rows away from the data you need."
                     )
-                except Exception:
-                    logger.debug("[DATA][CHECK] failed to log index diagnostics", exc_info=True)
+                    try:
+                        idx_vals = self._repair_index if self._repair_index is not None else self.df.index
+                        idx_min = idx_vals.min()
+                        idx_max = idx_vals.max()
+                        logger.info(
+                            "[DATA][CHECK] asset=%s timestep=%s dt=%s length=%s timeshift=%s iter_index=%s idx_min=%s idx_max=%s rows=%s",
+                            getattr(self.asset, "symbol", self.asset),
+                            getattr(self, "timestep", None),
+                            dt,
+                            length,
+                            timeshift,
+                            i,
+                            idx_min,
+                            idx_max,
+                            len(idx_vals),
+                        )
+                    except Exception:
+                        logger.debug("[DATA][CHECK] failed to log index diagnostics", exc_info=True)
 
             res = func(self, *args, **kwargs)
             # print(f"Results last price: {res}")
@@ -565,7 +703,7 @@ class Data:
         if self.timestep == "day":
             price = close_price
         else:
-            price = close_price if dt > self.datalines["datetime"].dataline[iter_count] else open_price
+            price = open_price if self._is_exact_bar(dt) else close_price
 
         if price is None:
             return None
@@ -717,6 +855,16 @@ class Data:
 
         """
 
+        start_row, end_row = self._get_bars_range(dt, length=length, timeshift=timeshift)
+
+        dict = {}
+        for dl_name, dl in self.datalines.items():
+            dict[dl_name] = dl.dataline[start_row:end_row]
+
+        return dict
+
+    def _get_bars_range(self, dt, length=1, timeshift=0):
+        """Return the ``(start_row, end_row)`` slice of the ``length`` bars ending at ``dt`` (shifted by ``timeshift``)."""
         if isinstance(timeshift, datetime.timedelta):
             if self.timestep == "day":
                 timeshift = int(timeshift.total_seconds() / (24 * 3600))
@@ -740,14 +888,7 @@ class Data:
             start_row = max(0, end_row - 1)
 
         # Cast both start_row and end_row to int
-        start_row = int(start_row)
-        end_row = int(end_row)
-
-        dict = {}
-        for dl_name, dl in self.datalines.items():
-            dict[dl_name] = dl.dataline[start_row:end_row]
-
-        return dict
+        return int(start_row), int(end_row)
 
     def _get_bars_between_dates_dict(self, timestep=None, start_date=None, end_date=None):
         """Returns a dictionary of all the data available between the start and end dates.
@@ -854,6 +995,62 @@ class Data:
 
         return df_result
 
+    @check_data
+    def _get_bars_arrays_dict(self, dt, length=1, timeshift=0):
+        """Returns views of the datetime and bar columns for ``get_bars_arrays``."""
+        start_row, end_row = self._get_bars_range(dt, length=length, timeshift=timeshift)
+        columns = {"datetime": self._index_ns[start_row:end_row].view("datetime64[ns]")}
+        for name in _BAR_COLUMNS:
+            if name in self.datalines:
+                columns[name] = self.datalines[name].dataline[start_row:end_row]
+        return columns
+
+    def get_bars_arrays(self, dt, length=1, timestep=MIN_TIMESTEP, timeshift=0):
+        """Returns the bars of ``get_bars`` as NumPy arrays.
+
+        When the requested timestep is the timestep of the data, the arrays are read-only slices of the datalines
+        and no DataFrame is built. Other timesteps are aggregated by ``get_bars`` first.
+
+        Parameters
+        ----------
+        dt : datetime.datetime
+            The datetime to get the data.
+        length : int
+            The number of periods to get the data.
+        timestep : str
+            The frequency of the data to get the data. Only minute and day are supported.
+        timeshift : int
+            The number of periods to shift the data.
+
+        Returns
+        -------
+        BarArrays
+        """
+        quantity, unit = parse_timestep_qty_and_unit(timestep)
+        if quantity != 1 or unit != self.timestep:
+            return BarArrays.from_frame(
+                self.get_bars(dt, length=length, timestep=timestep, timeshift=timeshift), asset=self.asset
+            )
+
+        columns = self._get_bars_arrays_dict(dt, length=length, timeshift=timeshift)
+
+        # Like get_bars, drop the bars with a missing value (rare once the data has been repaired and filled)
+        complete = None
+        for name in _BAR_COLUMNS:
+            values = columns.get(name)
+            if values is not None and values.dtype.kind in "fO":
+                missing = pd.isna(values)
+                if missing.any():
+                    complete = ~missing if complete is None else complete & ~missing
+        for name, values in columns.items():
+            if complete is not None:
+                values = values[complete]
+            elif values.flags.writeable:
+                values = values.view()
+            values.flags.writeable = False
+            columns[name] = values
+        return BarArrays(columns, asset=self.asset)
+
     def get_bars_between_dates(self, timestep=MIN_TIMESTEP, exchange=None, start_date=None, end_date=None):
         """Returns a dataframe of all the data available between the start and end dates.
 
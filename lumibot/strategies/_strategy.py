@@ -22,7 +22,10 @@ from sqlalchemy.exc import OperationalError
 from termcolor import colored
 
 from lumibot.constants import LUMIBOT_DEFAULT_PYTZ
+from lumibot.tools.backtest_profiler import get_backtest_profiler, profiled
+from lumibot.tools.chart_series_store import LINE_COLUMNS, MARKER_COLUMNS, MARKER_KEY_COLUMNS, ChartSeriesStore
 from lumibot.tools.lumibot_logger import get_logger, get_strategy_logger
+from lumibot.tools.running_metrics import RunningPerformanceMetrics
 
 from ..backtesting import (
     AlpacaBacktesting,
@@ -33,6 +36,7 @@ from ..backtesting import (
     PolygonDataBacktesting,
     ThetaDataBacktesting,
     ThetaDataBacktestingPandas,
+    ThetaDataBacktestingPolars,
     YahooDataBacktesting,
 )
 from ..credentials import (
@@ -154,6 +158,28 @@ class _Strategy:
     def is_backtesting(self, value: bool) -> None:
         self._is_backtesting = bool(value)
 
+    @property
+    def _chart_markers_list(self):
+        """The chart markers added with ``add_marker`` (a list-like ``ChartSeriesStore`` of marker dicts)."""
+        if "_chart_markers" not in self.__dict__:
+            self._chart_markers = ChartSeriesStore(MARKER_COLUMNS, key_columns=MARKER_KEY_COLUMNS)
+        return self._chart_markers
+
+    @_chart_markers_list.setter
+    def _chart_markers_list(self, markers):
+        self._chart_markers = ChartSeriesStore.from_records(markers, MARKER_COLUMNS, key_columns=MARKER_KEY_COLUMNS)
+
+    @property
+    def _chart_lines_list(self):
+        """The chart line points added with ``add_line`` (a list-like ``ChartSeriesStore`` of line dicts)."""
+        if "_chart_lines" not in self.__dict__:
+            self._chart_lines = ChartSeriesStore(LINE_COLUMNS)
+        return self._chart_lines
+
+    @_chart_lines_list.setter
+    def _chart_lines_list(self, lines):
+        self._chart_lines = ChartSeriesStore.from_records(lines, LINE_COLUMNS)
+
     IS_BACKTESTABLE = True
     _trader = None
 
@@ -418,11 +444,9 @@ class _Strategy:
         # Force start immediately if we are backtesting
         self.force_start_immediately = force_start_immediately
 
-        # Initialize the chart markers list
-        self._chart_markers_list = []
-
-        # Initialize the chart lines list
-        self._chart_lines_list = []
+        # Initialize the chart markers and lines (columnar, with O(1) duplicate marker detection)
+        self._chart_markers = ChartSeriesStore(MARKER_COLUMNS, key_columns=MARKER_KEY_COLUMNS)
+        self._chart_lines = ChartSeriesStore(LINE_COLUMNS)
 
         # Hold the asset objects for strings for stocks only.
         self._asset_mapping = dict()
@@ -504,6 +528,7 @@ class _Strategy:
         self._stats = None
         self._stats_list = []
         self._stats_dirty = False
+        self._running_metrics = RunningPerformanceMetrics()
         self._analysis = {}
 
         # Variable backup related variables
@@ -697,6 +722,7 @@ class _Strategy:
 
     # =============Auto updating functions=============
 
+    @profiled("portfolio_valuation")
     def _update_portfolio_value(self):
         """updates self.portfolio_value"""
         # Live runs don't need to recalculate portfolio value here, as the broker sync should handle it
@@ -717,7 +743,7 @@ class _Strategy:
 
             # Set the base currency for crypto valuations.
 
-            prices = {}
+            sources = {}
             for asset in assets_original:
                 if asset != self._quote_asset:
                     asset_is_option = False
@@ -727,9 +753,21 @@ class _Strategy:
                         asset_is_option = True
 
                     if self.broker.option_source is not None and asset_is_option:
-                        source = self.broker.option_source
+                        sources[asset] = self.broker.option_source
                     else:
-                        source = self.broker.data_source
+                        sources[asset] = self.broker.data_source
+
+            # A columnar data source prices all of its positions with one cross-section read.
+            prices = {}
+            data_source = self.broker.data_source
+            if getattr(data_source, "universe_store", None) is not None:
+                batch = [asset for asset, source in sources.items() if source is data_source]
+                prices = {
+                    asset: price for asset, price in data_source.get_last_prices(batch).items() if price is not None
+                }
+
+            for asset, source in sources.items():
+                if asset not in prices:
                     prices[asset] = self._get_price_from_source(source, asset)
 
             for position in positions:
@@ -841,7 +879,7 @@ class _Strategy:
         is_thetadata_option_backtest = (
             self.is_backtesting
             and is_option_asset
-            and isinstance(source, ThetaDataBacktestingPandas)
+            and isinstance(source, (ThetaDataBacktestingPandas, ThetaDataBacktestingPolars))
         )
 
         # Determine if this strategy is effectively daily cadence.
@@ -1222,6 +1260,12 @@ class _Strategy:
     def _append_row(self, row):
         self._stats_list.append(row)
         self._stats_dirty = True
+        running_metrics = getattr(self, "_running_metrics", None)
+        if running_metrics is None:
+            running_metrics = self._running_metrics = RunningPerformanceMetrics()
+            for previous in self._stats_list[:-1]:
+                running_metrics.update(previous.get("datetime"), previous.get("portfolio_value"))
+        running_metrics.update(row.get("datetime"), row.get("portfolio_value"))
 
     def _format_stats(self):
         if not self._stats_dirty and self._stats is not None:
@@ -1252,7 +1296,14 @@ class _Strategy:
 
             self._strategy_returns_df = day_deduplicate(self._stats)
 
-            self._analysis = stats_summary(self._strategy_returns_df, self.risk_free_rate)
+            # The running metrics match stats_summary; the batch functions cover rows they could not follow.
+            running_metrics = getattr(self, "_running_metrics", None)
+            if running_metrics is not None and running_metrics.is_valid and running_metrics.rows == len(
+                self._strategy_returns_df
+            ):
+                self._analysis = running_metrics.summary(self.risk_free_rate)
+            else:
+                self._analysis = stats_summary(self._strategy_returns_df, self.risk_free_rate)
 
             # Get performance for the benchmark asset
             self._dump_benchmark_stats()
@@ -1496,6 +1547,7 @@ class _Strategy:
         trader_class = Trader,
         include_cash_positions=False,
         save_stats_file = True,
+        profile = False,
         **kwargs,
     ):
         """Backtest a strategy.
@@ -1580,6 +1632,11 @@ class _Strategy:
             Whether to quiet the logs during the backtest. Defaults to True.
         trader_class : class
             The class to use for the trader. Defaults to Trader.
+        profile : bool
+            Whether to profile the backtest. Defaults to False. If True, wall time and call counts are accumulated
+            for data fetches, cache loads, check_data, order processing, portfolio valuation, stats tracing and
+            on_trading_iteration. A JSON report (``*_profile.json``) and a flamegraph-compatible collapsed-stack file
+            (``*_profile.collapsed``) are written to the logs directory.
 
         Returns
         -------
@@ -1910,14 +1967,30 @@ class _Strategy:
         self.logger.info("Starting backtest...")
         start = datetime.datetime.now()
 
-        result = self._trader.run_all(
-            show_plot=show_plot,
-            show_tearsheet=show_tearsheet,
-            save_tearsheet=save_tearsheet,
-            show_indicators=show_indicators,
-            tearsheet_file=tearsheet_file,
-            base_filename=base_filename,
-        )
+        profiler = get_backtest_profiler()
+        if profile:
+            profiler.reset()
+            profiler.start()
+
+        try:
+            result = self._trader.run_all(
+                show_plot=show_plot,
+                show_tearsheet=show_tearsheet,
+                save_tearsheet=save_tearsheet,
+                show_indicators=show_indicators,
+                tearsheet_file=tearsheet_file,
+                base_filename=base_filename,
+            )
+        finally:
+            if profile:
+                profiler.stop()
+
+        if profile:
+            strategy.backtest_profile = profiler.to_dict()
+            profile_json = profiler.write_json(f"{logdir}/{base_filename}_profile.json")
+            profile_collapsed = profiler.write_collapsed(f"{logdir}/{base_filename}_profile.collapsed")
+            self.logger.info(profiler.summary())
+            self.logger.info(f"Backtest profile written to {profile_json} and {profile_collapsed}")
 
         end = datetime.datetime.now()
         backtesting_length = backtesting_end - backtesting_start
@@ -1982,9 +2055,9 @@ class _Strategy:
             show_plot=show_plot,
         )
         # Create chart lines dataframe
-        chart_lines_df = pd.DataFrame(self._chart_lines_list)
+        chart_lines_df = self._chart_lines_list.to_dataframe()
         # Create chart markers dataframe
-        chart_markers_df = pd.DataFrame(self._chart_markers_list)
+        chart_markers_df = self._chart_markers_list.to_dataframe()
 
         # Check if we have at least one indicator to plot
         if chart_markers_df is not None and chart_lines_df is not None:
@@ -18,8 +18,9 @@ from apscheduler.triggers.cron import CronTrigger
 from termcolor import colored, COLORS
 
 from ..data_sources import DataSource
-from ..entities import Asset, Data, Order, Position, Quote, TradingFee
-from ..tools import get_risk_free_rate
+from ..entities import Asset, BarArrays, Data, Order, Position, Quote, TradingFee
+from ..tools import day_deduplicate, get_risk_free_rate, stats_summary
+from ..tools.indicator_engine import IndicatorEngine
 from ..tools.polars_utils import PolarsResampleError, resample_polars_ohlc
 from ..traders import Trader
 from ..credentials import IS_BACKTESTING
@@ -335,6 +336,61 @@ class Strategy(_Strategy):
     def analysis(self):
         return self._analysis
 
+    def get_performance_metrics(self, risk_free_rate: float = None) -> dict:
+        """Returns the performance of the strategy so far.
+
+        The metrics are updated every time the strategy records its portfolio value, so this is cheap to call
+        on every iteration, e.g. to post periodic summaries from a live bot.
+
+        Parameters
+        ----------
+        risk_free_rate : float, optional
+            The risk-free rate used for the Sharpe ratio. Defaults to the strategy's risk free rate.
+
+        Returns
+        -------
+        dict
+            The same keys as the end of run analysis: "cagr", "volatility", "sharpe", "max_drawdown" (a dict with
+            "drawdown" and "date"), "romad" and "total_return".
+
+        Example
+        -------
+        >>> metrics = self.get_performance_metrics()
+        >>> self.log_message(f"Sharpe: {metrics['sharpe']:.2f}, Max DD: {metrics['max_drawdown']['drawdown']:.2%}")
+        """
+        if risk_free_rate is None:
+            risk_free_rate = self.risk_free_rate
+        if not self._running_metrics.is_valid:
+            self._format_stats()
+            return stats_summary(day_deduplicate(self._stats), risk_free_rate)
+        return self._running_metrics.summary(risk_free_rate)
+
+    @property
+    def indicators(self) -> IndicatorEngine:
+        """Technical indicators (SMA, EMA, RSI, ATR) that update incrementally as new bars arrive.
+
+        The first call for an indicator fetches enough history to warm it up. Later calls only fetch the bars that
+        are new since the previous iteration, so this is much cheaper than calling ``get_historical_prices`` with a
+        long window on every iteration. Each method returns the latest value, or None while warming up.
+
+        Returns
+        -------
+        IndicatorEngine
+
+        Example
+        -------
+        >>> ema_fast = self.indicators.ema("SPY", 20, "day")
+        >>> ema_slow = self.indicators.ema("SPY", 50, "day")
+        >>> if ema_fast is not None and ema_slow is not None and ema_fast > ema_slow:
+        >>>     self.log_message("Uptrend")
+        >>>
+        >>> # Past values as NumPy arrays, oldest first
+        >>> datetimes, rsi_values = self.indicators.rsi("SPY", 14, "minute", history=True)
+        """
+        if "_indicators" not in self.__dict__:
+            self._indicators = IndicatorEngine(self)
+        return self._indicators
+
     @property
     def risk_free_rate(self) -> float:
         if self._risk_free_rate is not None:
@@ -2293,6 +2349,35 @@ class Strategy(_Strategy):
         asset = self._sanitize_user_asset(asset)
         return self.broker.get_chains(asset)
 
+    def prefetch_data(self, assets: list, timestep: str = "minute"):
+        """Loads the data of many assets at once, before they are priced one by one.
+
+        In backtests the data of an asset is downloaded the first time the strategy asks for its price. When
+        the backtesting data source supports it (ThetaData, DataBento), this downloads the data of all the
+        given assets up front, concurrently where possible, so the following get_last_price / get_quote calls
+        read it from the cache. Does nothing in live trading or with other data sources.
+
+        Parameters
+        ----------
+        assets : list of Asset
+            The assets that will be priced, e.g. the option contracts of a strike scan.
+        timestep : str
+            The timestep of the data, "minute" or "day". Default is "minute".
+
+        Example
+        -------
+        >>> contracts = [Asset("SPY", Asset.AssetType.OPTION, expiration=expiry, strike=strike, right="call")
+        ...              for strike in strikes]
+        >>> self.prefetch_data(contracts)
+        >>> prices = {contract.strike: self.get_last_price(contract) for contract in contracts}
+        """
+        if not self.is_backtesting:
+            return
+        prefetch = getattr(getattr(self.broker, "data_source", None), "prefetch_data", None)
+        if prefetch is None:
+            return
+        prefetch([self._sanitize_user_asset(asset) for asset in assets], timestep=timestep)
+
     def get_next_trading_day(self, date: str, exchange="NYSE"):
         """
         Finds the next trading day for the given date and exchange.
@@ -3198,21 +3283,9 @@ class Strategy(_Strategy):
 
         value = numeric_value
 
-        # Check for duplicate markers
-        if len(self._chart_markers_list) > 0:
-            timestamp = dt.timestamp()
-            for marker in self._chart_markers_list:
-                if (
-                        marker["timestamp"] == timestamp
-                        and marker["name"] == name
-                        and marker["symbol"] == symbol
-                        and marker['plot_name'] == plot_name
-                ):
-                    return None
-
         new_marker = {
             "datetime": dt,
-            "timestamp": dt.timestamp(),  # This is to speed up the process of finding duplicate markers
+            "timestamp": dt.timestamp(),  # Part of the duplicate-marker key
             "name": name,
             "symbol": symbol,
             "color": color,
@@ -3220,18 +3293,15 @@ class Strategy(_Strategy):
             "value": value,
             "detail_text": detail_text,
             "plot_name": plot_name,
-            # Asset fields for multi-symbol charting support
-            "asset_symbol": asset.symbol if asset else None,
-            "asset_type": asset.asset_type if asset else None,
-            "asset_expiration": str(asset.expiration) if asset and asset.expiration else None,
-            "asset_strike": asset.strike if asset else None,
-            "asset_right": asset.right if asset else None,
-            "asset_multiplier": asset.multiplier if asset else None,
-            "quote_symbol": asset._quote_asset.symbol if asset and hasattr(asset, '_quote_asset') and asset._quote_asset else None,
-            "asset_display_name": str(asset) if asset else None,
         }
 
-        self._chart_markers_list.append(new_marker)
+        # Markers are stored columnar; duplicates (same timestamp, name, symbol and plot) are skipped via a key set
+        markers = self._chart_markers_list
+        if not markers.append(new_marker, asset=asset):
+            return None
+
+        # Asset fields for multi-symbol charting support
+        new_marker.update(markers.asset_fields(asset))
 
         return new_marker
 
@@ -3244,7 +3314,8 @@ class Strategy(_Strategy):
             The markers on the indicator chart.
         """
 
-        df = pd.DataFrame(self._chart_markers_list)
+        # Copy so edits to the returned frame cannot change the cached one
+        df = self._chart_markers_list.to_dataframe().copy()
 
         return df
 
@@ -3378,16 +3449,8 @@ class Strategy(_Strategy):
                 "width": width,
                 "detail_text": detail_text,
                 "plot_name": plot_name,
-                # Asset fields for multi-symbol charting support
-                "asset_symbol": asset.symbol if asset else None,
-                "asset_type": asset.asset_type if asset else None,
-                "asset_expiration": str(asset.expiration) if asset and asset.expiration else None,
-                "asset_strike": asset.strike if asset else None,
-                "asset_right": asset.right if asset else None,
-                "asset_multiplier": asset.multiplier if asset else None,
-                "quote_symbol": asset._quote_asset.symbol if asset and hasattr(asset, '_quote_asset') and asset._quote_asset else None,
-                "asset_display_name": str(asset) if asset else None,
-            }
+            },
+            asset=asset,
         )
 
     def get_lines_df(self):
@@ -3399,7 +3462,8 @@ class Strategy(_Strategy):
             The lines on the indicator chart.
         """
 
-        df = pd.DataFrame(self._chart_lines_list)
+        # Copy so edits to the returned frame cannot change the cached one
+        df = self._chart_lines_list.to_dataframe().copy()
 
         return df
 
@@ -3521,6 +3585,7 @@ class Strategy(_Strategy):
         exchange: str = None,
         include_after_hours: bool = True,
         return_polars: bool = False,
+        return_numpy: bool = False,
     ):
         """Get historical pricing data for a given symbol or asset.
 
@@ -3567,13 +3632,16 @@ class Strategy(_Strategy):
         return_polars : bool
             If True, return Bars with Polars DataFrame for better performance. Default is False (returns pandas).
             When False and data is in Polars format, a warning will be issued about the conversion.
+        return_numpy : bool
+            If True, return a ``BarArrays`` (one NumPy array per column, e.g. ``arrays.close``) instead of Bars.
+            In pandas backtests the arrays are views of the loaded data and no DataFrame is built. Default is False.
 
         Returns
         -------
         Bars
             The bars object with all the historical pricing data. Please check the ``Entities.Bars``
             object documentation for more details on how to use Bars objects. To get a ``DataFrame``
-            from the Bars object, use ``bars.df``.
+            from the Bars object, use ``bars.df``. With ``return_numpy=True``, a ``BarArrays``.
 
         Example
         -------
@@ -3590,6 +3658,9 @@ class Strategy(_Strategy):
         >>> last_ohlc = df.iloc[-1] # Get the last row of the DataFrame (the most recent pricing data we have)
         >>> self.log_message(f"Last price of BTC in USD: {last_ohlc['close']}, and the open price was {last_ohlc['open']}")
 
+        >>> # Get the closes of the last 200 minutes of SPY as a NumPy array, without building a DataFrame
+        >>> closes = self.get_historical_prices("SPY", 200, "minute", return_numpy=True).close
+
         >>> # Get the data for AAPL for the last 30 minutes
         >>> bars =  self.get_historical_prices("AAPL", 30, "minute")
         >>>
@@ -3702,6 +3773,13 @@ class Strategy(_Strategy):
                 include_after_hours=include_after_hours,
                 quote=quote,
             )
+            if return_numpy and not needs_resampling and "return_numpy" in params:
+                return fn(
+                    asset,
+                    actual_length,
+                    return_numpy=True,
+                    **common_kwargs,
+                )
             if supports_return_polars:
                 return fn(
                     asset,
@@ -3722,6 +3800,9 @@ class Strategy(_Strategy):
         else:
             bars = _call_get_hist(self.broker.data_source)
 
+        if isinstance(bars, BarArrays):
+            return bars
+
         # If we need to resample the data
         if needs_resampling and bars and len(bars) > 0:
             resampled_with_polars = False
@@ -3775,6 +3856,8 @@ class Strategy(_Strategy):
                     # If resampling fails, log warning and return original data
                     self.logger.warning(f"Failed to resample data from {actual_timestep} to {original_timestep}: {e}")
 
+        if return_numpy and bars is not None and hasattr(bars, "arrays"):
+            return bars.arrays
         return bars
 
     def get_symbol_bars(
@@ -4194,6 +4277,29 @@ class Strategy(_Strategy):
         """
         pass
 
+    def prefetch_assets(self):
+        """Use this lifecycle method to list the assets whose data a backtest should load up front.
+
+        It is called once in backtests, right after initialize and before the first trading iteration. The data
+        source loads the data of the returned assets before the backtest clock starts, concurrently when it
+        supports it (ThetaData), instead of one asset at a time the first time each one is priced. The progress
+        is shown on the backtest progress bar. It is not called in live trading.
+
+        Returns
+        -------
+        list of Asset or str
+            The assets to load. Default is an empty list (no warm-up).
+
+        Example
+        -------
+        >>> def initialize(self):
+        >>>     self.universe = ["AAPL", "MSFT", "NVDA", "AMZN"]
+
+        >>> def prefetch_assets(self):
+        >>>     return self.universe
+        """
+        return []
+
     def before_market_opens(self):
         """Use this lifecycle method to execute code
         self.minutes_before_opening minutes before opening.
@@ -4589,6 +4695,7 @@ class Strategy(_Strategy):
         quiet_logs: bool = True,
         trader_class: Type[Trader] = Trader,
         save_stats_file: bool = True,
+        profile: bool = False,
         **kwargs,
     ):
         """Backtest a strategy.
@@ -4678,6 +4785,9 @@ class Strategy(_Strategy):
             Whether to quiet noisy logs by setting the log level to ERROR. Defaults to True.
         trader_class : Trader class
             The trader class to use. Defaults to Trader.
+        profile : bool
+            Whether to profile the backtest and write a JSON report and a collapsed-stack (flamegraph) file to the
+            logs directory. Defaults to False.
 
         Returns
         -------
@@ -4751,6 +4861,7 @@ class Strategy(_Strategy):
             quiet_logs=quiet_logs,
             trader_class=trader_class,
             save_stats_file=save_stats_file,
+            profile=profile,
             **kwargs,
         )
         return results
@@ -20,6 +20,7 @@ from lumibot.constants import LUMIBOT_DEFAULT_PYTZ
 from lumibot.entities import Asset, Order
 from lumibot.entities import Asset
 from lumibot.tools import append_locals, get_trading_days, staticdecorator
+from lumibot.tools.backtest_profiler import profile_section, profiled
 
 
 class StrategyExecutor(Thread):
@@ -161,24 +162,30 @@ class StrategyExecutor(Thread):
                 pass
             time.sleep(0.5)
 
+    def _progress_positions(self):
+        """Positions in minimal format for the progress log (Position.to_minimal_dict()).
+
+        Passed to the broker as a function so the snapshot is only taken when a progress row is written.
+        """
+        positions = self.strategy.get_positions()
+        return [p.to_minimal_dict() for p in positions] if positions else None
+
+    def _progress_orders(self):
+        """ACTIVE (open) orders in minimal format for the progress log (Order.to_minimal_dict()).
+
+        Filled orders are skipped to avoid serializing thousands of them, which can exceed CSV field size limits in
+        high-frequency strategies.
+        """
+        orders = self.broker.get_tracked_orders(strategy=self.strategy.name)
+        active_orders = [o for o in orders if o.is_active()] if orders else []
+        return [o.to_minimal_dict() for o in active_orders] if active_orders else None
+
     def safe_sleep(self, sleeptime):
         # This method should only be run in back testing. If it's running during live, something has gone wrong.
 
         if self.strategy.is_backtesting:
             self.process_queue()
 
-            # Get positions and serialize to minimal format for progress logging
-            # Use Position.to_minimal_dict() for proper asset info
-            positions = self.strategy.get_positions()
-            positions_minimal = [p.to_minimal_dict() for p in positions] if positions else None
-
-            # Get ACTIVE (open) orders only and serialize to minimal format
-            # Filter to is_active() to avoid serializing thousands of filled orders
-            # which can exceed CSV field size limits in high-frequency strategies
-            orders = self.broker.get_tracked_orders(strategy=self.strategy.name)
-            active_orders = [o for o in orders if o.is_active()] if orders else []
-            orders_minimal = [o.to_minimal_dict() for o in active_orders] if active_orders else None
-
             # Get initial budget for return calculation
             initial_budget = getattr(self.strategy, '_initial_budget', None)
 
@@ -186,9 +193,9 @@ class StrategyExecutor(Thread):
                 sleeptime,
                 cash=self.strategy.cash,
                 portfolio_value=self.strategy.get_portfolio_value(),
-                positions=positions_minimal,
+                positions=self._progress_positions,
                 initial_budget=initial_budget,
-                orders=orders_minimal
+                orders=self._progress_orders
             )
 
     def sync_broker(self):
@@ -612,6 +619,7 @@ class StrategyExecutor(Thread):
 
         return func_output
 
+    @profiled("stats_tracing")
     def _trace_stats(self, context, snapshot_before):
         if context is None:
             result = {}
@@ -653,6 +661,20 @@ class StrategyExecutor(Thread):
                 safe_params_to_pass[arg] = self.strategy.parameters[arg]
         self.strategy.initialize(**safe_params_to_pass)
 
+    def _warm_up_backtest_data(self):
+        """Load the data of the strategy's prefetch_assets before the first trading iteration."""
+        assets = self.strategy.prefetch_assets()
+        warm_up = getattr(self.broker.data_source, "warm_up", None)
+        if not assets or warm_up is None:
+            return
+
+        # Same cadence rule as portfolio valuation: daily strategies read daily data.
+        sleeptime_seconds = self.strategy._get_sleeptime_seconds()
+        timestep = "day" if sleeptime_seconds is not None and sleeptime_seconds >= 20 * 3600 else "minute"
+        assets = [self.strategy._sanitize_user_asset(asset) for asset in assets]
+        self.strategy.log_message(f"Warming up the data of {len(assets)} assets ({timestep})")
+        warm_up(assets, timestep=timestep)
+
     @lifecycle_method
     @trace_stats
     def _before_market_opens(self):
@@ -722,7 +744,8 @@ class StrategyExecutor(Thread):
         try:
             # Variable Restore
             self.strategy.load_variables_from_db()
-            on_trading_iteration()
+            with profile_section("on_trading_iteration"):
+                on_trading_iteration()
 
             self.strategy._first_iteration = False
             self.broker._first_iteration = False
@@ -1271,17 +1294,6 @@ class StrategyExecutor(Thread):
 
         dt = self.broker.data_source._date_index[self.broker.data_source._iter_count]
 
-        # Get positions and serialize to minimal format for progress logging
-        positions = self.strategy.get_positions()
-        positions_minimal = [p.to_minimal_dict() for p in positions] if positions else None
-
-        # Get ACTIVE (open) orders only and serialize to minimal format for progress logging
-        # Filter to is_active() to avoid serializing thousands of filled orders
-        # which can exceed CSV field size limits in high-frequency strategies
-        orders = self.broker.get_tracked_orders(strategy=self.strategy.name)
-        active_orders = [o for o in orders if o.is_active()] if orders else []
-        orders_minimal = [o.to_minimal_dict() for o in active_orders] if active_orders else None
-
         # Get initial budget for return calculation
         initial_budget = getattr(self.strategy, '_initial_budget', None)
 
@@ -1289,9 +1301,9 @@ class StrategyExecutor(Thread):
             dt,
             cash=self.strategy.cash,
             portfolio_value=self.strategy.get_portfolio_value(),
-            positions=positions_minimal,
+            positions=self._progress_positions,
             initial_budget=initial_budget,
-            orders=orders_minimal
+            orders=self._progress_orders
         )
         self.strategy._update_cash_with_dividends()
 
@@ -1407,7 +1419,9 @@ class StrategyExecutor(Thread):
 
         # TODO: I think we should remove the OR. Pandas data can have dividends.
         # Especially if it was saved from yahoo.
-        if not has_data_source or (has_data_source and self.broker.data_source.SOURCE != "PANDAS"):
+        if not has_data_source or (
+            has_data_source and self.broker.data_source.SOURCE not in ("PANDAS", "THETADATA_POLARS")
+        ):
             self.strategy._update_cash_with_dividends()
 
         if not self.broker.is_market_open():
@@ -1584,6 +1598,9 @@ class StrategyExecutor(Thread):
 
             self._initialize()
 
+            if self.strategy.is_backtesting:
+                self._warm_up_backtest_data()
+
             # Get the trading days based on the market that the strategy is trading on
             market = self.broker.market
 
@@ -1626,6 +1643,13 @@ class StrategyExecutor(Thread):
                     if not self._advance_to_next_trading_day():
                         # Can't advance to next day (end of backtest period)
                         break
+
+            if self.strategy.is_backtesting:
+                # Progress rows are written in the background; make sure the last one reached the file.
+                flush_progress_log = getattr(self.broker.data_source, "flush_progress_log", None)
+                if flush_progress_log is not None:
+                    flush_progress_log()
+
             try:
                 self._on_strategy_end()
             except Exception as e:
@@ -0,0 +1,246 @@
+"""
+Low-overhead wall-clock instrumentation for backtests.
+
+The profiler is a process-wide singleton that is disabled by default. Instrumented code calls
+``profile_section(name)`` (or decorates a function with ``@profiled(name)``); when the profiler is disabled these
+return a shared no-op context manager so the cost is a single attribute check.
+
+When enabled (``Strategy.run_backtest(profile=True)``) every section accumulates its call count, inclusive wall time
+and self time. Nested sections are tracked per thread so the profiler can also export a collapsed-stack file
+(``frame;frame;frame <microseconds>`` per line) that flamegraph tools such as ``flamegraph.pl`` or speedscope consume.
+
+Example
+-------
+>>> from lumibot.tools.backtest_profiler import get_backtest_profiler, profile_section
+>>> profiler = get_backtest_profiler()
+>>> profiler.start()
+>>> with profile_section("data_fetch"):
+...     pass
+>>> profiler.stop()
+>>> profiler.to_dict()["sections"]["data_fetch"]["calls"]
+1
+"""
+
+import json
+import os
+import threading
+import time
+from functools import wraps
+
+
+class _NullSection:
+    """Shared no-op context manager returned while profiling is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SECTION = _NullSection()
+
+
+class _Section:
+    __slots__ = ("_profiler", "_name")
+
+    def __init__(self, profiler, name):
+        self._profiler = profiler
+        self._name = name
+
+    def __enter__(self):
+        self._profiler._push(self._name)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._profiler._pop()
+        return False
+
+
+class BacktestProfiler:
+    """Accumulates wall time and call counts per backtest subsystem."""
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._started_at = None
+        self._elapsed = 0.0
+        self._calls = {}
+        self._inclusive = {}
+        self._self_time = {}
+        self._stacks = {}
+
+    def reset(self):
+        """Clear all recorded timings. Does not change the enabled state."""
+        with self._lock:
+            self._calls = {}
+            self._inclusive = {}
+            self._self_time = {}
+            self._stacks = {}
+            self._elapsed = 0.0
+            self._started_at = time.perf_counter() if self.enabled else None
+        self._local = threading.local()
+
+    def start(self):
+        """Enable profiling and start the wall clock."""
+        self.enabled = True
+        self._started_at = time.perf_counter()
+
+    def stop(self):
+        """Disable profiling and freeze the wall clock."""
+        if self._started_at is not None:
+            self._elapsed += time.perf_counter() - self._started_at
+            self._started_at = None
+        self.enabled = False
+
+    def section(self, name):
+        """Return a context manager timing ``name`` (a no-op while disabled)."""
+        if not self.enabled:
+            return _NULL_SECTION
+        return _Section(self, name)
+
+    def _frames(self):
+        frames = getattr(self._local, "frames", None)
+        if frames is None:
+            frames = []
+            self._local.frames = frames
+        return frames
+
+    def _push(self, name):
+        # Frame layout: [name, start, child_seconds]
+        self._frames().append([name, time.perf_counter(), 0.0])
+
+    def _pop(self):
+        frames = self._frames()
+        if not frames:
+            return
+        stack_key = ";".join(frame[0] for frame in frames)
+        name, start, child_seconds = frames.pop()
+        elapsed = time.perf_counter() - start
+        own = max(elapsed - child_seconds, 0.0)
+
+        if frames:
+            frames[-1][2] += elapsed
+
+        with self._lock:
+            self._calls[name] = self._calls.get(name, 0) + 1
+            self._self_time[name] = self._self_time.get(name, 0.0) + own
+            self._stacks[stack_key] = self._stacks.get(stack_key, 0.0) + own
+            # Recursive sections only count their outermost frame towards inclusive time.
+            if not any(frame[0] == name for frame in frames):
+                self._inclusive[name] = self._inclusive.get(name, 0.0) + elapsed
+
+    @property
+    def wall_time(self):
+        """Total profiled wall time in seconds."""
+        if self._started_at is not None:
+            return self._elapsed + (time.perf_counter() - self._started_at)
+        return self._elapsed
+
+    def to_dict(self):
+        """
+        Build a JSON-serializable report.
+
+        Returns
+        -------
+        dict
+            ``wall_time_seconds``, ``unaccounted_seconds`` and a ``sections`` mapping of
+            ``name -> {calls, total_seconds, self_seconds, mean_microseconds, percent_of_wall}``.
+        """
+        wall = self.wall_time
+        with self._lock:
+            sections = {}
+            for name, calls in self._calls.items():
+                total = self._inclusive.get(name, 0.0)
+                sections[name] = {
+                    "calls": calls,
+                    "total_seconds": round(total, 6),
+                    "self_seconds": round(self._self_time.get(name, 0.0), 6),
+                    "mean_microseconds": round((total / calls) * 1e6, 3) if calls else 0.0,
+                    "percent_of_wall": round((total / wall) * 100, 2) if wall > 0 else 0.0,
+                }
+            accounted = sum(self._self_time.values())
+
+        sections = dict(sorted(sections.items(), key=lambda item: item[1]["total_seconds"], reverse=True))
+        return {
+            "wall_time_seconds": round(wall, 6),
+            "unaccounted_seconds": round(max(wall - accounted, 0.0), 6),
+            "sections": sections,
+        }
+
+    def to_collapsed(self):
+        """Return the collapsed-stack lines (``a;b;c <microseconds>``) sorted by stack."""
+        with self._lock:
+            stacks = dict(self._stacks)
+        lines = []
+        for stack, seconds in sorted(stacks.items()):
+            micros = int(round(seconds * 1e6))
+            if micros > 0:
+                lines.append(f"{stack} {micros}")
+        return lines
+
+    def write_json(self, path):
+        """Write the JSON report to ``path`` and return the path."""
+        _ensure_parent_dir(path)
+        with open(path, "w") as fh:
+            json.dump(self.to_dict(), fh, indent=2)
+        return path
+
+    def write_collapsed(self, path):
+        """Write the collapsed-stack file to ``path`` and return the path."""
+        _ensure_parent_dir(path)
+        with open(path, "w") as fh:
+            for line in self.to_collapsed():
+                fh.write(line + "\n")
+        return path
+
+    def summary(self, top=10):
+        """Return a short human-readable table of the most expensive sections."""
+        report = self.to_dict()
+        lines = [f"Backtest profile (wall time {report['wall_time_seconds']:.2f}s)"]
+        for name, stats in list(report["sections"].items())[:top]:
+            lines.append(
+                f"  {name:<24} {stats['total_seconds']:>10.3f}s {stats['percent_of_wall']:>6.2f}% "
+                f"{stats['calls']:>10,} calls {stats['mean_microseconds']:>10.1f}us/call"
+            )
+        return "\n".join(lines)
+
+
+def _ensure_parent_dir(path):
+    dir_path = os.path.dirname(path)
+    if dir_path:
+        os.makedirs(dir_path, exist_ok=True)
+
+
+_PROFILER = BacktestProfiler()
+
+
+def get_backtest_profiler():
+    """Return the process-wide backtest profiler."""
+    return _PROFILER
+
+
+def profile_section(name):
+    """Context manager timing ``name`` on the process-wide profiler (no-op while disabled)."""
+    if not _PROFILER.enabled:
+        return _NULL_SECTION
+    return _Section(_PROFILER, name)
+
+
+def profiled(name):
+    """Decorator timing every call of the wrapped function under ``name``."""
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _PROFILER.enabled:
+                return func(*args, **kwargs)
+            with _Section(_PROFILER, name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -437,6 +437,94 @@ class BS:
         )
 
 
+def _bsBatchPrices(underlyingPrice, strikePrice, logMoneyness, interestRate, daysToExpiration, volatility, isCall):
+    """Vectorised ``BS._price`` for rates, times and volatilities already expressed as fractions."""
+    _a_ = volatility * daysToExpiration**0.5
+    _d1_ = (logMoneyness + (interestRate + (volatility**2) / 2) * daysToExpiration) / _a_
+    _d2_ = _d1_ - _a_
+    discount = np.power(e, -interestRate * daysToExpiration)
+    call = underlyingPrice * norm.cdf(_d1_) - strikePrice * discount * norm.cdf(_d2_)
+    put = strikePrice * discount * norm.cdf(-_d2_) - underlyingPrice * norm.cdf(-_d1_)
+    return np.where(isCall, call, put)
+
+
+def batchGreeksBS(underlyingPrice, strikePrice, interestRate, daysToExpiration, optionPrice, isCall,
+                  high=500.0, low=0.0):
+    """Implied volatility and Greeks of many options at once, matching ``BS`` element by element.
+
+    All arguments are arrays of the same length, in the units ``BS`` takes (interest rate in percent, days to
+    expiration in days); ``isCall`` is a boolean array. Every option must have a positive underlying price, strike,
+    option price and time to expiration. The bisection of ``impliedVolatility`` runs for all options together, each
+    option stopping at the same step the scalar search would.
+
+    Returns a dict of arrays: impliedVolatility, optionPrice, delta, gamma, vega and theta.
+    """
+    underlyingPrice = np.asarray(underlyingPrice, dtype=float)
+    strikePrice = np.asarray(strikePrice, dtype=float)
+    isCall = np.asarray(isCall, dtype=bool)
+    rate = np.asarray(interestRate, dtype=float) / 100
+    years = np.asarray(daysToExpiration, dtype=float) / 365
+    target = np.array([round(float(price), 6) for price in optionPrice])
+    decimals = np.array([len(str(price).split(".")[1]) for price in target])
+    # log() of a scalar and of an array can differ in the last bit, which would change where the bisection stops.
+    logMoneyness = np.array([log(s / k) for s, k in zip(underlyingPrice, strikePrice)])
+
+    n = len(target)
+    iv = np.full(n, np.nan)
+    highs = np.full(n, float(high))
+    lows = np.full(n, float(low))
+
+    estimate = _bsBatchPrices(underlyingPrice, strikePrice, logMoneyness, rate, years, high / 100, isCall)
+    too_high = estimate < target
+    iv[too_high] = high
+    deep_itm = ~too_high & np.where(isCall, underlyingPrice > strikePrice + target, strikePrice > underlyingPrice + target)
+    iv[deep_itm] = 0.001
+    active = np.flatnonzero(~(too_high | deep_itm))
+
+    for _ in range(10000):  # To avoid infinite loops, as in impliedVolatility
+        if active.size == 0:
+            break
+        mid = np.maximum((highs[active] + lows[active]) / 2, 0.00001)
+        estimate = _bsBatchPrices(
+            underlyingPrice[active], strikePrice[active], logMoneyness[active], rate[active], years[active],
+            mid / 100, isCall[active],
+        )
+        iv[active] = mid
+        rounded = np.empty_like(estimate)
+        for decimal in np.unique(decimals[active]):
+            same = decimals[active] == decimal
+            rounded[same] = np.round(estimate[same], decimal)
+        found = rounded == target[active]
+        lower = ~found & (estimate > target[active])
+        raise_ = ~found & (estimate < target[active])
+        previous = (highs[active].copy(), lows[active].copy())
+        highs[active[lower]] = mid[lower]
+        lows[active[raise_]] = mid[raise_]
+        # Once the bounds stop moving every further step is identical, so the search has converged.
+        stuck = (highs[active] == previous[0]) & (lows[active] == previous[1])
+        active = active[~found & ~stuck]
+
+    volatility = iv / 100
+    _a_ = volatility * years**0.5
+    _d1_ = (logMoneyness + (rate + (volatility**2) / 2) * years) / _a_
+    _d2_ = _d1_ - _a_
+    discount = np.power(e, -(rate * years))
+    pdf_d1 = norm.pdf(_d1_)
+    theta_common = -underlyingPrice * pdf_d1 * volatility / (2 * years**0.5)
+    return {
+        "impliedVolatility": iv,
+        "optionPrice": _bsBatchPrices(underlyingPrice, strikePrice, logMoneyness, rate, years, volatility, isCall),
+        "delta": np.where(isCall, norm.cdf(_d1_), -norm.cdf(-_d1_)),
+        "gamma": pdf_d1 / (underlyingPrice * _a_),
+        "vega": underlyingPrice * pdf_d1 * years**0.5 / 100,
+        "theta": np.where(
+            isCall,
+            theta_common - rate * strikePrice * discount * norm.cdf(_d2_),
+            theta_common + rate * strikePrice * discount * norm.cdf(-_d2_),
+        ) / 365,
+    }
+
+
 class Me:
     """Merton
 	Used for pricing European options on stocks with dividends
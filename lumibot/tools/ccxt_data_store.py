@@ -1,6 +1,7 @@
 import time
 import duckdb
 import os
+import threading
 import uuid
 import ccxt
 from datetime import datetime
@@ -15,22 +16,52 @@ from typing import Union
 
 logger = get_logger(__name__)
 
+# One DuckDB connection per database file, shared by every CcxtCacheDB of the process. DuckDB connections are not
+# safe to use from several threads at once, so each one is paired with a lock that serializes access to it.
+_CONNECTIONS = {}
+_CONNECTIONS_LOCK = threading.Lock()
+
+
+def _shared_connection(path:str)->tuple:
+    with _CONNECTIONS_LOCK:
+        entry = _CONNECTIONS.get(path)
+        if entry is None:
+            entry = (duckdb.connect(path), threading.RLock())
+            _CONNECTIONS[path] = entry
+        return entry
+
+
+def close_connections()->None:
+    """Close every shared CCXT cache connection (they are reopened on the next use)."""
+    with _CONNECTIONS_LOCK:
+        for con, lock in _CONNECTIONS.values():
+            with lock:
+                con.close()
+        _CONNECTIONS.clear()
+
+
 class CcxtCacheDB:
     """A ccxt data cache class using duckdb.
     The data being cached is OHLCV data and is stored in UTC.
     After importing the data, you'll need to change the timezone if necessary.
-    Create an exchange_id folder in the cache folder, and create a symbol_timeframe.duckdb file under it.
-    ex) Create a BTC_USDT_1m.duckdb file in the binance folder.
-    If there is an existing cache file, it will use it to fetch the data, otherwise it will use ccxt to fetch the data.
-    If a cache file exists, but the requested data range is not in the cache file, the data will be fetched using ccxt.
-    For example, if the cache file contains data from 2023-01-01 to 2023-01-10, and you request data from 2023-01-05 to 2023-01-15,
-    the data from 2023-01-05 to 2023-01-10 will be fetched from the cache file, and the data from 2023-01-11 to 2023-01-15 will be fetched using ccxt.
-    The newly fetched data is stored in the cache file and the range of data stored in the cache file is updated to 2023-01-05 ~ 2023-01-15.
-    The cache file uses two tables to store the data using duckdb.
-    The candles table, which stores the OHLCV data, has the columns open, high, low, close, volume, and missing.
-    The cache_dt_ranges table, which stores the ranges of the cached data, has the following columns: id, start_dt, end_dt.
+    All symbols and timeframes of an exchange share one database, ex) binance/binance_ohlcv.duckdb in the cache folder,
+    and one connection that is kept open for the life of the process.
+    If the requested data is in the cache, it is read from the cache, otherwise it is fetched using ccxt.
+    If the cache has data for a symbol, but the requested data range is not in the cache, the data will be fetched using ccxt.
+    For example, if the cache contains data from 2023-01-01 to 2023-01-10, and you request data from 2023-01-05 to 2023-01-15,
+    the data from 2023-01-05 to 2023-01-10 will be fetched from the cache, and the data from 2023-01-11 to 2023-01-15 will be fetched using ccxt.
+    The newly fetched data is stored in the cache and the range of data stored for the symbol is updated to 2023-01-05 ~ 2023-01-15.
+    The cache uses two tables to store the data using duckdb.
+    The candles table, which stores the OHLCV data, has the columns symbol, timeframe, datetime, open, high, low, close,
+    volume and missing, with (symbol, timeframe, datetime) as the primary key.
+    The cache_dt_ranges table, which stores the ranges of the cached data, has the following columns:
+    id, symbol, timeframe, start_dt, end_dt.
     We use the missing column to fill in missing data in the time series data.
     The missing column is 1 for missing data and 0 for non-missing data.
+    Caches written by earlier versions (one symbol_timeframe.duckdb file per symbol) are imported the first time the
+    symbol is requested.
+
+    Use get_data_for_symbols (cache only) or download_ohlcv_for_symbols to load many symbols with a single query.
 
     If max_download_limit is not set, both 1m and 1d will be set to 50000.
     Raise an error if 'end_datetime - start_datetime' is greater than max_download_limit.
@@ -61,16 +92,30 @@ class CcxtCacheDB:
         # Recommended two or less api calls per second.
         self.api.enableRateLimit = True
         self.max_download_limit = 50000 if max_download_limit is None else max_download_limit
+        self._cache_file = self.get_cache_file_name()
+        self._create_tables()
+        self._legacy_checked = set()
+
+    @property
+    def _con(self):
+        # Looked up on every use, so a connection closed by close_connections() is reopened.
+        return _shared_connection(self._cache_file)[0]
 
+    @property
+    def _lock(self):
+        return _shared_connection(self._cache_file)[1]
 
-    def get_cache_file_name(self, symbol:str, timeframe:str)->str:
+
+    def get_cache_file_name(self, symbol:str=None, timeframe:str=None)->str:
         """Returns the cache file name. If the cache folder does not exist, it is created.
-        cache folder is created under LUMIBOT_CACHE_FOLDER with exchange_id and symbol_timeframe.duckdb file.
-        e.g. BTC_USDT_1m.duckdb file is created under binance folder.
+        cache folder is created under LUMIBOT_CACHE_FOLDER with exchange_id and exchange_id_ohlcv.duckdb file.
+        e.g. binance_ohlcv.duckdb file is created under binance folder.
+        The file holds every symbol and timeframe; with a symbol and timeframe the name of the per-symbol file used by
+        earlier versions is returned instead.
 
         Args:
-            symbol (str): BTC/USDT, ETH/USDT etc.
-            timeframe (str): 1m, 1d etc.
+            symbol (str, optional): BTC/USDT, ETH/USDT etc.
+            timeframe (str, optional): 1m, 1d etc.
 
         Raises:
             Exception: OSError if the cache folder cannot be created.
@@ -85,15 +130,15 @@ class CcxtCacheDB:
         except OSError:
             raise Exception("Could not create cache folder at {}".format(cache_folder))
 
-        cache_file = os.path.join(cache_folder,
-                                  f"{symbol.replace('/', '_')}_{timeframe}.duckdb")
-        return cache_file
+        if symbol is not None and timeframe is not None:
+            return os.path.join(cache_folder, f"{symbol.replace('/', '_')}_{timeframe}.duckdb")
+        return os.path.join(cache_folder, f"{self.exchange_id}_ohlcv.duckdb")
 
 
     def get_data_from_cache(self, symbol:str, timeframe:str,
                             start:datetime, end:datetime)->DataFrame:
-        """Fetch data from cache. Raise an exception if the cache file does not exist.
-        Fetch data in the range start and end from the cache file.
+        """Fetch data from cache. Raise an exception if nothing is cached for the symbol and timeframe.
+        Fetch data in the range start and end from the cache.
 
         Args:
             symbol (str): BTC/USDT, ETH/USDT etc.
@@ -102,30 +147,67 @@ class CcxtCacheDB:
             end (datetime): datetime object, ex) datetime(2023, 3, 4), datetime(2023, 3, 4, 10, 14, 0, 0)
 
         Raises:
-            Exception: cache file이 없으면 예외를 발생시킨다.
+            Exception: Raise an exception if nothing is cached for the symbol and timeframe.
 
         Returns:
             DataFrame: Data fetched from cache.
                        Use datetime as the index.
                        datetime, open, high, low, close, volume, missing columns.
         """
+        if self.get_cache_ranges(symbol, timeframe).empty:
+            raise Exception(f"No cached {timeframe} data for {symbol} in {self.get_cache_file_name()}")
+        return self.get_data_for_symbols([symbol], timeframe, start, end)[symbol]
+
 
-        cache_file = self.get_cache_file_name(symbol, timeframe)
-        if not os.path.exists(cache_file):
-            raise Exception(f"Cache file {cache_file} does not exist")
+    def get_data_for_symbols(self, symbols:list[str], timeframe:str,
+                             start:datetime, end:datetime)->dict[str, DataFrame]:
+        """Fetch the cached data of many symbols with a single query.
+
+        Args:
+            symbols (list[str]): BTC/USDT, ETH/USDT etc.
+            timeframe (str): 1m, 1d etc.
+            start (datetime): datetime object, ex) datetime(2023, 3, 2)
+            end (datetime): datetime object, ex) datetime(2023, 3, 4)
+
+        Returns:
+            dict[str, DataFrame]: Data fetched from cache for every symbol (empty if nothing is cached).
+                       Use datetime as the index.
+                       datetime, open, high, low, close, volume, missing columns.
+        """
+        symbols = list(dict.fromkeys(symbols))
+        for symbol in symbols:
+            self._import_legacy_cache(symbol, timeframe)
 
         start = start.replace(tzinfo=None)
         end = end.replace(tzinfo=None)
-
-        with duckdb.connect(database = cache_file) as con:
-            df = con.execute("""select datetime, open, high, low, close, volume, missing
+        placeholders = ", ".join("?" for _ in symbols)
+        df = self._fetch_df(f"""select symbol, datetime, open, high, low, close, volume, missing
                              from candles
-                             where datetime  between  ? and ?
-                             order by datetime asc
-                             """,(start,end)).fetch_df()
-        df.drop_duplicates(inplace=True,subset=['datetime'])
-        df.set_index("datetime", inplace=True)
-        return df
+                             where timeframe = ? and symbol in ({placeholders}) and datetime between ? and ?
+                             order by symbol, datetime asc
+                             """, [timeframe, *symbols, start, end])
+
+        result = {}
+        groups = {symbol: frame for symbol, frame in df.groupby("symbol", sort=False)} if len(df) else {}
+        for symbol in symbols:
+            frame = groups.get(symbol, df.iloc[0:0])
+            frame = frame.drop(columns="symbol").set_index("datetime")
+            result[symbol] = frame
+        return result
+
+
+    def get_cache_ranges(self, symbol:str, timeframe:str)->DataFrame:
+        """Returns the cached data ranges (id, start_dt, end_dt) of a symbol and timeframe."""
+        self._import_legacy_cache(symbol, timeframe)
+        return self._fetch_df("""select id, start_dt, end_dt from cache_dt_ranges
+                              where symbol = ? and timeframe = ? order by start_dt""", [symbol, timeframe])
+
+
+    def delete_data(self, symbol:str, timeframe:str)->None:
+        """Remove the cached candles and ranges of a symbol and timeframe."""
+        with self._lock:
+            self._con.execute("DELETE FROM candles WHERE symbol = ? AND timeframe = ?", [symbol, timeframe])
+            self._con.execute("DELETE FROM cache_dt_ranges WHERE symbol = ? AND timeframe = ?", [symbol, timeframe])
 
 
     # timeframes: 1m, 1h, 1d
@@ -134,10 +216,10 @@ class CcxtCacheDB:
         """Download data according to the given symbol, timeframe, start, end, and limit.
         Store the downloaded data in a cache.
         Data that is not in the cache is downloaded using CCXT.
-        If a cache file exists, but the requested data range is not in the cache file, the data will be fetched using ccxt.
-        For example, if the cache file contains data from 2023-01-01 to 2023-01-10, and you request data from 2023-01-05 to 2023-01-15,
-        the data from 2023-01-05 to 2023-01-10 will be fetched from the cache file, and the data from 2023-01-11 to 2023-01-15 will be fetched using ccxt.
-        The newly fetched data is stored in the cache file and the range of data stored in the cache file is updated to 2023-01-05 ~ 2023-01-15.
+        If the cache has data for the symbol, but the requested data range is not in the cache, the data will be fetched using ccxt.
+        For example, if the cache contains data from 2023-01-01 to 2023-01-10, and you request data from 2023-01-05 to 2023-01-15,
+        the data from 2023-01-05 to 2023-01-10 will be fetched from the cache, and the data from 2023-01-11 to 2023-01-15 will be fetched using ccxt.
+        The newly fetched data is stored in the cache and the range of data stored for the symbol is updated to 2023-01-05 ~ 2023-01-15.
 
         Args:
             symbol (str):  BTC/USDT, ETH/USDT etc.
@@ -154,9 +236,40 @@ class CcxtCacheDB:
                        Use datetime as the index.
                        datetime, open, high, low, close, volume, missing columns.
         """
+        return self.download_ohlcv_for_symbols([symbol], timeframe, start, end, limit=limit)[symbol]
+
+
+    def download_ohlcv_for_symbols(self, symbols:list[str], timeframe:str,
+                                   start:datetime, end:datetime, limit:int=None)->dict[str, DataFrame]:
+        """Download the data of every symbol that is not in the cache yet, then read all of them with one query.
+
+        Args:
+            symbols (list[str]): BTC/USDT, ETH/USDT etc.
+            timeframe (str): 1m, 1d etc.
+            start (datetime): datetime object, ex) datetime(2023, 3, 2), datetime(2023, 3, 2, 12, 1, 0, 0)
+            end (datetime): datetime object, ex) datetime(2023, 3, 4), datetime(2023, 3, 4, 10, 14, 0, 0)
+            limit (int, optional): max download limit. Defaults to None.
+
+        Raises:
+            Exception: Raise an exception if the max download limit is exceeded.
+
+        Returns:
+            dict[str, DataFrame]: Data fetched from cache for every symbol.
+                       Use datetime as the index.
+                       datetime, open, high, low, close, volume, missing columns.
+        """
         if end is None:
             end = datetime.utcnow()
 
+        for symbol in dict.fromkeys(symbols):
+            self._download_missing_ranges(symbol, timeframe, start, end, limit)
+
+        return self.get_data_for_symbols(symbols, timeframe, start, end)
+
+
+    def _download_missing_ranges(self, symbol:str, timeframe:str,
+                                 start:datetime, end:datetime, limit:int=None)->None:
+        """Download the parts of start ~ end that are not cached for the symbol and update its cache ranges."""
         if limit is None:
             limit = self.max_download_limit
 
@@ -168,8 +281,10 @@ class CcxtCacheDB:
         end_dt = end_dt.replace(hour=23, minute=59, second=59, microsecond=999999)
 
         download_ranges,overap_range_ids,cache_range = self._calc_download_ranges(symbol, timeframe,start_dt, end_dt)
+        if not download_ranges:
+            return
 
-        self.logger.info(f"download ranges :\n{self._table_str(download_ranges,headers=['from','to'])}")
+        self.logger.info(f"{symbol} download ranges :\n{self._table_str(download_ranges,headers=['from','to'])}")
 
         for download_start,download_end in download_ranges:
             range_cnt = download_end - download_start
@@ -186,55 +301,95 @@ class CcxtCacheDB:
             df = self._fill_missing_data(df, timeframe)
             self._cache_ohlcv(symbol, df, timeframe)
 
-        cache_file = self.get_cache_file_name(symbol, timeframe)
-
-        if download_ranges:
+        if len(overap_range_ids) > 0:
+            start_dt = cache_range[0]
+            end_dt = cache_range[1]
+        else:
+            start_dt = df.datetime.min()
+            end_dt = df.datetime.max()
+
+        with self._lock:
+            # insert new cache data range
+            self._con.execute("""INSERT INTO cache_dt_ranges VALUES (?, ?, ?, ?, ?)""",
+                              (str(uuid.uuid4().hex), symbol, timeframe, start_dt, end_dt))
+            # delete overlapping ranges
             if len(overap_range_ids) > 0:
-                start_dt = cache_range[0]
-                end_dt = cache_range[1]
-            else:
-                start_dt = df.datetime.min()
-                end_dt = df.datetime.max()
+                params = [(id,) for id in overap_range_ids]
+                self._con.executemany("""DELETE FROM  cache_dt_ranges WHERE id = ?""", params)
+
+        df = self.get_cache_ranges(symbol, timeframe)
+        self.logger.info(f"{symbol} cache ranges:\n{self._table_str(df[['start_dt', 'end_dt']],headers=['from','to'])}")
 
-            with duckdb.connect(cache_file) as con:
-                # insert new cache data range
-                con.execute("""INSERT INTO cache_dt_ranges VALUES (?, ?, ?)""",
-                            (str(uuid.uuid4().hex),start_dt,end_dt))
-                # delete overlapping ranges
-                if len(overap_range_ids) > 0:
-                    params = [(id,) for id in overap_range_ids]
-                    con.executemany("""DELETE FROM  cache_dt_ranges WHERE id = ?""", params)
 
-        with duckdb.connect(cache_file) as con:
-            df = con.execute("""select * from cache_dt_ranges""").fetch_df()
-        self.logger.info(f"cache ranges:\n{self._table_str(df[['start_dt', 'end_dt']],headers=['from','to'])}")
+    def _create_tables(self)->None:
+        with self._lock:
+            self._con.execute("""CREATE TABLE IF NOT EXISTS candles (
+                            symbol VARCHAR, timeframe VARCHAR, datetime TIMESTAMP,
+                            open DOUBLE, high DOUBLE, low DOUBLE, close DOUBLE, volume DOUBLE, missing INTEGER,
+                            PRIMARY KEY (symbol, timeframe, datetime))""")
+
+            # cache ranges table
+            self._con.execute("""CREATE TABLE  IF NOT EXISTS cache_dt_ranges (
+                            id VARCHAR, symbol VARCHAR, timeframe VARCHAR,
+                            start_dt TIMESTAMP,
+                            end_dt TIMESTAMP)""")
 
-        df_cache = self.get_data_from_cache(symbol, timeframe, start, end)
-        return df_cache
+
+    def _fetch_df(self, query:str, params:list=None)->DataFrame:
+        with self._lock:
+            return self._con.execute(query, params or []).fetch_df()
 
 
     def _cache_ohlcv(self, symbol:str, df:DataFrame, timeframe:str)->None:
-        """ccxt에서 가져온 데이터를 cache에 저장한다.
+        """Store the data fetched from ccxt in the cache. Candles that are already cached are replaced.
 
         Args:
             symbol (str): BCH/USDT, ETH/USDT etc.
             df (DataFrame): DataFrame to store in cache(datetime, open, high, low, close, volume, missing columns)
             timeframe (str): 1m, 1d etc.
         """
-        cache_file = self.get_cache_file_name(symbol, timeframe)
-
-        with duckdb.connect(cache_file) as con:
-            con.execute("""CREATE TABLE IF NOT EXISTS candles (
-                            datetime DATETIME,
-                            open DECIMAL, high DECIMAL, low DECIMAL, close DECIMAL, volume DECIMAL, missing INTEGER)""")
+        df = df.drop_duplicates(subset=["datetime"], keep="last")
+        with self._lock:
+            self._con.register("ccxt_new_candles", df)
+            try:
+                self._con.execute("""INSERT OR REPLACE INTO candles
+                                  SELECT ?, ?, datetime, open, high, low, close, volume, missing
+                                  FROM ccxt_new_candles""", [symbol, timeframe])
+            finally:
+                self._con.unregister("ccxt_new_candles")
+
+
+    def _import_legacy_cache(self, symbol:str, timeframe:str)->None:
+        """Copy a per-symbol cache file written by earlier versions into the shared store (once per symbol)."""
+        key = (symbol, timeframe)
+        if key in self._legacy_checked:
+            return
+        self._legacy_checked.add(key)
+
+        legacy_file = self.get_cache_file_name(symbol, timeframe)
+        if not os.path.exists(legacy_file):
+            return
+        existing = self._fetch_df("""select count(*) as n from cache_dt_ranges where symbol = ? and timeframe = ?""",
+                                  [symbol, timeframe])
+        if existing["n"].iat[0] > 0:
+            return
 
-            # cache ranges table
-            con.execute("""CREATE TABLE  IF NOT EXISTS cache_dt_ranges (
-                            id STRING ,
-                            start_dt DATETIME ,
-                            end_dt DATETIME)""")
-            # insert df to cache db
-            con.execute("""INSERT INTO candles SELECT *  from df""")
+        try:
+            with duckdb.connect(legacy_file, read_only=True) as con:
+                candles = con.execute("""select datetime, open, high, low, close, volume, missing
+                                      from candles order by datetime""").fetch_df()
+                ranges = con.execute("""select id, start_dt, end_dt from cache_dt_ranges""").fetch_df()
+        except Exception as e:
+            self.logger.warning(f"Could not import the cache file {legacy_file}: {e}")
+            return
+
+        if len(candles):
+            self._cache_ohlcv(symbol, candles, timeframe)
+        with self._lock:
+            self._con.executemany("""INSERT INTO cache_dt_ranges VALUES (?, ?, ?, ?, ?)""",
+                                  [(row.id, symbol, timeframe, row.start_dt, row.end_dt)
+                                   for row in ranges.itertuples(index=False)])
+        self.logger.info(f"Imported {len(candles)} cached {timeframe} candles for {symbol} from {legacy_file}")
 
 
     def _calc_download_ranges(self,symbol:str,timeframe:str,
@@ -266,13 +421,8 @@ class CcxtCacheDB:
         Returns:
             tuple[list[tuple[datetime, datetime]],list[str]]: (new download ranges,overap range ids,new cache range)
         """
-        cache_file = self.get_cache_file_name(symbol, timeframe)
-        if not os.path.exists(cache_file):
-            return [(start, end)],[],(start, end)
-        if os.path.exists(cache_file):
-            # get cache data ranges (id, start_dt, end_dt)
-            with duckdb.connect(cache_file) as con:
-                df = con.execute("""select * from cache_dt_ranges""").fetch_df()
+        # get cache data ranges (id, start_dt, end_dt)
+        df = self.get_cache_ranges(symbol, timeframe)
         if len(df) > 0:
             return self._find_non_overlapping_range(df,start, end)
         else:
@@ -466,10 +616,8 @@ if __name__ == "__main__":
 
     cache = CcxtCacheDB(exchange_id)
 
-    cache_file_path = cache.get_cache_file_name(symbol,timeframe)
-     # Remove cache file if exists.
-    if os.path.exists(cache_file_path):
-        os.remove(cache_file_path)
+    # Remove cached data if exists.
+    cache.delete_data(symbol, timeframe)
 
     # no overap new download range
     start = datetime(2023, 3, 1)
@@ -0,0 +1,191 @@
+"""
+Columnar store for the markers and lines strategies add to the indicators chart.
+
+``Strategy.add_marker`` used to find duplicates by scanning every marker added so far, and both ``add_marker`` and
+``add_line`` kept one wide dict per point that repeated the same eight asset fields. ``ChartSeriesStore`` keeps one
+Python list per column, looks duplicates up in a key set, and stores each distinct asset's metadata once; every point
+only records the position of its asset in that table. DataFrames are built on demand and cached until the next point.
+
+The store still behaves like the list of dicts it replaces (``len``, indexing, iteration and ``== []``) so code that
+reads ``strategy._chart_markers_list`` keeps working.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Asset metadata columns, in the order they appear in the markers/lines DataFrames.
+ASSET_COLUMNS = (
+    "asset_symbol",
+    "asset_type",
+    "asset_expiration",
+    "asset_strike",
+    "asset_right",
+    "asset_multiplier",
+    "quote_symbol",
+    "asset_display_name",
+)
+_NO_ASSET = (None,) * len(ASSET_COLUMNS)
+
+MARKER_COLUMNS = ("datetime", "timestamp", "name", "symbol", "color", "size", "value", "detail_text", "plot_name")
+# A marker with the same time, name, marker symbol and subplot as an earlier one is dropped.
+MARKER_KEY_COLUMNS = ("timestamp", "name", "symbol", "plot_name")
+LINE_COLUMNS = ("datetime", "name", "value", "color", "style", "width", "detail_text", "plot_name")
+
+
+def asset_metadata(asset):
+    """Return the ``ASSET_COLUMNS`` values describing ``asset`` (all ``None`` without an asset)."""
+    if asset is None:
+        return _NO_ASSET
+    quote = getattr(asset, "_quote_asset", None)
+    return (
+        asset.symbol,
+        asset.asset_type,
+        str(asset.expiration) if asset.expiration else None,
+        asset.strike,
+        asset.right,
+        asset.multiplier,
+        quote.symbol if quote else None,
+        str(asset),
+    )
+
+
+class ChartSeriesStore:
+    """Append-only, columnar list of chart points.
+
+    Parameters
+    ----------
+    columns : tuple of str
+        Point columns stored before the asset columns, in DataFrame order.
+    key_columns : tuple of str, optional
+        Columns identifying a point. When given, ``append`` ignores a point whose key was already added.
+    """
+
+    def __init__(self, columns, key_columns=None):
+        self.columns = tuple(columns)
+        self.key_columns = tuple(key_columns) if key_columns else None
+        self.clear()
+
+    def clear(self):
+        """Remove every point."""
+        self._values = {column: [] for column in self.columns}
+        self._asset_rows = []
+        self._keys = set()
+        # Distinct asset metadata tuples, their positions, and a per-object cache so str(asset) runs once per asset.
+        self._asset_table = [_NO_ASSET]
+        self._asset_positions = {_NO_ASSET: 0}
+        self._asset_cache = {}
+        self._frame = None
+
+    def __len__(self):
+        return len(self._asset_rows)
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._row(i)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._row(j) for j in range(len(self))[i]]
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("chart point index out of range")
+        return self._row(i)
+
+    def __eq__(self, other):
+        if isinstance(other, ChartSeriesStore):
+            other = list(other)
+        if isinstance(other, list):
+            return len(other) == len(self) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return f"ChartSeriesStore({len(self)} points)"
+
+    def append(self, point, asset=None):
+        """Add a point.
+
+        Parameters
+        ----------
+        point : dict
+            Values for ``columns``; missing columns are stored as ``None``.
+        asset : Asset, optional
+            The asset the point belongs to.
+
+        Returns
+        -------
+        bool
+            False if the point was a duplicate and was not added.
+        """
+        if self.key_columns is not None:
+            key = tuple(point.get(column) for column in self.key_columns)
+            if key in self._keys:
+                return False
+            self._keys.add(key)
+
+        for column in self.columns:
+            self._values[column].append(point.get(column))
+        self._asset_rows.append(self._asset_position(asset))
+        self._frame = None
+        return True
+
+    def asset_fields(self, asset):
+        """Return the asset columns for ``asset`` as a dict (interned, so repeated calls are cheap)."""
+        return dict(zip(ASSET_COLUMNS, self._asset_table[self._asset_position(asset)]))
+
+    def to_dataframe(self):
+        """Return every point as a DataFrame (cached until the next ``append``)."""
+        if self._frame is None:
+            if len(self) == 0:
+                self._frame = pd.DataFrame()
+            else:
+                data = dict(self._values)
+                rows = np.asarray(self._asset_rows, dtype=np.intp)
+                for j, column in enumerate(ASSET_COLUMNS):
+                    table_column = np.empty(len(self._asset_table), dtype=object)
+                    table_column[:] = [meta[j] for meta in self._asset_table]
+                    # As a list, so pandas infers dtypes the same way it did for the old list of dicts.
+                    data[column] = table_column[rows].tolist()
+                self._frame = pd.DataFrame(data)
+        return self._frame
+
+    @classmethod
+    def from_records(cls, records, columns, key_columns=None):
+        """Build a store from a list of point dicts (the layout ``_chart_markers_list`` used to hold)."""
+        store = cls(columns, key_columns=key_columns)
+        for record in records or []:
+            store._append_record(record)
+        return store
+
+    def _append_record(self, record):
+        meta = tuple(record.get(column) for column in ASSET_COLUMNS)
+        if self.append(record) and meta != _NO_ASSET:
+            self._asset_rows[-1] = self._intern(meta)
+
+    def _asset_position(self, asset):
+        if asset is None:
+            return 0
+        cached = self._asset_cache.get(id(asset))
+        # Keep the asset itself in the cache so its id cannot be reused by another object.
+        if cached is not None and cached[0] is asset:
+            return cached[1]
+        position = self._intern(asset_metadata(asset))
+        self._asset_cache[id(asset)] = (asset, position)
+        return position
+
+    def _intern(self, meta):
+        position = self._asset_positions.get(meta)
+        if position is None:
+            position = len(self._asset_table)
+            self._asset_table.append(meta)
+            self._asset_positions[meta] = position
+        return position
+
+    def _row(self, i):
+        row = {column: self._values[column][i] for column in self.columns}
+        row.update(zip(ASSET_COLUMNS, self._asset_table[self._asset_rows[i]]))
+        return row
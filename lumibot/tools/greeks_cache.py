@@ -0,0 +1,91 @@
+"""
+Bounded cache for option Greeks.
+
+``DataSource.calculate_greeks`` used to keep its results in a plain dict and, past 10,000 entries, delete the 5,000
+oldest insertions. That purge also threw away contracts the strategy was still pricing every iteration.
+``GreeksCache`` is a least-recently-used cache: a hit moves the entry to the back, and only the least recently used
+entries are evicted when it is full. Entries can also expire after a number of seconds, which matters when live
+trading keeps one data source running for days. Hits, misses and evictions are counted so option-heavy backtests
+can check that the cache is sized well.
+"""
+
+import time
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+class GreeksCache:
+    """Least-recently-used cache with an optional time to live.
+
+    Parameters
+    ----------
+    max_size : int, optional
+        Maximum number of entries. The least recently used entry is evicted when a new one does not fit.
+    ttl : float, optional
+        Seconds an entry stays valid after it was stored. ``None`` keeps entries until they are evicted.
+    """
+
+    def __init__(self, max_size=10000, ttl=None):
+        self.max_size = max(int(max_size), 1)
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return self.get(key, _MISSING, record=False) is not _MISSING
+
+    def get(self, key, default=None, record=True):
+        """Return the value stored for ``key`` (``default`` if missing or expired) and mark it as recently used.
+
+        Parameters
+        ----------
+        record : bool, optional
+            Count the lookup in the hit/miss statistics.
+        """
+        entry = self._entries.get(key, _MISSING)
+        if entry is not _MISSING and self.ttl is not None and time.monotonic() - entry[1] > self.ttl:
+            del self._entries[key]
+            self.expirations += 1
+            entry = _MISSING
+        if entry is _MISSING:
+            if record:
+                self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        if record:
+            self.hits += 1
+        return entry[0]
+
+    def put(self, key, value):
+        """Store ``value`` for ``key``, evicting the least recently used entries if the cache is full."""
+        self._entries[key] = (value, time.monotonic() if self.ttl is not None else None)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Remove every entry and reset the statistics."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    @property
+    def stats(self):
+        """Return a dict with the size, hits, misses, hit rate, evictions and expirations of the cache."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
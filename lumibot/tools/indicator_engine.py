@@ -0,0 +1,440 @@
+"""
+Streaming technical indicators for strategies.
+
+Strategies usually compute indicators by calling ``get_historical_prices(asset, 200, "minute")`` on every
+iteration and rebuilding an SMA, EMA, RSI or ATR over a window that only moved by one bar. The DataFrame work grows
+with the window, and it is repeated for every indicator and every asset.
+
+``IndicatorEngine`` (available as ``strategy.indicators``) keeps the state of each indicator instead. Indicators are
+registered per ``(asset, quote, timestep)`` the first time they are requested and warmed up with one history request.
+After that, each iteration only asks the data source for the last couple of bars (as NumPy arrays, see
+``BarArrays``) and feeds the new ones to the indicators. Each indicator update costs O(1) whatever its length. Live strategies that receive bars from a stream can
+push them with ``update_bars`` instead.
+
+The formulas follow the usual conventions, the same as pandas-ta:
+- EMA, RSI and ATR are seeded with the simple average of their first ``length`` inputs;
+- RSI and ATR then use Wilder's smoothing.
+Recursive indicators (EMA, RSI, ATR) depend slightly on where they started, so they are warmed up with several times
+their length before their first value is returned.
+"""
+
+import math
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from ..entities.bars import BarArrays
+from .lumibot_logger import get_logger
+
+logger = get_logger(__name__)
+
+IndicatorHistory = namedtuple("IndicatorHistory", ["datetimes", "values"])
+
+_SOURCES = ("open", "high", "low", "close", "volume")
+
+# ``_Feed.checked_at`` for feeds that receive their bars from ``update_bars`` instead of polling.
+_PUSHED = object()
+
+
+class _RingBuffer:
+    """Fixed-size history of numbers, oldest first."""
+
+    def __init__(self, capacity, dtype=np.float64):
+        self._data = np.empty(capacity, dtype=dtype)
+        self._capacity = capacity
+        self._size = 0
+        self._start = 0
+
+    def __len__(self):
+        return self._size
+
+    def append(self, value):
+        end = (self._start + self._size) % self._capacity
+        self._data[end] = value
+        if self._size < self._capacity:
+            self._size += 1
+        else:
+            self._start = (self._start + 1) % self._capacity
+
+    def to_array(self):
+        end = self._start + self._size
+        if end <= self._capacity:
+            return self._data[self._start:end].copy()
+        return np.concatenate((self._data[self._start:], self._data[:end - self._capacity]))
+
+
+class _Indicator:
+    """Base class: ``_next`` takes one bar and returns the new value, or NaN while warming up."""
+
+    warmup_factor = 1
+
+    def __init__(self, length, source="close", history=1000):
+        self.length = int(length)
+        if self.length < 1:
+            raise ValueError(f"Indicator length must be a positive integer, got {length}")
+        if source not in _SOURCES:
+            raise ValueError(f"Indicator source must be one of {_SOURCES}, got {source!r}")
+        self.source = source
+        self.value = math.nan
+        self.datetimes = _RingBuffer(history, dtype=np.int64)
+        self.values = _RingBuffer(history)
+
+    @property
+    def warmup_bars(self):
+        """Number of bars needed before the value no longer depends on where the indicator started."""
+        return self.length * self.warmup_factor + 1
+
+    def update(self, timestamp, bar):
+        self.value = self._next(bar)
+        self.datetimes.append(timestamp)
+        self.values.append(self.value)
+
+    def _next(self, bar):
+        raise NotImplementedError
+
+
+class SMA(_Indicator):
+    """Simple moving average, kept as a running sum over the last ``length`` inputs."""
+
+    def __init__(self, length, source="close", history=1000):
+        super().__init__(length, source, history)
+        self._window = np.zeros(self.length)
+        self._count = 0
+        self._sum = 0.0
+
+    def _next(self, bar):
+        x = bar[self.source]
+        slot = self._count % self.length
+        self._sum += x - self._window[slot]
+        self._window[slot] = x
+        self._count += 1
+        if self._count % (self.length * 100) == 0:
+            # Resum from time to time so the rounding errors of the running sum do not accumulate.
+            self._sum = float(self._window.sum())
+        return self._sum / self.length if self._count >= self.length else math.nan
+
+
+class EMA(_Indicator):
+    """Exponential moving average with ``alpha = 2 / (length + 1)``, seeded with the SMA of the first inputs."""
+
+    warmup_factor = 6
+
+    def __init__(self, length, source="close", history=1000):
+        super().__init__(length, source, history)
+        self._alpha = 2.0 / (self.length + 1)
+        self._count = 0
+        self._ema = 0.0
+
+    def _next(self, bar):
+        x = bar[self.source]
+        self._count += 1
+        if self._count < self.length:
+            self._ema += x
+            return math.nan
+        if self._count == self.length:
+            self._ema = (self._ema + x) / self.length
+        else:
+            self._ema += self._alpha * (x - self._ema)
+        return self._ema
+
+
+class _WilderAverage:
+    """Wilder's moving average (RMA): the SMA of the first ``length`` inputs, then ``(prev * (n - 1) + x) / n``."""
+
+    def __init__(self, length):
+        self.length = length
+        self.count = 0
+        self.value = 0.0
+
+    def update(self, x):
+        self.count += 1
+        if self.count < self.length:
+            self.value += x
+            return math.nan
+        if self.count == self.length:
+            self.value = (self.value + x) / self.length
+        else:
+            self.value += (x - self.value) / self.length
+        return self.value
+
+
+class RSI(_Indicator):
+    """Relative strength index with Wilder's smoothing of the gains and losses."""
+
+    warmup_factor = 10
+
+    def __init__(self, length=14, source="close", history=1000):
+        super().__init__(length, source, history)
+        self._previous = None
+        self._gains = _WilderAverage(self.length)
+        self._losses = _WilderAverage(self.length)
+
+    def _next(self, bar):
+        x = bar[self.source]
+        previous, self._previous = self._previous, x
+        if previous is None:
+            return math.nan
+        change = x - previous
+        gain = self._gains.update(max(change, 0.0))
+        loss = self._losses.update(max(-change, 0.0))
+        if math.isnan(gain) or gain + loss == 0:
+            return math.nan
+        return 100.0 * gain / (gain + loss)
+
+
+class ATR(_Indicator):
+    """Average true range with Wilder's smoothing. The first bar has no previous close and no true range."""
+
+    warmup_factor = 10
+
+    def __init__(self, length=14, source="close", history=1000):
+        super().__init__(length, source, history)
+        self._previous_close = None
+        self._average = _WilderAverage(self.length)
+
+    def _next(self, bar):
+        high, low, close = bar["high"], bar["low"], bar["close"]
+        previous_close, self._previous_close = self._previous_close, close
+        if previous_close is None:
+            return math.nan
+        true_range = max(high - low, abs(high - previous_close), abs(low - previous_close))
+        return self._average.update(true_range)
+
+
+def rsi_values(values, length=14):
+    """Return the RSI of every element of ``values`` (NaN while warming up), as a NumPy array.
+
+    Gives the same numbers as ``pandas_ta.rsi`` without building a DataFrame.
+    """
+    indicator = RSI(length, history=1)
+    out = np.empty(len(values))
+    for i, value in enumerate(values):
+        out[i] = indicator._next({"close": float(value)})
+    return out
+
+
+class _Feed:
+    """The bars of one ``(asset, quote, timestep)`` seen so far and the indicators computed from them."""
+
+    def __init__(self):
+        self.indicators = {}
+        self.last_timestamp = None
+        self.checked_at = None
+
+    @property
+    def warmup_bars(self):
+        return max((indicator.warmup_bars for indicator in self.indicators.values()), default=1)
+
+
+class IndicatorEngine:
+    """Indicators that update incrementally as new bars arrive.
+
+    Use it through ``self.indicators`` in a strategy. Each method returns the value after the latest available bar,
+    or None while the indicator is still warming up.
+
+    Parameters
+    ----------
+    strategy : Strategy
+        The strategy whose ``get_historical_prices`` and ``get_datetime`` provide the bars.
+    history : int, optional
+        Number of past values kept for each indicator (returned with ``history=True``).
+
+    Example
+    -------
+    >>> ema = self.indicators.ema("SPY", 50, "day")
+    >>> rsi = self.indicators.rsi("SPY", 14, "minute")
+    >>> # The last values, oldest first, as NumPy arrays
+    >>> datetimes, values = self.indicators.sma("SPY", 20, "day", history=True)
+    """
+
+    #: Largest number of bars fetched at once to catch up before the indicators are warmed up again from scratch.
+    MAX_CATCH_UP_BARS = 512
+
+    def __init__(self, strategy, history=1000):
+        self._strategy = strategy
+        self._history = int(history)
+        self._feeds = {}
+
+    # ----- public API -----
+
+    def sma(self, asset, length, timestep="day", source="close", quote=None, history=False):
+        """Simple moving average of the last ``length`` bars.
+
+        Parameters
+        ----------
+        asset : Asset or str
+            The asset.
+        length : int
+            Number of bars in the average.
+        timestep : str, optional
+            Bar size, as accepted by ``get_historical_prices``.
+        source : str, optional
+            The bar field to average: "open", "high", "low", "close" or "volume".
+        quote : Asset, optional
+            The quote asset, for crypto and forex.
+        history : bool, optional
+            Return an ``IndicatorHistory`` of the past datetimes and values (NumPy arrays) instead of the last value.
+
+        Returns
+        -------
+        float, None or IndicatorHistory
+        """
+        return self._get(SMA, asset, length, timestep, source, quote, history)
+
+    def ema(self, asset, length, timestep="day", source="close", quote=None, history=False):
+        """Exponential moving average over ``length`` bars. See ``sma`` for the parameters."""
+        return self._get(EMA, asset, length, timestep, source, quote, history)
+
+    def rsi(self, asset, length=14, timestep="day", source="close", quote=None, history=False):
+        """Relative strength index over ``length`` bars. See ``sma`` for the parameters."""
+        return self._get(RSI, asset, length, timestep, source, quote, history)
+
+    def atr(self, asset, length=14, timestep="day", quote=None, history=False):
+        """Average true range over ``length`` bars. See ``sma`` for the parameters."""
+        return self._get(ATR, asset, length, timestep, "close", quote, history)
+
+    def update_bars(self, asset, bars, timestep="day", quote=None):
+        """Feed bars received from a stream to the indicators of ``asset``.
+
+        Bars at or before the last bar already seen are ignored. Once bars are pushed for a feed, the engine stops
+        polling ``get_historical_prices`` for it.
+
+        Parameters
+        ----------
+        asset : Asset or str
+            The asset.
+        bars : Bars or pandas.DataFrame
+            Bars with a datetime index and open, high, low, close and volume columns.
+        timestep : str, optional
+            Bar size of the indicators to update.
+        quote : Asset, optional
+            The quote asset, for crypto and forex.
+        """
+        key = self._feed_key(asset, timestep, quote)
+        feed = self._feeds.setdefault(key, _Feed())
+        feed.checked_at = _PUSHED
+        timestamps, columns = self._columns(bars)
+        if timestamps is not None:
+            self._push(feed, feed.indicators.values(), timestamps, columns)
+
+    def reset(self):
+        """Forget every indicator."""
+        self._feeds.clear()
+
+    # ----- internals -----
+
+    def _feed_key(self, asset, timestep, quote):
+        asset = self._strategy._sanitize_user_asset(asset)
+        if quote is None:
+            quote = self._strategy.quote_asset
+        return asset, quote, timestep
+
+    def _get(self, indicator_class, asset, length, timestep, source, quote, history):
+        key = self._feed_key(asset, timestep, quote)
+        feed = self._feeds.get(key)
+        if feed is None:
+            feed = self._feeds[key] = _Feed()
+
+        indicator_key = (indicator_class.__name__, int(length), source)
+        indicator = feed.indicators.get(indicator_key)
+        if indicator is None:
+            indicator = indicator_class(length, source=source, history=self._history)
+            self._warm_up(key, feed, indicator)
+            feed.indicators[indicator_key] = indicator
+        self._catch_up(key, feed)
+        # Catching up may have replaced the indicators with fresh ones.
+        indicator = feed.indicators[indicator_key]
+
+        if history:
+            return IndicatorHistory(
+                pd.to_datetime(indicator.datetimes.to_array(), utc=True).tz_convert(self._strategy.pytz),
+                indicator.values.to_array(),
+            )
+        return None if math.isnan(indicator.value) else indicator.value
+
+    def _fetch(self, key, length):
+        asset, quote, timestep = key
+        bars = self._strategy.get_historical_prices(asset, length, timestep, quote=quote, return_numpy=True)
+        return self._columns(bars)
+
+    @staticmethod
+    def _columns(bars):
+        if isinstance(bars, BarArrays):
+            if len(bars) == 0 or "datetime" not in bars:
+                return None, None
+            timestamps = np.asarray(bars["datetime"], dtype="datetime64[ns]").view(np.int64)
+            columns = {name: np.asarray(bars[name], dtype=np.float64) for name in _SOURCES if name in bars}
+            return timestamps, columns
+
+        df = getattr(bars, "df", bars)
+        if df is None or len(df) == 0:
+            return None, None
+        index = pd.DatetimeIndex(df.index)
+        if index.tz is None:
+            index = index.tz_localize("UTC")
+        columns = {name: df[name].to_numpy(dtype=np.float64) for name in _SOURCES if name in df.columns}
+        return index.asi8, columns
+
+    def _push(self, feed, indicators, timestamps, columns, until=None):
+        """Feed the bars after ``feed.last_timestamp`` (and at or before ``until``) to ``indicators``."""
+        start = 0 if feed.last_timestamp is None else int(np.searchsorted(timestamps, feed.last_timestamp, "right"))
+        stop = len(timestamps) if until is None else int(np.searchsorted(timestamps, until, "right"))
+        self._replay(indicators, timestamps, columns, start, stop)
+        if until is None and stop > start:
+            feed.last_timestamp = int(timestamps[stop - 1])
+
+    @staticmethod
+    def _replay(indicators, timestamps, columns, start, stop):
+        indicators = list(indicators)
+        names = list(columns)
+        for i in range(start, stop):
+            bar = {name: columns[name][i] for name in names}
+            for indicator in indicators:
+                indicator.update(timestamps[i], bar)
+
+    def _warm_up(self, key, feed, indicator):
+        """Replay enough past bars for a new indicator to be up to date with the other indicators of its feed."""
+        timestamps, columns = self._fetch(key, indicator.warmup_bars)
+        if timestamps is None:
+            return
+        if feed.last_timestamp is None:
+            self._push(feed, [indicator], timestamps, columns)
+            feed.checked_at = self._strategy.get_datetime()
+        else:
+            # The other indicators have only seen bars up to the feed's last bar.
+            self._replay([indicator], timestamps, columns, 0,
+                         int(np.searchsorted(timestamps, feed.last_timestamp, "right")))
+
+    def _catch_up(self, key, feed):
+        """Feed the bars that appeared since the last call, once per strategy datetime."""
+        if feed.checked_at is _PUSHED:
+            return
+        now = self._strategy.get_datetime()
+        if feed.checked_at == now or feed.last_timestamp is None:
+            feed.checked_at = now
+            return
+        feed.checked_at = now
+
+        length = 2
+        while True:
+            timestamps, columns = self._fetch(key, length)
+            if timestamps is None:
+                return
+            if timestamps[0] <= feed.last_timestamp:
+                # The request overlaps the bars already seen, so nothing was skipped.
+                self._push(feed, feed.indicators.values(), timestamps, columns)
+                return
+            if length >= min(feed.warmup_bars, self.MAX_CATCH_UP_BARS):
+                break
+            length = min(length * 4, feed.warmup_bars, self.MAX_CATCH_UP_BARS)
+
+        # Too many bars were missed: start the indicators again from the bars of the last request.
+        logger.debug(f"Indicators of {key[0]} ({key[2]}) fell behind by more than {length} bars; warming up again")
+        indicators = {k: type(i)(i.length, source=i.source, history=self._history) for k, i in feed.indicators.items()}
+        feed.indicators = indicators
+        feed.last_timestamp = None
+        timestamps, columns = self._fetch(key, feed.warmup_bars)
+        if timestamps is not None:
+            self._push(feed, indicators.values(), timestamps, columns)
+
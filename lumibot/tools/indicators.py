@@ -5,6 +5,7 @@ import webbrowser
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import pytz
@@ -37,7 +38,65 @@ TERMINAL_TRADE_STATUSES_FOR_MARKERS = {
 
 def _build_trade_marker_tooltip(row: pd.Series):
     """Return tooltip text for a trade marker; None when the row lacks required data."""
-    status_value = row.get("status")
+    return _format_trade_marker_tooltip(*(row.get(column) for column in _TRADE_TOOLTIP_COLUMNS))
+
+
+# Trade columns used by the buy/sell tooltips, in ``_format_trade_marker_tooltip`` argument order.
+_TRADE_TOOLTIP_COLUMNS = (
+    "status",
+    "filled_quantity",
+    "price",
+    "asset.multiplier",
+    "trade_cost",
+    "asset.asset_type",
+    "symbol",
+    "asset.right",
+    "asset.strike",
+    "asset.expiration",
+    "type",
+)
+
+
+def _trade_marker_tooltips(trades: pd.DataFrame) -> pd.Series:
+    """Tooltip text for every row of ``trades`` (None where ``_build_trade_marker_tooltip`` would return None).
+
+    Rows that cannot produce a tooltip (non-terminal status, missing quantity, price or multiplier) are filtered out
+    with column operations first; the remaining rows are formatted from plain column values instead of building a
+    Series per row with ``DataFrame.apply``.
+    """
+    result = pd.Series([None] * len(trades), index=trades.index, dtype=object)
+    if trades.empty or "status" not in trades.columns:
+        return result
+
+    columns = [
+        trades[column] if column in trades.columns else pd.Series([None] * len(trades), index=trades.index, dtype=object)
+        for column in _TRADE_TOOLTIP_COLUMNS
+    ]
+    status, filled_quantity, price, multiplier = columns[:4]
+    mask = status.astype(str).str.strip().str.lower().isin(TERMINAL_TRADE_STATUSES_FOR_MARKERS) & status.notna()
+    mask &= filled_quantity.notna() & price.notna() & multiplier.notna() & (multiplier.astype(str) != "")
+
+    positions = mask.to_numpy().nonzero()[0]
+    if len(positions) == 0:
+        return result
+    values = zip(*(column.iloc[positions].tolist() for column in columns))
+    result.iloc[positions] = [_format_trade_marker_tooltip(*row_values) for row_values in values]
+    return result
+
+
+def _format_trade_marker_tooltip(
+    status_value,
+    filled_quantity,
+    price,
+    multiplier_value,
+    trade_cost_value,
+    asset_type,
+    symbol,
+    right,
+    strike,
+    expiration,
+    order_type,
+):
     if pd.isna(status_value) or str(status_value).strip() == "":
         return None
 
@@ -45,18 +104,16 @@ def _build_trade_marker_tooltip(row: pd.Series):
     if status_text.lower() not in TERMINAL_TRADE_STATUSES_FOR_MARKERS:
         return None
 
-    for key in ("filled_quantity", "price"):
-        value = row.get(key)
+    for value in (filled_quantity, price):
         if pd.isna(value):
             return None
 
     try:
-        filled_quantity_dec = Decimal(str(row["filled_quantity"]))
-        price_dec = Decimal(str(row["price"]))
+        filled_quantity_dec = Decimal(str(filled_quantity))
+        price_dec = Decimal(str(price))
     except (InvalidOperation, TypeError, ValueError):
         return None
 
-    multiplier_value = row.get("asset.multiplier")
     if pd.isna(multiplier_value) or multiplier_value == "":
         return None
     try:
@@ -69,7 +126,6 @@ def _build_trade_marker_tooltip(row: pd.Series):
     except (InvalidOperation, TypeError, ValueError):
         return None
 
-    trade_cost_value = row.get("trade_cost")
     trade_cost_dec = None
     if not (pd.isna(trade_cost_value) or trade_cost_value == ""):
         try:
@@ -80,29 +136,29 @@ def _build_trade_marker_tooltip(row: pd.Series):
     if trade_cost_dec is None:
         trade_cost_dec = amount_transacted_dec
 
-    if row.get("asset.asset_type") == "option":
+    if asset_type == "option":
         try:
             return (
                 status_text
                 + "<br>"
                 + str(filled_quantity_dec.quantize(Decimal("0.01")).__format__(",f"))
                 + " "
-                + str(row.get("symbol"))
+                + str(symbol)
                 + " "
-                + str(row.get("asset.right"))
+                + str(right)
                 + " Option"
                 + "<br>"
                 + "Strike: "
-                + str(row.get("asset.strike"))
+                + str(strike)
                 + "<br>"
                 + "Expiration: "
-                + str(row.get("asset.expiration"))
+                + str(expiration)
                 + "<br>"
                 + "Price: "
                 + str(price_dec.quantize(Decimal("0.0001")).__format__(",f"))
                 + "<br>"
                 + "Order Type: "
-                + str(row.get("type"))
+                + str(order_type)
                 + "<br>"
                 + "Amount Transacted: "
                 + str(
@@ -138,13 +194,13 @@ def _build_trade_marker_tooltip(row: pd.Series):
         + "<br>"
         + filled_qty_text
         + " "
-        + str(row.get("symbol"))
+        + str(symbol)
         + "<br>"
         + "Price: "
         + price_text
         + "<br>"
         + "Order Type: "
-        + str(row.get("type"))
+        + str(order_type)
         + "<br>"
         + "Amount Transacted: "
         + amount_transacted
@@ -365,6 +421,117 @@ def _safe_color(raw_color, key_hint=""):
     return SAFE_COLOR_CYCLE[idx]
 
 
+# Most points drawn per trace in the HTML plots; longer series are downsampled. 0 disables downsampling.
+DEFAULT_PLOT_MAX_POINTS = 5000
+
+
+def _plot_max_points_from_env():
+    value = os.environ.get("LUMIBOT_PLOT_MAX_POINTS")
+    if value is None or not value.strip():
+        return DEFAULT_PLOT_MAX_POINTS
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(
+            f"Ignoring LUMIBOT_PLOT_MAX_POINTS={value!r}: expected an integer, using {DEFAULT_PLOT_MAX_POINTS}."
+        )
+        return DEFAULT_PLOT_MAX_POINTS
+
+
+PLOT_MAX_POINTS = _plot_max_points_from_env()
+# Draw the plots with WebGL (Scattergl) traces, which stay responsive with many points.
+PLOT_USE_WEBGL = os.environ.get("LUMIBOT_PLOT_WEBGL", "").lower() in ("1", "true", "yes")
+
+
+def _scatter_class(use_webgl):
+    return go.Scattergl if use_webgl else go.Scatter
+
+
+def _x_as_float(x):
+    """Datetimes as float seconds since the first point (keeps the LTTB area arithmetic well conditioned)."""
+    x_ns = pd.to_datetime(pd.Index(x), utc=True).asi8
+    return (x_ns - x_ns[0]) / 1e9
+
+
+def _lttb_indices(x, y, max_points):
+    """Indices of the points kept by Largest-Triangle-Three-Buckets downsampling.
+
+    ``x`` must be sorted and ``y`` free of NaN. The first and last points are always kept; every bucket in between
+    keeps the point forming the largest triangle with the previously kept point and the next bucket's average.
+    """
+    n = len(x)
+    if max_points >= n or max_points < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.intp)
+    # Average of each bucket, used as the third triangle corner for the bucket before it.
+    sums_x = np.add.reduceat(x[1:n - 1], edges[:-1] - 1)
+    sums_y = np.add.reduceat(y[1:n - 1], edges[:-1] - 1)
+    counts = np.diff(edges)
+    avg_x = np.append(sums_x / counts, x[-1])
+    avg_y = np.append(sums_y / counts, y[-1])
+
+    kept = np.empty(max_points, dtype=np.intp)
+    kept[0] = 0
+    a = 0
+    for i in range(max_points - 2):
+        lo, hi = edges[i], edges[i + 1]
+        area = np.abs(
+            (x[a] - avg_x[i + 1]) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y[i + 1] - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        kept[i + 1] = a
+    kept[-1] = n - 1
+    return kept
+
+
+def _min_max_indices(y, max_points):
+    """Indices of the lowest and highest point in each of ``max_points // 2`` equal buckets (plus both ends)."""
+    n = len(y)
+    if max_points >= n or max_points < 4:
+        return np.arange(n)
+    bucket = np.arange(n) * (max_points // 2) // n
+    order = np.lexsort((y, bucket))
+    bucket_sorted = bucket[order]
+    first = np.r_[True, bucket_sorted[1:] != bucket_sorted[:-1]]
+    last = np.r_[bucket_sorted[1:] != bucket_sorted[:-1], True]
+    return np.unique(np.concatenate(([0, n - 1], order[first], order[last])))
+
+
+def _downsample_positions(x, y, max_points, method="lttb"):
+    """Positions (into ``x``/``y``) of the points to draw for one trace.
+
+    Points with a missing ``y`` are dropped first (the traces connect gaps anyway). With ``max_points`` of 0/None
+    every remaining point is kept. ``method`` is ``"lttb"`` for lines or ``"minmax"`` to keep every bucket's extremes.
+    """
+    y = pd.to_numeric(pd.Series(y), errors="coerce").to_numpy(dtype=float)
+    positions = np.flatnonzero(~np.isnan(y))
+    if not max_points or len(positions) <= max_points:
+        return positions
+
+    x_values = _x_as_float(pd.Index(x)[positions])
+    order = np.argsort(x_values, kind="stable")
+    positions, x_values = positions[order], x_values[order]
+    if method == "minmax":
+        kept = _min_max_indices(y[positions], max_points)
+    else:
+        kept = _lttb_indices(x_values, y[positions], max_points)
+    return positions[kept]
+
+
+def _value_hover_text(values, detail_text):
+    """``"Value: <value>"`` plus ``"<br><detail_text>"`` when there is one, for whole columns at once."""
+    text = "Value: " + pd.Series(values).astype(str).reset_index(drop=True)
+    if detail_text is None:
+        return text
+    detail = pd.Series(detail_text).reset_index(drop=True)
+    has_detail = detail.notna()
+    text[has_detail] = text[has_detail] + "<br>" + detail[has_detail].astype(str)
+    return text
+
+
 def calculate_returns(symbol, start=datetime(1900, 1, 1), end=datetime.now()):
     start = to_datetime_aware(start)
     end = to_datetime_aware(end)
@@ -381,12 +548,27 @@ def plot_indicators(
     chart_lines_df=None,
     strategy_name=None,
     show_indicators=True,
+    max_points=None,
+    use_webgl=None,
 ):
+    """Write the markers and lines strategies added with ``add_marker``/``add_line`` to an HTML plot and a CSV file.
+
+    Parameters
+    ----------
+    max_points : int, optional
+        Most points drawn per marker/line trace (``PLOT_MAX_POINTS`` by default, 0 for all). Longer lines are
+        downsampled with LTTB and longer marker series keep each bucket's extremes. The CSV always has every point.
+    use_webgl : bool, optional
+        Draw with WebGL (``Scattergl``) traces. Defaults to ``PLOT_USE_WEBGL``.
+    """
     # If show plot is False, then we don't want to open the plot in the browser
     if not show_indicators:
         logger.debug("show_indicators is False, not creating the plot file.")
         return
 
+    max_points = PLOT_MAX_POINTS if max_points is None else max_points
+    scatter = _scatter_class(PLOT_USE_WEBGL if use_webgl is None else use_webgl)
+
     logger.info("\nCreating indicators plot...")
 
     # Assign "default_plot" as plot_name for markers and lines that don't have one
@@ -435,21 +617,19 @@ def plot_indicators(
     # Chart Markers
     ###############################
 
-    def generate_marker_plotly_text(row):
-        if row["detail_text"] is None:
-            return "Value: " + str(row["value"])
-        else:
-            return "Value: " + str(row["value"]) + "<br>" + row["detail_text"]
-
     # Plot the chart markers
     if chart_markers_df is not None and not chart_markers_df.empty:
-        chart_markers_df["detail_text"] = chart_markers_df.apply(generate_marker_plotly_text, axis=1)
+        # Hover text for the whole column at once (it also goes to the CSV export, as before)
+        chart_markers_df["detail_text"] = _value_hover_text(
+            chart_markers_df["value"], chart_markers_df.get("detail_text")
+        ).to_numpy()
 
         # Group by plot_name first, then by name
         for plot_name, plot_df in chart_markers_df.groupby("plot_name"):
             # Loop over the marker names for this plot_name
             for marker_name, group_df in plot_df.groupby("name"):
-                group_df = group_df.copy()
+                positions = _downsample_positions(group_df["datetime"], group_df["value"], max_points, "minmax")
+                group_df = group_df.iloc[positions].copy()
                 # Get the marker symbol
                 marker_symbol = group_df["symbol"].iloc[0]
 
@@ -485,7 +665,7 @@ def plot_indicators(
 
                 # Create a new trace for this marker name
                 fig.add_trace(
-                    go.Scatter(
+                    scatter(
                         x=group_df["datetime"],
                         y=group_df["value"],
                         mode="markers",
@@ -506,20 +686,19 @@ def plot_indicators(
     # Chart Lines
     ###############################
 
-    def generate_line_plotly_text(row):
-        if row["detail_text"] is None:
-            return "Value: " + str(row["value"])
-        else:
-            return "Value: " + str(row["value"]) + "<br>" + row["detail_text"]
-
     # Plot the chart lines
     if chart_lines_df is not None and not chart_lines_df.empty:
-        chart_lines_df["detail_text"] = chart_lines_df.apply(generate_line_plotly_text, axis=1)
+        # Hover text for the whole column at once (it also goes to the CSV export, as before)
+        chart_lines_df["detail_text"] = _value_hover_text(
+            chart_lines_df["value"], chart_lines_df.get("detail_text")
+        ).to_numpy()
 
         # Group by plot_name first, then by name
         for plot_name, plot_df in chart_lines_df.groupby("plot_name"):
             # Loop over the line names for this plot_name
             for line_name, group_df in plot_df.groupby("name"):
+                positions = _downsample_positions(group_df["datetime"], group_df["value"], max_points)
+                group_df = group_df.iloc[positions]
                 if "color" not in group_df.columns:
                     group_df = group_df.assign(color=None)
                 color = _safe_color(group_df["color"].iloc[0], f"{plot_name}:{line_name}")
@@ -529,7 +708,7 @@ def plot_indicators(
 
                 # Create a new trace for this line name
                 fig.add_trace(
-                    go.Scatter(
+                    scatter(
                         x=group_df["datetime"],
                         y=group_df["value"],
                         mode="lines",
@@ -644,12 +823,27 @@ def plot_returns(
     initial_budget=1,
     # chart_markers_df=None,
     # chart_lines_df=None,
+    max_points=None,
+    use_webgl=None,
 ):
+    """Write the strategy vs benchmark HTML plot (with buy/sell markers) and the trades CSV.
+
+    Parameters
+    ----------
+    max_points : int, optional
+        Most points drawn per strategy/benchmark/cash line (``PLOT_MAX_POINTS`` by default, 0 for all). Longer lines
+        are downsampled with LTTB; buy and sell markers are always drawn in full.
+    use_webgl : bool, optional
+        Draw with WebGL (``Scattergl``) traces. Defaults to ``PLOT_USE_WEBGL``.
+    """
     # If show plot is False, then we don't want to open the plot in the browser
     if not show_plot:
         logger.info("show_plot is False, not creating the plot file or CSV.")
         return
 
+    max_points = PLOT_MAX_POINTS if max_points is None else max_points
+    scatter = _scatter_class(PLOT_USE_WEBGL if use_webgl is None else use_webgl)
+
     logger.info("\nCreating trades plot and CSV...")
 
     # --- Start: CSV Generation for trades_df ---
@@ -773,14 +967,15 @@ def plot_returns(
             return f"{positions.get('asset', 'Unknown asset')}: {positions.get('quantity', 0):,.2f}"
         return "No positions"
 
-    # Manually create a list of formatted positions
-    formatted_positions_list = [format_positions(pos) for pos in df_final["positions"]]
+    # Only the points that are drawn need their positions formatted
+    strategy_points = df_final.iloc[_downsample_positions(df_final.index, df_final[strategy_name], max_points)]
+    formatted_positions_list = [format_positions(pos) for pos in strategy_points["positions"]]
 
     # Modify the strategy line to include positions
     fig.add_trace(
-        go.Scatter(
-            x=df_final.index,
-            y=df_final[strategy_name],
+        scatter(
+            x=strategy_points.index,
+            y=strategy_points[strategy_name],
             mode="lines",
             name=strategy_name,
             connectgaps=True,
@@ -796,10 +991,13 @@ def plot_returns(
     )
 
     # Benchmark line
+    benchmark_points = df_final[benchmark_name].iloc[
+        _downsample_positions(df_final.index, df_final[benchmark_name], max_points)
+    ]
     fig.add_trace(
-        go.Scatter(
-            x=df_final.index,
-            y=df_final[benchmark_name],
+        scatter(
+            x=benchmark_points.index,
+            y=benchmark_points,
             mode="lines",
             name=benchmark_name,
             connectgaps=True,
@@ -808,10 +1006,11 @@ def plot_returns(
     )
 
     # Cash line
+    cash_points = df_final["cash"].iloc[_downsample_positions(df_final.index, df_final["cash"], max_points)]
     fig.add_trace(
-        go.Scatter(
-            x=df_final.index,
-            y=df_final["cash"],
+        scatter(
+            x=cash_points.index,
+            y=cash_points,
             mode="lines",
             name="cash",
             connectgaps=True,
@@ -825,16 +1024,16 @@ def plot_returns(
     _min = df_final[strategy_name].min()
     vshift = (_max - _min) * 0.10
 
+    # Strategy value at each trade, back-filled from the next portfolio snapshot
+    strategy_values_bfilled = df_final[strategy_name].bfill()
+
     # Buy ticks
-    buys = df_final.copy()
-    buys[strategy_name] = buys[strategy_name].bfill()
     # Include all buy-type sides: buy, buy_to_open, buy_to_cover, buy_to_close
-    buys = buys.loc[df_final["side"].isin(["buy", "buy_to_open", "buy_to_cover", "buy_to_close"])]
-
-    def generate_buysell_plotly_text(row):
-        return _build_trade_marker_tooltip(row)
+    buy_mask = df_final["side"].isin(["buy", "buy_to_open", "buy_to_cover", "buy_to_close"]).to_numpy()
+    buys = df_final.loc[buy_mask].copy()
+    buys[strategy_name] = strategy_values_bfilled.to_numpy()[buy_mask]
 
-    buy_ticks_df = buys.apply(generate_buysell_plotly_text, axis=1)
+    buy_ticks_df = _trade_marker_tooltips(buys)
 
     # Plot the buy ticks
     if not buy_ticks_df.empty:
@@ -850,7 +1049,7 @@ def plot_returns(
         buys = buys.set_index("datetime")
         buys["buy_shift"] = buys[strategy_name] - vshift
         fig.add_trace(
-            go.Scatter(
+            scatter(
                 x=buys.index,
                 y=buys["buy_shift"],
                 mode="markers",
@@ -868,12 +1067,12 @@ def plot_returns(
     ###############################
 
     # Sell ticks
-    sells = df_final.copy()
-    sells[strategy_name] = sells[strategy_name].bfill()
     # Include all sell-type sides: sell, sell_to_close, sell_short, sell_to_open
-    sells = sells.loc[df_final["side"].isin(["sell", "sell_to_close", "sell_short", "sell_to_open"])]
+    sell_mask = df_final["side"].isin(["sell", "sell_to_close", "sell_short", "sell_to_open"]).to_numpy()
+    sells = df_final.loc[sell_mask].copy()
+    sells[strategy_name] = strategy_values_bfilled.to_numpy()[sell_mask]
 
-    sells_ticks_df = sells.apply(generate_buysell_plotly_text, axis=1)
+    sells_ticks_df = _trade_marker_tooltips(sells)
 
     # Plot the sell ticks
     if not sells_ticks_df.empty:
@@ -891,7 +1090,7 @@ def plot_returns(
         sells = sells.set_index("datetime")
         sells["sell_shift"] = sells[strategy_name] + vshift
         fig.add_trace(
-            go.Scatter(
+            scatter(
                 x=sells.index,
                 y=sells["sell_shift"],
                 mode="markers",
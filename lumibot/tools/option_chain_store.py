@@ -0,0 +1,296 @@
+"""
+Contract master tables for historical option chains.
+
+The ThetaData and Polygon chain caches used to keep one parquet file per underlying and per backtest date, and to
+look for a file from the last few days on every call. A miss cost a full chain download (for ThetaData, one
+expirations request plus one strikes request per expiration), so a multi-year backtest rebuilt the chain every week
+or two and left hundreds of overlapping files behind.
+
+``OptionContractTable`` keeps one file per option root instead. It holds every contract ``(right, expiration,
+strike)`` seen in a downloaded chain, with the first and last dates of the chains it was part of, plus the list of
+those chain dates (the snapshots). The chain on a date is a vectorized interval filter on the table: the contracts
+already listed on that date, not expired yet, and still listed in the latest snapshot before it. Each new download
+is merged into the same file, so the table extends itself as a backtest moves forward.
+"""
+
+import datetime
+import json
+import os
+import threading
+import uuid
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .lumibot_logger import get_logger
+
+logger = get_logger(__name__)
+
+RIGHTS = ("CALL", "PUT")
+
+_METADATA_KEY = b"lumibot_option_contracts"
+
+# Tables already read in this process, by path, with the modification time of the file they were read from.
+_tables = {}
+_tables_lock = threading.Lock()
+
+
+def _as_date(value):
+    if value is None or isinstance(value, datetime.date) and not isinstance(value, datetime.datetime):
+        return value
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    return datetime.date.fromisoformat(str(value)[:10])
+
+
+def _day(value):
+    return np.datetime64(_as_date(value), "D")
+
+
+class OptionContractTable:
+    """
+    The contracts of one option root seen over time, stored in a single parquet file.
+
+    Parameters
+    ----------
+    path : str or Path
+        The parquet file of the table. It is created by the first ``add_snapshot``.
+    version : int, optional
+        Version of the chain format. A file written with an older version is ignored and replaced.
+
+    Example
+    -------
+    >>> table = OptionContractTable.load(folder / "SPY.contracts.parquet")
+    >>> snapshot = table.find_snapshot(date(2024, 3, 1), max_age_days=7)
+    >>> if snapshot is None:
+    ...     table.add_snapshot(date(2024, 3, 1), download_chain(), info={"Multiplier": 100, "Exchange": "SMART"})
+    ...     snapshot = date(2024, 3, 1)
+    >>> chain = table.chain(date(2024, 3, 1), snapshot)
+    """
+
+    def __init__(self, path, version=0):
+        self.path = Path(path)
+        self.version = version
+        self.info = {}
+        self.snapshots = []
+        self._mtime = None
+        self._set_contracts(self._empty_frame())
+
+    @classmethod
+    def load(cls, path, version=0):
+        """Return the table stored at ``path``, shared by the callers of this process and re-read when the file
+        changes."""
+        path = Path(path)
+        try:
+            mtime = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        with _tables_lock:
+            table = _tables.get(path)
+            if table is None or table.version != version or table._mtime != mtime:
+                table = cls(path, version)
+                table._read()
+                _tables[path] = table
+            return table
+
+    @staticmethod
+    def _empty_frame():
+        return pd.DataFrame(
+            {
+                "right": pd.Series(dtype=object),
+                "expiration": pd.Series(dtype="datetime64[s]"),
+                "strike": pd.Series(dtype=float),
+                "first_seen": pd.Series(dtype="datetime64[s]"),
+                "last_seen": pd.Series(dtype="datetime64[s]"),
+            }
+        )
+
+    def _set_contracts(self, contracts):
+        contracts = contracts.sort_values(["right", "expiration", "strike"], ignore_index=True)
+        self.contracts = contracts
+        self._rights = contracts["right"].to_numpy()
+        self._expirations = contracts["expiration"].to_numpy().astype("datetime64[D]")
+        self._strikes = contracts["strike"].to_numpy(dtype=float)
+        self._first_seen = contracts["first_seen"].to_numpy().astype("datetime64[D]")
+        self._last_seen = contracts["last_seen"].to_numpy().astype("datetime64[D]")
+
+    def _read(self):
+        if not self.path.exists():
+            return
+        try:
+            table = pq.read_table(self.path)
+            metadata = json.loads((table.schema.metadata or {}).get(_METADATA_KEY, b"{}"))
+            self._mtime = self.path.stat().st_mtime_ns
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable option contract table {self.path}: {e}")
+            return
+
+        if int(metadata.get("version", 0) or 0) < self.version:
+            logger.debug(f"Ignoring outdated option contract table {self.path} (version {metadata.get('version')})")
+            return
+
+        self.info = metadata.get("info", {})
+        self.snapshots = [
+            {
+                "as_of": _as_date(snapshot["as_of"]),
+                "min_expiration": _as_date(snapshot.get("min_expiration")),
+                "max_expiration": _as_date(snapshot.get("max_expiration")),
+            }
+            for snapshot in metadata.get("snapshots", [])
+        ]
+        contracts = table.to_pandas()
+        for column in ("expiration", "first_seen", "last_seen"):
+            contracts[column] = pd.to_datetime(contracts[column]).astype("datetime64[s]")
+        self._set_contracts(contracts)
+
+    def _write(self):
+        metadata = {
+            "version": self.version,
+            "info": self.info,
+            "snapshots": [
+                {key: value.isoformat() if value is not None else None for key, value in snapshot.items()}
+                for snapshot in self.snapshots
+            ],
+        }
+        contracts = self.contracts.copy()
+        for column in ("expiration", "first_seen", "last_seen"):
+            contracts[column] = contracts[column].dt.date
+        table = pa.Table.from_pandas(contracts, preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), _METADATA_KEY: json.dumps(metadata)})
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            pq.write_table(table, tmp_path, compression="snappy")
+            os.replace(tmp_path, self.path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+        self._mtime = self.path.stat().st_mtime_ns
+
+    def __len__(self):
+        return len(self.contracts)
+
+    def find_snapshot(self, current_date, max_age_days=None, min_expiration=None, max_expiration=None):
+        """
+        Get the latest snapshot that can give the chain on ``current_date``.
+
+        Parameters
+        ----------
+        current_date : datetime.date
+            The date of the chain.
+        max_age_days : int, optional
+            Only use snapshots taken at most this many days before ``current_date``. None accepts any age.
+        min_expiration, max_expiration : datetime.date, optional
+            The range of expirations needed. A snapshot downloaded for a narrower range is not used.
+
+        Returns
+        -------
+        datetime.date or None
+            The date of the snapshot, or None if the chain has to be downloaded.
+        """
+        current_date = _as_date(current_date)
+        min_expiration, max_expiration = _as_date(min_expiration), _as_date(max_expiration)
+        first_needed = max(current_date, min_expiration) if min_expiration else current_date
+
+        best = None
+        for snapshot in self.snapshots:
+            as_of = snapshot["as_of"]
+            if as_of > current_date:
+                continue
+            if max_age_days is not None and (current_date - as_of).days > max_age_days:
+                continue
+            if snapshot["min_expiration"] is not None and snapshot["min_expiration"] > first_needed:
+                continue
+            if snapshot["max_expiration"] is not None and (
+                max_expiration is None or snapshot["max_expiration"] < max_expiration
+            ):
+                continue
+            if best is None or as_of > best:
+                best = as_of
+        return best
+
+    def chain(self, current_date, snapshot, min_expiration=None, max_expiration=None):
+        """
+        Get the chain on ``current_date`` from the contracts listed in ``snapshot`` (see ``find_snapshot``).
+
+        Returns
+        -------
+        dict
+            ``info`` (Multiplier, Exchange, ...) and ``"Chains": {"CALL": {"YYYY-MM-DD": [strikes]}, "PUT": {...}}``
+            with the expirations and strikes in increasing order.
+        """
+        current_date = _as_date(current_date)
+        first_needed = max(current_date, _as_date(min_expiration)) if min_expiration else current_date
+
+        mask = (
+            (self._first_seen <= _day(current_date))
+            & (self._last_seen >= _day(snapshot))
+            & (self._expirations >= _day(first_needed))
+        )
+        if max_expiration is not None:
+            mask &= self._expirations <= _day(max_expiration)
+
+        chains = {right: {} for right in RIGHTS}
+        rights, expirations, strikes = self._rights[mask], self._expirations[mask], self._strikes[mask]
+        if len(strikes):
+            # Rows are sorted by right, expiration and strike, so each (right, expiration) is one run of rows.
+            starts = np.flatnonzero(
+                np.concatenate(([True], (rights[1:] != rights[:-1]) | (expirations[1:] != expirations[:-1])))
+            )
+            ends = np.append(starts[1:], len(strikes))
+            for start, end in zip(starts, ends):
+                chains.setdefault(rights[start], {})[str(expirations[start])] = strikes[start:end].tolist()
+
+        return {**self.info, "Chains": chains}
+
+    def add_snapshot(self, as_of, chains, info=None, min_expiration=None, max_expiration=None):
+        """
+        Merge a downloaded chain into the table and save it.
+
+        Parameters
+        ----------
+        as_of : datetime.date
+            The date the chain was downloaded for.
+        chains : dict
+            ``{"CALL": {"YYYY-MM-DD": [strikes]}, "PUT": {...}}``.
+        info : dict, optional
+            The other keys of the chain (Multiplier, Exchange, ...), returned with every chain of the table.
+        min_expiration, max_expiration : datetime.date, optional
+            The range of expirations the download was limited to, if any.
+        """
+        as_of = _as_date(as_of)
+        rows = [
+            (right, expiration, float(strike))
+            for right, expirations in (chains or {}).items()
+            for expiration, strikes in (expirations or {}).items()
+            for strike in strikes
+        ]
+        new = pd.DataFrame(rows, columns=["right", "expiration", "strike"])
+        new["expiration"] = pd.to_datetime(new["expiration"]).astype("datetime64[s]")
+        new["first_seen"] = new["last_seen"] = pd.Timestamp(as_of).as_unit("s")
+
+        contracts = pd.concat([self.contracts, new], ignore_index=True) if len(self.contracts) else new
+        contracts = contracts.groupby(["right", "expiration", "strike"], as_index=False, sort=False).agg(
+            first_seen=("first_seen", "min"), last_seen=("last_seen", "max")
+        )
+        self._set_contracts(contracts)
+
+        if info is not None:
+            self.info = {key: value for key, value in info.items() if key != "Chains"}
+        snapshot = {
+            "as_of": as_of,
+            "min_expiration": _as_date(min_expiration),
+            "max_expiration": _as_date(max_expiration),
+        }
+        if snapshot not in self.snapshots:
+            self.snapshots.append(snapshot)
+            self.snapshots.sort(key=lambda item: item["as_of"])
+
+        try:
+            self._write()
+        except Exception as e:
+            logger.warning(f"Could not save the option contract table {self.path}: {e}")
@@ -21,7 +21,9 @@ from urllib3.exceptions import MaxRetryError
 from lumibot.constants import LUMIBOT_CACHE_FOLDER, LUMIBOT_DEFAULT_PYTZ
 from lumibot.credentials import POLYGON_API_KEY
 from lumibot.entities import Asset
+from lumibot.tools.backtest_profiler import profiled
 from lumibot.tools.lumibot_logger import get_logger
+from lumibot.tools.option_chain_store import OptionContractTable
 
 logger = get_logger(__name__)
 
@@ -523,6 +525,7 @@ def get_missing_dates(
     return missing_dates
 
 
+@profiled("cache_load")
 def load_cache(cache_file: Path) -> pd.DataFrame:
     """
     Load cached data from a Feather file and return a DataFrame with a UTC‐aware DateTimeIndex.
@@ -734,10 +737,11 @@ def get_chains_cached(
     -----
     1) We do *not* use the real system date in this function because it is purely 
        historical/backtest-oriented.
-    2) If a suitable chain file from within RECENT_FILE_TOLERANCE_DAYS of current_date 
-       exists, it is reused directly.
-    3) Otherwise, the function downloads fresh data from Polygon, then saves it under 
-       `LUMIBOT_CACHE_FOLDER/polygon/option_chains/{symbol}_{date}.parquet`.
+    2) Chains are cached in one contract master table per underlying (see ``OptionContractTable``),
+       `LUMIBOT_CACHE_FOLDER/polygon/option_chains/{symbol}.contracts.parquet`. If the table has a
+       snapshot from within RECENT_FILE_TOLERANCE_DAYS of current_date, the chain is taken from it.
+       Chain files of the older per-date layout are still reused, and merged into the table.
+    3) Otherwise, the function downloads fresh data from Polygon, then merges it into the table.
     4) By default, we fetch both 'expired=True' and 'expired=False', so you get 
        historical + near-future options for your specified date.
     """
@@ -757,7 +761,15 @@ def get_chains_cached(
     chain_folder = Path(LUMIBOT_CACHE_FOLDER) / "polygon" / "option_chains"
     chain_folder.mkdir(parents=True, exist_ok=True)
 
-    # 4) Attempt to find a suitable recent file (reuse it if found)
+    # 4) Attempt to find a suitable recent snapshot or file (reuse it if found)
+    contract_table = OptionContractTable.load(chain_folder / f"{asset.symbol}.contracts.parquet")
+    snapshot = contract_table.find_snapshot(current_date, max_age_days=RECENT_FILE_TOLERANCE_DAYS)
+    if snapshot is not None:
+        data = contract_table.chain(current_date, snapshot)
+        if any(data["Chains"].values()):
+            logger.debug(f"Reusing chain snapshot {snapshot} of {contract_table.path}")
+            return data
+
     earliest_okay_date = current_date - timedelta(days=RECENT_FILE_TOLERANCE_DAYS)
     pattern = f"{asset.symbol}_*.parquet"
     potential_files = sorted(chain_folder.glob(pattern), reverse=True)
@@ -790,6 +802,8 @@ def get_chains_cached(
                 for exp_date in data["Chains"][right]:
                     data["Chains"][right][exp_date] = list(data["Chains"][right][exp_date])
 
+            # Move the chain to the contract table so later dates are served from there.
+            contract_table.add_snapshot(file_date, data["Chains"], info=data)
             return data
 
     # 5) No suitable file => must fetch from Polygon
@@ -833,13 +847,11 @@ def get_chains_cached(
         option_contracts["Exchange"] = exg
         option_contracts["Chains"][right][exp_date].append(strike)
 
-    # 8) Save to a new file for future reuse
-    cache_file = chain_folder / f"{asset.symbol}_{current_date.isoformat()}.parquet"
-    df_to_cache = pd.DataFrame({"data": [option_contracts]})
-    df_to_cache.to_parquet(cache_file, compression='snappy', engine='pyarrow')
+    # 8) Merge the chain into the contract table for future reuse
+    contract_table.add_snapshot(current_date, option_contracts["Chains"], info=option_contracts)
     logger.debug(
         f"Download complete for {asset.symbol} on {current_date}. "
-        f"Saved chain file to {cache_file}"
+        f"Saved chain snapshot to {contract_table.path}"
     )
 
     return option_contracts
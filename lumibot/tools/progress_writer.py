@@ -0,0 +1,144 @@
+"""
+Background writer for the backtest progress file.
+
+When ``log_backtest_progress_to_file`` is enabled, the backtest writes a one-row CSV (``logs/progress.csv``) that
+other processes poll to display the progress of a run. Writing it used to happen on the simulation thread: every
+two seconds the data source serialized the positions and orders to JSON, asked the ThetaData helper for its download
+status, reopened the file and rewrote it.
+
+``ProgressFileWriter`` moves that work to a daemon thread. The simulation thread only hands over a callable that
+builds the row. If a newer row arrives before the previous one was written, the older row is dropped, since only the
+latest progress matters. The file stays open for the whole backtest and is rewritten in place: seek to the start,
+write, truncate, flush. Pending rows are written when the interpreter exits.
+"""
+
+import atexit
+import csv
+import io
+import os
+import threading
+import weakref
+
+from .lumibot_logger import get_logger
+
+logger = get_logger(__name__)
+
+PROGRESS_CSV_HEADER = [
+    "timestamp",
+    "percent",
+    "elapsed",
+    "eta",
+    "portfolio_value",
+    "simulation_date",
+    "cash",
+    "total_return_pct",
+    "positions_json",
+    "orders_json",
+    "download_status",
+]
+
+_open_writers = weakref.WeakSet()
+
+
+class ProgressFileWriter:
+    """Keeps the progress CSV open and rewrites its single row, either right away or from a background thread.
+
+    Parameters
+    ----------
+    path : str
+        The CSV file to write. Its directory is created if needed.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._handle = None
+        self._io_lock = threading.Lock()
+        self._state_lock = threading.Condition()
+        self._pending = None
+        self._busy = False
+        self._closed = False
+        self._thread = None
+        _open_writers.add(self)
+
+    def write(self, row):
+        """Write ``row`` under the header, replacing the previous content of the file."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(PROGRESS_CSV_HEADER)
+        writer.writerow(row)
+        with self._io_lock:
+            if self._handle is None:
+                dir_path = os.path.dirname(self.path)
+                if dir_path:
+                    os.makedirs(dir_path, exist_ok=True)
+                self._handle = open(self.path, "w", newline="")
+            self._handle.seek(0)
+            self._handle.write(buffer.getvalue())
+            self._handle.truncate()
+            self._handle.flush()
+
+    def submit(self, build_row):
+        """Write the row returned by ``build_row`` from the background thread.
+
+        Parameters
+        ----------
+        build_row : callable
+            Called without arguments on the writer thread; returns the list of values for the row. Replaces any
+            row that has not been written yet.
+        """
+        with self._state_lock:
+            if self._closed:
+                return
+            self._pending = build_row
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="backtest-progress-writer", daemon=True)
+                self._thread.start()
+            self._state_lock.notify_all()
+
+    def _run(self):
+        while True:
+            with self._state_lock:
+                while self._pending is None and not self._closed:
+                    self._state_lock.wait()
+                build_row, self._pending = self._pending, None
+                if build_row is None:
+                    return
+                self._busy = True
+            try:
+                self.write(build_row())
+            except Exception as exc:
+                logger.debug(f"Could not write backtest progress to {self.path}: {exc}")
+            finally:
+                with self._state_lock:
+                    self._busy = False
+                    self._state_lock.notify_all()
+
+    def flush(self, timeout=5.0):
+        """Wait until the pending row, if any, has been written. Returns False on timeout."""
+        with self._state_lock:
+            if self._thread is None:
+                return True
+            return self._state_lock.wait_for(lambda: self._pending is None and not self._busy, timeout)
+
+    def close(self):
+        """Write the pending row, stop the thread and close the file."""
+        self.flush()
+        with self._state_lock:
+            self._closed = True
+            self._state_lock.notify_all()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5.0)
+        with self._io_lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
+
+@atexit.register
+def _close_open_writers():
+    for writer in list(_open_writers):
+        try:
+            writer.close()
+        except Exception:
+            pass
@@ -0,0 +1,157 @@
+"""
+Performance metrics kept up to date as the strategy records portfolio values.
+
+``stats_summary`` and the functions it calls (``cagr``, ``volatility``, ``sharpe``, ``max_drawdown``, ``romad`` and
+``total_return`` in ``lumibot.tools.indicators``) rebuild a DataFrame of every return each time they run.
+``RunningPerformanceMetrics`` gets the same numbers from a few running values instead. It keeps the compounded
+return, the Welford mean and variance of the returns, and the running peak and deepest drawdown. Each new row costs
+O(1), and so does reading the current metrics.
+
+The batch functions remain the reference implementation. The accumulator follows the same conventions:
+- returns are the percent change of the portfolio value from the previous row;
+- only the first row of each timestamp is counted, as ``day_deduplicate`` does;
+- periods are measured in whole days divided by 365.25.
+"""
+
+import math
+from datetime import datetime
+
+import pandas as pd
+import pytz
+
+
+class RunningPerformanceMetrics:
+    """Online accumulator for CAGR, volatility, Sharpe, max drawdown, RoMaD and total return.
+
+    Feed it one ``update`` per stats row, in chronological order. If rows arrive out of order, or a portfolio value
+    is missing or not finite, the accumulator can no longer match the batch functions; ``is_valid`` then turns False
+    and callers should fall back to ``stats_summary``.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Forget every row."""
+        self.is_valid = True
+        self.rows = 0
+        self._first_dt = None
+        self._last_dt = None
+        self._last_value = None
+        # Welford running mean and sum of squared deviations of the returns
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._cum_return = 1.0
+        self._peak = None
+        self._max_drawdown = None
+        self._max_drawdown_dt = None
+
+    def update(self, dt, portfolio_value):
+        """Record the portfolio value of a stats row.
+
+        Parameters
+        ----------
+        dt : datetime
+            The time of the row.
+        portfolio_value : float
+            The portfolio value at ``dt``.
+        """
+        if not self.is_valid:
+            return
+        try:
+            value = float(portfolio_value)
+        except (TypeError, ValueError):
+            value = math.nan
+        if dt is None or not math.isfinite(value) or (self._last_dt is not None and dt < self._last_dt):
+            self.is_valid = False
+            return
+
+        previous_value = self._last_value
+        new_timestamp = self._last_dt is None or dt != self._last_dt
+        self._last_value = value
+        if not new_timestamp:
+            # A later row with the same timestamp only sets the base of the next return.
+            return
+
+        self.rows += 1
+        if self._first_dt is None:
+            self._first_dt = dt
+        self._last_dt = dt
+        if previous_value is None:
+            return
+        if previous_value == 0:
+            self.is_valid = False
+            return
+
+        ret = value / previous_value - 1
+        self._count += 1
+        delta = ret - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (ret - self._mean)
+
+        self._cum_return *= 1 + ret
+        if self._peak is None or self._cum_return > self._peak:
+            self._peak = self._cum_return
+        drawdown = (self._peak - self._cum_return) / self._peak
+        if self._max_drawdown is None or drawdown > self._max_drawdown:
+            self._max_drawdown = drawdown
+            self._max_drawdown_dt = dt
+
+    # ----- metrics -----
+
+    def _period_years(self):
+        if self._first_dt is None:
+            return 0
+        start = datetime.fromtimestamp(pd.Timestamp(self._first_dt).value / 1e9, pytz.UTC)
+        end = datetime.fromtimestamp(pd.Timestamp(self._last_dt).value / 1e9, pytz.UTC)
+        return (end - start).days / 365.25
+
+    @property
+    def total_return(self):
+        return self._cum_return - 1
+
+    @property
+    def cagr(self):
+        period_years = self._period_years()
+        if period_years == 0:
+            return 0
+        return self._cum_return ** (1 / period_years) - 1
+
+    @property
+    def volatility(self):
+        period_years = self._period_years()
+        if period_years == 0:
+            return 0
+        std = math.sqrt(self._m2 / (self._count - 1)) if self._count > 1 else math.nan
+        return std * math.sqrt(self._count / period_years)
+
+    def sharpe(self, risk_free_rate):
+        vol = self.volatility
+        if vol == 0:
+            return 0
+        return (self.cagr - risk_free_rate) / vol
+
+    @property
+    def max_drawdown(self):
+        if self.rows <= 1 or self._max_drawdown is None:
+            return {"drawdown": 0, "date": self._first_dt}
+        return {"drawdown": self._max_drawdown, "date": self._max_drawdown_dt}
+
+    @property
+    def romad(self):
+        mdd = self.max_drawdown["drawdown"]
+        if mdd == 0:
+            return 0
+        return self.cagr / mdd
+
+    def summary(self, risk_free_rate):
+        """Return the metrics in the layout of ``stats_summary``."""
+        return {
+            "cagr": self.cagr,
+            "volatility": self.volatility,
+            "sharpe": self.sharpe(risk_free_rate),
+            "max_drawdown": self.max_drawdown,
+            "romad": self.romad,
+            "total_return": self.total_return,
+        }
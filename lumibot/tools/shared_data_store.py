@@ -0,0 +1,200 @@
+"""
+Memory-mapped Arrow IPC store that lets many backtest processes share one copy of their price data.
+
+Each ``Data`` object is written once to an uncompressed Arrow IPC file. Worker processes then attach to those files
+read-only: numeric columns are memory-mapped and handed to ``Data``/``Dataline`` as zero-copy numpy views, so the
+operating system page cache holds a single copy of the prices no matter how many workers run. Put the store on a
+tmpfs such as ``/dev/shm`` to get a pure shared-memory segment instead of a disk-backed one.
+
+Typical use
+-----------
+>>> store = SharedDataStore("/dev/shm/lumibot/spy_2024")
+>>> store.publish(pandas_data, datetime_start=backtesting_start, datetime_end=backtesting_end)  # once
+>>> # ... in every worker process
+>>> MyStrategy.backtest(PandasDataBacktesting, backtesting_start, backtesting_end,
+...                     pandas_data=SharedDataStore("/dev/shm/lumibot/spy_2024"))
+
+When ``datetime_start``/``datetime_end`` are given, ``publish`` runs the same calendar repair and forward-fill that
+``PandasData.load_data`` performs, so workers backtesting the same window skip that step and never copy the columns.
+Workers using a different window still work; their ``Data`` objects fall back to a private repaired copy.
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import re
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from lumibot.constants import LUMIBOT_DEFAULT_PYTZ
+from lumibot.entities import Asset, Data
+from lumibot.tools.lumibot_logger import get_logger
+
+logger = get_logger(__name__)
+
+FILE_SUFFIX = ".arrow"
+METADATA_KEY = b"lumibot.data"
+INDEX_COLUMN = "__datetime_ns__"
+FORMAT_VERSION = 1
+
+
+class SharedDataStore:
+    """A directory of memory-mapped ``Data`` frames shared between processes.
+
+    Parameters
+    ----------
+    path : str
+        Directory holding one ``.arrow`` file per ``Data`` object. Created on ``publish`` if missing.
+    """
+
+    def __init__(self, path):
+        self.path = str(path)
+
+    def __repr__(self):
+        return f"SharedDataStore({self.path!r})"
+
+    def publish(self, pandas_data, datetime_start=None, datetime_end=None):
+        """Write ``Data`` objects to the store.
+
+        Parameters
+        ----------
+        pandas_data : list or dict of Data
+            The data to share, in any form accepted by ``PandasData(pandas_data=...)``.
+        datetime_start, datetime_end : datetime.datetime, optional
+            Backtest window the workers will use. When both are given the frames are repaired against the trading
+            calendar for that window before being written, so attached workers can use them without copying.
+
+        Returns
+        -------
+        list of str
+            Paths of the files written.
+        """
+        datas = list(pandas_data.values()) if isinstance(pandas_data, dict) else list(pandas_data)
+        repaired = datetime_start is not None and datetime_end is not None
+        if repaired:
+            # Imported here: the data source package imports this module.
+            from lumibot.data_sources import PandasData
+
+            source = PandasData(datetime_start=datetime_start, datetime_end=datetime_end, pandas_data=datas)
+            source.load_data()
+            datas = list(source._data_store.values())
+
+        os.makedirs(self.path, exist_ok=True)
+        return [self._write(data, repaired) for data in datas]
+
+    def attach(self):
+        """Map every file in the store and return read-only ``Data`` objects.
+
+        Returns
+        -------
+        list of Data
+        """
+        if not os.path.isdir(self.path):
+            raise FileNotFoundError(f"Shared data store {self.path} does not exist; call publish() first.")
+        names = sorted(name for name in os.listdir(self.path) if name.endswith(FILE_SUFFIX))
+        return [_read(os.path.join(self.path, name)) for name in names]
+
+    def _write(self, data, repaired):
+        df = data.df
+        index = pd.DatetimeIndex(df.index)
+        metadata = {
+            "version": FORMAT_VERSION,
+            "asset": data.asset.to_dict(),
+            "quote": data.quote.to_dict() if data.quote is not None else None,
+            "timestep": data.timestep,
+            "timezone": str(index.tz) if index.tz is not None else None,
+            "trading_hours_start": data.trading_hours_start.isoformat(),
+            "trading_hours_end": data.trading_hours_end.isoformat(),
+            "date_start": _isoformat(getattr(data, "date_start", None)),
+            "date_end": _isoformat(getattr(data, "date_end", None)),
+            "repaired": bool(repaired and data._index_ns is not None),
+        }
+
+        names = [INDEX_COLUMN]
+        arrays = [pa.array(np.ascontiguousarray(index.asi8), type=pa.int64())]
+        for column in df.columns:
+            names.append(str(column))
+            arrays.append(_to_arrow(df[column]))
+        batch = pa.RecordBatch.from_arrays(arrays, names=names)
+        schema = batch.schema.with_metadata({METADATA_KEY: json.dumps(metadata).encode()})
+
+        file_path = os.path.join(self.path, _file_name(data))
+        tmp_path = f"{file_path}.{os.getpid()}.tmp"
+        with pa.OSFile(tmp_path, "wb") as sink:
+            with pa.ipc.new_file(sink, schema) as writer:
+                writer.write_batch(batch)
+        # Atomic rename so workers attaching concurrently never see a partial file.
+        os.replace(tmp_path, file_path)
+        return file_path
+
+
+def _to_arrow(series):
+    values = series.to_numpy()
+    if values.dtype.kind in "fiu":
+        # Keep NaN as a value (no validity bitmap) so the column maps back as a zero-copy numpy view.
+        return pa.array(np.ascontiguousarray(values), from_pandas=False)
+    return pa.array(series, from_pandas=True)
+
+
+def _read(file_path):
+    source = pa.memory_map(file_path, "r")
+    table = pa.ipc.open_file(source).read_all()
+    metadata = json.loads(table.schema.metadata[METADATA_KEY])
+
+    index_ns = table.column(INDEX_COLUMN).chunk(0).to_numpy(zero_copy_only=True)
+    index = pd.DatetimeIndex(index_ns.view("datetime64[ns]")).tz_localize("UTC")
+    index = index.tz_convert(metadata["timezone"] or LUMIBOT_DEFAULT_PYTZ)
+    index.name = "datetime"
+
+    columns = {}
+    for name in table.column_names:
+        if name == INDEX_COLUMN:
+            continue
+        column = table.column(name)
+        zero_copy = (
+            column.num_chunks == 1
+            and column.null_count == 0
+            and (pa.types.is_floating(column.type) or pa.types.is_integer(column.type))
+        )
+        if zero_copy:
+            columns[name] = column.chunk(0).to_numpy(zero_copy_only=True)
+        else:
+            columns[name] = column.to_pandas().array
+    df = pd.DataFrame(columns, index=index, copy=False)
+
+    data = Data._from_shared_frame(
+        Asset.from_dict(metadata["asset"]),
+        df,
+        metadata["timestep"],
+        quote=Asset.from_dict(metadata["quote"]) if metadata["quote"] else None,
+        trading_hours_start=datetime.time.fromisoformat(metadata["trading_hours_start"]),
+        trading_hours_end=datetime.time.fromisoformat(metadata["trading_hours_end"]),
+        date_start=_parse_datetime(metadata["date_start"]),
+        date_end=_parse_datetime(metadata["date_end"]),
+        repaired=metadata["repaired"],
+    )
+    # Keep the mapping alive for as long as the Data object references its columns.
+    data._shared_source = table
+    return data
+
+
+def _file_name(data):
+    key = json.dumps(
+        [data.asset.to_dict(), data.quote.to_dict() if data.quote is not None else None, data.timestep],
+        sort_keys=True,
+        default=str,
+    )
+    digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+    symbol = re.sub(r"[^A-Za-z0-9_.-]", "_", data.asset.symbol)
+    return f"{symbol}-{data.timestep}-{digest}{FILE_SUFFIX}"
+
+
+def _isoformat(value):
+    return value.isoformat() if value is not None else None
+
+
+def _parse_datetime(value):
+    return pd.Timestamp(value).to_pydatetime() if value else None
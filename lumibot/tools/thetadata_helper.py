@@ -26,7 +26,9 @@ from tqdm import tqdm
 from lumibot import LUMIBOT_CACHE_FOLDER, LUMIBOT_DEFAULT_PYTZ
 from lumibot.entities import Asset
 from lumibot.tools.backtest_cache import CacheMode, get_backtest_cache
+from lumibot.tools.backtest_profiler import profiled
 from lumibot.tools.lumibot_logger import get_logger
+from lumibot.tools.option_chain_store import OptionContractTable
 
 logger = get_logger(__name__)
 
@@ -479,7 +481,12 @@ def _extract_timestamp_series(
     date_col = _detect_column(df, ("date",))
     ms_col = _detect_column(df, ("ms_of_day", "msOfDay", "ms_of_day2"))
     if date_col and ms_col:
-        date_series = pd.to_datetime(df[date_col].astype(str), format="%Y%m%d", errors="coerce")
+        # Intraday payloads repeat each date on hundreds of rows: parse the distinct dates only.
+        date_codes, unique_dates = pd.factorize(df[date_col], use_na_sentinel=True)
+        parsed_dates = pd.to_datetime(pd.Index(unique_dates).astype(str), format="%Y%m%d", errors="coerce")
+        date_series = pd.Series(
+            parsed_dates.take(date_codes, allow_fill=True, fill_value=pd.NaT), index=df.index
+        )
         ms_series = pd.to_timedelta(pd.to_numeric(df[ms_col], errors="coerce").fillna(0), unit="ms")
         ts_series = date_series + ms_series
         if getattr(ts_series.dt, "tz", None) is None:
@@ -1361,16 +1368,7 @@ def _apply_corporate_actions_to_frame(
         )
         return frame
 
-    tz_index = frame.index
-    if isinstance(tz_index, pd.DatetimeIndex):
-        index_dates = tz_index
-    else:
-        index_dates = pd.to_datetime(tz_index, errors="coerce")
-    if getattr(index_dates, "tz", None) is None:
-        index_dates = index_dates.tz_localize("UTC")
-    else:
-        index_dates = index_dates.tz_convert("UTC")
-    index_dates = index_dates.date
+    index_days = _frame_utc_days(frame)
 
     if asset_type == "option":
         # Options use split-normalized strikes in strategy code (e.g., GOOG strike 130 post-split).
@@ -1380,10 +1378,7 @@ def _apply_corporate_actions_to_frame(
         #    post-split terms (matching split-adjusted underlying prices).
         #
         # This prevents false stop-loss triggers and portfolio cliffs on split dates.
-        if "dividend" not in frame.columns:
-            frame["dividend"] = 0.0
-        else:
-            frame["dividend"] = 0.0
+        frame["dividend"] = 0.0
 
         if "stock_splits" not in frame.columns:
             frame["stock_splits"] = 0.0
@@ -1402,19 +1397,8 @@ def _apply_corporate_actions_to_frame(
             frame["_split_adjusted"] = True
             return frame
 
-        split_map = splits.groupby(splits["event_date"].dt.date)["ratio"].prod().to_dict()
-        frame["stock_splits"] = [float(split_map.get(day, 0.0)) for day in index_dates]
-
-        sorted_splits = splits.sort_values("event_date")
-        applicable_splits = sorted_splits[sorted_splits["event_date"].dt.date <= today]
-        split_dates = applicable_splits["event_date"].dt.date.tolist()
-        split_ratios = applicable_splits["ratio"].tolist()
-
-        cumulative_factor = pd.Series(1.0, index=frame.index)
-        for split_date, ratio in zip(reversed(split_dates), reversed(split_ratios)):
-            if ratio > 0 and ratio != 1.0:
-                mask = pd.Series(index_dates) < split_date
-                cumulative_factor.loc[mask.values] *= ratio
+        frame["stock_splits"] = _daily_event_values(index_days, splits, "ratio", "prod")
+        cumulative_factor = _split_factors(index_days, splits, today)
 
         price_columns = ["open", "high", "low", "close", "bid", "ask", "mid_price"]
         available_price_cols = [col for col in price_columns if col in frame.columns]
@@ -1438,75 +1422,35 @@ def _apply_corporate_actions_to_frame(
     from datetime import date as date_type
     today = date_type.today()
     splits = _get_theta_splits(asset, start_day, today, username, password)
-    if "dividend" not in frame.columns:
-        frame["dividend"] = 0.0
     if not dividends.empty:
-        dividend_map = dividends.groupby(dividends["event_date"].dt.date)["cash_amount"].sum().to_dict()
-        frame["dividend"] = [float(dividend_map.get(day, 0.0)) for day in index_dates]
+        frame["dividend"] = _daily_event_values(index_days, dividends, "cash_amount", "sum")
     else:
         frame["dividend"] = 0.0
 
-    if "stock_splits" not in frame.columns:
-        frame["stock_splits"] = 0.0
     if not splits.empty:
-        split_map = splits.groupby(splits["event_date"].dt.date)["ratio"].prod().to_dict()
-        frame["stock_splits"] = [float(split_map.get(day, 0.0)) for day in index_dates]
+        frame["stock_splits"] = _daily_event_values(index_days, splits, "ratio", "prod")
 
         # Apply split adjustments to OHLC prices for backtesting accuracy.
         # For a 3-for-1 split (ratio=3.0), prices BEFORE the split should be divided by 3.
         # This makes historical prices comparable to current prices.
-        # IMPORTANT: Only apply splits that have actually occurred (split_date <= data_end_date)
-        # Don't adjust for future splits that haven't happened yet.
+        # IMPORTANT: Apply ALL splits up to TODAY's date, not the data's end date.
+        # When we fetch March 2020 data in 2025, we need to apply the July 2022 split
+        # so that historical prices are comparable to current split-adjusted prices.
+        # This matches how Yahoo Finance calculates Adj Close - it always reflects
+        # the current share count, not what the shares were worth at that time.
         price_columns = ["open", "high", "low", "close"]
         available_price_cols = [col for col in price_columns if col in frame.columns]
 
         if available_price_cols:
-            # Sort splits by date (oldest first)
-            sorted_splits = splits.sort_values("event_date")
-
-            # IMPORTANT: Apply ALL splits up to TODAY's date, not the data's end date.
-            # When we fetch March 2020 data in 2025, we need to apply the July 2022 split
-            # so that historical prices are comparable to current split-adjusted prices.
-            # This matches how Yahoo Finance calculates Adj Close - it always reflects
-            # the current share count, not what the shares were worth at that time.
-            applicable_splits = sorted_splits[sorted_splits["event_date"].dt.date <= today]
-
-            if len(applicable_splits) < len(sorted_splits):
-                skipped = len(sorted_splits) - len(applicable_splits)
+            cumulative_factor = _split_factors(index_days, splits, today)
+            for col in available_price_cols:
+                frame[col] = frame[col] / cumulative_factor
+            if len(cumulative_factor) and cumulative_factor.max() > 1.1:  # More than 10% adjustment
                 logger.debug(
-                    "[THETA][SPLIT_ADJUST] Skipping %d future split(s) after today=%s",
-                    skipped,
-                    today,
+                    "[THETA][SPLIT_ADJUST] asset=%s max_factor=%.2f splits=%d",
+                    asset.symbol, cumulative_factor.max(), len(splits)
                 )
 
-            # Calculate cumulative split factor for each date in the frame
-            # We need to work from most recent to oldest, accumulating the factor
-            split_dates = applicable_splits["event_date"].dt.date.tolist()
-            split_ratios = applicable_splits["ratio"].tolist()
-
-            # Create a cumulative adjustment factor series
-            # For each date in the frame, calculate how much to divide prices by
-            cumulative_factor = pd.Series(1.0, index=frame.index)
-
-            # Work backwards through splits
-            for split_date, ratio in zip(reversed(split_dates), reversed(split_ratios)):
-                if ratio > 0 and ratio != 1.0:
-                    # All dates BEFORE the split date need to be divided by this ratio
-                    mask = pd.Series(index_dates) < split_date
-                    cumulative_factor.loc[mask.values] *= ratio
-
-            # Apply the adjustment to price columns
-            for col in available_price_cols:
-                if col in frame.columns:
-                    frame[col] = frame[col] / cumulative_factor
-                    # Log significant adjustments for debugging
-                    max_adjustment = cumulative_factor.max()
-                    if max_adjustment > 1.1:  # More than 10% adjustment
-                        logger.debug(
-                            "[THETA][SPLIT_ADJUST] asset=%s col=%s max_factor=%.2f splits=%d",
-                            asset.symbol, col, max_adjustment, len(splits)
-                        )
-
             # Also adjust volume (multiply instead of divide for splits)
             if "volume" in frame.columns:
                 frame["volume"] = frame["volume"] * cumulative_factor
@@ -1515,12 +1459,7 @@ def _apply_corporate_actions_to_frame(
             # ThetaData returns unadjusted dividend amounts, so a $1.22 dividend
             # from 2015 that occurred before several splits needs to be divided
             # by the cumulative split factor to get the per-share amount in today's terms.
-            if "dividend" in frame.columns:
-                frame["dividend"] = frame["dividend"] / cumulative_factor
-                logger.debug(
-                    "[THETA][SPLIT_ADJUST] Adjusted dividends for %s by cumulative split factor",
-                    asset.symbol
-                )
+            frame["dividend"] = frame["dividend"] / cumulative_factor
     else:
         frame["stock_splits"] = 0.0
 
@@ -1530,6 +1469,44 @@ def _apply_corporate_actions_to_frame(
     return frame
 
 
+def _frame_utc_days(frame: pd.DataFrame) -> np.ndarray:
+    """The UTC calendar day of each row of ``frame`` (naive timestamps are taken as UTC), as datetime64[D]."""
+    index = frame.index if isinstance(frame.index, pd.DatetimeIndex) else pd.to_datetime(frame.index, errors="coerce")
+    index = index.tz_localize("UTC") if index.tz is None else index.tz_convert("UTC")
+    return index.tz_localize(None).to_numpy().astype("datetime64[D]")
+
+
+def _event_days(events: pd.DataFrame) -> np.ndarray:
+    return np.array(list(pd.to_datetime(events["event_date"]).dt.date), dtype="datetime64[D]")
+
+
+def _daily_event_values(days: np.ndarray, events: pd.DataFrame, value_column: str, aggregate: str) -> np.ndarray:
+    """Per row, the ``aggregate`` ("sum" or "prod") of the event values dated on the row's day, 0.0 if none."""
+    values = pd.Series(events[value_column].to_numpy(dtype=float), index=_event_days(events))
+    per_day = values.groupby(level=0).agg(aggregate)
+    return per_day.reindex(days, fill_value=0.0).to_numpy(dtype=float)
+
+
+def _split_factors(days: np.ndarray, splits: pd.DataFrame, today: date) -> np.ndarray:
+    """Per row, the product of the ratios of the splits after the row's day (up to ``today``): the number
+    to divide prices by to put them in today's share terms."""
+    ordered = splits.sort_values("event_date", kind="stable")
+    split_days = _event_days(ordered)
+    applicable = split_days <= np.datetime64(today, "D")
+    if not applicable.all():
+        logger.debug("[THETA][SPLIT_ADJUST] Skipping %d future split(s) after today=%s", (~applicable).sum(), today)
+    split_days = split_days[applicable]
+    ratios = ordered["ratio"].to_numpy(dtype=float)[applicable]
+    ratios = np.where((ratios > 0) & (ratios != 1.0), ratios, 1.0)
+
+    # factors[i] is the product of the ratios of splits i and later, multiplied latest first like the
+    # original per-split loop so the floats are identical.
+    factors = np.ones(len(ratios) + 1)
+    for i in range(len(ratios) - 1, -1, -1):
+        factors[i] = factors[i + 1] * ratios[i]
+    return factors[np.searchsorted(split_days, days, side="right")]
+
+
 def ensure_missing_column(df: Optional[pd.DataFrame]) -> Optional[pd.DataFrame]:
     """Ensure the dataframe includes a `missing` flag column (True for placeholders)."""
     if df is None or len(df) == 0:
@@ -1581,6 +1558,15 @@ def _market_close_utc_for_date(trading_date: date) -> datetime:
     return close_local.astimezone(pytz.UTC)
 
 
+def _market_close_utc_index(trading_dates, name=None) -> pd.DatetimeIndex:
+    """Vectorized `_market_close_utc_for_date` over many trading dates (dates or midnight timestamps)."""
+    days = pd.DatetimeIndex(trading_dates)
+    if days.tz is not None:
+        days = days.tz_localize(None)
+    close_local = (days.normalize() + pd.Timedelta(hours=16)).tz_localize(LUMIBOT_DEFAULT_PYTZ)
+    return close_local.tz_convert(pytz.UTC).rename(name)
+
+
 def _align_day_index_to_market_close_utc(frame: Optional[pd.DataFrame]) -> Optional[pd.DataFrame]:
     """Normalize a day-cadence ThetaData frame to market-close timestamps in UTC.
 
@@ -1595,10 +1581,7 @@ def _align_day_index_to_market_close_utc(frame: Optional[pd.DataFrame]) -> Optio
         frame.index = pd.to_datetime(frame.index, utc=True)
 
     idx_utc = pd.to_datetime(frame.index, utc=True)
-    new_index = pd.DatetimeIndex(
-        [_market_close_utc_for_date(d) for d in idx_utc.date],
-        name=frame.index.name,
-    )
+    new_index = _market_close_utc_index(idx_utc.tz_localize(None).normalize(), name=frame.index.name)
 
     if frame.index.equals(new_index):
         return frame
@@ -2924,6 +2907,7 @@ def get_missing_dates(df_all, asset, start, end):
     return missing_dates
 
 
+@profiled("cache_load")
 def load_cache(cache_file):
     """Load the data from the cache file and return a DataFrame with a DateTimeIndex"""
     # DEBUG-LOG: Start loading cache
@@ -4909,13 +4893,14 @@ def get_chains_cached(
     chain_constraints: Optional[Dict[str, Any]] = None,
 ) -> dict:
     """
-    Retrieve option chain with caching (MATCHES POLYGON PATTERN).
+    Retrieve option chain with caching.
 
-    This function follows the EXACT same caching strategy as Polygon:
-    1. Check cache: LUMIBOT_CACHE_FOLDER/thetadata/<asset-type>/option_chains/{symbol}_{date}.parquet
-    2. Reuse files within RECENT_FILE_TOLERANCE_DAYS (default 7 days)
-    3. If not found, fetch from ThetaData and save to cache
-    4. Use pyarrow engine with snappy compression
+    Chains are cached in one contract master table per underlying (see ``OptionContractTable``):
+    LUMIBOT_CACHE_FOLDER/thetadata/<asset-type>/option_chains/{symbol}.contracts.parquet
+    1. Use the latest snapshot of the table taken within THETADATA_CHAIN_RECENT_FILE_TOLERANCE_DAYS
+       (default 7 days, any age for indexes) that covers the requested expirations
+    2. Otherwise reuse a recent per-date file of the older cache layout, and merge it into the table
+    3. Otherwise fetch from ThetaData and merge the chain into the table
 
     Parameters
     ----------
@@ -4947,11 +4932,11 @@ def get_chains_cached(
     chain_folder.mkdir(parents=True, exist_ok=True)
 
     constraints = chain_constraints or {}
-    hint_present = any(
-        constraints.get(key) is not None for key in ("min_expiration_date", "max_expiration_date")
-    )
+    min_hint_date = constraints.get("min_expiration_date")
+    max_hint_date = constraints.get("max_expiration_date")
+    hint_present = min_hint_date is not None or max_hint_date is not None
 
-    # 3) Check for recent cached file (within RECENT_FILE_TOLERANCE_DAYS) unless hints require fresh data
+    # 3) Check for a recent snapshot (within RECENT_FILE_TOLERANCE_DAYS) covering the hinted expirations
     recent_days_default = 7
     try:
         recent_days_default = int(os.environ.get("THETADATA_CHAIN_RECENT_FILE_TOLERANCE_DAYS", "7"))
@@ -4961,6 +4946,28 @@ def get_chains_cached(
     asset_type = str(getattr(asset, "asset_type", "") or "").lower()
     is_index = asset_type == "index"
 
+    # For indexes, allow reusing older snapshots as long as they still contain future expirations
+    # covering `current_date`. Index underlyings don't have splits, and Theta's expirations payload
+    # is not truly point-in-time anyway, so aggressively reusing valid chains can reduce year-long
+    # backtests from dozens of chain rebuilds to just a handful.
+    #
+    # For equities, stick to the tighter "recent days" window to minimize any chance of subtle
+    # strike normalization drift around corporate actions.
+    contract_table = OptionContractTable.load(
+        chain_folder / f"{asset.symbol}.contracts.parquet", version=THETADATA_CHAIN_CACHE_VERSION
+    )
+    snapshot = contract_table.find_snapshot(
+        current_date,
+        max_age_days=None if is_index else recent_days_default,
+        min_expiration=min_hint_date,
+        max_expiration=max_hint_date,
+    )
+    if snapshot is not None:
+        data = contract_table.chain(current_date, snapshot, min_hint_date, max_hint_date)
+        if any(data["Chains"].values()):
+            logger.debug(f"Reusing chain snapshot {snapshot} of {contract_table.path}")
+            return data
+
     if not hint_present:
         pattern = f"{asset.symbol}_*.parquet"
         potential_files = sorted(chain_folder.glob(pattern), reverse=True)
@@ -4982,14 +4989,6 @@ def get_chains_cached(
             if file_date > current_date:
                 continue
 
-            # For indexes, allow reusing older chain files as long as the cached chain still
-            # contains future expirations covering `current_date`. Index underlyings don't
-            # have splits, and Theta's expirations payload is not truly point-in-time anyway,
-            # so aggressively reusing valid chain files can reduce year-long backtests from
-            # dozens of chain rebuilds to just a handful.
-            #
-            # For equities, stick to the tighter "recent days" window to minimize any chance
-            # of subtle strike normalization drift around corporate actions.
             if not is_index:
                 earliest_okay_date = current_date - timedelta(days=recent_days_default)
                 if file_date < earliest_okay_date:
@@ -5028,11 +5027,13 @@ def get_chains_cached(
                 for exp_date in data["Chains"][right]:
                     data["Chains"][right][exp_date] = list(data["Chains"][right][exp_date])
 
+            # Move the chain to the contract table so later dates are served from there.
+            contract_table.add_snapshot(file_date, data["Chains"], info=data)
             return data
 
-    # 4) No suitable file => fetch from ThetaData using exp=0 chain builder
+    # 4) No suitable snapshot => fetch from ThetaData using exp=0 chain builder
     logger.debug(
-        f"No suitable cache file found for {asset.symbol} on {current_date}; building historical chain."
+        f"No suitable cached chain found for {asset.symbol} on {current_date}; building historical chain."
     )
     print(
         f"\nDownloading option chain for {asset} on {current_date}. This will be cached for future use."
@@ -5056,10 +5057,14 @@ def get_chains_cached(
             "Chains": {"CALL": {}, "PUT": {}},
         }
 
-    # 5) Save to cache file for future reuse
-    cache_file = chain_folder / f"{asset.symbol}_{current_date.isoformat()}.parquet"
-    df_to_cache = pd.DataFrame({"data": [chains_dict]})
-    df_to_cache.to_parquet(cache_file, compression='snappy', engine='pyarrow')
-    logger.debug(f"Saved chain cache: {cache_file}")
+    # 5) Merge the chain into the contract table for future reuse
+    contract_table.add_snapshot(
+        current_date,
+        chains_dict["Chains"],
+        info=chains_dict,
+        min_expiration=min_hint_date if hint_present else None,
+        max_expiration=max_hint_date if hint_present else None,
+    )
+    logger.debug(f"Saved chain snapshot {current_date} to {contract_table.path}")
 
     return chains_dict
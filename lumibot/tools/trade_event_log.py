@@ -0,0 +1,222 @@
+"""
+Append-only, columnar log of broker trade events.
+
+``Broker._process_trade_event`` used to build a one-row DataFrame per event and ``pd.concat`` it onto the full log,
+which copies the whole log on every fill. ``TradeEventLog`` instead appends each event to per-column Python lists and
+only builds a DataFrame when the log is read; the frame is cached until the next event arrives.
+
+Long live sessions can also stream events to disk as they happen (``stream_to``). CSV files are appended to in place;
+parquet files are written as one row group per flushed batch with a fixed schema.
+"""
+
+import csv
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from lumibot.tools.lumibot_logger import get_logger
+
+logger = get_logger(__name__)
+
+# Columns written to stream files, in order. The in-memory frame also keeps any other keys an event carries.
+TRADE_EVENT_COLUMNS = (
+    "time",
+    "strategy",
+    "exchange",
+    "identifier",
+    "symbol",
+    "side",
+    "type",
+    "status",
+    "price",
+    "filled_quantity",
+    "multiplier",
+    "trade_cost",
+    "time_in_force",
+    "asset.right",
+    "asset.strike",
+    "asset.multiplier",
+    "asset.expiration",
+    "asset.asset_type",
+    "price_source",
+)
+_NUMERIC_COLUMNS = {"price", "filled_quantity", "multiplier", "trade_cost", "asset.strike", "asset.multiplier"}
+
+
+def _is_missing(value):
+    if value is None:
+        return True
+    try:
+        return bool(pd.isna(value))
+    except (TypeError, ValueError):
+        return False
+
+
+def _to_utc(value):
+    ts = pd.Timestamp(value)
+    return ts.tz_convert("UTC") if ts.tzinfo is not None else ts.tz_localize("UTC")
+
+
+class TradeEventLog:
+    """Columnar append buffer for trade events.
+
+    Parameters
+    ----------
+    stream_path : str, optional
+        If given, events are also written to this ``.csv`` or ``.parquet`` file (see ``stream_to``).
+    flush_every : int
+        Number of buffered events that triggers a write to ``stream_path``.
+    """
+
+    def __init__(self, stream_path=None, flush_every=100):
+        self._lock = threading.Lock()
+        self._columns = {}
+        self._length = 0
+        self._frame = None
+        self._stream_path = None
+        self._stream_format = None
+        self._stream_pending = []
+        self._parquet_writer = None
+        self.flush_every = flush_every
+        if stream_path:
+            self.stream_to(stream_path)
+
+    def __len__(self):
+        return self._length
+
+    def append(self, row):
+        """Add one event (a ``dict`` of column name to value). ``None``/NaN values are stored as missing."""
+        with self._lock:
+            n = self._length
+            for key, value in row.items():
+                if _is_missing(value):
+                    continue
+                column = self._columns.get(key)
+                if column is None:
+                    # A column seen for the first time is missing for every earlier event.
+                    column = [np.nan] * n
+                    self._columns[key] = column
+                column.append(value)
+            self._length = n + 1
+            for column in self._columns.values():
+                if len(column) == n:
+                    column.append(np.nan)
+            self._frame = None
+
+            if self._stream_path is not None:
+                self._stream_pending.append(row)
+                if len(self._stream_pending) >= self.flush_every:
+                    self._flush_locked()
+
+    def to_dataframe(self):
+        """Return the log as a DataFrame (cached until the next ``append``)."""
+        with self._lock:
+            if self._frame is None:
+                if self._length == 0:
+                    self._frame = pd.DataFrame()
+                else:
+                    # Same shape the historical per-event ``pd.concat`` produced: every row keeps index 0.
+                    self._frame = pd.DataFrame(self._columns, index=np.zeros(self._length, dtype=np.int64))
+            return self._frame
+
+    def clear(self):
+        """Drop every buffered event (streamed files are left untouched)."""
+        with self._lock:
+            self._columns = {}
+            self._length = 0
+            self._frame = None
+
+    @classmethod
+    def from_dataframe(cls, df):
+        """Build a log pre-filled with the rows of ``df`` (``None`` gives an empty log)."""
+        log = cls()
+        if df is not None and len(df) > 0:
+            for row in df.to_dict(orient="records"):
+                log.append(row)
+        return log
+
+    def stream_to(self, path, flush_every=None):
+        """Also write every event to ``path`` as it is logged.
+
+        Parameters
+        ----------
+        path : str
+            Target file. A ``.parquet`` suffix writes parquet, anything else writes CSV. An existing CSV file is
+            appended to; an existing parquet file is replaced.
+        flush_every : int, optional
+            Override the number of buffered events per write.
+        """
+        with self._lock:
+            self._close_locked()
+            if flush_every is not None:
+                self.flush_every = flush_every
+            dir_path = os.path.dirname(path)
+            if dir_path:
+                os.makedirs(dir_path, exist_ok=True)
+            self._stream_path = path
+            self._stream_format = "parquet" if str(path).endswith(".parquet") else "csv"
+
+    def flush(self):
+        """Write buffered events to the stream file."""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self):
+        """Flush and close the stream file, if any."""
+        with self._lock:
+            self._close_locked()
+
+    def _flush_locked(self):
+        rows = self._stream_pending
+        if not rows or self._stream_path is None:
+            return
+        self._stream_pending = []
+        try:
+            if self._stream_format == "parquet":
+                self._write_parquet(rows)
+            else:
+                self._write_csv(rows)
+        except Exception as e:
+            logger.warning(f"Could not stream {len(rows)} trade events to {self._stream_path}: {e}")
+
+    def _close_locked(self):
+        self._flush_locked()
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+        self._stream_path = None
+
+    def _write_csv(self, rows):
+        write_header = not os.path.exists(self._stream_path) or os.path.getsize(self._stream_path) == 0
+        with open(self._stream_path, "a", newline="") as fh:
+            writer = csv.DictWriter(fh, fieldnames=TRADE_EVENT_COLUMNS, extrasaction="ignore")
+            if write_header:
+                writer.writeheader()
+            for row in rows:
+                writer.writerow({key: ("" if _is_missing(value) else value) for key, value in row.items()})
+
+    def _write_parquet(self, rows):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        # Fixed schema so every batch lands in the same file: numbers as float64, everything else as text.
+        arrays = []
+        fields = []
+        for name in TRADE_EVENT_COLUMNS:
+            values = [row.get(name) for row in rows]
+            if name == "time":
+                values = [None if _is_missing(v) else _to_utc(v) for v in values]
+                arrays.append(pa.array(values, type=pa.timestamp("us", tz="UTC")))
+                fields.append(pa.field(name, pa.timestamp("us", tz="UTC")))
+            elif name in _NUMERIC_COLUMNS:
+                arrays.append(pa.array([None if _is_missing(v) else float(v) for v in values], type=pa.float64()))
+                fields.append(pa.field(name, pa.float64()))
+            else:
+                arrays.append(pa.array([None if _is_missing(v) else str(v) for v in values], type=pa.string()))
+                fields.append(pa.field(name, pa.string()))
+        schema = pa.schema(fields)
+        if self._parquet_writer is None:
+            self._parquet_writer = pq.ParquetWriter(self._stream_path, schema)
+        self._parquet_writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
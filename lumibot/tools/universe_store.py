@@ -0,0 +1,237 @@
+"""
+Columnar (time x asset) view of a ``PandasData`` universe for cross-sectional reads.
+
+Every ``Data`` object keeps its own datalines and its own position in the backtest index, so pricing a universe of
+hundreds of assets means one lookup per asset for every iteration. ``UniverseStore`` lines those datalines up on the
+shared backtest index and keeps one 2D ``float64`` matrix per column (rows are bars, columns are assets). A whole
+cross-section is then a single row slice, and a history window for many assets a single block slice.
+
+The matrices are built on first use of each column and take ``8 * bars * assets`` bytes each, which is why the store
+is optional (``PandasData(columnar_store=True)``). Lookups the store cannot answer exactly like ``Data`` would (an
+asset whose data does not cover the current bar, a missing price) return ``None`` so the caller can fall back to the
+per-asset path.
+"""
+
+import numpy as np
+import pandas as pd
+
+from lumibot.constants import LUMIBOT_DEFAULT_PYTZ
+from lumibot.tools.helpers import parse_timestep_qty_and_unit
+from lumibot.tools.lumibot_logger import get_logger
+
+logger = get_logger(__name__)
+
+# The columns returned by Data.get_bars; price columns must be present for a bar to be kept.
+BAR_COLUMNS = ("open", "high", "low", "close", "volume", "dividend")
+PRICE_COLUMNS = ("open", "high", "low", "close")
+
+
+def _to_ns(dt):
+    """Nanoseconds since the epoch for a datetime (naive values are taken as default-timezone wall time)."""
+    ts = pd.Timestamp(dt)
+    if ts.tzinfo is None:
+        ts = ts.tz_localize(LUMIBOT_DEFAULT_PYTZ)
+    return ts.value
+
+
+class UniverseStore:
+    """Aligned per-column matrices for the ``Data`` objects of a ``PandasData`` data store.
+
+    Parameters
+    ----------
+    index : pandas.DatetimeIndex
+        The backtest index every ``Data`` object was repaired against (``PandasData._date_index``).
+    data_store : dict
+        Mapping of data store key to ``Data``, already repaired with ``repair_times_and_fill``. Data that is not a
+        contiguous run of ``index`` is left out and keeps using the per-asset path.
+    """
+
+    def __init__(self, index, data_store):
+        self.index = pd.DatetimeIndex(index)
+        self._index_ns = np.asarray(self.index.asi8, dtype=np.int64)
+        self._datas = []
+        self._columns = {}
+        rows = []
+        for key, data in data_store.items():
+            span = self._locate(data)
+            if span is None:
+                logger.debug(f"Columnar store skips {key}: its bars are not a run of the backtest index.")
+                continue
+            self._columns[key] = len(self._datas)
+            self._datas.append(data)
+            rows.append(span + (_to_ns(data.datetime_start), _to_ns(data.datetime_end)))
+
+        bounds = np.array(rows, dtype=np.int64).reshape(-1, 4)
+        self._first_row, self._stop_row, self._start_ns, self._end_ns = bounds.T
+        self._minute = np.array([data.timestep == "minute" for data in self._datas], dtype=bool)
+        self._matrices = {}
+
+    def _locate(self, data):
+        """The ``(first, stop)`` rows of ``data`` in the shared index, or ``None`` if it is not aligned with it."""
+        data_ns = data._index_ns
+        if data_ns is None or len(data_ns) == 0:
+            return None
+        first = int(self._index_ns.searchsorted(data_ns[0]))
+        stop = first + len(data_ns)
+        if stop > len(self._index_ns) or not np.array_equal(self._index_ns[first:stop], data_ns):
+            return None
+        return first, stop
+
+    def __contains__(self, key):
+        return key in self._columns
+
+    def __len__(self):
+        return len(self._datas)
+
+    def matrix(self, column):
+        """The ``(bars, assets)`` matrix of ``column``; rows outside an asset's data, or missing columns, are NaN."""
+        matrix = self._matrices.get(column)
+        if matrix is None:
+            matrix = np.full((len(self._index_ns), len(self._datas)), np.nan)
+            for position, data in enumerate(self._datas):
+                if column not in data.datalines:
+                    continue
+                values = data.datalines[column].dataline
+                if values.dtype.kind not in "fiub":
+                    values = pd.to_numeric(pd.Series(values), errors="coerce").to_numpy(dtype=float)
+                matrix[self._first_row[position]:self._stop_row[position], position] = values
+            self._matrices[column] = matrix
+        return matrix
+
+    def _row(self, dt):
+        """Position of the last bar at or before ``dt`` in the shared index, and whether ``dt`` is exactly on it."""
+        dt_ns = _to_ns(dt)
+        row = int(self._index_ns.searchsorted(dt_ns, side="right")) - 1
+        return row, dt_ns, row >= 0 and self._index_ns[row] == dt_ns
+
+    def _covered(self, positions, row, dt_ns):
+        """Mask of the assets whose data contains the bar at ``row`` and the datetime ``dt_ns``."""
+        return (
+            (self._first_row[positions] <= row)
+            & (row < self._stop_row[positions])
+            & (self._start_ns[positions] <= dt_ns)
+            & (dt_ns <= self._end_ns[positions])
+        )
+
+    def get_last_prices(self, keys, dt):
+        """Last prices of ``keys`` at ``dt`` from a single row of the open and close matrices.
+
+        Like ``Data.get_last_price``, minute data uses the open of a bar that starts exactly at ``dt`` and the close
+        otherwise, and day data always uses the close.
+
+        Parameters
+        ----------
+        keys : list
+            Data store keys (``None`` for assets that are not in the data store).
+        dt : datetime.datetime
+            The current backtest datetime.
+
+        Returns
+        -------
+        list of float or None
+            One price per key. ``None`` when the store cannot price the key (not in the store, not covering ``dt``,
+            or a missing or non-positive price), so the caller can use the per-asset path for it.
+        """
+        prices = [None] * len(keys)
+        found = [(slot, self._columns[key]) for slot, key in enumerate(keys) if key in self._columns]
+        if not found:
+            return prices
+        slots, positions = (np.array(values, dtype=np.int64) for values in zip(*found))
+
+        row, dt_ns, exact = self._row(dt)
+        if row < 0:
+            return prices
+        covered = self._covered(positions, row, dt_ns)
+        values = self.matrix("close")[row, positions]
+        if exact:
+            use_open = self._minute[positions]
+            if use_open.any():
+                values = np.where(use_open, self.matrix("open")[row, positions], values)
+        usable = covered & (values > 0)
+        for slot, value in zip(slots[usable], values[usable]):
+            prices[slot] = value
+        return prices
+
+    def get_bars(self, keys, dt, length, timestep, timeshift=0):
+        """The ``Data.get_bars`` frames of ``keys`` read from one block slice of the column matrices.
+
+        Only bars in the native timestep of each data object are served; aggregation (e.g. day bars built from
+        minute data) is left to ``Data.get_bars``.
+
+        Parameters
+        ----------
+        keys : list
+            Data store keys (``None`` for assets that are not in the data store).
+        dt : datetime.datetime
+            The current backtest datetime.
+        length : int
+            The number of bars.
+        timestep : str
+            The requested timestep.
+        timeshift : int or datetime.timedelta
+            The number of bars to shift the window back by.
+
+        Returns
+        -------
+        list of pandas.DataFrame or None
+            One frame per key, ``None`` for the keys the store cannot serve.
+        """
+        frames = [None] * len(keys)
+        quantity, unit = parse_timestep_qty_and_unit(timestep)
+        row, dt_ns, _ = self._row(dt)
+        if quantity != 1 or row < 0:
+            return frames
+
+        # Assets with the same span of the index share one window, so each group is a single block slice.
+        groups = {}
+        for slot, key in enumerate(keys):
+            position = self._columns.get(key)
+            if position is None or self._datas[position].timestep != unit:
+                continue
+            if not self._covered(position, row, dt_ns):
+                continue
+            span = (int(self._first_row[position]), int(self._stop_row[position]), unit)
+            groups.setdefault(span, []).append((slot, position))
+
+        for (first, stop, unit), members in groups.items():
+            begin, end = self._window(row - first, stop - first, length, timeshift, unit)
+            begin, end = first + begin, first + end
+            positions = [position for _, position in members]
+            index = self.index[begin:end]
+            if unit == "day":
+                # Data.get_bars resamples to calendar days, which labels each bar with its day.
+                index = index.floor("D")
+                if index.has_duplicates:
+                    continue
+            blocks = {column: self.matrix(column)[begin:end, positions] for column in BAR_COLUMNS}
+            complete = ~np.isnan(np.stack([blocks[column] for column in PRICE_COLUMNS])).any(axis=0)
+            for member, (slot, position) in enumerate(members):
+                data = self._datas[position]
+                keep = complete[:, member]
+                columns = {}
+                for column in BAR_COLUMNS:
+                    if column not in data.datalines:
+                        continue
+                    values = blocks[column][keep, member]
+                    if column in ("volume", "dividend"):
+                        values = np.nan_to_num(values, nan=0.0)
+                    dtype = data.datalines[column].dataline.dtype
+                    if dtype.kind in "iu":
+                        values = values.astype(dtype)
+                    columns[column] = values
+                frame = pd.DataFrame(columns, index=index[keep])
+                frame.index.name = "datetime"
+                frames[slot] = frame.tail(int(length))
+        return frames
+
+    @staticmethod
+    def _window(iter_count, rows, length, timeshift, unit):
+        """The ``(start, end)`` rows of ``Data._get_bars_range`` within one asset's own rows."""
+        if hasattr(timeshift, "total_seconds"):
+            seconds = 24 * 3600 if unit == "day" else 60
+            timeshift = int(timeshift.total_seconds() / seconds)
+        end = min(max(iter_count - (timeshift or 0), 0), rows)
+        start = min(max(end - length, 0), end)
+        if start == end and end > 0:
+            start = end - 1
+        return start, end
@@ -1,9 +1,13 @@
+import json
 import os
 import pickle
 import time
 import random
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
 from fp.fp import FreeProxy
@@ -16,6 +20,14 @@ logger = get_logger(__name__)
 
 INFO_DATA = "info"
 INVALID_SYMBOLS = set()
+# Bump when the layout of the parquet cache or its metadata changes; older caches are then re-downloaded.
+CACHE_FORMAT_VERSION = 1
+
+
+def _as_timestamp(dt):
+    """Return ``dt`` as a timezone-aware Timestamp (naive values are taken to be in the default timezone)."""
+    ts = pd.Timestamp(dt)
+    return ts.tz_localize(LUMIBOT_DEFAULT_PYTZ) if ts.tzinfo is None else ts
 
 
 class _YahooData:
@@ -79,9 +91,120 @@ class YahooHelper:
         return None
 
     # ====================Caching methods=================================
+    # Bar data is cached as one parquet file per symbol and interval, next to a small JSON sidecar that records the
+    # range of bars in the file and when Yahoo was last asked for new bars. Freshness checks only read the sidecar,
+    # refreshes download the bars after the cached range and append them, and every file is replaced atomically so
+    # several workers can share the cache folder.
+
+    # Bars re-downloaded before the end of the cache on a refresh, to check that Yahoo's adjusted prices still match.
+    REFRESH_OVERLAP_DAYS = 5
+    # Threads used by get_symbols_data to load many symbols at once.
+    BULK_MAX_WORKERS = 8
+
+    @staticmethod
+    def _cache_base_path(symbol, type):
+        return os.path.join(YahooHelper.LUMIBOT_YAHOO_CACHE_FOLDER, f"{symbol}_{type.lower()}")
+
+    @staticmethod
+    def _write_atomic(path, write):
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            write(tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    @staticmethod
+    def read_cache_metadata(symbol, interval):
+        """Return the metadata sidecar of a cached symbol (``None`` if it is not cached)."""
+        if not YahooHelper.CACHING_ENABLED:
+            return None
+        meta_path = YahooHelper._cache_base_path(symbol, interval) + ".meta.json"
+        if not os.path.exists(meta_path):
+            return None
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable Yahoo cache metadata {meta_path}: {e}")
+            return None
+        return meta if meta.get("version") == CACHE_FORMAT_VERSION else None
+
+    @staticmethod
+    def load_cached_data(symbol, interval, columns=None):
+        """Read the cached bars of a symbol, optionally only some columns. Returns ``None`` if nothing is cached."""
+        if YahooHelper.read_cache_metadata(symbol, interval) is None:
+            return None
+        data_path = YahooHelper._cache_base_path(symbol, interval) + ".parquet"
+        try:
+            data = pd.read_parquet(data_path, columns=columns)
+        except Exception as e:
+            # The file is rewritten by the next download, so there is no need to delete it here.
+            logger.warning(f"Ignoring unreadable Yahoo cache file {data_path}: {e}")
+            return None
+        if isinstance(data.index, pd.DatetimeIndex) and data.index.tz is not None:
+            data.index = data.index.tz_convert(LUMIBOT_DEFAULT_PYTZ)
+        return data
+
+    @staticmethod
+    def write_cached_data(symbol, interval, data):
+        """Store the bars of a symbol and their metadata sidecar."""
+        if not YahooHelper.CACHING_ENABLED or data is None or data.empty:
+            return
+        base_path = YahooHelper._cache_base_path(symbol, interval)
+        meta = {
+            "version": CACHE_FORMAT_VERSION,
+            "symbol": symbol,
+            "interval": interval.lower(),
+            "start": data.index[0].isoformat(),
+            "end": data.index[-1].isoformat(),
+            "rows": len(data),
+            "last_update": get_lumibot_datetime().isoformat(),
+        }
+        try:
+            YahooHelper._write_atomic(base_path + ".parquet", data.to_parquet)
+            YahooHelper._write_json(base_path + ".meta.json", meta)
+        except Exception as e:
+            logger.warning(f"Could not write the Yahoo cache for {symbol}: {e}")
+
+    @staticmethod
+    def _touch_cache_metadata(symbol, interval, meta):
+        """Record that Yahoo had no newer bars than the cache."""
+        meta = dict(meta, last_update=get_lumibot_datetime().isoformat())
+        try:
+            YahooHelper._write_json(YahooHelper._cache_base_path(symbol, interval) + ".meta.json", meta)
+        except Exception as e:
+            logger.warning(f"Could not update the Yahoo cache metadata for {symbol}: {e}")
+
+    @staticmethod
+    def _write_json(path, payload):
+        def write(tmp_path):
+            with open(tmp_path, "w") as f:
+                json.dump(payload, f, default=str)
+
+        YahooHelper._write_atomic(path, write)
+
+    @staticmethod
+    def is_cache_up_to_date(meta, last_needed_datetime=None):
+        """True if the cached bars described by ``meta`` cover ``last_needed_datetime`` (default: now).
+
+        The cache is also up to date if Yahoo was last asked for new bars after ``last_needed_datetime``; e.g. on
+        holidays the last bar is older than the requested day but there is nothing newer to download.
+        """
+        if last_needed_datetime is None:
+            last_needed_datetime = get_lumibot_datetime()
+        last_needed = _as_timestamp(last_needed_datetime)
+        end = _as_timestamp(meta["end"])
+        if meta["interval"] == "1d":
+            covered = end.date() >= last_needed.date()
+        else:
+            covered = end >= last_needed
+        return covered or _as_timestamp(meta["last_update"]) >= last_needed
 
     @staticmethod
     def check_pickle_file(symbol, type):
+        """Load a pickle written by earlier versions of the cache (``None`` if missing or unreadable)."""
         if YahooHelper.CACHING_ENABLED:
             file_name = f"{symbol}_{type.lower()}.pickle"
             pickle_file_path = os.path.join(YahooHelper.LUMIBOT_YAHOO_CACHE_FOLDER, file_name)
@@ -91,20 +214,53 @@ class YahooHelper:
                         return pickle.load(f)
                 except Exception as e:
                     logger.error("Error while loading pickle file %s: %s" % (pickle_file_path, e))
-                    # Remove the file because it is corrupted.  This will enable re-download.
-                    os.remove(pickle_file_path)
                     return None
 
         return None
 
     @staticmethod
-    def dump_pickle_file(symbol, type, data):
-        if YahooHelper.CACHING_ENABLED:
-            yahoo_data = _YahooData(symbol, type, data)
-            file_name = "%s_%s.pickle" % (symbol, type.lower())
-            pickle_file_path = os.path.join(YahooHelper.LUMIBOT_YAHOO_CACHE_FOLDER, file_name)
-            with open(pickle_file_path, "wb") as f:
-                pickle.dump(yahoo_data, f)
+    def _import_pickle_cache(symbol, interval):
+        """Convert a legacy ``{symbol}_{interval}.pickle`` cache to parquet. Returns its metadata or ``None``."""
+        cached = YahooHelper.check_pickle_file(symbol, interval)
+        if cached is None or getattr(cached, "data", None) is None or cached.data.empty:
+            return None
+        YahooHelper.write_cached_data(symbol, interval, cached.data)
+        meta = YahooHelper.read_cache_metadata(symbol, interval)
+        if meta is None:
+            return None
+        # When the pickle was written is unknown, so its freshness is decided by its last bar alone.
+        meta["last_update"] = meta["end"]
+        YahooHelper._write_json(YahooHelper._cache_base_path(symbol, interval) + ".meta.json", meta)
+        os.remove(YahooHelper._cache_base_path(symbol, interval) + ".pickle")
+        return meta
+
+    @staticmethod
+    def load_symbol_info_cache(symbol):
+        """Return the cached symbol info dict (``None`` if it is not cached)."""
+        if not YahooHelper.CACHING_ENABLED:
+            return None
+        path = YahooHelper._cache_base_path(symbol, INFO_DATA) + ".json"
+        if os.path.exists(path):
+            try:
+                with open(path) as f:
+                    data = json.load(f)
+                data["last_update"] = datetime.fromisoformat(data["last_update"])
+                return data
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable Yahoo symbol info cache {path}: {e}")
+                return None
+        cached = YahooHelper.check_pickle_file(symbol, INFO_DATA)
+        return cached.data if cached is not None else None
+
+    @staticmethod
+    def dump_symbol_info_cache(symbol, data):
+        if not YahooHelper.CACHING_ENABLED:
+            return
+        payload = dict(data, last_update=data["last_update"].isoformat())
+        try:
+            YahooHelper._write_json(YahooHelper._cache_base_path(symbol, INFO_DATA) + ".json", payload)
+        except Exception as e:
+            logger.warning(f"Could not write the Yahoo symbol info cache for {symbol}: {e}")
 
     # ====================Formatters methods===============================
 
@@ -181,14 +337,6 @@ class YahooHelper:
             "info": info,
         }
 
-    @staticmethod
-    def get_symbol_info(symbol):
-        proxy = YahooHelper.sleep_and_get_proxy()
-        if proxy:
-            yf.set_config(proxy=proxy)
-        ticker = yf.Ticker(symbol)
-        return ticker.info
-
     @staticmethod
     def get_symbol_last_price(symbol):
         proxy = YahooHelper.sleep_and_get_proxy()
@@ -204,12 +352,15 @@ class YahooHelper:
         return df["Close"].iloc[-1]
 
     @staticmethod
-    def download_symbol_data(symbol, interval="1d"):
+    def download_symbol_data(symbol, interval="1d", start=None):
         """
         Attempts to download historical data from yfinance for the specified symbol and interval.
         Retries on empty/None data in case of transient rate limits.
         If all attempts fail, marks the symbol as invalid (added to INVALID_SYMBOLS) to skip it in future.
         If symbol info is unavailable, we just skip timezone adjustments (do not return None).
+
+        With ``start``, only the bars from ``start`` on are downloaded (used to refresh a cache). No bars after
+        ``start`` is a normal answer then: an empty DataFrame is returned and the symbol is not marked invalid.
         """
 
         # If we've already marked this symbol invalid, skip further calls
@@ -229,16 +380,18 @@ class YahooHelper:
                 proxy = YahooHelper.sleep_and_get_proxy()
                 if proxy:
                     yf.set_config(proxy=proxy)
-                if interval == "1m":
+                if interval in ("1m", "15m"):
+                    # Yahoo only serves the last 7 days of minute bars and the last 60 days of 15 minute bars.
+                    earliest = get_lumibot_datetime() - timedelta(days=7 if interval == "1m" else 60)
                     df = ticker.history(
                         interval=interval,
-                        start=get_lumibot_datetime() - timedelta(days=7),
+                        start=max(_as_timestamp(start), earliest) if start is not None else earliest,
                         auto_adjust=False
                     )
-                elif interval == "15m":
+                elif start is not None:
                     df = ticker.history(
                         interval=interval,
-                        start=get_lumibot_datetime() - timedelta(days=60),
+                        start=start,
                         auto_adjust=False
                     )
                 else:
@@ -254,6 +407,9 @@ class YahooHelper:
                     time.sleep(sleep_sec)
                     sleep_sec *= 2
                     continue
+                elif start is not None:
+                    logger.debug(f"{symbol}: All {max_retries} attempts to refresh the data failed.")
+                    return None
                 else:
                     logger.debug(f"{symbol}: All {max_retries} attempts failed. Marking invalid.")
                     INVALID_SYMBOLS.add(symbol)
@@ -261,6 +417,8 @@ class YahooHelper:
 
             if df is None or df.empty:
                 logger.debug(f"{symbol}: Attempt {attempt} returned empty or None data.")
+                if start is not None:
+                    return pd.DataFrame()
                 if attempt < max_retries:
                     logger.debug(f"{symbol}: Sleeping {sleep_sec}s, then retry.")
                     time.sleep(sleep_sec)
@@ -336,56 +494,115 @@ class YahooHelper:
     @staticmethod
     def fetch_symbol_info(symbol, caching=True, last_needed_datetime=None):
         if caching:
-            cached_data = YahooHelper.check_pickle_file(symbol, INFO_DATA)
-            if cached_data:
-                if cached_data.is_up_to_date(last_needed_datetime=last_needed_datetime):
-                    return cached_data.data
+            cached_data = YahooHelper.load_symbol_info_cache(symbol)
+            if cached_data and not cached_data.get("error"):
+                if last_needed_datetime is None:
+                    last_needed_datetime = get_lumibot_datetime()
+                if cached_data["last_update"].date() >= last_needed_datetime.date():
+                    return cached_data
 
         # Caching is disabled or no previous data found
         # or data found not up to date
         data = YahooHelper.download_symbol_info(symbol)
-        YahooHelper.dump_pickle_file(symbol, INFO_DATA, data)
+        YahooHelper.dump_symbol_info_cache(symbol, data)
         return data
 
     @staticmethod
     def fetch_symbol_data(symbol, caching=True, last_needed_datetime=None, interval="1d"):
         if caching:
-            cached_data = YahooHelper.check_pickle_file(symbol, interval)
-            if cached_data:
-                if cached_data.is_up_to_date(last_needed_datetime=last_needed_datetime):
-                    return cached_data.data
+            meta = YahooHelper.read_cache_metadata(symbol, interval) or YahooHelper._import_pickle_cache(
+                symbol, interval
+            )
+            if meta is not None:
+                cached = YahooHelper.load_cached_data(symbol, interval)
+                if cached is not None and not cached.empty:
+                    if YahooHelper.is_cache_up_to_date(meta, last_needed_datetime=last_needed_datetime):
+                        return cached
+                    data = YahooHelper._refresh_symbol_data(symbol, interval, cached, meta)
+                    if data is not None:
+                        return data
 
         # Caching is disabled or no previous data found
-        # or data found not up to date
+        # or the cached data could not be refreshed
         data = YahooHelper.download_symbol_data(symbol, interval)
 
         # Check if the data is empty
         if data is None or data.empty:
             return data
 
-        YahooHelper.dump_pickle_file(symbol, interval, data)
+        YahooHelper.write_cached_data(symbol, interval, data)
         return data
 
     @staticmethod
-    def fetch_symbols_data(symbols, interval, caching=True):
-        result = {}
-        missing_symbols = symbols.copy()
+    def _refresh_symbol_data(symbol, interval, cached, meta):
+        """Download the bars after the cached ones and append them to the cache.
 
-        if caching:
-            for symbol in symbols:
-                cached_data = YahooHelper.check_pickle_file(symbol, interval)
-                if cached_data:
-                    if cached_data.is_up_to_date():
-                        result[symbol] = cached_data.data
-                        missing_symbols.remove(symbol)
-
-        if missing_symbols:
-            missing_data = YahooHelper.download_symbols_data(missing_symbols, interval)
-            for symbol, data in missing_data.items():
-                result[symbol] = data
-                YahooHelper.dump_pickle_file(symbol, interval, data)
+        The last ``REFRESH_OVERLAP_DAYS`` of cached bars are downloaded again. If Yahoo's adjusted closes for them
+        changed, or the new bars contain a dividend or split, the adjustment of the whole history changed and
+        ``None`` is returned so the caller downloads everything again.
+        """
+        start = cached.index[-1] - timedelta(days=YahooHelper.REFRESH_OVERLAP_DAYS)
+        new = YahooHelper.download_symbol_data(symbol, interval, start=start)
+        if new is None:
+            return None
+        if new.empty:
+            YahooHelper._touch_cache_metadata(symbol, interval, meta)
+            return cached
+
+        new_bars = new.index > cached.index[-1]
+        actions = [column for column in ("Dividends", "Stock Splits") if column in new.columns]
+        if actions and (new.loc[new_bars, actions].fillna(0) != 0).any(axis=None):
+            logger.debug(f"{symbol}: new dividends or splits, downloading the full history again.")
+            return None
 
-        return result
+        price_column = "Adj Close" if "Adj Close" in new.columns and "Adj Close" in cached.columns else "Close"
+        overlap = cached.index.intersection(new.index)
+        if not np.allclose(
+            cached.loc[overlap, price_column].to_numpy(dtype=float),
+            new.loc[overlap, price_column].to_numpy(dtype=float),
+            rtol=1e-6,
+            equal_nan=True,
+        ):
+            logger.debug(f"{symbol}: adjusted prices changed, downloading the full history again.")
+            return None
+
+        data = pd.concat([cached[cached.index < new.index[0]], new])
+        data = data[~data.index.duplicated(keep="last")]
+        YahooHelper.write_cached_data(symbol, interval, data)
+        return data
+
+    @staticmethod
+    def fetch_symbols_data(symbols, interval, caching=True, last_needed_datetime=None, max_workers=None):
+        """Fetch many symbols at once, each through ``fetch_symbol_data`` on a pool of threads.
+
+        Returns a dict of symbol to DataFrame in the order of ``symbols``; a symbol that failed maps to ``None``.
+        """
+        symbols = list(dict.fromkeys(symbols))
+        if not symbols:
+            return {}
+
+        result = {}
+        workers = min(max_workers or YahooHelper.BULK_MAX_WORKERS, len(symbols))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="yahoo_bulk") as executor:
+            futures = {
+                executor.submit(
+                    YahooHelper.fetch_symbol_data,
+                    symbol,
+                    caching=caching,
+                    last_needed_datetime=last_needed_datetime,
+                    interval=interval,
+                ): symbol
+                for symbol in symbols
+            }
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    result[symbol] = future.result()
+                except Exception as e:
+                    logger.warning(f"Could not load Yahoo data for {symbol}: {e}")
+                    result[symbol] = None
+
+        return {symbol: result[symbol] for symbol in symbols}
 
     # ======Shortcut methods==================================
 
@@ -414,19 +631,29 @@ class YahooHelper:
             raise ValueError("Unknown interval %s" % interval)
 
     @staticmethod
-    def get_symbols_data(symbols, interval="1d", auto_adjust=True, caching=True):
-        result = YahooHelper.fetch_symbols_data(symbols, interval=interval, caching=caching)
+    def get_symbols_data(
+        symbols,
+        interval="1d",
+        auto_adjust=True,
+        caching=True,
+        last_needed_datetime=None,
+        max_workers=None,
+    ):
+        """Return a dict of symbol to formatted DataFrame (``None`` for symbols without data), loaded in parallel."""
+        if interval not in ["1m", "15m", "1d"]:
+            raise ValueError("Unknown interval %s" % interval)
+        result = YahooHelper.fetch_symbols_data(
+            symbols,
+            interval=interval,
+            caching=caching,
+            last_needed_datetime=last_needed_datetime,
+            max_workers=max_workers,
+        )
         for key, df in result.items():
-            result[key] = YahooHelper.format_df(df, auto_adjust)
+            if df is not None:
+                result[key] = YahooHelper.format_df(df, auto_adjust)
         return result
 
-    @staticmethod
-    def get_symbols_data(symbols, interval="1d", auto_adjust=True, caching=True):
-        if interval in ["1m", "15m", "1d"]:
-            return YahooHelper.get_symbols_data(symbols, interval=interval, auto_adjust=auto_adjust, caching=caching)
-        else:
-            raise ValueError("Unknown interval %s" % interval)
-
     @staticmethod
     def get_symbol_dividends(symbol, caching=True):
         """https://github.com/ranaroussi/yfinance/blob/main/yfinance/base.py"""
@@ -464,14 +691,14 @@ class YahooHelper:
     @staticmethod
     def get_symbol_actions(symbol, caching=True):
         """https://github.com/ranaroussi/yfinance/blob/main/yfinance/base.py"""
-        history = YahooHelper.get_symbol__data(symbol, caching=caching)
+        history = YahooHelper.get_symbol_data(symbol, caching=caching)
         actions = history[["Dividends", "Stock Splits"]]
         return actions[actions != 0].dropna(how="all").fillna(0)
 
     @staticmethod
     def get_symbols_actions(symbols, caching=True):
         result = {}
-        data = YahooHelper.get_symbols__data(symbols, caching=caching)
+        data = YahooHelper.get_symbols_data(symbols, caching=caching)
         for symbol, df in data.items():
             actions = df[["Dividends", "Stock Splits"]]
             result[symbol] = actions[actions != 0].dropna(how="all").fillna(0)
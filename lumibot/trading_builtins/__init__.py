@@ -1,2 +1,3 @@
 from .custom_stream import CustomStream, PollingStream
 from .safe_list import SafeList
+from .polling_reconciler import PollingReconciler
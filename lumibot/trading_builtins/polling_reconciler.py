@@ -0,0 +1,153 @@
+"""
+Change detection and pacing for brokers that learn about order updates by polling.
+
+Polling brokers (Tradier, Schwab, Interactive Brokers REST, Alpaca with OAuth) pull the full list of today's orders
+every cycle and used to re-parse every row into an ``Order`` even when nothing had changed. ``PollingReconciler``
+remembers a cheap version of each raw order (its update timestamp, or a digest of the row) so only rows that are new
+or different since the last successful cycle are parsed.
+
+It also picks the time to the next poll: the broker's configured interval while orders are working, a longer idle
+interval when the account is flat, and exponential backoff (or the server's ``Retry-After``) after a rate limit.
+"""
+
+import hashlib
+import json
+
+
+class PollingReconciler:
+    """Per-broker snapshot diff and adaptive polling interval.
+
+    Parameters
+    ----------
+    base_interval : float
+        Seconds between polls while orders are working.
+    idle_multiplier : float, optional
+        The interval when no orders are working is ``base_interval * idle_multiplier``.
+    max_interval : float, optional
+        Upper bound for the idle interval and for rate limit backoff.
+    full_sync_every : int, optional
+        Every this many snapshots, every raw order is reported as changed. This re-aligns Lumibot's orders with the
+        broker if they drifted apart without the broker's copy changing. ``0`` disables it.
+    """
+
+    def __init__(self, base_interval, idle_multiplier=3.0, max_interval=60.0, full_sync_every=0):
+        self.base_interval = float(base_interval)
+        self.idle_multiplier = max(float(idle_multiplier), 1.0)
+        self.max_interval = max(float(max_interval), self.base_interval)
+        self.full_sync_every = int(full_sync_every or 0)
+        self._versions = {}
+        self._pending = None
+        self._snapshots = 0
+        self._backoff_level = 0
+        self._retry_after = None
+        self._rate_limited_this_cycle = False
+
+    # ----- snapshot diff -----
+
+    def changed(self, raw_orders, key, version):
+        """Return the raw orders that are new or changed since the last committed cycle.
+
+        Parameters
+        ----------
+        raw_orders : list
+            The broker's current snapshot of orders.
+        key : callable
+            Returns the broker identifier of a raw order (``None`` means always treat the row as changed).
+        version : callable
+            Returns a hashable value that changes whenever the raw order changes.
+
+        Returns
+        -------
+        list
+            The changed raw orders, in snapshot order. Call ``commit`` once they have been processed.
+        """
+        self._snapshots += 1
+        full_sync = self.full_sync_every > 0 and self._snapshots % self.full_sync_every == 0
+        pending = {}
+        changed = []
+        for raw in raw_orders:
+            order_key = key(raw)
+            if order_key is None:
+                changed.append(raw)
+                continue
+            order_version = version(raw)
+            pending[order_key] = order_version
+            if full_sync or self._versions.get(order_key) != order_version:
+                changed.append(raw)
+        self._pending = pending
+        return changed
+
+    def commit(self):
+        """Remember the versions from the last ``changed`` call; orders missing from that snapshot are forgotten."""
+        if self._pending is not None:
+            self._versions = self._pending
+            self._pending = None
+
+    def reset(self):
+        """Forget every remembered version so the next cycle processes the full snapshot."""
+        self._versions = {}
+        self._pending = None
+
+    @staticmethod
+    def digest(raw):
+        """Return a stable digest of a raw order (a dict, list or any object with a meaningful ``repr``)."""
+        if isinstance(raw, (dict, list)):
+            text = json.dumps(raw, sort_keys=True, default=str)
+        else:
+            text = repr(raw)
+        return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+    # ----- adaptive interval -----
+
+    def start_cycle(self):
+        """Mark the start of a polling cycle."""
+        self._rate_limited_this_cycle = False
+
+    def rate_limited(self, retry_after=None):
+        """Record that the broker answered with a rate limit (HTTP 429) during this cycle."""
+        self._rate_limited_this_cycle = True
+        self._backoff_level += 1
+        self._retry_after = retry_after
+
+    def wake(self):
+        """Return the working interval; used when a new order is submitted during an idle wait."""
+        return self.base_interval if self._backoff_level == 0 else self.next_interval(True)
+
+    def finish_cycle(self, active):
+        """Close a polling cycle and return the seconds to wait before the next one.
+
+        Parameters
+        ----------
+        active : bool
+            True if any order is still working (the tight interval is used).
+        """
+        if not self._rate_limited_this_cycle:
+            self._backoff_level = 0
+            self._retry_after = None
+        return self.next_interval(active)
+
+    def next_interval(self, active):
+        """Return the wait before the next poll without closing the cycle."""
+        interval = self.base_interval if active else self.base_interval * self.idle_multiplier
+        if self._backoff_level:
+            interval *= 2 ** self._backoff_level
+        interval = min(interval, self.max_interval)
+        if self._retry_after:
+            interval = max(interval, float(self._retry_after))
+        return interval
+
+    @staticmethod
+    def rate_limit_info(error):
+        """Return ``(is_rate_limit, retry_after_seconds)`` for an exception raised by a broker API call."""
+        response = getattr(error, "response", None)
+        status = getattr(error, "status_code", None) or getattr(response, "status_code", None)
+        headers = getattr(response, "headers", None) or {}
+        text = str(error).lower()
+        if status != 429 and "429" not in text and "too many requests" not in text and "rate limit" not in text:
+            return False, None
+        retry_after = None
+        try:
+            retry_after = float(headers.get("Retry-After")) if headers.get("Retry-After") else None
+        except (TypeError, ValueError):
+            retry_after = None
+        return True, retry_after
@@ -0,0 +1,423 @@
+"""
+Offline regression benchmarks for the backtest engine.
+
+Unlike ``tests/backtest/performance_tracker.py`` (which times whole backtests against downloaded vendor data), these
+workloads run entirely on the deterministic synthetic data from ``tests/performance/synthetic_data.py`` so they can
+run on any Linux CI host without network access or API keys.
+
+Workloads
+---------
+- ``buy_and_hold_daily``: one asset, daily bars, buy on the first iteration and hold.
+- ``minute_rotation``: a large minute-bar universe ranked every few minutes, rotating into the top names.
+- ``bracket_churn``: bracket orders opened and closed continuously on minute bars.
+- ``zero_dte_delta``: 0DTE option chain scan that picks the call closest to a target delta every few minutes.
+
+Each workload runs in a fresh process so peak RSS is attributable to it. Reported metrics are the mean, p50 and p95
+latency between consecutive ``on_trading_iteration`` calls, iterations per second and peak RSS.
+
+Usage
+-----
+Run from the repository root::
+
+    python -m tests.performance.benchmark_suite                     # run and compare with the stored baseline
+    python -m tests.performance.benchmark_suite --update-baseline   # re-record the baseline on this host
+    python -m tests.performance.benchmark_suite --profile smoke --workload bracket_churn
+
+The baseline is host specific. Re-record it with ``--update-baseline`` on the machine that enforces it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+os.environ.setdefault("BACKTESTING_QUIET_LOGS", "true")
+os.environ.setdefault("BACKTESTING_SHOW_PROGRESS_BAR", "false")
+
+from lumibot.backtesting import PandasDataBacktesting  # noqa: E402
+from lumibot.entities import Asset, Order  # noqa: E402
+from lumibot.strategies import Strategy  # noqa: E402
+
+from tests.performance.synthetic_data import (  # noqa: E402
+    day_index,
+    make_option_chain,
+    make_stock_data,
+    make_universe,
+    minute_index,
+    trading_dates,
+)
+
+BASELINE_PATH = Path(__file__).parent / "benchmark_baseline.json"
+DEFAULT_LATENCY_TOLERANCE = 0.5  # fail when mean iteration latency is 50% above baseline
+DEFAULT_RSS_TOLERANCE = 0.25  # fail when peak RSS is 25% above baseline
+START_DATE = date(2024, 1, 2)
+
+# Size of each workload per profile. "full" is what the baseline records; "smoke" is used by the unit tests.
+PROFILES = {
+    "full": {
+        "buy_and_hold_daily": {"days": 504},
+        "minute_rotation": {"days": 1, "assets": 500, "top_n": 10},
+        "bracket_churn": {"days": 5},
+        "zero_dte_delta": {"days": 3, "strikes": 10},
+    },
+    "smoke": {
+        "buy_and_hold_daily": {"days": 30},
+        "minute_rotation": {"days": 1, "assets": 10, "top_n": 3},
+        "bracket_churn": {"days": 1},
+        "zero_dte_delta": {"days": 1, "strikes": 3},
+    },
+}
+
+
+class _TimedStrategy(Strategy):
+    """Base strategy that records the wall clock at the start of every trading iteration."""
+
+    def initialize(self):
+        self.iteration_started_at = []
+
+    def _mark_iteration(self):
+        self.iteration_started_at.append(time.perf_counter())
+
+
+class BuyAndHoldDaily(_TimedStrategy):
+    def initialize(self):
+        super().initialize()
+        self.sleeptime = "1D"
+
+    def on_trading_iteration(self):
+        self._mark_iteration()
+        if self.first_iteration:
+            self.submit_order(self.create_order(self.parameters["symbol"], 10, Order.OrderSide.BUY))
+
+
+class MinuteRotation(_TimedStrategy):
+    def initialize(self):
+        super().initialize()
+        self.sleeptime = "5M"
+        self.universe = [Asset(symbol) for symbol in self.parameters["symbols"]]
+        self.previous_prices = {}
+
+    def on_trading_iteration(self):
+        self._mark_iteration()
+        prices = self.get_last_prices(self.universe)
+        momentum = {}
+        for asset, price in prices.items():
+            previous = self.previous_prices.get(asset)
+            if price is not None and previous:
+                momentum[asset] = float(price) / float(previous) - 1
+        self.previous_prices = {asset: price for asset, price in prices.items() if price is not None}
+        if not momentum:
+            return
+
+        top_n = self.parameters["top_n"]
+        winners = set(sorted(momentum, key=momentum.get, reverse=True)[:top_n])
+        held = {position.asset for position in self.get_positions() if position.asset.asset_type == "stock"}
+        for asset in held - winners:
+            self._close(asset)
+        budget = self.portfolio_value / top_n
+        for asset in winners - held:
+            price = prices.get(asset)
+            if price:
+                quantity = int(budget // float(price))
+                if quantity > 0:
+                    self.submit_order(self.create_order(asset, quantity, Order.OrderSide.BUY))
+
+    def _close(self, asset):
+        position = self.get_position(asset)
+        if position is not None and position.quantity > 0:
+            self.submit_order(self.create_order(asset, position.quantity, Order.OrderSide.SELL))
+
+
+class BracketChurn(_TimedStrategy):
+    def initialize(self):
+        super().initialize()
+        self.sleeptime = "1M"
+        self.asset = Asset(self.parameters["symbol"])
+
+    def on_trading_iteration(self):
+        self._mark_iteration()
+        if self.get_position(self.asset) is not None or self.get_orders():
+            return
+        price = self.get_last_price(self.asset)
+        if price is None:
+            return
+        order = self.create_order(
+            self.asset,
+            10,
+            Order.OrderSide.BUY,
+            order_class=Order.OrderClass.BRACKET,
+            secondary_limit_price=round(float(price) * 1.001, 2),
+            secondary_stop_price=round(float(price) * 0.999, 2),
+        )
+        self.submit_order(order)
+
+
+class ZeroDteDelta(_TimedStrategy):
+    def initialize(self):
+        super().initialize()
+        self.sleeptime = "15M"
+        self.underlying = Asset(self.parameters["symbol"])
+        self.target_delta = 0.30
+
+    def on_trading_iteration(self):
+        self._mark_iteration()
+        today = self.get_datetime().date()
+        chains = self.get_chains(self.underlying)
+        strikes = sorted(chains["Chains"]["CALL"].get(today.isoformat(), []))
+        if not strikes:
+            return
+        underlying_price = self.get_last_price(self.underlying)
+        if underlying_price is None:
+            return
+
+        best = None
+        for strike in strikes:
+            option = Asset(
+                self.underlying.symbol,
+                asset_type=Asset.AssetType.OPTION,
+                expiration=today,
+                strike=strike,
+                right=Asset.OptionRight.CALL,
+            )
+            greeks = self.get_greeks(option, underlying_price=underlying_price, risk_free_rate=0.04)
+            if not greeks or greeks.get("delta") is None:
+                continue
+            distance = abs(greeks["delta"] - self.target_delta)
+            if best is None or distance < best[0]:
+                best = (distance, option)
+
+        if best is not None and self.get_position(best[1]) is None:
+            self.submit_order(self.create_order(best[1], 1, Order.OrderSide.BUY))
+
+
+@dataclass
+class Workload:
+    name: str
+    strategy: type
+    pandas_data: list
+    start: date
+    end: date
+    parameters: dict = field(default_factory=dict)
+
+
+def _backtest_end(dates):
+    return dates[-1] + timedelta(days=1)
+
+
+def build_buy_and_hold_daily(days):
+    dates = trading_dates(START_DATE, days)
+    data = make_stock_data("SYND", day_index(dates), "day", seed=11)
+    return Workload("buy_and_hold_daily", BuyAndHoldDaily, [data], dates[0], _backtest_end(dates), {"symbol": "SYND"})
+
+
+def build_minute_rotation(days, assets, top_n):
+    dates = trading_dates(START_DATE, days)
+    universe = make_universe(assets, dates, timestep="minute", seed=101)
+    symbols = [data.asset.symbol for data in universe]
+    return Workload(
+        "minute_rotation",
+        MinuteRotation,
+        universe,
+        dates[0],
+        _backtest_end(dates),
+        {"symbols": symbols, "top_n": top_n},
+    )
+
+
+def build_bracket_churn(days):
+    dates = trading_dates(START_DATE, days)
+    data = make_stock_data("SYNB", minute_index(dates), "minute", seed=23)
+    return Workload("bracket_churn", BracketChurn, [data], dates[0], _backtest_end(dates), {"symbol": "SYNB"})
+
+
+def build_zero_dte_delta(days, strikes):
+    dates = trading_dates(START_DATE, days)
+    underlying = make_stock_data("SYNO", minute_index(dates), "minute", seed=37, start_price=450.0)
+    offsets = list(range(-strikes, strikes + 1))
+    chain = make_option_chain(underlying, dates, offsets)
+    return Workload(
+        "zero_dte_delta",
+        ZeroDteDelta,
+        [underlying] + chain,
+        dates[0],
+        _backtest_end(dates),
+        {"symbol": "SYNO"},
+    )
+
+
+BUILDERS: Dict[str, Callable[..., Workload]] = {
+    "buy_and_hold_daily": build_buy_and_hold_daily,
+    "minute_rotation": build_minute_rotation,
+    "bracket_churn": build_bracket_churn,
+    "zero_dte_delta": build_zero_dte_delta,
+}
+
+
+def _peak_rss_mb():
+    # ru_maxrss is reported in kilobytes on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+def run_workload(name: str, profile: str = "full") -> dict:
+    """
+    Build and run one workload in the current process.
+
+    Returns
+    -------
+    dict
+        ``iterations``, ``setup_seconds``, ``run_seconds``, ``mean_iteration_ms``, ``p50_iteration_ms``,
+        ``p95_iteration_ms``, ``iterations_per_second`` and ``peak_rss_mb``.
+    """
+    from datetime import datetime
+
+    setup_start = time.perf_counter()
+    workload = BUILDERS[name](**PROFILES[profile][name])
+    setup_seconds = time.perf_counter() - setup_start
+
+    run_start = time.perf_counter()
+    _, strategy = workload.strategy.run_backtest(
+        PandasDataBacktesting,
+        datetime.combine(workload.start, datetime.min.time()),
+        datetime.combine(workload.end, datetime.min.time()),
+        pandas_data=workload.pandas_data,
+        parameters=workload.parameters,
+        benchmark_asset=None,
+        risk_free_rate=0.04,
+        budget=1_000_000,
+        show_plot=False,
+        show_tearsheet=False,
+        save_tearsheet=False,
+        show_indicators=False,
+        save_logfile=False,
+        save_stats_file=False,
+        show_progress_bar=False,
+        quiet_logs=True,
+        analyze_backtest=False,
+    )
+    run_seconds = time.perf_counter() - run_start
+
+    marks = np.asarray(strategy.iteration_started_at, dtype=float)
+    gaps_ms = np.diff(marks) * 1000.0 if len(marks) > 1 else np.asarray([run_seconds * 1000.0])
+    iterations = len(marks)
+    return {
+        "iterations": iterations,
+        "setup_seconds": round(setup_seconds, 4),
+        "run_seconds": round(run_seconds, 4),
+        "mean_iteration_ms": round(float(gaps_ms.mean()), 4),
+        "p50_iteration_ms": round(float(np.percentile(gaps_ms, 50)), 4),
+        "p95_iteration_ms": round(float(np.percentile(gaps_ms, 95)), 4),
+        "iterations_per_second": round(iterations / run_seconds, 3) if run_seconds > 0 else 0.0,
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+    }
+
+
+def _run_in_child(args):
+    name, profile = args
+    return run_workload(name, profile)
+
+
+def run_suite(names: Optional[List[str]] = None, profile: str = "full", isolate: bool = True) -> dict:
+    """Run the selected workloads (all by default), each in a fresh process unless ``isolate`` is False."""
+    names = names or list(BUILDERS)
+    results = {}
+    for name in names:
+        if isolate:
+            ctx = multiprocessing.get_context("spawn")
+            with ctx.Pool(1) as pool:
+                results[name] = pool.apply(_run_in_child, ((name, profile),))
+        else:
+            results[name] = run_workload(name, profile)
+    return {"profile": profile, "workloads": results}
+
+
+def compare_to_baseline(
+    results: dict,
+    baseline: dict,
+    latency_tolerance: float = DEFAULT_LATENCY_TOLERANCE,
+    rss_tolerance: float = DEFAULT_RSS_TOLERANCE,
+) -> List[str]:
+    """
+    Compare suite results with a stored baseline.
+
+    Returns
+    -------
+    list of str
+        One message per regression. An empty list means the run is within tolerance.
+    """
+    regressions = []
+    if baseline.get("profile") != results.get("profile"):
+        return [f"baseline profile {baseline.get('profile')!r} does not match run profile {results.get('profile')!r}"]
+
+    for name, current in results["workloads"].items():
+        reference = baseline.get("workloads", {}).get(name)
+        if reference is None:
+            continue
+        limit = reference["mean_iteration_ms"] * (1 + latency_tolerance)
+        if current["mean_iteration_ms"] > limit:
+            regressions.append(
+                f"{name}: mean iteration latency {current['mean_iteration_ms']:.3f}ms exceeds "
+                f"baseline {reference['mean_iteration_ms']:.3f}ms by more than {latency_tolerance:.0%}"
+            )
+        rss_limit = reference["peak_rss_mb"] * (1 + rss_tolerance)
+        if current["peak_rss_mb"] > rss_limit:
+            regressions.append(
+                f"{name}: peak RSS {current['peak_rss_mb']:.1f}MB exceeds "
+                f"baseline {reference['peak_rss_mb']:.1f}MB by more than {rss_tolerance:.0%}"
+            )
+    return regressions
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> Optional[dict]:
+    if not Path(path).exists():
+        return None
+    with open(path) as fh:
+        return json.load(fh)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offline backtest engine benchmarks on synthetic data.")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="full")
+    parser.add_argument("--workload", action="append", choices=sorted(BUILDERS), help="Run only these workloads.")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true", help="Record this run as the new baseline.")
+    parser.add_argument("--latency-tolerance", type=float, default=DEFAULT_LATENCY_TOLERANCE)
+    parser.add_argument("--rss-tolerance", type=float, default=DEFAULT_RSS_TOLERANCE)
+    parser.add_argument("--no-isolate", action="store_true", help="Run workloads in this process.")
+    parser.add_argument("--output", type=Path, help="Also write the results JSON to this path.")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.workload, profile=args.profile, isolate=not args.no_isolate)
+    print(json.dumps(results, indent=2))
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one.")
+        return 0
+
+    regressions = compare_to_baseline(results, baseline, args.latency_tolerance, args.rss_tolerance)
+    for message in regressions:
+        print(f"REGRESSION: {message}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,207 @@
+"""
+Deterministic synthetic market data for offline backtest benchmarks.
+
+Everything here is generated from a fixed seed so two runs on any machine produce byte-identical frames. No network
+access or vendor cache is required: the generators return ready-to-use ``lumibot.entities.Data`` objects that can be
+passed straight to ``PandasDataBacktesting`` via ``pandas_data=...``.
+
+Prices follow a geometric random walk; option prices are Black-Scholes values of that walk with a constant
+volatility, so greeks computed by the engine are well defined.
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import date, datetime, time as dt_time
+from typing import Iterable, List, Sequence
+
+import numpy as np
+import pandas as pd
+from scipy.stats import norm
+
+from lumibot.entities import Asset, Data
+
+NEW_YORK = "America/New_York"
+MINUTES_PER_SESSION = 390
+USD = Asset(symbol="USD", asset_type=Asset.AssetType.FOREX)
+
+
+def trading_dates(start: date, count: int) -> List[date]:
+    """Return ``count`` consecutive weekdays starting at ``start`` (holidays are ignored on purpose)."""
+    return [d.date() for d in pd.bdate_range(start=start, periods=count)]
+
+
+def minute_index(dates: Sequence[date]) -> pd.DatetimeIndex:
+    """Regular-session minute timestamps (09:30-15:59 New York) for the given dates."""
+    sessions = [
+        pd.date_range(
+            start=pd.Timestamp(datetime.combine(d, dt_time(9, 30)), tz=NEW_YORK),
+            periods=MINUTES_PER_SESSION,
+            freq="min",
+        )
+        for d in dates
+    ]
+    return sessions[0].append(sessions[1:]) if len(sessions) > 1 else sessions[0]
+
+
+def day_index(dates: Sequence[date]) -> pd.DatetimeIndex:
+    """Daily timestamps at midnight New York for the given dates."""
+    return pd.DatetimeIndex([pd.Timestamp(d, tz=NEW_YORK) for d in dates])
+
+
+def generate_ohlcv(
+    index: pd.DatetimeIndex,
+    seed: int,
+    start_price: float = 100.0,
+    annual_drift: float = 0.05,
+    annual_volatility: float = 0.20,
+    bars_per_year: float = 252 * MINUTES_PER_SESSION,
+) -> pd.DataFrame:
+    """
+    Generate a deterministic OHLCV frame for ``index``.
+
+    Parameters
+    ----------
+    index : pandas.DatetimeIndex
+        Bar timestamps.
+    seed : int
+        Seed for ``numpy.random.default_rng``.
+    start_price : float
+        Price of the first open.
+    annual_drift, annual_volatility : float
+        Parameters of the geometric random walk.
+    bars_per_year : float
+        Number of bars per year, used to scale drift and volatility per bar.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Frame with ``open``, ``high``, ``low``, ``close`` and ``volume`` columns.
+    """
+    rng = np.random.default_rng(seed)
+    n = len(index)
+    dt = 1.0 / bars_per_year
+    shocks = rng.standard_normal(n)
+    log_returns = (annual_drift - 0.5 * annual_volatility**2) * dt + annual_volatility * math.sqrt(dt) * shocks
+    close = start_price * np.exp(np.cumsum(log_returns))
+    open_ = np.empty(n)
+    open_[0] = start_price
+    open_[1:] = close[:-1]
+    wick = np.abs(rng.standard_normal(n)) * annual_volatility * math.sqrt(dt) * 0.5
+    high = np.maximum(open_, close) * (1.0 + wick)
+    low = np.minimum(open_, close) * (1.0 - wick)
+    volume = rng.integers(1_000, 50_000, size=n)
+
+    return pd.DataFrame(
+        {
+            "open": np.round(open_, 4),
+            "high": np.round(high, 4),
+            "low": np.round(low, 4),
+            "close": np.round(close, 4),
+            "volume": volume.astype(float),
+        },
+        index=index,
+    )
+
+
+def make_stock_data(symbol: str, index: pd.DatetimeIndex, timestep: str, seed: int, **kwargs) -> Data:
+    """Build a ``Data`` object for a synthetic stock."""
+    bars_per_year = 252 * MINUTES_PER_SESSION if timestep == "minute" else 252
+    df = generate_ohlcv(index, seed=seed, bars_per_year=bars_per_year, **kwargs)
+    asset = Asset(symbol=symbol, asset_type=Asset.AssetType.STOCK)
+    return Data(asset, df, timestep=timestep, quote=USD)
+
+
+def make_universe(n_assets: int, dates: Sequence[date], timestep: str = "minute", seed: int = 7) -> List[Data]:
+    """
+    Build ``n_assets`` synthetic stocks named ``SYN000``, ``SYN001``, ...
+
+    Each asset gets its own seed (``seed + i``), start price and drift so cross-sectional rankings change over time.
+    """
+    index = minute_index(dates) if timestep == "minute" else day_index(dates)
+    rng = np.random.default_rng(seed)
+    start_prices = rng.uniform(20.0, 400.0, size=n_assets)
+    drifts = rng.normal(0.05, 0.25, size=n_assets)
+    return [
+        make_stock_data(
+            f"SYN{i:03d}",
+            index,
+            timestep,
+            seed=seed + i,
+            start_price=float(start_prices[i]),
+            annual_drift=float(drifts[i]),
+        )
+        for i in range(n_assets)
+    ]
+
+
+def black_scholes_price(spot, strike, years, rate, volatility, is_call):
+    """Vectorized Black-Scholes price (``years`` may contain zeros at expiry)."""
+    spot = np.asarray(spot, dtype=float)
+    years = np.maximum(np.asarray(years, dtype=float), 1e-9)
+    sqrt_t = np.sqrt(years)
+    d1 = (np.log(spot / strike) + (rate + 0.5 * volatility**2) * years) / (volatility * sqrt_t)
+    d2 = d1 - volatility * sqrt_t
+    discount = np.exp(-rate * years)
+    if is_call:
+        return spot * norm.cdf(d1) - strike * discount * norm.cdf(d2)
+    return strike * discount * norm.cdf(-d2) - spot * norm.cdf(-d1)
+
+
+def make_option_chain(
+    underlying: Data,
+    expirations: Iterable[date],
+    strike_offsets: Sequence[float],
+    strike_step: float = 1.0,
+    volatility: float = 0.18,
+    rate: float = 0.04,
+) -> List[Data]:
+    """
+    Build call and put ``Data`` objects around the underlying for each expiration.
+
+    Strikes are centred on the underlying's first open on the expiration date (rounded to ``strike_step``). Each
+    contract only has bars up to and including its expiration session.
+    """
+    und_df = underlying.df
+    symbol = underlying.asset.symbol
+    contracts = []
+    for expiration in expirations:
+        session_mask = und_df.index.date <= expiration
+        frame = und_df.loc[session_mask]
+        if frame.empty:
+            continue
+        session_open = frame.loc[frame.index.date == expiration, "open"]
+        anchor = float(session_open.iloc[0]) if len(session_open) else float(frame["close"].iloc[-1])
+        atm = round(anchor / strike_step) * strike_step
+        expiry_ts = pd.Timestamp(datetime.combine(expiration, dt_time(16, 0)), tz=NEW_YORK)
+        years = (expiry_ts - frame.index).total_seconds().to_numpy() / (365.0 * 24 * 3600)
+
+        for offset in strike_offsets:
+            strike = atm + offset * strike_step
+            for right in (Asset.OptionRight.CALL, Asset.OptionRight.PUT):
+                is_call = right == Asset.OptionRight.CALL
+                price_close = np.maximum(
+                    black_scholes_price(frame["close"].to_numpy(), strike, years, rate, volatility, is_call), 0.01
+                )
+                price_open = np.maximum(
+                    black_scholes_price(frame["open"].to_numpy(), strike, years, rate, volatility, is_call), 0.01
+                )
+                df = pd.DataFrame(
+                    {
+                        "open": np.round(price_open, 2),
+                        "high": np.round(np.maximum(price_open, price_close) * 1.01, 2),
+                        "low": np.round(np.minimum(price_open, price_close) * 0.99, 2),
+                        "close": np.round(price_close, 2),
+                        "volume": frame["volume"].to_numpy() // 10,
+                    },
+                    index=frame.index,
+                )
+                asset = Asset(
+                    symbol=symbol,
+                    asset_type=Asset.AssetType.OPTION,
+                    expiration=expiration,
+                    strike=strike,
+                    right=right,
+                )
+                contracts.append(Data(asset, df, timestep=underlying.timestep, quote=USD))
+    return contracts
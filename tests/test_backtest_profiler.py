@@ -0,0 +1,110 @@
+import datetime
+import json
+import os
+import time
+
+import pytest
+
+from lumibot.backtesting import PandasDataBacktesting
+from lumibot.strategies import Strategy
+from lumibot.tools.backtest_profiler import (
+    BacktestProfiler,
+    get_backtest_profiler,
+    profile_section,
+    profiled,
+)
+from tests.fixtures import pandas_data_fixture
+
+
+class BuyOnceStrategy(Strategy):
+    def initialize(self):
+        self.sleeptime = "1D"
+
+    def on_trading_iteration(self):
+        if self.first_iteration:
+            order = self.create_order("SPY", 1, "buy")
+            self.submit_order(order)
+
+
+@pytest.fixture
+def global_profiler():
+    profiler = get_backtest_profiler()
+    profiler.reset()
+    yield profiler
+    profiler.stop()
+    profiler.reset()
+
+
+def test_disabled_profiler_records_nothing(global_profiler):
+    with profile_section("data_fetch"):
+        pass
+
+    assert global_profiler.to_dict()["sections"] == {}
+
+
+def test_nested_sections_produce_self_time_and_collapsed_stacks():
+    profiler = BacktestProfiler()
+    profiler.start()
+    with profiler.section("on_trading_iteration"):
+        with profiler.section("data_fetch"):
+            time.sleep(0.002)
+        with profiler.section("data_fetch"):
+            pass
+    profiler.stop()
+
+    report = profiler.to_dict()
+    outer = report["sections"]["on_trading_iteration"]
+    inner = report["sections"]["data_fetch"]
+    assert outer["calls"] == 1
+    assert inner["calls"] == 2
+    assert outer["total_seconds"] >= inner["total_seconds"]
+    assert outer["self_seconds"] < outer["total_seconds"]
+
+    stacks = [line.rsplit(" ", 1)[0] for line in profiler.to_collapsed()]
+    assert "on_trading_iteration;data_fetch" in stacks
+
+
+def test_profiled_decorator_uses_global_profiler(global_profiler):
+    @profiled("cache_load")
+    def load():
+        return 42
+
+    global_profiler.start()
+    assert load() == 42
+    global_profiler.stop()
+
+    assert global_profiler.to_dict()["sections"]["cache_load"]["calls"] == 1
+
+
+def test_run_backtest_profile_writes_reports(pandas_data_fixture, global_profiler):
+    results, strategy = BuyOnceStrategy.run_backtest(
+        datasource_class=PandasDataBacktesting,
+        backtesting_start=datetime.datetime(2019, 3, 1),
+        backtesting_end=datetime.datetime(2019, 3, 8),
+        pandas_data=pandas_data_fixture,
+        show_plot=False,
+        show_tearsheet=False,
+        save_tearsheet=False,
+        show_indicators=False,
+        save_logfile=False,
+        show_progress_bar=False,
+        save_stats_file=False,
+        profile=True,
+    )
+
+    report = strategy.backtest_profile
+    assert report["sections"]["on_trading_iteration"]["calls"] > 0
+    assert "order_processing" in report["sections"]
+    assert "portfolio_valuation" in report["sections"]
+    assert not global_profiler.enabled
+
+    profile_files = [f for f in os.listdir("logs") if f.startswith(strategy._name) and "_profile." in f]
+    try:
+        json_files = [f for f in profile_files if f.endswith(".json")]
+        assert json_files
+        with open(os.path.join("logs", json_files[-1])) as fh:
+            assert "sections" in json.load(fh)
+        assert any(f.endswith(".collapsed") for f in profile_files)
+    finally:
+        for f in profile_files:
+            os.remove(os.path.join("logs", f))
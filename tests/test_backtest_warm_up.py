@@ -0,0 +1,144 @@
+import threading
+import time
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from lumibot.backtesting import PolygonDataBacktesting, YahooDataBacktesting
+from lumibot.backtesting.thetadata_backtesting_pandas import ThetaDataBacktestingPandas
+from lumibot.data_sources import PandasData, data_source_backtesting
+from lumibot.entities import Asset
+from lumibot.strategies.strategy import Strategy
+from lumibot.strategies.strategy_executor import StrategyExecutor
+from lumibot.tools import polygon_helper, thetadata_helper, yahoo_helper
+from tests.test_thetadata_prefetch import _FakeTheta
+from tests.test_yahoo_cache import _day, yahoo  # noqa: F401
+
+
+@pytest.fixture
+def theta_source(monkeypatch):
+    monkeypatch.setattr(ThetaDataBacktestingPandas, "kill_processes_by_name", lambda *args, **kwargs: None)
+    fake = _FakeTheta(fail_strikes={999.0})
+    monkeypatch.setattr(thetadata_helper, "get_price_data", fake)
+    ds = ThetaDataBacktestingPandas(
+        datetime_start=pd.Timestamp("2024-01-02", tz="America/New_York"),
+        datetime_end=pd.Timestamp("2024-01-10", tz="America/New_York"),
+        show_progress_bar=False,
+    )
+    ds._datetime = pd.Timestamp("2024-01-03 10:30", tz="America/New_York").to_pydatetime()
+    ds.fake = fake
+    return ds
+
+
+class _InFlight:
+    """Wraps a download function and records how many calls ran at the same time."""
+
+    def __init__(self, func):
+        self.func = func
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_in_flight = 0
+
+    def __call__(self, *args, **kwargs):
+        with self.lock:
+            self.running += 1
+            self.max_in_flight = max(self.max_in_flight, self.running)
+        try:
+            time.sleep(0.05)
+            return self.func(*args, **kwargs)
+        finally:
+            with self.lock:
+                self.running -= 1
+
+
+def _contracts(strikes):
+    return [
+        Asset("SPY", Asset.AssetType.OPTION, expiration=date(2024, 1, 19), strike=strike, right="call")
+        for strike in strikes
+    ]
+
+
+def test_warm_up_loads_assets_concurrently_before_the_first_iteration(theta_source):
+    contracts = _contracts([470.0, 471.0, 472.0, 473.0, 999.0])
+
+    assert theta_source.warm_up(contracts + contracts[:2]) == 4
+
+    assert theta_source.fake.max_in_flight > 2
+    downloads = len(theta_source.fake.calls)
+    for contract in contracts[:4]:
+        assert theta_source.get_quote(contract).bid == 1.0
+    assert len(theta_source.fake.calls) == downloads
+
+
+def test_warm_up_reports_progress_on_the_progress_bar(monkeypatch):
+    progress_bar = MagicMock()
+    monkeypatch.setattr(data_source_backtesting, "print_progress_bar", progress_bar)
+    source = PandasData(datetime_start=pd.Timestamp("2024-01-02"), datetime_end=pd.Timestamp("2024-01-03"))
+    source._show_progress_bar = True
+    monkeypatch.setattr(source, "_warm_up_asset", lambda asset, timestep: asset.symbol != "MISSING")
+
+    assert source.warm_up([Asset("SPY"), Asset("QQQ"), Asset("MISSING")], timestep="day") == 2
+
+    assert [call.args[:3] for call in progress_bar.call_args_list] == [(1, 0, 3), (2, 0, 3), (3, 0, 3)]
+    assert {call.kwargs["prefix"] for call in progress_bar.call_args_list} == {"Warm-up"}
+    assert source.warm_up([]) == 0
+
+
+def test_executor_warms_up_the_strategy_prefetch_assets():
+    strategy = Strategy.__new__(Strategy)
+    strategy.broker = SimpleNamespace(data_source=MagicMock())
+    strategy._sleeptime = "1D"
+    strategy.prefetch_assets = lambda: ["SPY", Asset("QQQ")]
+    strategy.log_message = MagicMock()
+    executor = SimpleNamespace(strategy=strategy, broker=strategy.broker)
+
+    StrategyExecutor._warm_up_backtest_data(executor)
+
+    strategy.broker.data_source.warm_up.assert_called_once_with([Asset("SPY"), Asset("QQQ")], timestep="day")
+
+    strategy.broker.data_source.warm_up.reset_mock()
+    strategy.prefetch_assets = lambda: []
+    StrategyExecutor._warm_up_backtest_data(executor)
+    strategy.broker.data_source.warm_up.assert_not_called()
+
+
+def test_yahoo_warm_up_downloads_the_assets_concurrently(yahoo, monkeypatch):  # noqa: F811
+    tracker = _InFlight(yahoo.ticker)
+    monkeypatch.setattr(yahoo_helper.yf, "Ticker", tracker)
+    source = YahooDataBacktesting(datetime_start=_day(20), datetime_end=_day(29), show_progress_bar=False)
+    source._datetime = source.to_default_timezone(_day(25))
+    assets = [Asset(f"S{i}") for i in range(6)] + [Asset("BAD")]
+
+    assert source.warm_up(assets, timestep="day") == 6
+
+    assert tracker.max_in_flight > 1
+    downloads = len(yahoo.calls)
+    assert len(source.get_historical_prices(Asset("S3"), 5, timestep="day").df) == 5
+    assert len(yahoo.calls) == downloads
+
+
+def test_polygon_warm_up_downloads_the_assets_concurrently(monkeypatch):
+    def fake_download(api_key, asset, start, end, timespan="day", quote_asset=None):
+        index = pd.bdate_range(start.date(), end.date(), tz="America/New_York")
+        return pd.DataFrame(
+            {"open": 1.0, "high": 2.0, "low": 0.5, "close": 1.5, "volume": 100.0}, index=index
+        ) if asset.symbol != "MISSING" else None
+
+    tracker = _InFlight(fake_download)
+    monkeypatch.setattr(polygon_helper, "get_price_data_from_polygon", tracker)
+    source = PolygonDataBacktesting(
+        datetime_start=pd.Timestamp("2024-01-02", tz="America/New_York"),
+        datetime_end=pd.Timestamp("2024-01-31", tz="America/New_York"),
+        api_key="test",
+        show_progress_bar=False,
+    )
+    source._datetime = pd.Timestamp("2024-01-10 09:30", tz="America/New_York").to_pydatetime()
+    assets = [Asset(symbol) for symbol in ("SPY", "QQQ", "IWM", "DIA", "MISSING")]
+
+    assert source.warm_up(assets, timestep="day") == 4
+
+    assert tracker.max_in_flight > 1
+    assert source.find_asset_in_data_store(Asset("QQQ")) is not None
@@ -0,0 +1,107 @@
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+
+from lumibot.data_sources import PandasData
+from lumibot.entities import Asset, BarArrays, Bars
+from lumibot.entities.data import Data
+
+
+def _frame(n=30, dividends=False):
+    idx = pd.date_range("2024-01-02 14:30", periods=n, freq="min", tz="UTC")
+    close = 100 + np.arange(n) * 0.5
+    df = pd.DataFrame(
+        {"open": close - 0.1, "high": close + 0.3, "low": close - 0.3, "close": close, "volume": 1000.0},
+        index=idx,
+    )
+    if dividends:
+        df["dividend"] = 0.0
+        df.iloc[10, df.columns.get_loc("dividend")] = 0.25
+    return df
+
+
+def _data_source(df):
+    asset = Asset("SPY")
+    quote = Asset("USD", asset_type=Asset.AssetType.FOREX)
+    data = Data(asset=asset, df=df, quote=quote, timestep="minute")
+    data_source = PandasData(
+        datetime_start=df.index[0].to_pydatetime(),
+        datetime_end=df.index[-1].to_pydatetime() + timedelta(minutes=2),
+        pandas_data={(asset, quote): data},
+        show_progress_bar=False,
+    )
+    data_source._datetime = df.index[20].to_pydatetime()
+    return data_source, data, asset, quote
+
+
+@pytest.mark.parametrize("dividends", [False, True])
+def test_derived_columns_are_computed_when_the_frame_is_read(dividends):
+    df = _frame(dividends=dividends)
+    bars = Bars(df, "test", Asset("SPY"))
+
+    assert "return" not in df.columns
+    assert bars.get_last_price() == df["close"].iloc[-1]
+    assert "return" not in df.columns
+
+    expected = df["close"].pct_change()
+    if dividends:
+        expected = df["dividend"] / df["close"] + expected
+    pd.testing.assert_series_equal(bars.df["return"], expected, check_names=False)
+    assert ("price_change" in bars.df.columns) == dividends
+
+
+def test_polars_bars_get_derived_columns_in_both_modes():
+    df = pl.from_pandas(_frame(dividends=True).reset_index().rename(columns={"index": "datetime"}))
+    expected = Bars(_frame(dividends=True), "test", Asset("SPY")).df["return"].to_numpy()
+    for return_polars in (True, False):
+        bars = Bars(df, "test", Asset("SPY"), return_polars=return_polars)
+        np.testing.assert_allclose(bars.df["return"].to_numpy(), expected, equal_nan=True)
+
+
+def test_arrays_share_memory_with_the_frame():
+    df = _frame(dividends=True)
+    bars = Bars(df, "test", Asset("SPY"))
+    arrays = bars.arrays
+
+    assert np.shares_memory(arrays.close, df["close"].to_numpy())
+    assert arrays["datetime"][0] == np.datetime64("2024-01-02T14:30")
+    assert len(arrays) == len(df) and "return" in arrays
+    np.testing.assert_allclose(arrays["return"], bars.df["return"].to_numpy(), equal_nan=True)
+    np.testing.assert_allclose(arrays.price_change, bars.df["price_change"].to_numpy(), equal_nan=True)
+
+
+def test_data_arrays_are_read_only_views_matching_get_bars():
+    df = _frame()
+    data_source, data, asset, quote = _data_source(df)
+    now = data_source.get_datetime()
+
+    arrays = data.get_bars_arrays(now, length=5, timestep="minute")
+    expected = data.get_bars(now, length=5, timestep="minute")
+    for name in ("open", "high", "low", "close", "volume"):
+        np.testing.assert_array_equal(arrays[name], expected[name].to_numpy())
+    np.testing.assert_array_equal(arrays.datetime, expected.index.tz_convert("UTC").tz_localize(None).to_numpy())
+    assert np.shares_memory(arrays.close, data.datalines["close"].dataline)
+    with pytest.raises(ValueError):
+        arrays.close[0] = 0.0
+
+    # Aggregated timesteps go through get_bars.
+    five_minutes = data.get_bars_arrays(now, length=2, timestep="5 minutes")
+    np.testing.assert_array_equal(
+        five_minutes.close, data.get_bars(now, length=2, timestep="5 minutes")["close"].to_numpy()
+    )
+
+
+def test_get_historical_prices_can_return_arrays():
+    df = _frame()
+    data_source, data, asset, quote = _data_source(df)
+
+    arrays = data_source.get_historical_prices(asset, 10, "minute", quote=quote, return_numpy=True)
+    bars = data_source.get_historical_prices(asset, 10, "minute", quote=quote)
+
+    assert isinstance(arrays, BarArrays)
+    np.testing.assert_array_equal(arrays.close, bars.df["close"].to_numpy())
+    np.testing.assert_allclose(arrays["return"][1:], bars.df["return"].to_numpy()[1:])
+    assert arrays.get_last_price() == bars.get_last_price()
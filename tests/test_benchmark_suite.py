@@ -0,0 +1,73 @@
+from datetime import date
+
+import pandas as pd
+
+from tests.performance import benchmark_suite
+from tests.performance.synthetic_data import (
+    MINUTES_PER_SESSION,
+    make_option_chain,
+    make_stock_data,
+    make_universe,
+    minute_index,
+    trading_dates,
+)
+
+
+def test_synthetic_ohlcv_is_deterministic_and_consistent():
+    dates = trading_dates(date(2024, 1, 2), 2)
+    index = minute_index(dates)
+
+    first = make_stock_data("SYN", index, "minute", seed=5).df
+    second = make_stock_data("SYN", index, "minute", seed=5).df
+
+    pd.testing.assert_frame_equal(first, second)
+    assert len(first) == 2 * MINUTES_PER_SESSION
+    assert (first["high"] >= first[["open", "close"]].max(axis=1)).all()
+    assert (first["low"] <= first[["open", "close"]].min(axis=1)).all()
+
+
+def test_universe_assets_differ_per_symbol():
+    dates = trading_dates(date(2024, 1, 2), 1)
+    universe = make_universe(3, dates, timestep="minute", seed=1)
+
+    assert [data.asset.symbol for data in universe] == ["SYN000", "SYN001", "SYN002"]
+    assert universe[0].df["close"].iloc[-1] != universe[1].df["close"].iloc[-1]
+
+
+def test_option_chain_expires_with_session():
+    dates = trading_dates(date(2024, 1, 2), 2)
+    underlying = make_stock_data("SYNO", minute_index(dates), "minute", seed=3, start_price=450.0)
+
+    chain = make_option_chain(underlying, dates[:1], strike_offsets=[-1, 0, 1])
+
+    assert len(chain) == 6
+    for data in chain:
+        assert data.asset.expiration == dates[0]
+        assert data.df.index[-1].date() == dates[0]
+        assert (data.df["close"] > 0).all()
+
+
+def test_compare_to_baseline_flags_latency_and_rss_regressions():
+    baseline = {
+        "profile": "full",
+        "workloads": {"bracket_churn": {"mean_iteration_ms": 1.0, "peak_rss_mb": 400.0}},
+    }
+    within = {
+        "profile": "full",
+        "workloads": {"bracket_churn": {"mean_iteration_ms": 1.2, "peak_rss_mb": 410.0}},
+    }
+    slower = {
+        "profile": "full",
+        "workloads": {"bracket_churn": {"mean_iteration_ms": 2.0, "peak_rss_mb": 600.0}},
+    }
+
+    assert benchmark_suite.compare_to_baseline(within, baseline) == []
+    assert len(benchmark_suite.compare_to_baseline(slower, baseline)) == 2
+
+
+def test_smoke_workload_runs_offline():
+    result = benchmark_suite.run_workload("bracket_churn", profile="smoke")
+
+    assert result["iterations"] > 0
+    assert result["mean_iteration_ms"] > 0
+    assert result["peak_rss_mb"] > 0
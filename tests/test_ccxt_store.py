@@ -1,8 +1,11 @@
-from lumibot.tools import CcxtCacheDB
+from lumibot.tools import CcxtCacheDB, ccxt_data_store
 import pytest
+import ccxt
 import duckdb
+import pandas as pd
 from datetime import datetime
 import os
+import threading
 
 
 # PYTHONWARNINGS="ignore::DeprecationWarning"; pytest test/test_ccxt_store.py
@@ -13,11 +16,9 @@ import os
                          ])
 def test_cache_download_data(exchange_id:str, symbol:str, timeframe:str, start:datetime, end:datetime)->None:
     cache = CcxtCacheDB(exchange_id)
-    cache_file_path = cache.get_cache_file_name(symbol,timeframe)
 
-    # Remove cache file if exists.
-    if os.path.exists(cache_file_path):
-        os.remove(cache_file_path)
+    # Remove cached data if exists.
+    cache.delete_data(symbol, timeframe)
 
     # Download data and store in cache.
     try:
@@ -25,7 +26,7 @@ def test_cache_download_data(exchange_id:str, symbol:str, timeframe:str, start:d
     except Exception as e:
         pytest.skip(f"Failed to download data from {exchange_id}: {str(e)}")
 
-    assert os.path.exists(cache_file_path)
+    assert os.path.exists(cache.get_cache_file_name())
 
     # Counting data for the requested time period.
     dt = end - start
@@ -61,11 +62,9 @@ def test_cache_download_data_without_overap(exchange_id:str, symbol:str, timefra
     """
 
     cache = CcxtCacheDB(exchange_id)
-    cache_file_path = cache.get_cache_file_name(symbol,timeframe)
 
     # Read the cache_dt_ranges table before caching new data to duckdb
-    with duckdb.connect(cache_file_path) as con:
-        df_down_range = con.execute("SELECT * from cache_dt_ranges").fetch_df()
+    df_down_range = cache.get_cache_ranges(symbol, timeframe)
     prev_start_dt = df_down_range.iloc[0].start_dt
     prev_end_dt = df_down_range.iloc[0].end_dt
 
@@ -76,8 +75,7 @@ def test_cache_download_data_without_overap(exchange_id:str, symbol:str, timefra
         pytest.skip(f"Failed to download data from {exchange_id}: {str(e)}")
 
     # Read the cache_dt_ranges table after caching new data to duckdb
-    with duckdb.connect(cache_file_path) as con:
-        df_down_range = con.execute("SELECT * from cache_dt_ranges").fetch_df()
+    df_down_range = cache.get_cache_ranges(symbol, timeframe)
 
     # Verify that the existing data range has been updated with the new data range
     # The number of data ranges should be 1.
@@ -108,6 +106,157 @@ def test_cache_download_data_without_overap(exchange_id:str, symbol:str, timefra
     # The first time of the cached data must be equal to or less than the requested time.
     assert df_cache.index.min() <= start
 
-    # Remove cache file if exists.
-    if os.path.exists(cache_file_path):
-        os.remove(cache_file_path)
\ No newline at end of file
+    # Remove cached data.
+    cache.delete_data(symbol, timeframe)
+
+# ---- Offline tests against a fake exchange ----
+
+DAY_MS = 86_400_000
+FAKE_SYMBOLS = {"BTC/USDT": 30_000.0, "ETH/USDT": 2_000.0, "SOL/USDT": 20.0}
+
+
+class _FakeExchange:
+    has = {"fetchOHLCV": True}
+    fetches = []
+
+    def __init__(self):
+        self.markets = {}
+
+    def load_markets(self):
+        self.markets = {symbol: {} for symbol in FAKE_SYMBOLS}
+
+    def parse8601(self, text):
+        return int(pd.Timestamp(text, tz="UTC").value // 1_000_000)
+
+    def fetch_ohlcv(self, symbol, timeframe, since=None, limit=None, params=None):
+        self.fetches.append(symbol)
+        last = self.parse8601("2023-03-31 00:00:00")
+        candles = []
+        # Pages of 15 candles, so downloads need several requests like they do against a real exchange.
+        for ts in range(since - since % DAY_MS, min(since + 15 * DAY_MS, last + DAY_MS), DAY_MS):
+            day = (ts - self.parse8601("2023-01-01 00:00:00")) // DAY_MS
+            if day == 40:  # one missing candle, filled by the cache
+                continue
+            price = FAKE_SYMBOLS[symbol] + day
+            candles.append([ts, price, price + 1, price - 1, price, 10.0])
+        return candles
+
+
+@pytest.fixture
+def fake_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(ccxt_data_store, "LUMIBOT_CACHE_FOLDER", str(tmp_path))
+    monkeypatch.setattr(ccxt, "fakex", _FakeExchange, raising=False)
+    _FakeExchange.fetches = []
+    yield CcxtCacheDB("fakex")
+    ccxt_data_store.close_connections()
+
+
+def test_all_symbols_share_one_store(fake_cache, tmp_path):
+    data = fake_cache.download_ohlcv_for_symbols(list(FAKE_SYMBOLS), "1d", datetime(2023, 2, 1), datetime(2023, 2, 20))
+
+    assert [f for f in os.listdir(tmp_path / "fakex") if f.endswith(".duckdb")] == ["fakex_ohlcv.duckdb"]
+    assert set(data) == set(FAKE_SYMBOLS)
+    btc = data["BTC/USDT"]
+    assert btc.index.min() == datetime(2023, 2, 1) and btc.index.max() == datetime(2023, 2, 20)
+    assert list(btc.columns) == ["open", "high", "low", "close", "volume", "missing"]
+    assert btc.loc[datetime(2023, 2, 10), "missing"] == 1
+    assert btc.loc[datetime(2023, 2, 10), "close"] == btc.loc[datetime(2023, 2, 9), "close"]
+    assert data["SOL/USDT"].loc[datetime(2023, 2, 2), "close"] == 20.0 + 32
+
+    # Everything is cached now: a second bulk load is one query and no downloads.
+    _FakeExchange.fetches.clear()
+    again = fake_cache.download_ohlcv_for_symbols(list(FAKE_SYMBOLS), "1d", datetime(2023, 2, 5), datetime(2023, 2, 6))
+    assert _FakeExchange.fetches == []
+    assert len(again["ETH/USDT"]) == 2
+
+
+def test_extending_a_range_downloads_only_the_gap(fake_cache):
+    fake_cache.download_ohlcv("ETH/USDT", "1d", datetime(2023, 2, 1), datetime(2023, 2, 10))
+    _FakeExchange.fetches.clear()
+    df = fake_cache.download_ohlcv("ETH/USDT", "1d", datetime(2023, 2, 5), datetime(2023, 2, 25))
+
+    assert _FakeExchange.fetches == ["ETH/USDT"]
+    assert df.index.is_unique
+    assert df.index.min() == datetime(2023, 2, 5) and df.index.max() == datetime(2023, 2, 25)
+    ranges = fake_cache.get_cache_ranges("ETH/USDT", "1d")
+    assert len(ranges) == 1 and ranges["start_dt"].iat[0] == datetime(2023, 2, 1)
+
+    fake_cache.delete_data("ETH/USDT", "1d")
+    with pytest.raises(Exception):
+        fake_cache.get_data_from_cache("ETH/USDT", "1d", datetime(2023, 2, 1), datetime(2023, 2, 10))
+
+
+def test_legacy_per_symbol_files_are_imported(fake_cache):
+    legacy_file = fake_cache.get_cache_file_name("BTC/USDT", "1d")
+    candles = pd.DataFrame({
+        "datetime": pd.date_range("2022-06-01", periods=5, freq="D"),
+        "open": 1.0, "high": 2.0, "low": 0.5, "close": [1.0, 1.1, 1.2, 1.3, 1.4], "volume": 3.0, "missing": 0,
+    })
+    with duckdb.connect(legacy_file) as con:
+        con.execute("""CREATE TABLE candles (datetime DATETIME, open DECIMAL, high DECIMAL, low DECIMAL,
+                       close DECIMAL, volume DECIMAL, missing INTEGER)""")
+        con.execute("CREATE TABLE cache_dt_ranges (id STRING, start_dt DATETIME, end_dt DATETIME)")
+        con.register("candles_df", candles)
+        con.execute("INSERT INTO candles SELECT * FROM candles_df")
+        con.execute("INSERT INTO cache_dt_ranges VALUES ('a', '2022-06-01', '2022-06-05 23:59:59')")
+
+    df = fake_cache.download_ohlcv("BTC/USDT", "1d", datetime(2022, 6, 2), datetime(2022, 6, 4))
+    assert _FakeExchange.fetches == []
+    assert df["close"].tolist() == [1.1, 1.2, 1.3]
+
+
+def test_concurrent_reads_share_the_connection(fake_cache):
+    expected = fake_cache.download_ohlcv_for_symbols(list(FAKE_SYMBOLS), "1d", datetime(2023, 1, 1), datetime(2023, 3, 1))
+    other = CcxtCacheDB("fakex")
+    assert other._con is fake_cache._con
+
+    errors = []
+
+    def read():
+        try:
+            for _ in range(20):
+                data = other.get_data_for_symbols(list(FAKE_SYMBOLS), "1d", datetime(2023, 1, 1), datetime(2023, 3, 1))
+                for symbol, df in data.items():
+                    pd.testing.assert_frame_equal(df, expected[symbol])
+        except Exception as e:  # noqa
+            errors.append(e)
+
+    threads = [threading.Thread(target=read) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+
+def test_backtesting_data_loads_the_universe_with_one_query(fake_cache, mocker):
+    from lumibot.data_sources import CcxtBacktestingData
+    from lumibot.entities import Asset
+
+    data_source = CcxtBacktestingData(datetime(2023, 2, 1), datetime(2023, 2, 20), exchange_id="fakex")
+    bulk_reads = mocker.spy(data_source.cache_db, "get_data_for_symbols")
+    usdt = Asset("USDT", asset_type="crypto")
+    universe = [(Asset(symbol.split("/")[0], asset_type="crypto"), usdt) for symbol in FAKE_SYMBOLS]
+
+    data_source._datetime = data_source.datetime_start + pd.Timedelta(days=5)
+    bars = data_source.get_bars(universe, 3, timestep="day")
+
+    assert bulk_reads.call_count == 1
+    assert len(bulk_reads.call_args.args[0]) == 3
+    assert all(len(bars[asset].df) == 3 for asset in universe)
+
+    bulk_reads.reset_mock()
+    price = data_source.get_last_price(universe[2][0], quote=usdt, timestep="day")
+    assert bulk_reads.call_count == 0
+    assert price == bars[universe[2]].df["close"].iloc[-1]
+
+
+def test_instances_reopen_the_connection_after_close_connections(fake_cache):
+    fake_cache.download_ohlcv("BTC/USDT", "1d", datetime(2023, 2, 1), datetime(2023, 2, 10))
+
+    ccxt_data_store.close_connections()
+
+    df = fake_cache.get_data_from_cache("BTC/USDT", "1d", datetime(2023, 2, 1), datetime(2023, 2, 10))
+    assert len(df) == 10
+    fake_cache.download_ohlcv("BTC/USDT", "1d", datetime(2023, 2, 1), datetime(2023, 2, 15))
+    assert fake_cache.get_cache_ranges("BTC/USDT", "1d")["end_dt"].max() >= datetime(2023, 2, 15)
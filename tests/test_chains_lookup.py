@@ -0,0 +1,89 @@
+from datetime import date, datetime
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from lumibot.components.options_helper import OptionsHelper
+from lumibot.data_sources.data_source import DataSource
+from lumibot.entities import Asset, Chains
+
+
+def _chains():
+    return Chains(
+        {
+            "Multiplier": 100,
+            "Exchange": "SMART",
+            "Chains": {
+                # Unsorted keys and strikes, duplicates and strings, like some broker payloads.
+                "CALL": {"2024-03-15": [110, "100", 105.0, 100], "2024-01-19": [95, 90], "20240216": [100]},
+                "PUT": {"2024-01-19": [85.0, 90.0]},
+            },
+        }
+    )
+
+
+def test_sorted_lookups():
+    chains = _chains()
+
+    assert chains.expiration_items() == [
+        ("2024-01-19", date(2024, 1, 19)),
+        ("20240216", date(2024, 2, 16)),
+        ("2024-03-15", date(2024, 3, 15)),
+    ]
+    assert chains.expiration_on_or_after(date(2024, 1, 20)) == date(2024, 2, 16)
+    assert chains.expiration_on_or_after(datetime(2024, 3, 15, 10, 0)) == date(2024, 3, 15)
+    assert chains.expiration_on_or_after(date(2024, 3, 16)) is None
+    assert [key for key, _ in chains.expirations_on_or_after(date(2024, 2, 1))] == ["20240216", "2024-03-15"]
+
+    strikes = chains.strike_array("2024-03-15")
+    np.testing.assert_array_equal(strikes, [100.0, 105.0, 110.0])
+    np.testing.assert_array_equal(chains.strike_array(date(2024, 2, 16)), [100.0])
+    assert len(chains.strike_array(date(2024, 2, 17))) == 0
+    with pytest.raises(ValueError):
+        strikes[0] = 1.0
+
+    np.testing.assert_array_equal(chains.strikes_in_range(date(2024, 3, 15), 101, 110), [105.0, 110.0])
+    assert chains.nearest_strike("2024-03-15", 102.4) == 100.0
+    assert chains.nearest_strike("2024-03-15", 102.5) == 100.0  # ties go to the lower strike
+    assert chains.nearest_strike("2024-03-15", 500) == 110.0
+    assert chains.nearest_strike("2024-01-19", 50, "put") == 85.0
+    np.testing.assert_array_equal(chains.all_strikes(), [85.0, 90.0, 95.0, 100.0, 105.0, 110.0])
+
+    # The dict interface is unchanged.
+    assert chains["Chains"]["CALL"]["2024-03-15"] == [110, "100", 105.0, 100]
+    assert chains.strikes("2024-01-19", "PUT") == [85.0, 90.0]
+
+
+def test_sorted_view_follows_changes_to_the_chain():
+    chains = _chains()
+    assert chains.expiration_on_or_after(date(2024, 3, 16)) is None
+
+    chains["Chains"]["CALL"]["2024-04-19"] = [120.0]
+    assert chains.expiration_on_or_after(date(2024, 3, 16)) == date(2024, 4, 19)
+
+    chains["Chains"]["CALL"] = {"2025-01-17": [50.0]}
+    assert chains.expiration_items() == [("2025-01-17", date(2025, 1, 17))]
+
+
+def test_data_source_get_strikes_uses_the_sorted_arrays():
+    data_source = MagicMock(spec=DataSource)
+    data_source.get_chains.return_value = _chains()
+    assert DataSource.get_strikes(data_source, Asset("SPY")) == [85.0, 90.0, 95.0, 100.0, 105.0, 110.0]
+
+    # Plain dict chains keep the set-based path.
+    data_source.get_chains.return_value = {"Chains": {"CALL": {"2024-01-19": [95, 90]}, "PUT": {"2024-01-19": [85, 90]}}}
+    assert DataSource.get_strikes(data_source, Asset("SPY")) == [85, 90, 95]
+
+
+def test_expiration_lookup_with_chains_validates_the_nearest_strike():
+    strategy = MagicMock()
+    strategy.get_last_price.return_value = 104.0
+    strategy.get_quote.return_value = MagicMock(bid=1.0, ask=1.2)
+    helper = OptionsHelper(strategy)
+
+    expiry = helper.get_expiration_on_or_after_date(date(2024, 2, 1), _chains(), "call", Asset("SPY"))
+
+    assert expiry == date(2024, 2, 16)
+    tested = strategy.get_quote.call_args.args[0]
+    assert (tested.expiration, tested.strike) == (date(2024, 2, 16), 100.0)
@@ -0,0 +1,103 @@
+import datetime
+import logging
+import time
+
+import pandas as pd
+import pytz
+
+from lumibot.entities import Asset
+from lumibot.strategies import Strategy
+from lumibot.tools.chart_series_store import ASSET_COLUMNS, asset_metadata
+
+NY = pytz.timezone("America/New_York")
+
+
+def _make_strategy_stub():
+    strat = Strategy.__new__(Strategy)
+    strat.logger = logging.getLogger("chart_series_store_tests")
+    strat.portfolio_value = 1_000
+    strat.get_datetime = lambda: NY.localize(datetime.datetime(2024, 1, 2, 9, 30))
+    return strat
+
+
+def _minute(i):
+    return NY.localize(datetime.datetime(2024, 1, 2, 9, 30)) + datetime.timedelta(minutes=i)
+
+
+def test_duplicate_markers_are_skipped():
+    strat = _make_strategy_stub()
+    spy = Asset("SPY")
+
+    assert strat.add_marker("buy", 10.0, dt=_minute(0), asset=spy)["asset_symbol"] == "SPY"
+    assert strat.add_marker("buy", 11.0, dt=_minute(0), asset=spy) is None
+    # Any difference in the key (marker symbol, plot or time) is a new marker.
+    assert strat.add_marker("buy", 11.0, dt=_minute(0), symbol="star") is not None
+    assert strat.add_marker("buy", 11.0, dt=_minute(0), plot_name="signals") is not None
+    assert strat.add_marker("buy", 11.0, dt=_minute(1)) is not None
+
+    assert len(strat.get_markers_df()) == 4
+    assert strat._chart_markers_list[0]["value"] == 10.0
+
+
+def test_dataframes_match_list_of_dicts_layout():
+    strat = _make_strategy_stub()
+    option = Asset("AAPL", asset_type="option", expiration=datetime.date(2024, 12, 20), strike=150, right="CALL")
+    for i in range(5):
+        asset = option if i % 2 else None
+        strat.add_line("sma", 100.0 + i, dt=_minute(i), asset=asset, color="red")
+        strat.add_marker("signal", 100.0 + i, dt=_minute(i), asset=asset, size=5)
+
+    lines = strat.get_lines_df()
+    expected_lines = pd.DataFrame(list(strat._chart_lines_list))
+    pd.testing.assert_frame_equal(lines, expected_lines)
+    assert list(lines.columns[-len(ASSET_COLUMNS):]) == list(ASSET_COLUMNS)
+    assert lines.loc[1, "asset_display_name"] == str(option)
+    assert lines.loc[0, "asset_symbol"] is None
+
+    markers = strat.get_markers_df()
+    pd.testing.assert_frame_equal(markers, pd.DataFrame(list(strat._chart_markers_list)))
+    assert markers["timestamp"].tolist() == [_minute(i).timestamp() for i in range(5)]
+
+
+def test_asset_metadata_is_interned():
+    strat = _make_strategy_stub()
+    spy = Asset("SPY")
+    for i in range(100):
+        strat.add_line("price", 400.0 + i, dt=_minute(i), asset=spy)
+        strat.add_line("price", 400.0 + i, dt=_minute(i), asset=Asset("SPY"))
+
+    store = strat._chart_lines_list
+    # The "no asset" entry plus one shared entry for both (equal) SPY objects.
+    assert len(store._asset_table) == 2
+    assert store._asset_table[1] == asset_metadata(spy)
+
+
+def test_list_assignment_and_returned_frame_copy():
+    strat = _make_strategy_stub()
+    strat._chart_markers_list = [
+        {"datetime": _minute(0), "timestamp": _minute(0).timestamp(), "name": "a", "symbol": "circle",
+         "plot_name": "default_plot", "value": 1.0, "asset_symbol": "QQQ"},
+    ]
+    assert strat.add_marker("a", 2.0, dt=_minute(0)) is None
+    assert strat._chart_markers_list[0]["asset_symbol"] == "QQQ"
+
+    df = strat.get_markers_df()
+    df["value"] = 0.0
+    assert strat.get_markers_df()["value"].tolist() == [1.0]
+
+
+def test_adding_markers_does_not_slow_down():
+    strat = _make_strategy_stub()
+    spy = Asset("SPY")
+
+    def add(start, count):
+        t0 = time.perf_counter()
+        for i in range(start, start + count):
+            strat.add_marker("tick", 1.0, dt=_minute(i), asset=spy)
+        return time.perf_counter() - t0
+
+    first = add(0, 2_000)
+    add(2_000, 10_000)
+    later = add(12_000, 2_000)
+    # With the old linear duplicate scan the last batch was ~7x slower than the first.
+    assert later < first * 3 + 0.05
@@ -0,0 +1,141 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from lumibot.entities import Asset
+from lumibot.entities.data import Data
+
+NY = "America/New_York"
+
+
+def _reference_repair(df, idx, timestep):
+    """The eager pandas reindex/fill pipeline that ``Data.repair_times_and_fill`` used to run."""
+    df = df[~df.index.duplicated(keep="first")]
+    source = df
+    df = df.reindex(idx, method="ffill")
+    if "volume" in df.columns:
+        df.loc[df["volume"].isna(), "volume"] = 0
+    else:
+        df["volume"] = None
+
+    quote_cols = [col for col in ["bid", "ask", "bid_size", "ask_size"] if col in df.columns]
+    minute = timestep == "minute"
+    if minute and quote_cols:
+        boundaries = df.index.to_series().diff() > pd.Timedelta(minutes=120)
+        for col in quote_cols:
+            clear_mask = boundaries & source[col].reindex(df.index).isna()
+            if clear_mask.any():
+                df.loc[clear_mask, col] = float("nan")
+
+    other = [col for col in df.columns if col not in ["open", "high", "low"] and col not in quote_cols]
+    df[other] = df[other].ffill()
+    if minute and quote_cols:
+        segments = (df.index.to_series().diff() > pd.Timedelta(minutes=120)).cumsum()
+        for col in quote_cols:
+            df[col] = df.groupby(segments)[col].ffill()
+
+    for col in ["close", "open", "high", "low"]:
+        if col not in df.columns:
+            df[col] = None
+    for col in ["open", "high", "low"]:
+        mask = df[col].isna()
+        if mask.any():
+            df[col] = df[col].where(~mask, df["close"])
+    return df
+
+
+def _minute_frame():
+    sessions = [
+        pd.date_range(f"2024-01-0{day} 09:30", periods=6, freq="min", tz=NY) for day in (2, 3)
+    ]
+    raw_index = sessions[0].append(sessions[1]).delete([2, 8])
+    # A pre-market row that the reindex forward-fills from.
+    raw_index = raw_index.insert(6, pd.Timestamp("2024-01-03 08:00", tz=NY))
+    n = len(raw_index)
+    rng = np.random.default_rng(3)
+    close = rng.uniform(10, 11, n)
+    close[[3, 4]] = np.nan
+    frame = pd.DataFrame(
+        {
+            "open": np.where(np.arange(n) % 4 == 0, np.nan, close - 0.01),
+            "high": close + 0.05,
+            "low": close - 0.05,
+            "close": close,
+            "volume": np.where(np.arange(n) % 3 == 0, np.nan, 100.0),
+            "bid": np.where(np.arange(n) % 5 == 1, np.nan, close - 0.02),
+            "ask": close + 0.02,
+            "bid_size": np.arange(n, dtype=np.int64),
+        },
+        index=raw_index,
+    )
+    idx = sessions[0].append(sessions[1])
+    return frame, idx
+
+
+@pytest.mark.parametrize("drop_columns", [[], ["volume"], ["open", "high"], ["bid", "ask", "bid_size"]])
+def test_lazy_repair_matches_eager_pipeline(drop_columns):
+    frame, idx = _minute_frame()
+    frame = frame.drop(columns=drop_columns)
+    data = Data(Asset("SPY"), frame.copy(), timestep="minute")
+    data.repair_times_and_fill(idx)
+
+    expected = _reference_repair(Data(Asset("SPY"), frame.copy(), timestep="minute").df, idx, "minute")
+    pd.testing.assert_frame_equal(data.df, expected, check_freq=False)
+
+
+def test_lazy_repair_matches_eager_pipeline_for_daily_quotes():
+    index = pd.DatetimeIndex(["2024-09-19 17:00", "2024-09-20 17:00", "2024-09-23 17:00"], tz=NY)
+    frame = pd.DataFrame(
+        {"close": [1.0, np.nan, 1.2], "bid": [0.9, np.nan, 1.1], "ask": [1.1, 1.2, np.nan], "volume": [1, 2, 3]},
+        index=index,
+    )
+    idx = pd.DatetimeIndex(["2024-09-19 17:00", "2024-09-20 09:30", "2024-09-20 17:00", "2024-09-23 17:00"], tz=NY)
+    data = Data(Asset("SPY"), frame.copy(), timestep="day")
+    data.repair_times_and_fill(idx)
+
+    expected = _reference_repair(Data(Asset("SPY"), frame.copy(), timestep="day").df, idx, "day")
+    pd.testing.assert_frame_equal(data.df, expected, check_freq=False)
+
+
+def test_columns_materialize_only_when_read():
+    frame, idx = _minute_frame()
+    data = Data(Asset("SPY"), frame, timestep="minute")
+    data.repair_times_and_fill(idx)
+
+    assert "bid" in data.datalines
+    assert list(dict.keys(data.datalines)) == []
+    assert not hasattr(data, "iter_index_dict")
+
+    dt = idx[9]
+    assert data.get_last_price(dt) == data.datalines["open"].dataline[9]
+    assert set(dict.keys(data.datalines)) == {"open", "close"}
+    assert data._fill_pending
+
+    # Reading a column attribute or the frame still works and completes the repair.
+    assert data.close[9] == data.df["close"].iloc[9]
+    assert not data._fill_pending
+
+
+def test_get_iter_count_returns_last_bar_at_or_before():
+    frame, idx = _minute_frame()
+    data = Data(Asset("SPY"), frame, timestep="minute")
+    data.repair_times_and_fill(idx)
+
+    assert data.get_iter_count(idx[7]) == 7
+    assert data.get_iter_count(idx[7] + pd.Timedelta(seconds=30)) == 7
+    assert data.get_iter_count(idx[-1] + pd.Timedelta(days=1)) == len(idx) - 1
+    assert data.get_iter_count(idx[7].tz_convert("UTC").to_pydatetime()) == 7
+
+
+def test_replacing_the_frame_drops_the_iteration_state():
+    frame, idx = _minute_frame()
+    data = Data(Asset("SPY"), frame, timestep="minute")
+    data.repair_times_and_fill(idx)
+    dt = idx[7]
+    assert data.get_iter_count(dt) == 7
+
+    # The same datetime sits at a different position in the replacement frame.
+    data.df = data.df.iloc[5:]
+
+    assert data.get_iter_count(dt) == 2
+    assert data.get_last_price(dt) == data.df["open"].iloc[2]
@@ -0,0 +1,147 @@
+from datetime import date, datetime
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from lumibot.brokers import Broker
+from lumibot.components.options_helper import OptionsHelper
+from lumibot.data_sources.data_source import DataSource
+from lumibot.entities import Asset
+from lumibot.tools import greeks_cache
+from lumibot.tools.greeks_cache import GreeksCache
+
+EXPIRATION = date(2024, 3, 15)
+
+
+class _DataSource(DataSource):
+    def get_chains(self, asset, quote=None):
+        return {}
+
+    def get_last_price(self, asset, quote=None, exchange=None):
+        return None
+
+    def get_historical_prices(self, asset, length, timestep="", timeshift=None, quote=None, exchange=None,
+                              include_after_hours=True):
+        return None
+
+
+@pytest.fixture
+def data_source(mocker):
+    ds = _DataSource()
+    mocker.patch.object(ds, "get_datetime", return_value=ds.tzinfo.localize(datetime(2024, 2, 1, 10, 30)))
+    return ds
+
+
+def _option(strike, right):
+    return Asset("SPY", asset_type="option", expiration=EXPIRATION, strike=strike, right=right)
+
+
+def _chain():
+    options, prices = [], []
+    for strike in range(470, 531, 5):
+        for right in ("CALL", "PUT"):
+            options.append(_option(strike, right))
+            intrinsic = max(500 - strike, 0) if right == "CALL" else max(strike - 500, 0)
+            prices.append(round(intrinsic + 4.0 + abs(500 - strike) * 0.05, 2))
+    return options, prices
+
+
+def test_cache_evicts_least_recently_used_and_counts():
+    cache = GreeksCache(max_size=3)
+    for key in "abc":
+        cache.put(key, key.upper())
+    assert cache.get("a") == "A"  # "a" is now the most recently used
+    cache.put("d", "D")
+
+    assert "b" not in cache and "a" in cache
+    assert cache.get("b") is None
+    assert cache.stats == {
+        "size": 3, "max_size": 3, "hits": 1, "misses": 1, "hit_rate": 0.5, "evictions": 1, "expirations": 0,
+    }
+
+
+def test_cache_entries_expire_after_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(greeks_cache.time, "monotonic", lambda: now[0])
+    cache = GreeksCache(ttl=60)
+    cache.put("key", {"delta": 0.5})
+    now[0] += 59
+    assert cache.get("key") == {"delta": 0.5}
+    now[0] += 2
+    assert cache.get("key") is None
+    assert cache.stats["expirations"] == 1 and len(cache) == 0
+
+
+def test_batch_matches_scalar_greeks(data_source):
+    options, prices = _chain()
+    batch = data_source.calculate_greeks_batch(options, prices, 500.0, 0.05)
+
+    reference = _DataSource()
+    reference.get_datetime = data_source.get_datetime
+    for option, price, greeks in zip(options, prices, batch):
+        expected = reference.calculate_greeks(option, price, 500.0, 0.05)
+        assert greeks.keys() == expected.keys()
+        for name, value in expected.items():
+            if value is None:
+                assert greeks[name] is None
+            else:
+                assert greeks[name] == pytest.approx(value, rel=1e-9, abs=1e-12), name
+
+
+def test_batch_reuses_and_fills_the_cache(data_source, mocker):
+    options, prices = _chain()
+    first = data_source.calculate_greeks(options[0], prices[0], 500.0, 0.05)
+    batch_pass = mocker.spy(data_source._greeks_cache, "put")
+
+    batch = data_source.calculate_greeks_batch(options, prices, 500.0, 0.05)
+    assert batch[0] is first
+    assert batch_pass.call_count == len(options) - 1
+    assert data_source._greeks_cache.stats["hits"] == 1
+
+    # Everything is cached now: single lookups are hits, missing prices give None.
+    assert data_source.calculate_greeks(options[5], prices[5], 500.0, 0.05) is batch[5]
+    assert data_source.calculate_greeks_batch(options[:2], [None, prices[1]], [500.0, None], 0.05) == [None, None]
+    assert list(data_source._expiration_datetimes) == [EXPIRATION]
+
+
+def test_batch_falls_back_to_scalar_for_expired_options(data_source):
+    expired = Asset("SPY", asset_type="option", expiration=date(2024, 1, 19), strike=500, right="CALL")
+    batch = data_source.calculate_greeks_batch([expired, _option(500, "CALL")], [1.5, 9.0], 500.0, 0.05)
+    scalar = _DataSource()
+    scalar.get_datetime = data_source.get_datetime
+    assert batch[0] == scalar.calculate_greeks(expired, 1.5, 500.0, 0.05)
+    assert batch[1]["delta"] == pytest.approx(0.5, abs=0.1)
+
+
+def test_broker_batch_prefers_queried_greeks(data_source, mocker):
+    options, prices = _chain()
+    queried = {"delta": 0.42}
+    mocker.patch.object(data_source, "query_greeks", side_effect=lambda asset: queried if asset is options[3] else {})
+    broker = SimpleNamespace(data_source=data_source)
+
+    greeks = Broker.get_greeks_batch(broker, options[:4], prices[:4], 500.0, 0.05, query_greeks=True)
+    assert greeks[3] is queried
+    assert greeks[:3] == data_source.calculate_greeks_batch(options[:3], prices[:3], 500.0, 0.05)
+
+
+def test_aggregate_portfolio_greeks_uses_one_batch(data_source):
+    options, prices = _chain()
+    strategy = Mock()
+    strategy.get_last_price.return_value = 500.0
+    strategy.get_last_prices.return_value = dict(zip(options, prices))
+    strategy.risk_free_rate = 0.05
+    strategy.broker = SimpleNamespace(
+        get_greeks_batch=Mock(side_effect=lambda *args, **kwargs: Broker.get_greeks_batch(
+            SimpleNamespace(data_source=data_source), *args, **kwargs
+        ))
+    )
+    positions = [SimpleNamespace(asset=option, quantity=2) for option in options[:4]]
+    positions.append(SimpleNamespace(asset=Asset("SPY"), quantity=100))
+
+    totals = OptionsHelper(strategy).aggregate_portfolio_greeks(positions, Asset("SPY"))
+
+    strategy.broker.get_greeks_batch.assert_called_once()
+    strategy.get_greeks.assert_not_called()
+    expected = data_source.calculate_greeks_batch(options[:4], prices[:4], 500.0, 0.05)
+    assert totals["delta"] == pytest.approx(sum(2 * greeks["delta"] for greeks in expected))
@@ -0,0 +1,159 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+import pandas_ta_classic as ta
+import pytest
+import pytz
+
+from lumibot.entities import Asset, BarArrays
+from lumibot.strategies import strategy as strategy_module
+from lumibot.tools.indicator_engine import IndicatorEngine, rsi_values
+
+TZ = pytz.timezone("America/New_York")
+
+
+def _frame(n=400, seed=3):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    index = pd.date_range(TZ.localize(datetime.datetime(2024, 1, 2, 9, 30)), periods=n, freq="min")
+    return pd.DataFrame(
+        {
+            "open": close + rng.normal(0, 0.2, n),
+            "high": close + rng.uniform(0.1, 1.5, n),
+            "low": close - rng.uniform(0.1, 1.5, n),
+            "close": close,
+            "volume": rng.integers(100, 1000, n).astype(float),
+        },
+        index=index,
+    )
+
+
+class _Bars:
+    def __init__(self, df):
+        self.df = df
+
+
+class _Strategy:
+    """Serves the bars of ``frame`` up to the current bar, like a backtest data source."""
+
+    quote_asset = Asset("USD", asset_type="forex")
+    pytz = TZ
+
+    def __init__(self, frame):
+        self.frame = frame
+        self.position = 0
+        self.requests = []
+
+    def get_datetime(self):
+        return self.frame.index[self.position]
+
+    def _sanitize_user_asset(self, asset):
+        return Asset(asset) if isinstance(asset, str) else asset
+
+    def get_historical_prices(self, asset, length, timestep, quote=None, return_numpy=False):
+        self.requests.append(length)
+        bars = _Bars(self.frame.iloc[max(0, self.position + 1 - length):self.position + 1])
+        return BarArrays.from_frame(bars.df) if return_numpy else bars
+
+
+def _reference(frame):
+    return {
+        "sma": ta.sma(frame["close"], length=10),
+        "ema": ta.ema(frame["close"], length=10),
+        "rsi": ta.rsi(frame["close"], length=14),
+        "atr": ta.atr(frame["high"], frame["low"], frame["close"], length=14),
+    }
+
+
+def _values(engine, **kwargs):
+    return {
+        "sma": engine.sma("SPY", 10, "minute", **kwargs),
+        "ema": engine.ema("SPY", 10, "minute", **kwargs),
+        "rsi": engine.rsi("SPY", 14, "minute", **kwargs),
+        "atr": engine.atr("SPY", 14, "minute", **kwargs),
+    }
+
+
+def test_indicators_match_pandas_ta_and_only_fetch_new_bars():
+    frame = _frame()
+    expected = _reference(frame)
+    strategy = _Strategy(frame)
+    engine = IndicatorEngine(strategy)
+
+    strategy.position = 5
+    assert _values(engine) == {"sma": None, "ema": None, "rsi": None, "atr": None}
+
+    for position in range(6, 300):
+        strategy.position = position
+        for name, value in _values(engine).items():
+            if position < 14:
+                continue
+            assert value == pytest.approx(expected[name].iloc[position], rel=1e-10), (name, position)
+
+    warmup, steady = strategy.requests[:4], strategy.requests[4:]
+    assert warmup == [11, 61, 141, 141]
+    # One request of two bars per iteration, whatever the number of indicators and their lengths.
+    assert steady == [2] * (300 - 6)
+
+
+def test_catch_up_after_skipped_bars_and_history():
+    frame = _frame()
+    expected = _reference(frame)
+    strategy = _Strategy(frame)
+    engine = IndicatorEngine(strategy, history=50)
+
+    strategy.position = 40
+    _values(engine)
+    strategy.position = 70  # 30 bars later: caught up with one larger request
+    strategy.requests.clear()
+    values = _values(engine)
+    assert strategy.requests == [2, 8, 32]
+    for name, value in values.items():
+        assert value == pytest.approx(expected[name].iloc[70], rel=1e-10)
+
+    strategy.position = 400 - 1  # far behind: warmed up again from scratch
+    assert engine.sma("SPY", 10, "minute") == pytest.approx(expected["sma"].iloc[-1])
+
+    datetimes, history = engine.ema("SPY", 10, "minute", history=True)
+    assert len(history) == 50
+    assert datetimes[-1] == frame.index[-1]
+    np.testing.assert_allclose(history, expected["ema"].iloc[-50:].to_numpy(), rtol=1e-6)
+
+
+def test_indicator_added_later_is_aligned_with_its_feed():
+    frame = _frame()
+    strategy = _Strategy(frame)
+    engine = IndicatorEngine(strategy)
+    for position in range(50, 80):
+        strategy.position = position
+        engine.sma("SPY", 5, "minute")
+
+    # The SMA was last updated with the bar at 79, so the new indicator starts there too.
+    late = engine.sma("SPY", 20, "minute")
+    assert late == pytest.approx(frame["close"].iloc[60:80].mean())
+
+
+def test_pushed_bars_update_without_polling():
+    frame = _frame(n=60)
+    strategy = _Strategy(frame)
+    engine = IndicatorEngine(strategy)
+    strategy.position = 29
+    engine.update_bars("SPY", frame.iloc[:30], "minute")
+    engine.rsi("SPY", 14, "minute")
+    engine.update_bars("SPY", _Bars(frame.iloc[25:]), "minute")
+
+    assert engine.rsi("SPY", 14, "minute") == pytest.approx(ta.rsi(frame["close"], length=14).iloc[-1])
+    # Only the warm-up of the new indicator asked for bars.
+    assert strategy.requests == [141]
+
+
+def test_rsi_values_match_pandas_ta():
+    closes = _frame(n=40)["close"]
+    np.testing.assert_allclose(rsi_values(closes.tolist(), 14), ta.rsi(closes, length=14).to_numpy(), equal_nan=True)
+
+
+def test_strategy_creates_the_engine_once():
+    harness = strategy_module.Strategy.__new__(strategy_module.Strategy)
+    assert harness.indicators is harness.indicators
+    assert isinstance(harness.indicators, IndicatorEngine)
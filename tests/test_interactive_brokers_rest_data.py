@@ -0,0 +1,182 @@
+import datetime
+import json
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from lumibot.data_sources.interactive_brokers_rest_data import InteractiveBrokersRESTData
+from lumibot.entities import Asset
+
+EXPIRATION = datetime.date(2024, 12, 20)
+
+
+class _MockGateway(ThreadingHTTPServer):
+    """Just enough of the Client Portal gateway for the market-data paths."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _GatewayHandler)
+        self.calls = Counter()
+        self.client_ports = set()
+        self.snapshot_conids = []
+        self.seen_conids = set()
+        self.lock = threading.Lock()
+
+
+class _GatewayHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._reply({})
+
+    def do_GET(self):
+        server = self.server
+        url = urlparse(self.path)
+        path = url.path.removeprefix("/v1/api")
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        with server.lock:
+            server.calls[path] += 1
+            server.client_ports.add(self.client_address[1])
+
+        if path == "/portfolio/accounts":
+            return self._reply([{"id": "DU123"}])
+        if path == "/iserver/accounts":
+            return self._reply({"accounts": ["DU123"]})
+        if path == "/iserver/secdef/search":
+            return self._reply(
+                [{"conid": 1000, "sections": [{"secType": "STK"}, {"secType": "OPT", "exchange": "SMART"}]}]
+            )
+        if path == "/iserver/secdef/info":
+            strike = float(query["strike"])
+            conid = 2000 + int(strike) * 10 + (1 if query["right"] == "CALL" else 0)
+            return self._reply([{"conid": conid, "maturityDate": EXPIRATION.strftime("%Y%m%d")}])
+        if path == "/iserver/marketdata/snapshot":
+            conids = [int(conid) for conid in query["conids"].split(",")]
+            rows = []
+            with server.lock:
+                server.snapshot_conids.append(conids)
+                for conid in conids:
+                    if conid not in server.seen_conids:
+                        # Like the real gateway: the first request for a conid only starts the subscription.
+                        server.seen_conids.add(conid)
+                        rows.append({"conid": conid})
+                    else:
+                        fields = {"31": str(conid / 100), "84": "1.0", "86": "1.2", "88": 5, "85": 7}
+                        rows.append({"conid": conid, **fields})
+            return self._reply(rows)
+        self.send_error(404)
+
+
+@pytest.fixture
+def gateway():
+    server = _MockGateway()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def data_source(gateway):
+    config = {
+        "API_URL": f"http://127.0.0.1:{gateway.server_address[1]}",
+        "RUNNING_ON_SERVER": None,
+        "IB_USERNAME": None,
+        "IB_PASSWORD": None,
+    }
+    return InteractiveBrokersRESTData(config)
+
+
+def _option_book(n_strikes=20):
+    return [
+        Asset("SPY", asset_type="option", expiration=EXPIRATION, strike=400 + i, right=right)
+        for i in range(n_strikes)
+        for right in ("CALL", "PUT")
+    ]
+
+
+def test_last_prices_for_an_option_book_use_batched_snapshots(data_source, gateway):
+    book = _option_book()
+    prices = data_source.get_last_prices(book)
+
+    assert len(prices) == 40
+    first = book[0]
+    assert prices[first] == pytest.approx(data_source.get_conid_from_asset(first) / 100)
+    # One preflight round and one data round, each a single request for all 40 conids.
+    assert [len(conids) for conids in gateway.snapshot_conids] == [40, 40]
+    assert gateway.calls["/iserver/secdef/info"] == 40
+
+    # Conids are cached and the accounts ping is throttled, so pricing again only hits the snapshot endpoint.
+    gateway.calls.clear()
+    data_source.get_last_prices(book)
+    assert set(gateway.calls) == {"/iserver/marketdata/snapshot"}
+    assert gateway.calls["/iserver/marketdata/snapshot"] == 1
+
+
+def test_requests_reuse_one_keep_alive_connection(data_source, gateway):
+    data_source.get_last_prices(_option_book(3))
+    data_source.get_quote(Asset("SPY"))
+    assert len(gateway.client_ports) == 1
+
+
+def test_snapshot_batches_are_split_at_the_batch_size(data_source, gateway, monkeypatch):
+    monkeypatch.setattr(InteractiveBrokersRESTData, "SNAPSHOT_BATCH_SIZE", 15)
+    data_source.get_last_prices(_option_book())
+    assert [len(conids) for conids in gateway.snapshot_conids] == [15, 15, 10, 15, 15, 10]
+
+
+def test_quotes_and_single_snapshot_share_the_batched_path(data_source, gateway):
+    stock = Asset("SPY")
+    quote = data_source.get_quote(stock)
+    assert quote.price == pytest.approx(10.0)
+    assert quote.bid == 1.0 and quote.ask == 1.2 and quote.bid_size == 5.0
+
+    quotes = data_source.get_quotes([stock] + _option_book(2))
+    assert quotes[stock].price == pytest.approx(10.0)
+    assert all(q is not None for q in quotes.values())
+
+
+def test_ping_interval_and_contract_cache_expire(data_source, gateway, monkeypatch):
+    stock = Asset("SPY")
+    gateway.calls.clear()  # drop the authentication check made while connecting
+    data_source.get_last_price(stock)
+    data_source.get_last_price(stock)
+    assert gateway.calls["/iserver/accounts"] == 1
+    assert gateway.calls["/iserver/secdef/search"] == 1
+
+    monkeypatch.setattr(InteractiveBrokersRESTData, "PING_INTERVAL", 0)
+    monkeypatch.setattr(InteractiveBrokersRESTData, "CONTRACT_CACHE_TTL", 0)
+    data_source.get_last_price(stock)
+    assert gateway.calls["/iserver/accounts"] > 1
+    assert gateway.calls["/iserver/secdef/search"] == 2
+
+
+def test_backtesting_prices_each_asset_instead_of_the_live_snapshot(monkeypatch):
+    from lumibot.backtesting.interactive_brokers_rest_backtesting import InteractiveBrokersRESTBacktesting
+
+    source = InteractiveBrokersRESTBacktesting.__new__(InteractiveBrokersRESTBacktesting)
+    source.SOURCE = "InteractiveBrokersREST"
+    monkeypatch.setattr(source, "get_last_price", lambda asset, quote=None, exchange=None: len(asset.symbol))
+    monkeypatch.setattr(source, "get_market_snapshots", lambda *args: pytest.fail("live snapshot in a backtest"))
+
+    prices = source.get_last_prices([Asset("SPY"), Asset("AAPL")])
+
+    assert prices[Asset("SPY")] == 3 and prices[Asset("AAPL")] == 4
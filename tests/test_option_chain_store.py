@@ -0,0 +1,108 @@
+from datetime import date
+
+import pytest
+
+from lumibot.entities import Asset
+from lumibot.tools import option_chain_store, thetadata_helper
+from lumibot.tools.option_chain_store import OptionContractTable
+
+
+def _chain(expirations):
+    puts = {expiration: [strike - 5 for strike in strikes] for expiration, strikes in expirations.items()}
+    return {"CALL": dict(expirations), "PUT": puts}
+
+
+@pytest.fixture
+def table_path(tmp_path):
+    option_chain_store._tables.clear()
+    yield tmp_path / "SPY.contracts.parquet"
+    option_chain_store._tables.clear()
+
+
+def test_chain_is_an_interval_filter_over_the_snapshots(table_path):
+    table = OptionContractTable.load(table_path)
+    table.add_snapshot(
+        date(2024, 1, 2), _chain({"2024-01-05": [100, 105], "2024-01-19": [100, 110]}), info={"Multiplier": 100}
+    )
+    # A week later: 2024-01-05 expired, a strike disappeared and a new expiration was listed.
+    table.add_snapshot(date(2024, 1, 9), _chain({"2024-01-19": [110, 100], "2024-02-16": [120]}))
+
+    assert table.find_snapshot(date(2024, 1, 4)) == date(2024, 1, 2)
+    assert table.chain(date(2024, 1, 4), date(2024, 1, 2)) == {
+        "Multiplier": 100,
+        "Chains": {
+            "CALL": {"2024-01-05": [100.0, 105.0], "2024-01-19": [100.0, 110.0]},
+            "PUT": {"2024-01-05": [95.0, 100.0], "2024-01-19": [95.0, 105.0]},
+        },
+    }
+    # Expired expirations are dropped, and contracts listed after the date are not visible yet.
+    assert table.chain(date(2024, 1, 8), date(2024, 1, 2))["Chains"]["CALL"] == {"2024-01-19": [100.0, 110.0]}
+    assert table.chain(date(2024, 1, 10), date(2024, 1, 9))["Chains"]["CALL"] == {
+        "2024-01-19": [100.0, 110.0],
+        "2024-02-16": [120.0],
+    }
+    assert len(table) == 2 * 5
+
+    # The table is one file, read back with its snapshots.
+    option_chain_store._tables.clear()
+    reloaded = OptionContractTable.load(table_path)
+    assert reloaded is not table and reloaded.snapshots == table.snapshots
+    assert reloaded.chain(date(2024, 1, 10), date(2024, 1, 9)) == table.chain(date(2024, 1, 10), date(2024, 1, 9))
+    assert [path.name for path in table_path.parent.iterdir()] == [table_path.name]
+
+
+def test_find_snapshot_checks_the_age_and_the_expiration_range(table_path):
+    table = OptionContractTable.load(table_path)
+    table.add_snapshot(date(2024, 1, 2), _chain({"2024-03-15": [100]}))
+    table.add_snapshot(date(2024, 1, 5), _chain({"2024-06-21": [100]}), max_expiration=date(2024, 12, 31))
+
+    assert table.find_snapshot(date(2024, 1, 1)) is None
+    assert table.find_snapshot(date(2024, 1, 20), max_age_days=7) is None
+    assert table.find_snapshot(date(2024, 1, 20)) == date(2024, 1, 2)
+    # The later snapshot only covers expirations up to the end of 2024.
+    assert table.find_snapshot(date(2024, 1, 8), max_expiration=date(2024, 6, 30)) == date(2024, 1, 5)
+    assert table.find_snapshot(date(2024, 1, 8), max_expiration=date(2025, 6, 30)) == date(2024, 1, 2)
+
+
+def test_tables_of_an_older_version_are_ignored(table_path):
+    OptionContractTable.load(table_path, version=1).add_snapshot(date(2024, 1, 2), _chain({"2024-01-19": [100]}))
+    option_chain_store._tables.clear()
+
+    table = OptionContractTable.load(table_path, version=2)
+    assert len(table) == 0 and table.find_snapshot(date(2024, 1, 2)) is None
+
+
+def test_thetadata_chains_are_built_once_per_tolerance_window(tmp_path, monkeypatch):
+    option_chain_store._tables.clear()
+    monkeypatch.setattr(thetadata_helper, "LUMIBOT_CACHE_FOLDER", str(tmp_path))
+    monkeypatch.delenv("THETADATA_CHAIN_RECENT_FILE_TOLERANCE_DAYS", raising=False)
+    builds = []
+
+    def fake_builder(asset, as_of_date, chain_constraints=None):
+        builds.append((as_of_date, chain_constraints))
+        return {
+            "Multiplier": 100,
+            "Exchange": "SMART",
+            "Chains": _chain({"2024-01-05": [100], "2024-01-12": [100], "2024-02-16": [100, 105]}),
+            "UnderlyingSymbol": asset.symbol,
+            "_chain_cache_version": thetadata_helper.THETADATA_CHAIN_CACHE_VERSION,
+        }
+
+    monkeypatch.setattr(thetadata_helper, "build_historical_chain", fake_builder)
+    asset = Asset("TBL", asset_type="stock")
+
+    for day in range(2, 10):
+        chain = thetadata_helper.get_chains_cached(asset, date(2024, 1, day))
+    hinted = thetadata_helper.get_chains_cached(
+        asset, date(2024, 1, 9), chain_constraints={"max_expiration_date": date(2024, 1, 31)}
+    )
+    thetadata_helper.get_chains_cached(asset, date(2024, 1, 10))
+
+    assert [as_of for as_of, _ in builds] == [date(2024, 1, 2), date(2024, 1, 10)]
+    assert list(chain["Chains"]["CALL"]) == ["2024-01-12", "2024-02-16"]
+    assert chain["UnderlyingSymbol"] == "TBL" and chain["Exchange"] == "SMART"
+    assert list(hinted["Chains"]["CALL"]) == ["2024-01-12"]
+    assert [path.name for path in (tmp_path / "thetadata" / "stock" / "option_chains").iterdir()] == [
+        "TBL.contracts.parquet"
+    ]
+    option_chain_store._tables.clear()
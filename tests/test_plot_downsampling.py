@@ -0,0 +1,178 @@
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import pytest
+
+from lumibot.tools.indicators import (
+    _build_trade_marker_tooltip,
+    _downsample_positions,
+    _lttb_indices,
+    _min_max_indices,
+    _plot_max_points_from_env,
+    _trade_marker_tooltips,
+    plot_indicators,
+    plot_returns,
+)
+
+
+@pytest.fixture
+def captured_figures(monkeypatch):
+    figures = []
+
+    def _capture(self, file, auto_open=True, **kwargs):
+        figures.append(self)
+
+    monkeypatch.setattr(go.Figure, "write_html", _capture, raising=False)
+    return figures
+
+
+def _minute_index(n):
+    return pd.date_range("2024-01-02 09:30", periods=n, freq="min", tz="America/New_York")
+
+
+def test_lttb_keeps_endpoints_and_spikes():
+    x = np.arange(10_000, dtype=float)
+    y = np.sin(x / 500)
+    y[4321] = 25.0
+    kept = _lttb_indices(x, y, 200)
+
+    assert len(kept) == 200
+    assert kept[0] == 0 and kept[-1] == len(x) - 1
+    assert np.all(np.diff(kept) > 0)
+    assert 4321 in kept
+
+
+def test_min_max_keeps_bucket_extremes():
+    rng = np.random.default_rng(0)
+    y = rng.normal(size=5_000)
+    kept = _min_max_indices(y, 100)
+
+    assert len(kept) <= 102
+    assert np.argmin(y) in kept and np.argmax(y) in kept
+
+
+def test_downsample_positions_drops_nan_and_respects_budget():
+    index = _minute_index(1_000)
+    values = pd.Series(np.linspace(1, 2, 1_000), index=index)
+    values.iloc[::3] = np.nan
+
+    assert len(_downsample_positions(index, values, 0)) == values.notna().sum()
+    positions = _downsample_positions(index, values, 100)
+    assert len(positions) == 100
+    assert values.iloc[positions].notna().all()
+
+
+def test_trade_marker_tooltips_match_row_builder():
+    trades = pd.DataFrame(
+        {
+            "status": ["fill", "new", "fill", "cash_settled", "fill"],
+            "filled_quantity": [10, 5, np.nan, 25, 3],
+            "price": [101.2345, 1.0, 2.0, 20.86, 2.675],
+            "asset.multiplier": [1, 1, 1, 100, 100],
+            "trade_cost": [0.5, 0, 0, pd.NA, np.nan],
+            "symbol": ["SPY", "SPY", "SPY", "WDC", "AAPL"],
+            "asset.asset_type": ["stock", "stock", "stock", "option", "option"],
+            "asset.right": [None, None, None, "CALL", "PUT"],
+            "asset.strike": [None, None, None, 86, 150],
+            "asset.expiration": [None, None, None, "2025-09-19", "2025-09-19"],
+            "type": ["market", "limit", "market", "cash_settled", "limit"],
+        }
+    )
+
+    expected = trades.apply(_build_trade_marker_tooltip, axis=1)
+    result = _trade_marker_tooltips(trades)
+    assert result.tolist() == expected.tolist()
+    assert result.notna().tolist() == [True, False, False, True, True]
+
+
+def test_plot_indicators_bounds_points_and_keeps_full_csv(tmp_path, captured_figures):
+    n = 20_000
+    index = _minute_index(n)
+    lines = pd.DataFrame(
+        {
+            "datetime": index,
+            "name": "sma",
+            "value": np.cumsum(np.ones(n)),
+            "color": "blue",
+            "detail_text": [None] * (n - 1) + ["last"],
+            "plot_name": "default_plot",
+        }
+    )
+    markers = pd.DataFrame(
+        {
+            "datetime": index[:3],
+            "name": "signal",
+            "symbol": "circle",
+            "value": [1.0, 2.0, 3.0],
+            "size": None,
+            "color": "red",
+            "detail_text": ["a", None, "c"],
+            "plot_name": "default_plot",
+        }
+    )
+    plot_file = tmp_path / "indicators.html"
+    plot_indicators(str(plot_file), markers, lines, "Test", show_indicators=True, max_points=500, use_webgl=True)
+
+    figure = captured_figures[0]
+    line_trace = next(trace for trace in figure.data if trace.name == "sma")
+    marker_trace = next(trace for trace in figure.data if trace.name == "signal")
+    assert isinstance(line_trace, go.Scattergl)
+    assert len(line_trace.x) == 500
+    assert line_trace.text[-1] == f"Value: {float(n)}<br>last"
+    assert list(marker_trace.text) == ["Value: 1.0<br>a", "Value: 2.0", "Value: 3.0<br>c"]
+
+    csv = pd.read_csv(plot_file.with_suffix(".csv"))
+    assert len(csv) == n + 3
+
+
+def test_plot_returns_bounds_line_points(tmp_path, captured_figures):
+    n = 10_000
+    index = _minute_index(n).tz_convert("UTC")
+    rng = np.random.default_rng(1)
+    strategy_df = pd.DataFrame(
+        {
+            "return": rng.normal(0, 0.001, n),
+            "cash": np.linspace(1_000, 500, n),
+            "positions": [[{"asset": "SPY", "quantity": 1}]] * n,
+        },
+        index=index,
+    )
+    prices = 100 + np.cumsum(rng.normal(0, 0.1, n))
+    benchmark_df = pd.DataFrame(
+        {"return": rng.normal(0, 0.001, n), "open": prices, "high": prices, "low": prices, "close": prices},
+        index=index,
+    )
+    trades_df = pd.DataFrame(
+        {
+            "time": [index[10], index[10], index[5000]],
+            "side": ["buy", "buy", "sell"],
+            "status": ["fill", "fill", "fill"],
+            "filled_quantity": [1, 2, 3],
+            "symbol": ["SPY", "QQQ", "SPY"],
+            "asset.asset_type": ["stock"] * 3,
+            "price": [100.0, 200.0, 101.0],
+            "type": ["market"] * 3,
+            "asset.multiplier": [1, 1, 1],
+            "trade_cost": [0.0, 0.0, 0.0],
+        }
+    )
+
+    plot_returns(
+        strategy_df, "Strategy", benchmark_df, "Benchmark", str(tmp_path / "plot.html"), trades_df,
+        show_plot=True, initial_budget=1000, max_points=300,
+    )
+
+    traces = {trace.name: trace for trace in captured_figures[0].data}
+    for name in ("Strategy", "Benchmark", "cash"):
+        assert isinstance(traces[name], go.Scatter)
+        assert len(traces[name].x) == 300
+    assert len(traces["Strategy"].text) == 300
+    # Both buys at the same time are merged into one marker; trade markers are never downsampled.
+    assert len(traces["buy"].x) == 1 and "QQQ" in traces["buy"].text[0]
+    assert len(traces["sell"].x) == 1
+
+
+@pytest.mark.parametrize(("value", "expected"), [("1200", 1200), ("0", 0), ("", 5000), ("lots", 5000), ("1e3", 5000)])
+def test_plot_max_points_env_falls_back_to_the_default(monkeypatch, value, expected):
+    monkeypatch.setenv("LUMIBOT_PLOT_MAX_POINTS", value)
+    assert _plot_max_points_from_env() == expected
@@ -0,0 +1,174 @@
+import datetime as dt
+
+import pytest
+
+from lumibot.brokers import Tradier
+from lumibot.entities import Asset, Order
+from lumibot.trading_builtins import PollingReconciler
+
+
+class _RecordingStream:
+    def __init__(self, polling_interval=5.0):
+        self.polling_interval = polling_interval
+        self.events = []
+
+    def dispatch(self, event, **payload):
+        self.events.append((event, payload))
+
+
+class _RateLimited(Exception):
+    def __init__(self, retry_after=None):
+        super().__init__("429 Too Many Requests")
+        self.status_code = 429
+        self.response = type("Response", (), {"status_code": 429, "headers": {"Retry-After": retry_after}})()
+
+
+def _row(order_id, status="open", avg_fill_price=None, exec_quantity=0):
+    return {
+        "id": order_id,
+        "type": "market",
+        "side": "buy",
+        "symbol": "SPY",
+        "class": "equity",
+        "quantity": 10,
+        "status": status,
+        "duration": "day",
+        "create_date": dt.datetime(2024, 1, 2, 9, 30),
+        "avg_fill_price": avg_fill_price,
+        "exec_quantity": exec_quantity,
+        "tag": "strat",
+    }
+
+
+@pytest.fixture
+def broker(mocker):
+    broker = Tradier(account_number="1234", access_token="a1b2c3", paper=True, polling_interval=2.0,
+                     connect_stream=False)
+    broker._strategy_name = "strat"
+    broker._first_iteration = False
+    broker.stream = _RecordingStream(2.0)
+    mocker.patch.object(broker, "sync_positions", return_value=None)
+    return broker
+
+
+def test_changed_rows_are_diffed_by_key_and_version():
+    reconciler = PollingReconciler(5.0)
+    key, version = (lambda row: row["id"]), PollingReconciler.digest
+    rows = [{"id": 1, "status": "open"}, {"id": 2, "status": "open"}]
+
+    assert reconciler.changed(rows, key, version) == rows
+    # Nothing is remembered until the cycle is committed.
+    assert reconciler.changed(rows, key, version) == rows
+    reconciler.commit()
+    assert reconciler.changed(rows, key, version) == []
+
+    rows[1]["status"] = "filled"
+    assert reconciler.changed(rows, key, version) == [rows[1]]
+    reconciler.commit()
+    # Orders that leave the snapshot are forgotten.
+    reconciler.changed(rows[:1], key, version)
+    reconciler.commit()
+    assert reconciler.changed(rows, key, version) == [rows[1]]
+
+
+def test_full_sync_reprocesses_every_row():
+    reconciler = PollingReconciler(5.0, full_sync_every=3)
+    rows = [{"id": 1}, {"id": 2}]
+    sizes = []
+    for _ in range(6):
+        sizes.append(len(reconciler.changed(rows, lambda row: row["id"], PollingReconciler.digest)))
+        reconciler.commit()
+    assert sizes == [2, 0, 2, 0, 0, 2]
+
+
+def test_interval_adapts_to_activity_and_rate_limits():
+    reconciler = PollingReconciler(2.0, idle_multiplier=4.0, max_interval=30.0)
+    assert reconciler.finish_cycle(active=True) == 2.0
+    assert reconciler.finish_cycle(active=False) == 8.0
+
+    for expected in (4.0, 8.0, 16.0, 30.0):
+        reconciler.start_cycle()
+        reconciler.rate_limited()
+        assert reconciler.finish_cycle(active=True) == expected
+
+    reconciler.start_cycle()
+    reconciler.rate_limited(retry_after=45)
+    assert reconciler.finish_cycle(active=True) == 45.0
+
+    reconciler.start_cycle()
+    assert reconciler.finish_cycle(active=True) == 2.0
+    assert PollingReconciler.rate_limit_info(_RateLimited("7")) == (True, 7.0)
+    assert PollingReconciler.rate_limit_info(ValueError("bad symbol")) == (False, None)
+
+
+def test_tradier_parses_only_changed_orders(broker, mocker):
+    rows = [_row(1), _row(2), _row(3, status="filled", avg_fill_price=100.0, exec_quantity=10)]
+    mocker.patch.object(broker, "_pull_broker_all_orders", return_value=rows)
+    parse = mocker.spy(broker, "_parse_broker_order_dict")
+
+    broker.do_polling()
+    assert parse.call_count == 3
+    assert {order.identifier for order in broker.get_all_orders()} == {1, 2, 3}
+
+    parse.reset_mock()
+    broker.do_polling()
+    assert parse.call_count == 0
+    assert broker.stream.events == []
+
+    rows[0].update(status="filled", avg_fill_price=101.0, exec_quantity=10)
+    broker.do_polling()
+    assert parse.call_count == 1
+    (event, payload), = broker.stream.events
+    assert event == broker.FILLED_ORDER
+    assert payload["order"].identifier == 1 and payload["price"] == 101.0 and payload["filled_quantity"] == 10
+
+
+def test_tradier_fill_waits_for_fill_price(broker, mocker):
+    rows = [_row(1)]
+    mocker.patch.object(broker, "_pull_broker_all_orders", return_value=rows)
+    broker.do_polling()
+
+    rows[0].update(status="filled")
+    broker.do_polling()
+    assert broker.stream.events == []
+
+    rows[0].update(avg_fill_price=99.5, exec_quantity=10)
+    broker.do_polling()
+    assert [event for event, _ in broker.stream.events] == [broker.FILLED_ORDER]
+    assert broker.stream.events[0][1]["price"] == 99.5
+
+
+def test_orders_missing_at_the_broker_are_canceled(broker, mocker):
+    mocker.patch.object(broker, "_pull_broker_all_orders", return_value=[])
+    order = Order("strat", Asset("SPY"), 10, "buy", order_type="market")
+    order.identifier = 42
+    broker._new_orders.append(order)
+
+    broker.do_polling()
+    assert broker.stream.events == [(broker.CANCELED_ORDER, {"order": order})]
+
+
+def test_poll_interval_follows_working_orders_and_backs_off(broker, mocker):
+    pull = mocker.patch.object(broker, "_pull_broker_all_orders", return_value=[_row(1)])
+    broker._poll_and_reconcile()
+    assert broker.stream.polling_interval == 2.0  # order 1 is working
+
+    pull.return_value = []
+    broker._new_orders.remove(1, key="identifier")
+    broker._poll_and_reconcile()
+    assert broker.stream.polling_interval == 2.0 * broker.POLLING_IDLE_MULTIPLIER
+
+    pull.side_effect = _RateLimited()
+    broker._poll_and_reconcile()
+    assert broker.stream.polling_interval == 2.0 * broker.POLLING_IDLE_MULTIPLIER * 2
+
+    # A new order switches back to the working interval straight away.
+    pull.side_effect = None
+    order = Order("strat", Asset("SPY"), 1, "buy", order_type="market")
+    order.identifier = 7
+    broker._process_new_order(order)
+    assert broker.stream.polling_interval == 4.0
+
+    pull.side_effect = ValueError("boom")
+    with pytest.raises(ValueError):
+        broker._poll_and_reconcile()
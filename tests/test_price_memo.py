@@ -0,0 +1,77 @@
+from datetime import timedelta
+
+import pandas as pd
+
+from lumibot.data_sources import PandasData
+from lumibot.entities import Asset
+from lumibot.entities.data import Data
+
+
+def _build_data_source():
+    idx = pd.date_range("2024-01-02 14:30", periods=5, freq="min", tz="UTC")
+    df = pd.DataFrame(
+        {
+            "open": [100.0, 101.0, 102.0, 103.0, 104.0],
+            "high": [100.5, 101.5, 102.5, 103.5, 104.5],
+            "low": [99.5, 100.5, 101.5, 102.5, 103.5],
+            "close": [100.2, 101.2, 102.2, 103.2, 104.2],
+            "volume": [1000, 1000, 1000, 1000, 1000],
+        },
+        index=idx,
+    )
+    asset = Asset("SPY", asset_type=Asset.AssetType.STOCK)
+    quote = Asset("USD", asset_type=Asset.AssetType.FOREX)
+    data = Data(asset=asset, df=df, quote=quote, timestep="minute")
+    data_source = PandasData(
+        datetime_start=idx[0].to_pydatetime(),
+        datetime_end=idx[-1].to_pydatetime() + timedelta(minutes=2),
+        pandas_data={(asset, quote): data},
+        show_progress_bar=False,
+    )
+    data_source._datetime = idx[1].to_pydatetime()
+    return data_source, asset, quote, idx
+
+
+def test_get_last_price_is_memoized_within_timestamp():
+    data_source, asset, quote, _ = _build_data_source()
+
+    first = data_source.get_last_price(asset, quote=quote)
+    second = data_source.get_last_price(asset, quote=quote)
+
+    assert first == second
+    stats = data_source.get_price_memo_stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+    assert stats["size"] == 1
+
+
+def test_price_memo_is_invalidated_when_datetime_advances():
+    data_source, asset, quote, idx = _build_data_source()
+
+    before = data_source.get_last_price(asset, quote=quote)
+    data_source._update_datetime(idx[3].to_pydatetime())
+    assert data_source.get_price_memo_stats()["size"] == 0
+
+    after = data_source.get_last_price(asset, quote=quote)
+    assert after != before
+    assert data_source.get_price_memo_stats()["misses"] == 2
+
+
+def test_quote_and_last_price_use_separate_memo_entries():
+    data_source, asset, quote, _ = _build_data_source()
+
+    price = data_source.get_last_price(asset, quote=quote)
+    quote_obj = data_source.get_quote(asset, quote=quote)
+
+    assert price is not None
+    assert quote_obj.price is not None
+    assert data_source.get_quote(asset, quote=quote) is quote_obj
+    assert data_source.get_price_memo_stats()["size"] == 2
+
+
+def test_missing_prices_are_not_memoized():
+    data_source, _, quote, _ = _build_data_source()
+    unknown = Asset("MISSING", asset_type=Asset.AssetType.STOCK)
+
+    assert data_source.get_last_price(unknown, quote=quote) is None
+    assert data_source.get_price_memo_stats()["size"] == 0
@@ -0,0 +1,108 @@
+import csv
+import json
+import threading
+from datetime import datetime
+
+import pytz
+
+from lumibot.data_sources.data_source_backtesting import DataSourceBacktesting
+from lumibot.tools.progress_writer import PROGRESS_CSV_HEADER, ProgressFileWriter
+
+
+class _DataSource(DataSourceBacktesting):
+    def get_historical_prices(self, *args, **kwargs):
+        return None
+
+    def get_chains(self, *args, **kwargs):
+        return None
+
+    def get_last_price(self, *args, **kwargs):
+        return None
+
+
+def _read(path):
+    with open(path, newline="") as csvfile:
+        return list(csv.reader(csvfile))
+
+
+def test_write_replaces_the_row_in_place(tmp_path):
+    path = tmp_path / "logs" / "progress.csv"
+    writer = ProgressFileWriter(str(path))
+    writer.write(["first", "a much longer value than the next one"])
+    writer.write(["second", "short"])
+
+    assert _read(path) == [PROGRESS_CSV_HEADER, ["second", "short"]]
+    writer.close()
+
+
+def test_submit_only_writes_the_latest_row(tmp_path):
+    path = tmp_path / "progress.csv"
+    writer = ProgressFileWriter(str(path))
+    started, release = threading.Event(), threading.Event()
+    built = []
+
+    def row(value, wait=False):
+        def build():
+            if wait:
+                started.set()
+                release.wait(5)
+            built.append(value)
+            return [value]
+        return build
+
+    writer.submit(row("1", wait=True))
+    assert started.wait(5)
+    for value in "234":
+        writer.submit(row(value))
+    release.set()
+    assert writer.flush()
+
+    assert _read(path) == [PROGRESS_CSV_HEADER, ["4"]]
+    # "2" and "3" were replaced by "4" while "1" was being written.
+    assert built == ["1", "4"]
+    writer.close()
+
+
+def test_update_datetime_only_takes_snapshots_when_a_row_is_due(tmp_path):
+    ds = _DataSource(
+        datetime_start=datetime(2024, 1, 1, tzinfo=pytz.UTC),
+        datetime_end=datetime(2024, 12, 31, tzinfo=pytz.UTC),
+        show_progress_bar=False,
+        log_backtest_progress_to_file=True,
+    )
+    ds._progress_csv_path = str(tmp_path / "logs" / "progress.csv")
+    calls = []
+
+    def positions():
+        calls.append("positions")
+        return [{"asset": {"symbol": "AAPL", "type": "stock"}, "qty": 10, "val": 1900.0, "pnl": 12.5}]
+
+    def orders():
+        calls.append("orders")
+        return None
+
+    for day in (2, 3, 4):
+        ds._update_datetime(
+            datetime(2024, 6, day, tzinfo=pytz.UTC),
+            cash=500.0,
+            portfolio_value=2400.0,
+            positions=positions,
+            initial_budget=2000.0,
+            orders=orders,
+        )
+    ds.flush_progress_log()
+
+    # The 2 second throttle drops the later steps before their snapshots are built.
+    assert calls == ["positions", "orders"]
+    header, row = _read(ds._progress_csv_path)
+    values = dict(zip(header, row))
+    assert values["simulation_date"] == "2024-06-02 00:00:00"
+    assert values["total_return_pct"] == "20.00"
+    assert json.loads(values["positions_json"])[0]["qty"] == 10
+    assert values["orders_json"] == "[]"
+
+    # Moving the progress file reopens the writer on the new path.
+    ds._progress_csv_path = str(tmp_path / "other.csv")
+    ds.log_backtest_progress_to_csv(50.0, "1:00:00", None, "2,400.00")
+    assert _read(ds._progress_csv_path)[1][1] == "50.00"
+    ds._progress_writer.close()
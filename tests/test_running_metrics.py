@@ -0,0 +1,104 @@
+import datetime
+import math
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from lumibot.strategies import _strategy as base_strategy_module
+from lumibot.strategies import strategy as strategy_module
+from lumibot.tools import day_deduplicate, stats_summary
+from lumibot.tools.running_metrics import RunningPerformanceMetrics
+
+START = datetime.datetime(2023, 1, 2, 9, 30, tzinfo=datetime.timezone.utc)
+
+
+def _rows(n=600, seed=7, step=datetime.timedelta(days=1)):
+    rng = np.random.default_rng(seed)
+    values = 100_000 * np.cumprod(1 + rng.normal(0.0004, 0.012, n))
+    rows = []
+    for i, value in enumerate(values):
+        dt = START + i * step
+        rows.append({"datetime": dt, "portfolio_value": float(value)})
+        if i % 5 == 0:
+            # Several lifecycle methods record stats at the same time; the batch keeps the first of them.
+            rows.append({"datetime": dt, "portfolio_value": float(value) * 1.001})
+    return rows
+
+
+def _batch_summary(rows, risk_free_rate):
+    stats = pd.DataFrame(rows).set_index("datetime").sort_index()
+    stats["return"] = stats["portfolio_value"].pct_change()
+    return stats_summary(day_deduplicate(stats), risk_free_rate)
+
+
+def _assert_same_summary(running, batch):
+    for key in ("cagr", "volatility", "sharpe", "romad", "total_return"):
+        assert running[key] == pytest.approx(batch[key], rel=1e-9), key
+    assert running["max_drawdown"]["drawdown"] == pytest.approx(batch["max_drawdown"]["drawdown"], rel=1e-9)
+    assert running["max_drawdown"]["date"] == batch["max_drawdown"]["date"]
+
+
+@pytest.mark.parametrize("step", [datetime.timedelta(days=1), datetime.timedelta(hours=3)])
+def test_running_metrics_match_the_batch_functions(step):
+    rows = _rows(step=step)
+    metrics = RunningPerformanceMetrics()
+    for row in rows:
+        metrics.update(row["datetime"], row["portfolio_value"])
+
+    assert metrics.is_valid
+    _assert_same_summary(metrics.summary(0.03), _batch_summary(rows, 0.03))
+
+
+def test_short_histories_match_the_batch_functions():
+    rows = _rows(n=2)[:1]
+    metrics = RunningPerformanceMetrics()
+    metrics.update(rows[0]["datetime"], rows[0]["portfolio_value"])
+    assert metrics.max_drawdown == {"drawdown": 0, "date": rows[0]["datetime"]}
+    assert metrics.summary(0.0)["cagr"] == 0 == _batch_summary(rows, 0.0)["cagr"]
+
+    two_days = [rows[0], {"datetime": START + datetime.timedelta(days=1), "portfolio_value": 99_000.0}]
+    metrics.update(two_days[1]["datetime"], two_days[1]["portfolio_value"])
+    running, batch = metrics.summary(0.0), _batch_summary(two_days, 0.0)
+    assert math.isnan(running["volatility"]) and math.isnan(batch["volatility"])
+    assert running["max_drawdown"] == batch["max_drawdown"]
+
+
+def test_out_of_order_or_missing_values_invalidate():
+    metrics = RunningPerformanceMetrics()
+    metrics.update(START, 100.0)
+    metrics.update(START - datetime.timedelta(days=1), 101.0)
+    assert not metrics.is_valid
+
+    metrics.reset()
+    metrics.update(START, None)
+    assert not metrics.is_valid
+
+
+def test_strategy_stats_use_running_metrics(monkeypatch):
+    harness = strategy_module.Strategy.__new__(strategy_module.Strategy)
+    harness._stats_list = []
+    harness._stats = None
+    harness._stats_dirty = False
+    harness._stats_file = None
+    harness._risk_free_rate = 0.02
+    harness._benchmark_asset = None
+    harness.logger = MagicMock()
+    monkeypatch.setattr(base_strategy_module._Strategy, "_dump_benchmark_stats", lambda self: None)
+    batch = MagicMock(side_effect=stats_summary)
+    monkeypatch.setattr(base_strategy_module, "stats_summary", batch)
+
+    rows = _rows(n=100)
+    for row in rows:
+        harness._append_row(dict(row, cash=0.0, positions=[]))
+    harness._dump_stats()
+
+    batch.assert_not_called()
+    _assert_same_summary(harness._analysis, _batch_summary(rows, 0.02))
+    assert harness.get_performance_metrics() == harness._analysis
+
+    # Rows the accumulator cannot follow fall back to the batch functions.
+    harness._append_row({"datetime": START, "portfolio_value": 1.0, "cash": 0.0, "positions": []})
+    harness._dump_stats()
+    batch.assert_called_once()
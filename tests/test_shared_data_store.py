@@ -0,0 +1,79 @@
+import subprocess
+import sys
+import textwrap
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+
+from lumibot.data_sources import PandasData
+from lumibot.tools.shared_data_store import SharedDataStore
+from tests.performance.synthetic_data import make_universe, trading_dates
+
+START = datetime(2024, 1, 2)
+END = datetime(2024, 1, 6)
+
+
+def _universe():
+    return make_universe(3, trading_dates(date(2024, 1, 2), 4), timestep="minute")
+
+
+def _loaded_source(pandas_data):
+    source = PandasData(datetime_start=START, datetime_end=END, pandas_data=pandas_data)
+    source.load_data()
+    return source
+
+
+def test_attached_data_matches_original(tmp_path):
+    store = SharedDataStore(tmp_path / "store")
+    store.publish(_universe(), datetime_start=START, datetime_end=END)
+
+    expected = _loaded_source(_universe())
+    attached = _loaded_source(store)
+
+    assert set(attached._data_store) == set(expected._data_store)
+    for key, data in expected._data_store.items():
+        shared = attached._data_store[key]
+        pd.testing.assert_frame_equal(shared.df, data.df, check_freq=False)
+        dt = data.df.index[500]
+        assert shared.get_last_price(dt) == data.get_last_price(dt)
+        pd.testing.assert_frame_equal(shared.get_bars(dt, length=30), data.get_bars(dt, length=30))
+
+
+def test_attached_datalines_are_read_only_views(tmp_path):
+    store = SharedDataStore(tmp_path / "store")
+    store.publish(_universe(), datetime_start=START, datetime_end=END)
+
+    source = _loaded_source(store)
+    for data in source._data_store.values():
+        close = data.datalines["close"].dataline
+        assert not close.flags.owndata
+        assert not close.flags.writeable
+        assert np.shares_memory(close, data.df["close"].to_numpy())
+
+
+def test_different_index_falls_back_to_private_copy(tmp_path):
+    store = SharedDataStore(tmp_path / "store")
+    store.publish(_universe(), datetime_start=START, datetime_end=END)
+
+    data = store.attach()[0]
+    data.repair_times_and_fill(data.df.index.delete(10))
+
+    assert data._shared_repaired is False
+    assert data.datalines["close"].dataline.flags.writeable
+    assert len(data.df) == 4 * 390 - 1
+
+
+def test_other_process_can_attach(tmp_path):
+    store_path = tmp_path / "store"
+    SharedDataStore(store_path).publish(_universe())
+
+    script = textwrap.dedent(
+        f"""
+        from lumibot.tools.shared_data_store import SharedDataStore
+        datas = SharedDataStore({str(store_path)!r}).attach()
+        print(sorted(d.asset.symbol for d in datas), len(datas[0].df))
+        """
+    )
+    out = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+    assert "['SYN000', 'SYN001', 'SYN002'] 1560" in out
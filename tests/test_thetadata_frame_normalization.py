@@ -0,0 +1,70 @@
+from datetime import date
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from lumibot.entities import Asset
+from lumibot.tools import thetadata_helper
+
+
+def test_day_index_alignment_matches_the_per_date_market_close():
+    # Both DST transitions, and bars stamped late in the UTC day.
+    index = pd.date_range("2024-03-05", "2024-11-08", freq="D", tz="UTC")
+    index = index.append(pd.DatetimeIndex(["2024-03-10 23:30", "2024-11-03 04:00"], tz="UTC"))
+    frame = pd.DataFrame({"close": np.arange(len(index), dtype=float)}, index=index)
+
+    aligned = thetadata_helper._align_day_index_to_market_close_utc(frame)
+
+    expected = [thetadata_helper._market_close_utc_for_date(day) for day in index.date]
+    assert list(aligned.index) == expected
+    assert str(aligned.index.tz) == "UTC"
+    # Already aligned frames are returned as is.
+    assert thetadata_helper._align_day_index_to_market_close_utc(aligned) is aligned
+
+
+def test_corporate_actions_use_the_splits_after_each_day():
+    index = pd.DatetimeIndex(["2020-01-02", "2020-06-01", "2021-01-04", "2022-01-03"], tz="UTC")
+    frame = pd.DataFrame({"close": [120.0, 60.0, 30.0, 10.0], "volume": [1.0, 1.0, 1.0, 1.0]}, index=index)
+    splits = pd.DataFrame(
+        {
+            # Two events on one day, and one in the future that must not be applied yet.
+            "event_date": pd.to_datetime(["2020-06-01", "2021-01-04", "2021-01-04", "2099-01-01"], utc=True),
+            "ratio": [2.0, 2.0, 1.5, 10.0],
+        }
+    )
+    dividends = pd.DataFrame({"event_date": pd.to_datetime(["2020-01-02"], utc=True), "cash_amount": [1.2]})
+
+    with patch.object(thetadata_helper, "_get_theta_splits", return_value=splits), patch.object(
+        thetadata_helper, "_get_theta_dividends", return_value=dividends
+    ):
+        adjusted = thetadata_helper._apply_corporate_actions_to_frame(
+            Asset("ZZSPLIT"), frame.copy(), date(2020, 1, 1), date(2022, 1, 31)
+        )
+
+    assert adjusted["close"].tolist() == pytest.approx([20.0, 20.0, 30.0, 10.0])
+    assert adjusted["volume"].tolist() == pytest.approx([6.0, 3.0, 1.0, 1.0])
+    assert adjusted["stock_splits"].tolist() == [0.0, 2.0, 3.0, 0.0]
+    assert adjusted["dividend"].tolist() == pytest.approx([0.2, 0.0, 0.0, 0.0])
+    assert adjusted["_split_adjusted"].all()
+
+
+def test_intraday_timestamps_parse_each_distinct_date_once():
+    raw = pd.DataFrame(
+        {
+            "date": pd.Series([20240102, 20240102, 20240103, None], dtype=object),
+            "ms_of_day": [34_200_000, 34_260_000, 34_200_000, 34_200_000],
+            "close": [1.0, 2.0, 3.0, 4.0],
+            "count": [1, 1, 1, 1],
+        }
+    )
+
+    frame = thetadata_helper._finalize_history_dataframe(raw, "ohlc", Asset("SPY"))
+
+    assert [ts.isoformat() for ts in frame.index] == [
+        "2024-01-02T09:30:00-05:00",
+        "2024-01-02T09:31:00-05:00",
+        "2024-01-03T09:30:00-05:00",
+    ]
+    assert frame["close"].tolist() == [1.0, 2.0, 3.0]
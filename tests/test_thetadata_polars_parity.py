@@ -0,0 +1,152 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+
+from lumibot.backtesting import ThetaDataBacktestingPolars
+from lumibot.backtesting.thetadata_backtesting_pandas import ThetaDataBacktestingPandas
+from lumibot.entities import Asset
+from lumibot.tools import thetadata_helper
+
+STOCK = Asset("SPY")
+OPTION = Asset("SPY", Asset.AssetType.OPTION, expiration=date(2024, 1, 19), strike=470, right="call")
+OHLCV = ["open", "high", "low", "close", "volume"]
+
+
+def _session_minutes(day):
+    return pd.date_range(f"{day} 09:30", f"{day} 15:59", freq="1min", tz="America/New_York").tz_convert("UTC")
+
+
+def _fake_price_data(asset, start, end, timespan="minute", datastyle="ohlc", **kwargs):
+    if timespan == "day":
+        sessions = pd.bdate_range("2023-12-20", "2024-01-12").date
+        index = pd.DatetimeIndex([thetadata_helper._market_close_utc_for_date(day) for day in sessions])
+    else:
+        index = _session_minutes("2024-01-02").append(_session_minutes("2024-01-03"))
+    steps = np.arange(len(index), dtype=float)
+    if datastyle == "quote":
+        columns = {"bid": steps * 0.01 + 1.0, "ask": steps * 0.01 + 1.1, "bid_size": 10, "ask_size": 12}
+        columns.update({name: 0 for name in ("bid_condition", "ask_condition", "bid_exchange", "ask_exchange")})
+    else:
+        columns = {"open": steps + 1.0, "high": steps + 2.0, "low": steps + 0.5, "close": steps + 1.5, "volume": 3.0}
+    return pd.DataFrame(columns, index=index)
+
+
+@pytest.fixture
+def make_sources(monkeypatch):
+    monkeypatch.setattr(ThetaDataBacktestingPandas, "kill_processes_by_name", lambda *args, **kwargs: None)
+    monkeypatch.setattr(ThetaDataBacktestingPolars, "kill_processes_by_name", lambda *args, **kwargs: None)
+    monkeypatch.setattr(thetadata_helper, "get_price_data", _fake_price_data)
+
+    def make(timestep="minute", trade_minutes=None):
+        if trade_minutes is not None:
+            # Sparse trades: OHLC rows only at ``trade_minutes``, quotes still every minute.
+            def sparse_price_data(*args, **kwargs):
+                frame = _fake_price_data(*args, **kwargs)
+                if kwargs.get("timespan") == "minute" and kwargs.get("datastyle", "ohlc") != "quote":
+                    frame = frame.loc[trade_minutes]
+                return frame
+
+            monkeypatch.setattr(thetadata_helper, "get_price_data", sparse_price_data)
+        sources = []
+        for cls in (ThetaDataBacktestingPandas, ThetaDataBacktestingPolars):
+            ds = cls(
+                datetime_start=pd.Timestamp("2024-01-02", tz="America/New_York"),
+                datetime_end=pd.Timestamp("2024-01-05", tz="America/New_York"),
+            )
+            ds._timestep = timestep
+            sources.append(ds)
+        return sources
+
+    return make
+
+
+def _at(sources, when):
+    for ds in sources:
+        ds._datetime = pd.Timestamp(when, tz="America/New_York").to_pydatetime()
+
+
+def _assert_same_bars(sources, *args, **kwargs):
+    expected, actual = (ds.get_historical_prices(*args, **kwargs) for ds in sources)
+    assert list(actual.df.index) == list(expected.df.index)
+    pd.testing.assert_frame_equal(actual.df[OHLCV], expected.df[OHLCV], check_freq=False)
+
+
+@pytest.mark.parametrize("when", ["2024-01-02 09:45", "2024-01-03 10:30", "2024-01-03 15:59"])
+@pytest.mark.parametrize("timeshift", [None, -2, timedelta(minutes=5)])
+def test_minute_bars_match_the_pandas_source(make_sources, when, timeshift):
+    sources = make_sources()
+    _at(sources, when)
+
+    _assert_same_bars(sources, STOCK, 3, "minute", timeshift=timeshift)
+    _assert_same_bars(sources, OPTION, 4, "minute", timeshift=timeshift)
+
+
+@pytest.mark.parametrize("when", ["2024-01-02 09:45", "2024-01-03 10:30", "2024-01-03 15:59"])
+@pytest.mark.parametrize("timeshift", [None, -2, timedelta(days=1)])
+def test_day_bars_match_the_pandas_source(make_sources, when, timeshift):
+    sources = make_sources("day")
+    _at(sources, when)
+
+    _assert_same_bars(sources, STOCK, 3, "day", timeshift=timeshift)
+    _assert_same_bars(sources, OPTION, 2, "day", timeshift=timeshift)
+
+
+@pytest.mark.parametrize("load_quotes", [False, True])
+def test_sparse_minute_bars_match_the_pandas_source(make_sources, load_quotes):
+    sessions = _session_minutes("2024-01-02").append(_session_minutes("2024-01-03"))
+    trade_minutes = sessions[np.sort(np.random.default_rng(7).choice(len(sessions), 60, replace=False))]
+    sources = make_sources(trade_minutes=trade_minutes)
+    if load_quotes:
+        _at(sources, "2024-01-02 09:45")
+        for ds in sources:
+            ds.get_quote(OPTION)
+
+    # Every 7 minutes: mostly between trades, where the last trade before dt is not part of the window.
+    for when in pd.date_range("2024-01-02 09:31", "2024-01-03 15:59", freq="7min"):
+        if not (9 * 60 + 30) <= when.hour * 60 + when.minute < 16 * 60:
+            continue
+        _at(sources, when)
+        for timeshift in (None, -2, 3, timedelta(minutes=5)):
+            expected, actual = (ds.get_historical_prices(OPTION, 5, "minute", timeshift=timeshift) for ds in sources)
+            if expected is None:
+                assert actual is None, (when, timeshift)
+                continue
+            assert list(actual.df.index) == list(expected.df.index), (when, timeshift)
+            pd.testing.assert_frame_equal(actual.df[OHLCV], expected.df[OHLCV], check_freq=False)
+
+
+def test_prices_and_quotes_match_the_pandas_source(make_sources):
+    sources = make_sources()
+    for when in ("2024-01-02 09:45", "2024-01-03 10:30"):
+        _at(sources, when)
+        for asset in (STOCK, OPTION):
+            expected, actual = (ds.get_quote(asset) for ds in sources)
+            assert (actual.price, actual.bid, actual.ask, actual.bid_size) == pytest.approx(
+                (expected.price, expected.bid, expected.ask, expected.bid_size)
+            )
+            expected, actual = (ds.get_last_price(asset) for ds in sources)
+            assert actual == pytest.approx(expected)
+
+
+def test_the_broker_fill_bar_is_the_bar_at_the_current_minute(make_sources):
+    sources = make_sources()
+    _at(sources, "2024-01-03 10:30")
+    now = sources[1].get_datetime()
+
+    bars = sources[1].get_historical_prices(OPTION, 2, timeshift=-2, timestep="minute").df
+
+    assert bars[bars.index >= now].index[0] == now
+
+
+def test_polars_frames_and_prefetch(make_sources):
+    _, source = make_sources()
+    _at([source], "2024-01-03 10:30")
+
+    assert source.prefetch_data([OPTION, STOCK, OPTION]) == 2
+    bars = source.get_historical_prices(STOCK, 5, "minute", return_polars=True)
+
+    assert isinstance(bars.df, pl.DataFrame)
+    assert bars.df.height == 5
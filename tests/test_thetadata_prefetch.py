@@ -0,0 +1,118 @@
+import threading
+import time
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from lumibot.backtesting.thetadata_backtesting_pandas import ThetaDataBacktestingPandas
+from lumibot.components.options_helper import OptionsHelper
+from lumibot.entities import Asset
+from lumibot.strategies.strategy import Strategy
+from lumibot.tools import thetadata_helper
+
+
+class _FakeTheta:
+    """Stands in for thetadata_helper.get_price_data: slow responses, and a record of what ran in parallel."""
+
+    def __init__(self, fail_strikes=()):
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fail_strikes = set(fail_strikes)
+        self._lock = threading.Lock()
+
+    def __call__(self, asset, start, end, timespan="minute", datastyle="ohlc", **kwargs):
+        with self._lock:
+            self.calls.append((asset.strike, datastyle))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(0.05)
+            if asset.strike in self.fail_strikes:
+                return None
+            index = pd.date_range("2024-01-02 09:30", "2024-01-03 16:00", freq="1min", tz="America/New_York")
+            if datastyle == "quote":
+                columns = {"bid": 1.0, "ask": 1.2, "bid_size": 10, "ask_size": 12}
+                columns.update({name: 0 for name in ("bid_condition", "ask_condition", "bid_exchange", "ask_exchange")})
+            else:
+                columns = {"open": 1.1, "high": 1.1, "low": 1.1, "close": 1.1, "volume": 3}
+            return pd.DataFrame(columns, index=index.tz_convert("UTC"))
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+@pytest.fixture
+def data_source(monkeypatch):
+    monkeypatch.setattr(ThetaDataBacktestingPandas, "kill_processes_by_name", lambda *args, **kwargs: None)
+    fake = _FakeTheta(fail_strikes={999.0})
+    monkeypatch.setattr(thetadata_helper, "get_price_data", fake)
+    ds = ThetaDataBacktestingPandas(
+        datetime_start=pd.Timestamp("2024-01-02", tz="America/New_York"),
+        datetime_end=pd.Timestamp("2024-01-10", tz="America/New_York"),
+    )
+    ds._datetime = pd.Timestamp("2024-01-03 10:30", tz="America/New_York").to_pydatetime()
+    ds.fake = fake
+    return ds
+
+
+def _contracts(strikes):
+    return [
+        Asset("SPY", Asset.AssetType.OPTION, expiration=date(2024, 1, 19), strike=strike, right="call")
+        for strike in strikes
+    ]
+
+
+def test_prefetch_loads_contracts_concurrently_for_the_later_quotes(data_source):
+    contracts = _contracts(range(470, 482))
+
+    assert data_source.prefetch_data(contracts + contracts[:3]) == len(contracts)
+
+    # One OHLC and one quote request per contract, many of them in flight at once.
+    assert sorted(data_source.fake.calls) == sorted(
+        (float(contract.strike), style) for contract in contracts for style in ("ohlc", "quote")
+    )
+    assert data_source.fake.max_in_flight > 2
+
+    downloads = len(data_source.fake.calls)
+    for contract in contracts:
+        quote = data_source.get_quote(contract)
+        assert (quote.bid, quote.ask) == (1.0, 1.2)
+        assert data_source.get_last_price(contract) == pytest.approx(1.1)
+    assert len(data_source.fake.calls) == downloads
+
+
+def test_prefetch_skips_contracts_that_cannot_be_loaded(data_source):
+    assert data_source.prefetch_data(_contracts([470.0, 999.0])) == 1
+    assert data_source.prefetch_data([]) == 0
+
+
+def test_strike_search_prefetches_the_candidate_contracts():
+    strategy = MagicMock()
+    strategy.get_chains.return_value = None
+    strategy.get_last_price.return_value = None
+    strategy.get_quote.return_value = None
+    helper = OptionsHelper(strategy)
+
+    helper.find_strike_for_delta(Asset("SPY"), 100.0, 0.3, date(2024, 1, 19), "call")
+
+    contracts = strategy.prefetch_data.call_args.args[0]
+    assert [contract.strike for contract in contracts] == [float(strike) for strike in range(80, 131)]
+    assert {(contract.expiration, contract.right) for contract in contracts} == {(date(2024, 1, 19), "CALL")}
+
+
+def test_strategy_prefetch_data_only_runs_in_backtests():
+    strategy = Strategy.__new__(Strategy)
+    strategy.broker = SimpleNamespace(data_source=MagicMock())
+    contracts = _contracts([470.0])
+
+    strategy.is_backtesting = False
+    strategy.prefetch_data(contracts)
+    strategy.broker.data_source.prefetch_data.assert_not_called()
+
+    strategy.is_backtesting = True
+    strategy.prefetch_data(contracts, timestep="day")
+    strategy.broker.data_source.prefetch_data.assert_called_once_with(contracts, timestep="day")
@@ -0,0 +1,99 @@
+import datetime
+
+import pandas as pd
+import pytz
+
+from lumibot.entities import Order
+from lumibot.tools.trade_event_log import TradeEventLog
+
+
+def _event(i, price=None, price_source=None):
+    row = {
+        "time": pytz.timezone("America/New_York").localize(datetime.datetime(2024, 1, 2, 9, 30) + datetime.timedelta(minutes=i)),
+        "strategy": "Strat",
+        "exchange": None,
+        "identifier": f"order-{i}",
+        "symbol": "SPY",
+        "side": Order.OrderSide.BUY if i % 2 == 0 else Order.OrderSide.SELL,
+        "type": Order.OrderType.MARKET,
+        "status": "fill" if price is not None else "new",
+        "price": price,
+        "filled_quantity": 10.0 if price is not None else None,
+        "multiplier": 1,
+        "trade_cost": 0.0,
+        "time_in_force": "day",
+        "asset.right": None,
+        "asset.strike": None,
+        "asset.multiplier": 1,
+        "asset.expiration": None,
+        "asset.asset_type": "stock",
+    }
+    if price_source:
+        row["price_source"] = price_source
+    return row
+
+
+def _events():
+    return [_event(0), _event(1, price=470.5), _event(2, price=471.0, price_source="quote"), _event(3)]
+
+
+def _concat_reference(rows):
+    """How Broker._process_trade_event used to grow the log: one pd.concat per event."""
+    df = pd.DataFrame()
+    for row in rows:
+        new_row_df = pd.DataFrame(row, index=[0]).dropna(axis=1, how="all")
+        df = pd.concat([df, new_row_df], axis=0)
+    return df
+
+
+def test_dataframe_matches_per_event_concat():
+    log = TradeEventLog()
+    for row in _events():
+        log.append(row)
+
+    expected = _concat_reference(_events())
+    # Scalar construction infers microsecond resolution; the columnar frame uses pandas' default nanoseconds.
+    expected["time"] = expected["time"].dt.as_unit("ns")
+    pd.testing.assert_frame_equal(log.to_dataframe(), expected)
+
+
+def test_dataframe_is_cached_until_next_event():
+    log = TradeEventLog()
+    assert log.to_dataframe().empty
+
+    log.append(_event(0))
+    first = log.to_dataframe()
+    assert log.to_dataframe() is first
+
+    log.append(_event(1, price=470.5))
+    assert len(log.to_dataframe()) == 2
+
+
+def test_stream_to_csv_appends_in_batches(tmp_path):
+    path = tmp_path / "trades.csv"
+    log = TradeEventLog(stream_path=str(path), flush_every=2)
+    events = _events()
+    for row in events[:3]:
+        log.append(row)
+
+    assert len(pd.read_csv(path)) == 2
+    log.append(events[3])
+    log.close()
+
+    streamed = pd.read_csv(path)
+    assert list(streamed["identifier"]) == [row["identifier"] for row in events]
+    assert list(streamed["price_source"].fillna("")) == ["", "", "quote", ""]
+    assert streamed.loc[1, "side"] == "sell"
+
+
+def test_stream_to_parquet(tmp_path):
+    path = tmp_path / "trades.parquet"
+    log = TradeEventLog(stream_path=str(path), flush_every=3)
+    for row in _events():
+        log.append(row)
+    log.close()
+
+    streamed = pd.read_parquet(path)
+    assert len(streamed) == 4
+    assert streamed["price"].tolist()[1:3] == [470.5, 471.0]
+    assert str(streamed["time"].dt.tz) == "UTC"
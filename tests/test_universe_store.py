@@ -0,0 +1,85 @@
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from lumibot.data_sources import PandasData
+from lumibot.entities import Data
+from tests.performance.synthetic_data import make_universe, trading_dates
+
+START = datetime(2024, 1, 2)
+END = datetime(2024, 1, 6)
+
+
+def _universe(timestep):
+    datas = make_universe(4, trading_dates(date(2024, 1, 2), 4), timestep=timestep)
+    # One asset starts a day late, so it covers only part of the shared index.
+    late = datas[-1]
+    late_df = late.df[late.df.index >= pd.Timestamp("2024-01-03", tz="America/New_York")]
+    datas[-1] = Data(late.asset, late_df, timestep=timestep, quote=late.quote)
+    return datas
+
+
+def _sources(timestep):
+    sources = []
+    for columnar in (False, True):
+        source = PandasData(
+            datetime_start=START, datetime_end=END, pandas_data=_universe(timestep), columnar_store=columnar
+        )
+        source.load_data()
+        sources.append(source)
+    return sources
+
+
+def _at(sources, dt):
+    for source in sources:
+        source._datetime = dt
+
+
+@pytest.mark.parametrize("timestep", ["minute", "day"])
+def test_cross_sections_match_the_per_asset_lookups(timestep):
+    plain, columnar = _sources(timestep)
+    assert plain.universe_store is None and len(columnar.universe_store) == 4
+    assets = [key[0] for key in plain.get_assets()]
+
+    shift = timedelta(days=1) if timestep == "day" else timedelta(minutes=7)
+    times = ["2024-01-02 09:30", "2024-01-02 09:30:30", "2024-01-03 12:00", "2024-01-05 15:59"]
+    for when in times:
+        dt = pd.Timestamp(when, tz="America/New_York").to_pydatetime()
+        _at([plain, columnar], dt)
+        assert columnar.get_last_prices(assets) == plain.get_last_prices(assets)
+
+        for length, timeshift in ((5, None), (3, 2), (2, shift)):
+            expected = plain.get_bars(assets, length, timestep=timestep, timeshift=timeshift, sleep_time=0)
+            actual = columnar.get_bars(assets, length, timestep=timestep, timeshift=timeshift, sleep_time=0)
+            assert actual.keys() == expected.keys()
+            for asset, bars in expected.items():
+                if bars is None:
+                    assert actual[asset] is None
+                    continue
+                pd.testing.assert_frame_equal(actual[asset].df, bars.df, check_freq=False)
+
+
+def test_cross_section_is_read_without_per_asset_lookups():
+    _, columnar = _sources("minute")
+    assets = [key[0] for key in columnar.get_assets()]
+    _at([columnar], pd.Timestamp("2024-01-04 10:15", tz="America/New_York").to_pydatetime())
+
+    with patch.object(Data, "get_last_price", side_effect=AssertionError("per-asset lookup")):
+        prices = columnar.get_last_prices(assets)
+        # The cross-section also seeds the per-asset memo for this bar.
+        assert [columnar.get_last_price(asset) for asset in assets] == list(prices.values())
+    assert all(price > 0 for price in prices.values())
+
+
+def test_aggregated_timesteps_use_the_per_asset_path():
+    plain, columnar = _sources("minute")
+    assets = [key[0] for key in plain.get_assets()]
+    _at([plain, columnar], pd.Timestamp("2024-01-05 11:00", tz="America/New_York").to_pydatetime())
+
+    expected = plain.get_bars(assets, 4, timestep="5 minutes", sleep_time=0)
+    actual = columnar.get_bars(assets, 4, timestep="5 minutes", sleep_time=0)
+
+    for asset, bars in expected.items():
+        pd.testing.assert_frame_equal(actual[asset].df, bars.df)
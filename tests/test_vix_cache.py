@@ -0,0 +1,105 @@
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from lumibot.components.vix_helper import VixHelper
+from lumibot.tools.indicator_engine import rsi_values
+
+
+def _history(n=300, seed=7):
+    """Business-day closes (with weekend gaps) ending today, indexed like Yahoo's history."""
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range(end=datetime.now(), periods=n, tz="America/New_York").normalize()
+    close = np.round(18 + 4 * np.sin(np.arange(n) / 9) + rng.normal(0, 0.8, n), 1)
+    close[40] = close[39]  # a tie, for the percentile ranks
+    return pd.DataFrame({"Open": close + 0.3, "Close": close, "Volume": 0.0}, index=index)
+
+
+@pytest.fixture
+def ticker(tmp_path):
+    VixHelper.clear_cache()
+    with patch.object(VixHelper, "CACHE_FOLDER", str(tmp_path)), patch("yfinance.Ticker") as ticker_class:
+        ticker_class.return_value.history.return_value = _history()
+        yield ticker_class
+    VixHelper.clear_cache()
+
+
+def _helper():
+    return VixHelper(Mock())
+
+
+def _dates(history):
+    # Strategy datetimes (naive, after the open), every few days of the history
+    return [ts.tz_localize(None).to_pydatetime() + timedelta(hours=10) for ts in history.index[30::7]]
+
+
+def _window(history, dt, window, use_open):
+    """The values the helper used to slice out of the history for each check."""
+    lookup = pd.Timestamp(dt if use_open else dt - timedelta(days=1)).tz_localize(history.index.tz)
+    nearest = history.index.asof(lookup)
+    return history.loc[nearest - timedelta(days=window):nearest]["Open" if use_open else "Close"]
+
+
+@pytest.mark.parametrize("use_open", [False, True])
+def test_features_match_the_windowed_computations(ticker, use_open):
+    history = _history()
+    helper = _helper()
+
+    checked_rsi = 0
+    for dt in _dates(history):
+        values = _window(history, dt, 30, use_open)
+        assert helper.get_vix_value(dt, use_open=use_open) == values.iloc[-1]
+        assert helper.get_vix_values(dt, 30, use_open=use_open) == values.tolist()
+        assert helper.get_vix_percentile(dt, 30, use_open=use_open) == pytest.approx(
+            stats.percentileofscore(values.tolist(), values.iloc[-1])
+        )
+        assert helper.get_index_feature("vix", "min", dt, 30, use_open=use_open) == values.min()
+        assert helper.get_index_feature("vix", "max", dt, 30, use_open=use_open) == values.max()
+
+        # Windows with too few changes for the RSI used to give NaN, they now give None like the other checks.
+        for length in (14, 20):
+            expected_rsi = rsi_values(_window(history, dt, int(length * 1.6), use_open).tolist(), length)[-1]
+            rsi = helper.get_vix_rsi_value(dt, length, use_open=use_open)
+            assert rsi is None if np.isnan(expected_rsi) else rsi == pytest.approx(expected_rsi, rel=1e-12)
+            checked_rsi += rsi is not None
+    assert checked_rsi > 10
+
+
+def test_history_is_downloaded_once_and_shared(ticker, tmp_path):
+    dt = datetime.now()
+    first, second = _helper(), _helper()
+    first.get_vix_value(dt)
+    second.get_vix_rsi_value(dt)
+    second.get_gvz_value(dt)
+
+    assert [call.args for call in ticker.call_args_list] == [("^VIX",), ("^GVZ",)]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["gvz.parquet", "vix.parquet"]
+    assert first.last_historical_vix_update is not None and second.historical_vix is first.historical_vix
+
+    # A new process (here: an emptied memory cache) reads today's parquet file instead of downloading again.
+    VixHelper.clear_cache()
+    assert _helper().get_vix_value(dt) == first.get_vix_value(dt)
+    assert ticker.call_count == 2
+
+
+def test_errors_keep_the_fallback_values(ticker):
+    ticker.return_value.history.return_value = pd.DataFrame(columns=["Open", "Close"])
+    helper = _helper()
+
+    assert helper.get_vix_value(datetime.now()) is None
+    assert helper.get_vix_1d_value(datetime.now()) == 1000
+    assert helper.get_vix_percentile(datetime.now(), 30) is None
+    assert helper.check_max_vix_rsi(datetime.now(), 70) is False
+
+
+def test_dates_before_the_history_have_no_values(ticker):
+    helper = _helper()
+    too_early = _history().index[0].tz_localize(None).to_pydatetime()
+
+    assert helper.get_vix_value(too_early) is None
+    assert helper.get_vix_values(too_early, 30) is None
+    assert helper.get_vix_rsi_value(too_early + timedelta(days=5)) is None
@@ -11,6 +11,7 @@ if not hasattr(np, 'NaN'):
     np.NaN = np.nan
 from datetime import datetime, timedelta
 import sys
+import tempfile
 
 
 class TestVixHelperImport(unittest.TestCase):
@@ -52,7 +53,17 @@ class TestVixHelper(unittest.TestCase):
         self.mock_strategy.get_historical_prices = Mock()
         self.mock_strategy.log_message = Mock()
         self.mock_strategy.add_marker = Mock()
-        
+
+        # Each test mocks its own Yahoo history, so the shared cache must not carry it over to the next test.
+        from lumibot.components.vix_helper import VixHelper
+        cache_folder = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_folder.cleanup)
+        folder_patch = patch.object(VixHelper, "CACHE_FOLDER", cache_folder.name)
+        folder_patch.start()
+        self.addCleanup(folder_patch.stop)
+        VixHelper.clear_cache()
+        self.addCleanup(VixHelper.clear_cache)
+
     def test_vix_helper_initialization(self):
         """Test VixHelper initialization"""
         from lumibot.components.vix_helper import VixHelper
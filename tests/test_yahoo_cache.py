@@ -0,0 +1,179 @@
+import datetime
+import os
+import pickle
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from lumibot.backtesting import YahooDataBacktesting
+from lumibot.entities import Asset
+from lumibot.tools import yahoo_helper
+from lumibot.tools.yahoo_helper import YahooHelper, _YahooData
+
+
+def _history(n_days=40, end=None):
+    index = pd.bdate_range("2024-01-02", periods=n_days, tz="America/New_York")
+    close = 100 + np.arange(n_days, dtype=float)
+    frame = pd.DataFrame(
+        {
+            "Open": close - 0.5,
+            "High": close + 1,
+            "Low": close - 1,
+            "Close": close,
+            "Adj Close": close * 0.99,
+            "Volume": 1_000_000.0,
+            "Dividends": 0.0,
+            "Stock Splits": 0.0,
+        },
+        index=index,
+    )
+    return frame if end is None else frame[frame.index <= end]
+
+
+class _FakeYahoo:
+    """Stands in for ``yfinance.Ticker``; serves every symbol the same history up to ``available_until``."""
+
+    def __init__(self):
+        self.full = _history()
+        self.available_until = self.full.index[29]
+        self.clock_offset = pd.Timedelta(hours=20)
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def ticker(self, symbol):
+        fake = self
+
+        class _Ticker:
+            ticker = symbol
+            info = {}
+
+            def history(self, interval="1d", start=None, period=None, auto_adjust=False):
+                with fake.lock:
+                    fake.calls.append((symbol, start, period))
+                if symbol.startswith("BAD"):
+                    return pd.DataFrame()
+                data = fake.full[fake.full.index <= fake.available_until]
+                if start is not None:
+                    data = data[data.index >= pd.Timestamp(start)]
+                return data.copy()
+
+        return _Ticker()
+
+
+@pytest.fixture
+def yahoo(tmp_path, monkeypatch):
+    fake = _FakeYahoo()
+    monkeypatch.setattr(yahoo_helper.yf, "Ticker", fake.ticker)
+    monkeypatch.setattr(YahooHelper, "sleep_and_get_proxy", staticmethod(lambda: None))
+    monkeypatch.setattr(YahooHelper, "LUMIBOT_YAHOO_CACHE_FOLDER", str(tmp_path))
+    monkeypatch.setattr(YahooHelper, "CACHING_ENABLED", True)
+    monkeypatch.setattr(yahoo_helper, "INVALID_SYMBOLS", set())
+    # "Now" is the evening of the last bar Yahoo has, unless a test moves the clock.
+    monkeypatch.setattr(
+        yahoo_helper, "get_lumibot_datetime", lambda: (fake.available_until + fake.clock_offset).to_pydatetime()
+    )
+    return fake
+
+
+def _day(i):
+    return _history().index[i].to_pydatetime()
+
+
+def test_cache_is_parquet_with_metadata_sidecar(yahoo, tmp_path):
+    data = YahooHelper.get_symbol_data("SPY", last_needed_datetime=_day(29))
+    assert len(data) == 30
+    assert sorted(os.listdir(tmp_path)) == ["SPY_1d.meta.json", "SPY_1d.parquet", "SPY_info.json"]
+
+    meta = YahooHelper.read_cache_metadata("SPY", "1d")
+    assert meta["rows"] == 30 and pd.Timestamp(meta["end"]) == data.index[-1]
+
+    # Covered by the cache: no request is made.
+    yahoo.calls.clear()
+    again = YahooHelper.get_symbol_data("SPY", last_needed_datetime=_day(10))
+    assert yahoo.calls == []
+    pd.testing.assert_frame_equal(again, data, check_freq=False)
+    assert list(YahooHelper.load_cached_data("SPY", "1d", columns=["Close"]).columns) == ["Close"]
+
+
+def test_refresh_downloads_only_the_missing_bars(yahoo):
+    YahooHelper.get_symbol_data("SPY", last_needed_datetime=_day(29))
+    yahoo.available_until = yahoo.full.index[-1]
+    yahoo.calls.clear()
+
+    data = YahooHelper.get_symbol_data("SPY", last_needed_datetime=_day(39))
+    (symbol, start, period), = yahoo.calls
+    assert period is None and start >= _day(29) - datetime.timedelta(days=YahooHelper.REFRESH_OVERLAP_DAYS)
+    assert len(data) == 40 and data.index.is_unique and data.index.is_monotonic_increasing
+    assert YahooHelper.read_cache_metadata("SPY", "1d")["rows"] == 40
+
+
+def test_refresh_without_new_bars_marks_the_cache_checked(yahoo):
+    YahooHelper.get_symbol_data("SPY", last_needed_datetime=_day(29))
+    yahoo.calls.clear()
+    yahoo.clock_offset = pd.Timedelta(days=1, hours=20)
+
+    # A day without a bar (e.g. a holiday): Yahoo is asked once, then the cache answers.
+    YahooHelper.get_symbol_data("SPY", last_needed_datetime=_day(29) + datetime.timedelta(days=1))
+    assert len(yahoo.calls) == 1
+    YahooHelper.get_symbol_data("SPY", last_needed_datetime=_day(29) + datetime.timedelta(days=1))
+    assert len(yahoo.calls) == 1
+
+
+def test_changed_adjustments_trigger_a_full_download(yahoo):
+    YahooHelper.get_symbol_data("SPY", last_needed_datetime=_day(29))
+    yahoo.full["Adj Close"] *= 0.98  # a dividend was paid and Yahoo re-adjusted the history
+    yahoo.available_until = yahoo.full.index[-1]
+    yahoo.calls.clear()
+
+    data = YahooHelper.get_symbol_data("SPY", last_needed_datetime=_day(39), auto_adjust=True)
+    assert [period for _, _, period in yahoo.calls] == [None, "max"]
+    np.testing.assert_allclose(data["Close"].to_numpy(), yahoo.full["Adj Close"].to_numpy())
+
+
+def test_legacy_pickle_is_imported(yahoo, tmp_path):
+    legacy = YahooHelper.process_df(_history(end=_history().index[29]))
+    with open(tmp_path / "SPY_1d.pickle", "wb") as f:
+        pickle.dump(_YahooData("SPY", "1d", legacy), f)
+
+    data = YahooHelper.get_symbol_data("SPY", last_needed_datetime=_day(20))
+    assert yahoo.calls == []
+    assert len(data) == 30
+    assert not (tmp_path / "SPY_1d.pickle").exists()
+
+
+def test_unreadable_cache_is_downloaded_again(yahoo, tmp_path):
+    YahooHelper.get_symbol_data("SPY", last_needed_datetime=_day(29))
+    (tmp_path / "SPY_1d.parquet").write_bytes(b"not parquet")
+    yahoo.calls.clear()
+
+    assert len(YahooHelper.get_symbol_data("SPY", last_needed_datetime=_day(29))) == 30
+    assert [period for _, _, period in yahoo.calls] == ["max"]
+
+
+def test_bulk_load_in_parallel(yahoo):
+    symbols = [f"S{i}" for i in range(20)] + ["BAD"]
+    data = YahooHelper.get_symbols_data(symbols, last_needed_datetime=_day(29), max_workers=4)
+
+    assert list(data) == symbols
+    assert all(len(data[symbol]) == 30 for symbol in symbols[:-1])
+    assert data["BAD"] is None
+
+
+def test_backtesting_get_bars_warms_all_assets_at_once(yahoo, monkeypatch):
+    data_source = YahooDataBacktesting(datetime_start=_day(20), datetime_end=_day(29))
+    data_source._datetime = data_source.to_default_timezone(_day(25))
+    bulk = []
+    original = YahooHelper.get_symbols_data
+
+    def _recording(symbols, *args, **kwargs):
+        bulk.append(list(symbols))
+        return original(symbols, *args, **kwargs)
+
+    monkeypatch.setattr(YahooHelper, "get_symbols_data", staticmethod(_recording))
+    assets = [Asset(f"S{i}") for i in range(10)]
+    bars = data_source.get_bars(assets, 5, timestep="day")
+
+    assert bulk == [[asset.symbol for asset in assets]]
+    assert all(len(bars[asset].df) == 5 for asset in assets)